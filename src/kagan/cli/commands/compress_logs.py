@@ -0,0 +1,51 @@
+"""Execution log compression command."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import click
+
+from kagan.core.adapters.execution_logs import DEFAULT_LOG_COMPRESS_MIN_BYTES
+from kagan.core.constants import DEFAULT_DB_PATH
+
+
+async def _compress_logs(db_path: str, min_bytes: int) -> int:
+    """Compress stored execution log rows; returns the number rewritten."""
+    from kagan.core.adapters.db.repositories import ExecutionRepository, TaskRepository
+
+    repo = TaskRepository(db_path)
+    await repo.initialize()
+    try:
+        executions = ExecutionRepository(repo.session_factory)
+        return await executions.compress_inline_logs(min_bytes=min_bytes)
+    finally:
+        await repo.close()
+
+
+@click.command(name="compress-logs")
+@click.option(
+    "--min-bytes",
+    type=click.IntRange(min=1),
+    default=DEFAULT_LOG_COMPRESS_MIN_BYTES,
+    show_default=True,
+    help="Only compress log rows at least this large",
+)
+def compress_logs(min_bytes: int) -> None:
+    """Compress agent output stored in the database by older versions."""
+    if not Path(DEFAULT_DB_PATH).exists():
+        click.secho("No database found.", fg="yellow")
+        return
+
+    try:
+        rewritten = asyncio.run(_compress_logs(DEFAULT_DB_PATH, min_bytes))
+    except Exception as error:
+        click.secho(f"Failed to compress logs: {error}", fg="red")
+        raise SystemExit(1) from error
+
+    if not rewritten:
+        click.secho("No uncompressed log rows found.", fg="green")
+        return
+    click.secho(f"Compressed {rewritten} log row(s).", fg="green")
+    click.echo("SQLite reuses the freed pages; run VACUUM to shrink the database file.")
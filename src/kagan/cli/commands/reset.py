@@ -51,6 +51,7 @@ async def _delete_project_data(db_path: str, project_id: str) -> str:
     from kagan.core.adapters.db.engine import create_db_engine
     from kagan.core.adapters.db.schema import (
         CodingAgentTurn,
+        ExecutionLogChunk,
         ExecutionProcess,
         ExecutionProcessLog,
         ExecutionProcessRepoState,
@@ -59,10 +60,12 @@ async def _delete_project_data(db_path: str, project_id: str) -> str:
         ProjectRepo,
         Session,
         Task,
+        TaskExecutionSummary,
         TaskLink,
         Workspace,
         WorkspaceRepo,
     )
+    from kagan.core.adapters.execution_logs import SegmentedLogStore, execution_log_root
 
     engine = await create_db_engine(db_path)
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
@@ -89,10 +92,18 @@ async def _delete_project_data(db_path: str, project_id: str) -> str:
             )
             exec_ids = [r[0] for r in exec_rows.all()]
 
-            for model in (ExecutionProcessRepoState, ExecutionProcessLog, CodingAgentTurn):
+            for model in (
+                ExecutionProcessRepoState,
+                ExecutionProcessLog,
+                ExecutionLogChunk,
+                CodingAgentTurn,
+            ):
                 await session.execute(
                     delete(model).where(col(model.execution_process_id).in_(exec_ids))
                 )
+            log_store = SegmentedLogStore(execution_log_root(Path(db_path)))
+            for exec_id in exec_ids:
+                log_store.remove(exec_id)
 
             await session.execute(
                 delete(ExecutionProcess).where(col(ExecutionProcess.id).in_(exec_ids))
@@ -122,6 +133,9 @@ async def _delete_project_data(db_path: str, project_id: str) -> str:
             )
             task_ids = [r[0] for r in task_rows.all()]
 
+            await session.execute(
+                delete(TaskExecutionSummary).where(col(TaskExecutionSummary.task_id).in_(task_ids))
+            )
             await session.execute(
                 delete(TaskLink).where(
                     col(TaskLink.task_id).in_(task_ids) | col(TaskLink.ref_task_id).in_(task_ids)
@@ -10,6 +10,7 @@ __version__ = version("kagan")
 from kagan.cli.tools import tools
 from kagan.cli.update import update
 
+from .compress_logs import compress_logs
 from .core import core
 from .list_projects import list_cmd
 from .mcp import mcp
@@ -37,3 +38,4 @@ cli.add_command(reset)
 cli.add_command(list_cmd)
 cli.add_command(mcp)
 cli.add_command(core)
+cli.add_command(compress_logs)
@@ -44,6 +44,7 @@ from kagan.core.acp import messages
 from kagan.core.acp.messages import AgentBuffers
 from kagan.core.acp.terminals import TerminalManager
 from kagan.core.debug_log import log
+from kagan.core.instrumentation import timed_operation
 from kagan.core.limits import SHUTDOWN_TIMEOUT, SUBPROCESS_LIMIT
 from kagan.core.mcp_naming import get_mcp_server_name
 from kagan.core.services.permission_policy import (
@@ -693,10 +694,11 @@ class KaganAgent:
             raise RequestError.internal_error({"details": "Agent connection not ready"})
 
         try:
-            result: PromptResponse = await self._connection.prompt(
-                prompt=[text_block(prompt)],
-                session_id=self.session_id,
-            )
+            with timed_operation("core.agent.prompt.duration_ms"):
+                result: PromptResponse = await self._connection.prompt(
+                    prompt=[text_block(prompt)],
+                    session_id=self.session_id,
+                )
         except RequestError as exc:
             log.error(f"[send_prompt] ACP error: {exc}")
             error_details = ""
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import platform
 import sys
+import time
 from pathlib import Path
 
-from sqlalchemy import event
+from sqlalchemy import Connection, event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
+from kagan.core.adapters.db.execution_summaries import backfill_execution_summaries
+from kagan.core.adapters.db.task_board import create_task_board_index
+from kagan.core.adapters.db.task_revisions import create_task_revision_triggers
+from kagan.core.adapters.db.task_search import create_task_search_index, drop_task_search_index
+from kagan.core.instrumentation import is_enabled, record_timing
 from kagan.core.paths import ensure_directories, get_database_path
 
+_TRANSACTION_STARTED_KEY = "kagan_transaction_started_at"
+
 
 def _check_greenlet() -> None:
     """Verify greenlet is functional (required by SQLAlchemy async)."""
@@ -29,8 +37,56 @@ def _check_greenlet() -> None:
         ) from exc
 
 
-async def create_db_engine(db_path: str | Path | None = None) -> AsyncEngine:
-    """Create async SQLite engine with WAL mode."""
+# Applied to every connection.  WAL makes ``synchronous=NORMAL`` safe against
+# corruption (a power loss can only roll back the last commits), and the
+# busy timeout lets readers and the writer wait out each other's locks
+# instead of failing with "database is locked".
+SQLITE_CONNECTION_PRAGMAS: tuple[tuple[str, str | int], ...] = (
+    ("foreign_keys", "ON"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", 5000),
+    ("temp_store", "MEMORY"),
+    ("cache_size", -16384),  # KiB, i.e. 16 MiB of page cache per connection
+    ("mmap_size", 268435456),
+)
+
+
+def _install_engine_listeners(engine: AsyncEngine, *, read_only: bool = False) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """Enable FK enforcement and tuned pragmas for every SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _mark_transaction_start(connection: Connection) -> None:
+        if is_enabled():
+            connection.info[_TRANSACTION_STARTED_KEY] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "commit")
+    @event.listens_for(engine.sync_engine, "rollback")
+    def _record_transaction_end(connection: Connection) -> None:
+        started_at = connection.info.pop(_TRANSACTION_STARTED_KEY, None)
+        if started_at is not None:
+            record_timing(
+                "core.db.transaction.duration_ms", (time.perf_counter() - started_at) * 1000
+            )
+
+
+async def create_db_engine(
+    db_path: str | Path | None = None,
+    *,
+    single_connection: bool = False,
+) -> AsyncEngine:
+    """Create async SQLite engine with WAL mode and incremental auto-vacuum.
+
+    With ``single_connection`` the pool holds exactly one connection, so every
+    session using the engine shares one dedicated writer.
+    """
     _check_greenlet()
     ensure_directories()
     resolved = Path(db_path) if db_path else get_database_path()
@@ -45,32 +101,66 @@ async def create_db_engine(db_path: str | Path | None = None) -> AsyncEngine:
     else:
         db_path_path = Path(db_path_str)
         db_path_path.parent.mkdir(parents=True, exist_ok=True)
+        pool_args: dict[str, int] = {"pool_size": 1, "max_overflow": 0} if single_connection else {}
         engine = create_async_engine(
             f"sqlite+aiosqlite:///{db_path_path}",
             echo=False,
             connect_args={"check_same_thread": False},
+            **pool_args,
         )
 
-    @event.listens_for(engine.sync_engine, "connect")
-    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
-        """Enable FK enforcement for every SQLite connection."""
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    _install_engine_listeners(engine)
 
     async with engine.begin() as conn:
+        # Only takes effect on a new, empty database; older files are switched
+        # over by the first full VACUUM (see ``SqliteMaintenance.vacuum``).
+        await conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
         await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
 
     return engine
 
 
+async def create_reader_engine(db_path: str | Path, *, pool_size: int) -> AsyncEngine:
+    """Create a pool of read-only connections to an existing WAL database.
+
+    Connections open the file with ``mode=ro`` and ``query_only``, so a
+    misrouted write fails loudly instead of contending with the writer.
+    """
+    _check_greenlet()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:{Path(db_path)}?mode=ro&uri=true",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    _install_engine_listeners(engine, read_only=True)
+    return engine
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Create indexes declared after a table first shipped.
+
+    ``create_all`` skips tables that already exist, including their indexes.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def create_db_tables(engine: AsyncEngine) -> None:
-    """Create all tables from SQLModel metadata."""
+    """Create all tables from SQLModel metadata, plus derived indexes and summaries."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(create_task_board_index)
+        await conn.run_sync(create_task_search_index)
+        await conn.run_sync(create_task_revision_triggers)
+        await conn.run_sync(backfill_execution_summaries)
 
 
 async def drop_db_tables(engine: AsyncEngine) -> None:
     """Drop all tables (for testing only)."""
     async with engine.begin() as conn:
+        await conn.run_sync(drop_task_search_index)
         await conn.run_sync(SQLModel.metadata.drop_all)
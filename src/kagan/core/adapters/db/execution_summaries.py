@@ -0,0 +1,68 @@
+"""Backfill for the per-task execution summary table."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, exists, insert, or_
+from sqlmodel import col, select
+
+from kagan.core.adapters.db.schema import (
+    ExecutionProcess,
+    Session,
+    Task,
+    TaskExecutionSummary,
+    Workspace,
+)
+from kagan.core.models.enums import ExecutionStatus
+from kagan.core.time import utc_now
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+
+def backfill_execution_summaries(connection: Connection) -> None:
+    """Repair ``task_execution_summaries`` and fill in tasks that have none.
+
+    Rows whose task or latest execution no longer exists are dropped first,
+    so those tasks are rebuilt from their remaining executions.  This covers
+    databases that predate the table as well as rows left behind by deletes
+    that bypassed the repositories.
+    """
+    summary = TaskExecutionSummary
+    connection.execute(
+        delete(summary).where(
+            or_(
+                ~exists().where(col(Task.id) == col(summary.task_id)),
+                ~exists().where(col(ExecutionProcess.id) == col(summary.latest_execution_id)),
+            )
+        )
+    )
+    rows = connection.execute(
+        select(Workspace.task_id, ExecutionProcess.id, ExecutionProcess.status)
+        .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
+        .join(Workspace, col(Session.workspace_id) == col(Workspace.id))
+        .join(Task, col(Task.id) == col(Workspace.task_id))
+        .where(~exists().where(col(summary.task_id) == col(Workspace.task_id)))
+        .order_by(col(ExecutionProcess.created_at).asc(), col(ExecutionProcess.id).asc())
+    ).all()
+
+    summaries: dict[str, dict[str, Any]] = {}
+    for task_id, execution_id, status in rows:
+        summary = summaries.setdefault(
+            task_id, {"task_id": task_id, "execution_count": 0, "running_execution_id": None}
+        )
+        summary["latest_execution_id"] = execution_id
+        summary["last_status"] = status
+        summary["execution_count"] += 1
+        if status == ExecutionStatus.RUNNING:
+            summary["running_execution_id"] = execution_id
+    if summaries:
+        now = utc_now()
+        connection.execute(
+            insert(TaskExecutionSummary),
+            [{**summary, "updated_at": now} for summary in summaries.values()],
+        )
+
+
+__all__ = ["backfill_execution_summaries"]
@@ -0,0 +1,172 @@
+"""SQLite housekeeping: WAL checkpoints, planner statistics and vacuuming."""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kagan.core.adapters.db.task_search import rebuild_task_search_index, task_search_available
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from kagan.core.adapters.db.write_executor import WriteExecutor
+
+# ``PRAGMA auto_vacuum`` value of databases that release free pages on request.
+AUTO_VACUUM_INCREMENTAL = 2
+
+# Rows ANALYZE may sample per index, which keeps it quick on large tables.
+_ANALYSIS_LIMIT = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class DbStorageStats:
+    """Page and WAL usage of the database file."""
+
+    page_size: int
+    page_count: int
+    freelist_count: int
+    wal_bytes: int
+    auto_vacuum: int
+
+    @property
+    def free_ratio(self) -> float:
+        """Share of the file's pages that are unused."""
+        return self.freelist_count / self.page_count if self.page_count else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class CheckpointResult:
+    """Outcome of one ``wal_checkpoint(TRUNCATE)``."""
+
+    busy: bool
+    wal_frames: int
+    checkpointed_frames: int
+
+
+class SqliteMaintenance:
+    """Run SQLite maintenance statements on the writer engine.
+
+    Statements run on their own autocommit connection.  With the ``split``
+    storage profile that is the single writer connection, so maintenance
+    waits for the current write batch and holds off the next one instead of
+    racing it for the write lock.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        db_path: Path,
+        *,
+        writer: WriteExecutor | None = None,
+    ) -> None:
+        self._engine = engine
+        self._wal_path = db_path.with_name(f"{db_path.name}-wal")
+        self._in_memory = str(db_path) == ":memory:"
+        self._writer = writer
+
+    @property
+    def pending_writes(self) -> int:
+        """Writes queued on the write executor and not yet picked up."""
+        return self._writer.pending_count if self._writer is not None else 0
+
+    async def stats(self) -> DbStorageStats:
+        async with self._connect() as conn:
+            page_size, page_count, freelist_count, auto_vacuum = [
+                await _pragma_int(conn, name)
+                for name in ("page_size", "page_count", "freelist_count", "auto_vacuum")
+            ]
+        return DbStorageStats(
+            page_size=page_size,
+            page_count=page_count,
+            freelist_count=freelist_count,
+            wal_bytes=self._wal_bytes(),
+            auto_vacuum=auto_vacuum,
+        )
+
+    async def checkpoint(self) -> CheckpointResult:
+        """Copy the WAL into the database and truncate it to zero bytes.
+
+        ``busy`` is set when a reader still needed part of the WAL; the file
+        is then left as is and the next checkpoint retries.
+        """
+        async with self._connect() as conn:
+            row = (await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")).one()
+        busy, wal_frames, checkpointed_frames = (int(value) for value in row)
+        return CheckpointResult(
+            busy=bool(busy), wal_frames=wal_frames, checkpointed_frames=checkpointed_frames
+        )
+
+    async def optimize(self) -> bool:
+        """Refresh query planner statistics.
+
+        Runs a full ``ANALYZE`` the first time, when no statistics exist yet,
+        and the cheaper ``PRAGMA optimize`` afterwards.  Returns whether a
+        full ``ANALYZE`` ran.
+        """
+        async with self._connect() as conn:
+            await conn.exec_driver_sql(f"PRAGMA analysis_limit={_ANALYSIS_LIMIT}")
+            analyzed = await conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if analyzed.first() is None:
+                await conn.exec_driver_sql("ANALYZE")
+                return True
+            await conn.exec_driver_sql("PRAGMA optimize")
+            return False
+
+    async def vacuum(self) -> int:
+        """Return free pages to the file system and report how many were freed.
+
+        Databases in ``auto_vacuum=INCREMENTAL`` mode release their free list
+        with ``PRAGMA incremental_vacuum``.  Older databases created without
+        it are converted by one full ``VACUUM``, after which the task search
+        index is rebuilt because ``VACUUM`` may renumber ``tasks.rowid``.
+        """
+        async with self._connect() as conn:
+            before = await _pragma_int(conn, "freelist_count")
+            if await _pragma_int(conn, "auto_vacuum") == AUTO_VACUUM_INCREMENTAL:
+                raw = await conn.get_raw_connection()
+                # ``incremental_vacuum`` frees one page per step, so the cursor
+                # has to be drained; SQLAlchemy stops after the first step.
+                cursor = await raw.driver_connection.execute("PRAGMA incremental_vacuum")
+                await cursor.fetchall()
+                await cursor.close()
+            else:
+                await conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+                await conn.exec_driver_sql("VACUUM")
+                if await conn.run_sync(task_search_available):
+                    await conn.exec_driver_sql("BEGIN IMMEDIATE")
+                    await conn.run_sync(rebuild_task_search_index)
+                    await conn.exec_driver_sql("COMMIT")
+            after = await _pragma_int(conn, "freelist_count")
+        return max(before - after, 0)
+
+    @contextlib.asynccontextmanager
+    async def _connect(self) -> AsyncIterator[AsyncConnection]:
+        async with self._engine.connect() as conn:
+            yield await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+    def _wal_bytes(self) -> int:
+        if self._in_memory:
+            return 0
+        try:
+            return self._wal_path.stat().st_size
+        except OSError:
+            return 0
+
+
+async def _pragma_int(conn: AsyncConnection, name: str) -> int:
+    return int((await conn.exec_driver_sql(f"PRAGMA {name}")).scalar_one())
+
+
+__all__ = [
+    "AUTO_VACUUM_INCREMENTAL",
+    "CheckpointResult",
+    "DbStorageStats",
+    "SqliteMaintenance",
+]
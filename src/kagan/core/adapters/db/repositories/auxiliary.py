@@ -7,15 +7,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import and_, func, or_
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import col, select
+from sqlmodel import col, delete, select
 
 from kagan.core.adapters.db.schema import (
     AuditEvent,
+    AuditRollup,
     PlannerProposal,
     ProjectRepo,
     Repo,
     Scratch,
+    ScratchpadEntry,
     Session,
     WorkspaceRepo,
 )
@@ -23,7 +26,12 @@ from kagan.core.limits import SCRATCHPAD_LIMIT
 from kagan.core.models.enums import ProposalStatus, ScratchType, SessionStatus, SessionType
 from kagan.core.time import utc_now
 
+# Notes kept in ``scratchpad_entries`` before they are folded into the snapshot.
+_SCRATCHPAD_FOLD_ENTRIES = 64
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from kagan.core.adapters.db.repositories.base import ClosingAwareSessionFactory
@@ -34,10 +42,9 @@ class AuditRepository:
 
     def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
 
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
 
     async def record(
         self,
@@ -52,21 +59,32 @@ class AuditRepository:
         success: bool = True,
     ) -> AuditEvent:
         """Create and persist an audit event row."""
-        async with self._lock:
-            async with self._get_session() as session:
-                event = AuditEvent(
-                    actor_type=actor_type,
-                    actor_id=actor_id,
-                    session_id=session_id,
-                    capability=capability,
-                    command_name=command_name,
-                    payload_json=payload_json,
-                    result_json=result_json,
-                    success=success,
-                )
-                session.add(event)
-                await session.commit()
-                return event
+
+        async def _record(session: AsyncSession) -> AuditEvent:
+            event = AuditEvent(
+                actor_type=actor_type,
+                actor_id=actor_id,
+                session_id=session_id,
+                capability=capability,
+                command_name=command_name,
+                payload_json=payload_json,
+                result_json=result_json,
+                success=success,
+            )
+            session.add(event)
+            return event
+
+        return await self._session_factory.write(_record)
+
+    async def record_many(self, events: Sequence[AuditEvent]) -> None:
+        """Persist pre-built audit event rows in a single transaction."""
+        if not events:
+            return
+
+        async def _record_many(session: AsyncSession) -> None:
+            session.add_all(events)
+
+        await self._session_factory.write(_record_many)
 
     async def list_events(
         self,
@@ -75,89 +93,250 @@ class AuditRepository:
         limit: int = 50,
         cursor: str | None = None,
     ) -> list[AuditEvent]:
-        """List audit events with optional filter and cursor pagination."""
-        async with self._get_session() as session:
+        """List audit events with optional filter and cursor pagination.
+
+        ``cursor`` is either a value from :meth:`cursor_for` or, for older
+        callers, a bare ISO timestamp.
+        """
+        async with self._get_read_session() as session:
             stmt = select(AuditEvent)
 
             if capability is not None:
                 stmt = stmt.where(AuditEvent.capability == capability)
 
             if cursor is not None:
-                cursor_dt = datetime.fromisoformat(cursor)
-                stmt = stmt.where(col(AuditEvent.occurred_at) < cursor_dt)
+                cursor_iso, _, cursor_id = cursor.partition("|")
+                cursor_dt = datetime.fromisoformat(cursor_iso)
+                if cursor_id:
+                    stmt = stmt.where(
+                        or_(
+                            col(AuditEvent.occurred_at) < cursor_dt,
+                            and_(
+                                col(AuditEvent.occurred_at) == cursor_dt,
+                                col(AuditEvent.id) < cursor_id,
+                            ),
+                        )
+                    )
+                else:
+                    stmt = stmt.where(col(AuditEvent.occurred_at) < cursor_dt)
+
+            stmt = stmt.order_by(
+                col(AuditEvent.occurred_at).desc(), col(AuditEvent.id).desc()
+            ).limit(limit)
+
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
+    @staticmethod
+    def cursor_for(event: AuditEvent) -> str:
+        """Return the ``list_events`` cursor that resumes after *event*."""
+        return f"{event.occurred_at.isoformat()}|{event.id}"
+
+    async def count_events(self) -> int:
+        """Return the number of stored audit events."""
+        async with self._get_read_session() as session:
+            result = await session.execute(select(func.count()).select_from(AuditEvent))
+            return int(result.scalar_one())
+
+    async def list_oldest_events(
+        self,
+        *,
+        limit: int,
+        before: datetime | None = None,
+    ) -> list[AuditEvent]:
+        """List the oldest audit events, optionally only those older than *before*."""
+        async with self._get_read_session() as session:
+            stmt = select(AuditEvent)
+            if before is not None:
+                stmt = stmt.where(col(AuditEvent.occurred_at) < before)
+            stmt = stmt.order_by(col(AuditEvent.occurred_at), col(AuditEvent.id)).limit(limit)
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
 
-            stmt = stmt.order_by(col(AuditEvent.occurred_at).desc()).limit(limit)
+    async def prune_events(
+        self,
+        event_ids: Sequence[str],
+        *,
+        rollups: Sequence[AuditRollup] = (),
+    ) -> int:
+        """Delete audit events and fold *rollups* into stored counters atomically."""
+        if not event_ids:
+            return 0
+
+        async def _prune(session: AsyncSession) -> int:
+            for rollup in rollups:
+                existing = (
+                    await session.execute(
+                        select(AuditRollup).where(
+                            AuditRollup.bucket_start == rollup.bucket_start,
+                            AuditRollup.capability == rollup.capability,
+                            AuditRollup.command_name == rollup.command_name,
+                        )
+                    )
+                ).scalar_one_or_none()
+                if existing is None:
+                    session.add(rollup)
+                else:
+                    existing.count += rollup.count
+                    existing.failure_count += rollup.failure_count
+                    session.add(existing)
+            result = await session.execute(
+                delete(AuditEvent).where(col(AuditEvent.id).in_(list(event_ids)))
+            )
+            return int(result.rowcount or 0)
+
+        return await self._session_factory.write(_prune)
 
+    async def list_rollups(
+        self,
+        *,
+        capability: str | None = None,
+        limit: int = 500,
+    ) -> list[AuditRollup]:
+        """List per-minute rollups, newest bucket first."""
+        async with self._get_read_session() as session:
+            stmt = select(AuditRollup)
+            if capability is not None:
+                stmt = stmt.where(AuditRollup.capability == capability)
+            stmt = stmt.order_by(
+                col(AuditRollup.bucket_start).desc(),
+                col(AuditRollup.capability),
+                col(AuditRollup.command_name),
+            ).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
 
 class ScratchRepository:
-    """Scratchpad repository."""
+    """Scratchpad repository.
+
+    A scratchpad is its ``scratches`` snapshot followed by the notes appended
+    to ``scratchpad_entries`` since.  Appending writes only the new note;
+    reads assemble the newest notes and keep the last ``SCRATCHPAD_LIMIT``
+    characters.  Once a task has ``_SCRATCHPAD_FOLD_ENTRIES`` notes they are
+    folded into the snapshot, so a read never scans more than that many.
+    """
 
     def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
 
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
-
-    async def get_scratchpad(self, task_id: str) -> str:
-        """Get scratchpad content for a task."""
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(Scratch).where(
-                    Scratch.id == task_id,
-                    Scratch.scratch_type == ScratchType.WORKSPACE_NOTES,
-                )
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
+
+    async def get_scratchpad(self, task_id: str, *, max_chars: int = SCRATCHPAD_LIMIT) -> str:
+        """Get the last ``max_chars`` characters of a task's scratchpad."""
+        async with self._get_read_session() as session:
+            return await self._read_tail(session, task_id, max_chars)
+
+    async def append_scratchpad(self, task_id: str, text: str, *, separator: str = "") -> None:
+        """Append a note; ``separator`` is put in front unless the scratchpad is empty."""
+
+        async def _append(session: AsyncSession) -> None:
+            content = text
+            if separator and await self._has_content(session, task_id):
+                content = separator + text
+            session.add(ScratchpadEntry(task_id=task_id, content=content))
+            await session.flush()
+            entries = await session.scalar(
+                select(func.count())
+                .select_from(ScratchpadEntry)
+                .where(ScratchpadEntry.task_id == task_id)
             )
-            scratchpad = result.scalars().first()
-            if not scratchpad:
-                return ""
-            payload = scratchpad.payload or {}
-            return str(payload.get("content", ""))
+            if (entries or 0) >= _SCRATCHPAD_FOLD_ENTRIES:
+                tail = await self._read_tail(session, task_id, SCRATCHPAD_LIMIT)
+                await self._write_snapshot(session, task_id, tail)
+
+        await self._session_factory.write(_append)
 
     async def update_scratchpad(self, task_id: str, content: str) -> None:
-        """Update or create scratchpad content."""
+        """Replace the whole scratchpad content."""
         content = content[-SCRATCHPAD_LIMIT:] if len(content) > SCRATCHPAD_LIMIT else content
 
-        async with self._lock:
-            async with self._get_session() as session:
-                result = await session.execute(
-                    select(Scratch).where(
-                        Scratch.id == task_id,
-                        Scratch.scratch_type == ScratchType.WORKSPACE_NOTES,
-                    )
-                )
-                scratchpad = result.scalars().first()
-                if scratchpad:
-                    scratchpad.payload = {"content": content}
-                    scratchpad.updated_at = utc_now()
-                else:
-                    scratchpad = Scratch(
-                        id=task_id,
-                        scratch_type=ScratchType.WORKSPACE_NOTES,
-                        payload={"content": content},
-                    )
-                    scratchpad.created_at = utc_now()
-                    scratchpad.updated_at = utc_now()
-                session.add(scratchpad)
-                await session.commit()
+        async def _update(session: AsyncSession) -> None:
+            await self._write_snapshot(session, task_id, content)
+
+        await self._session_factory.write(_update)
 
     async def delete_scratchpad(self, task_id: str) -> None:
         """Delete scratchpad for a task."""
-        async with self._lock:
-            async with self._get_session() as session:
-                result = await session.execute(
-                    select(Scratch).where(
-                        Scratch.id == task_id,
-                        Scratch.scratch_type == ScratchType.WORKSPACE_NOTES,
-                    )
-                )
-                scratchpad = result.scalars().first()
-                if scratchpad:
-                    await session.delete(scratchpad)
-                    await session.commit()
+
+        async def _delete(session: AsyncSession) -> None:
+            await session.execute(
+                delete(ScratchpadEntry).where(col(ScratchpadEntry.task_id) == task_id)
+            )
+            scratchpad = await self._snapshot(session, task_id)
+            if scratchpad:
+                await session.delete(scratchpad)
+
+        await self._session_factory.write(_delete)
+
+    @staticmethod
+    async def _snapshot(session: AsyncSession, task_id: str) -> Scratch | None:
+        result = await session.execute(
+            select(Scratch).where(
+                Scratch.id == task_id,
+                Scratch.scratch_type == ScratchType.WORKSPACE_NOTES,
+            )
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def _has_content(session: AsyncSession, task_id: str) -> bool:
+        entry = await session.scalar(
+            select(ScratchpadEntry.id).where(ScratchpadEntry.task_id == task_id).limit(1)
+        )
+        if entry is not None:
+            return True
+        snapshot = await session.scalar(
+            select(func.json_extract(Scratch.payload, "$.content")).where(
+                Scratch.id == task_id,
+                Scratch.scratch_type == ScratchType.WORKSPACE_NOTES,
+            )
+        )
+        return bool(snapshot)
+
+    async def _read_tail(self, session: AsyncSession, task_id: str, max_chars: int) -> str:
+        """Assemble the last ``max_chars`` characters, reading only the notes needed."""
+        running = (
+            func.sum(func.length(ScratchpadEntry.content))
+            .over(order_by=col(ScratchpadEntry.id).desc())
+            .label("running")
+        )
+        ranked = (
+            select(ScratchpadEntry.id, ScratchpadEntry.content, running)
+            .where(ScratchpadEntry.task_id == task_id)
+            .subquery()
+        )
+        result = await session.execute(
+            select(ranked.c.content)
+            .where(ranked.c.running - func.length(ranked.c.content) < max_chars)
+            .order_by(ranked.c.id)
+        )
+        content = "".join(result.scalars())
+        if len(content) < max_chars:
+            snapshot = await self._snapshot(session, task_id)
+            if snapshot is not None:
+                content = str((snapshot.payload or {}).get("content", "")) + content
+        return content[-max_chars:] if len(content) > max_chars else content
+
+    async def _write_snapshot(self, session: AsyncSession, task_id: str, content: str) -> None:
+        """Replace the snapshot and drop the notes it now contains."""
+        await session.execute(
+            delete(ScratchpadEntry).where(col(ScratchpadEntry.task_id) == task_id)
+        )
+        scratchpad = await self._snapshot(session, task_id)
+        if scratchpad:
+            scratchpad.payload = {"content": content}
+            scratchpad.updated_at = utc_now()
+        else:
+            scratchpad = Scratch(
+                id=task_id,
+                scratch_type=ScratchType.WORKSPACE_NOTES,
+                payload={"content": content},
+            )
+            scratchpad.created_at = utc_now()
+            scratchpad.updated_at = utc_now()
+        session.add(scratchpad)
 
 
 class SessionRecordRepository:
@@ -165,10 +344,6 @@ class SessionRecordRepository:
 
     def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
-
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
 
     async def create_session_record(
         self,
@@ -178,19 +353,20 @@ class SessionRecordRepository:
         external_id: str | None = None,
     ) -> Session:
         """Create a session record."""
-        async with self._lock:
-            async with self._get_session() as session:
-                record = Session(
-                    workspace_id=workspace_id,
-                    session_type=session_type,
-                    status=SessionStatus.ACTIVE,
-                    external_id=external_id,
-                    started_at=utc_now(),
-                    ended_at=None,
-                )
-                session.add(record)
-                await session.commit()
-                return record
+
+        async def _create(session: AsyncSession) -> Session:
+            record = Session(
+                workspace_id=workspace_id,
+                session_type=session_type,
+                status=SessionStatus.ACTIVE,
+                external_id=external_id,
+                started_at=utc_now(),
+                ended_at=None,
+            )
+            session.add(record)
+            return record
+
+        return await self._session_factory.write(_create)
 
     async def close_session_record(
         self,
@@ -199,16 +375,17 @@ class SessionRecordRepository:
         status: SessionStatus = SessionStatus.CLOSED,
     ) -> Session | None:
         """Close a session record."""
-        async with self._lock:
-            async with self._get_session() as session:
-                record = await session.get(Session, session_id)
-                if record is None:
-                    return None
-                record.status = status
-                record.ended_at = utc_now()
-                session.add(record)
-                await session.commit()
-                return record
+
+        async def _close(session: AsyncSession) -> Session | None:
+            record = await session.get(Session, session_id)
+            if record is None:
+                return None
+            record.status = status
+            record.ended_at = utc_now()
+            session.add(record)
+            return record
+
+        return await self._session_factory.write(_close)
 
     async def close_session_by_external_id(
         self,
@@ -217,19 +394,20 @@ class SessionRecordRepository:
         status: SessionStatus = SessionStatus.CLOSED,
     ) -> Session | None:
         """Close a session record by external ID."""
-        async with self._lock:
-            async with self._get_session() as session:
-                result = await session.execute(
-                    select(Session).where(Session.external_id == external_id)
-                )
-                record = result.scalars().first()
-                if record is None:
-                    return None
-                record.status = status
-                record.ended_at = utc_now()
-                session.add(record)
-                await session.commit()
-                return record
+
+        async def _close(session: AsyncSession) -> Session | None:
+            result = await session.execute(
+                select(Session).where(Session.external_id == external_id)
+            )
+            record = result.scalars().first()
+            if record is None:
+                return None
+            record.status = status
+            record.ended_at = utc_now()
+            session.add(record)
+            return record
+
+        return await self._session_factory.write(_close)
 
 
 class PlannerRepository:
@@ -237,10 +415,9 @@ class PlannerRepository:
 
     def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
 
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
 
     async def save_proposal(
         self,
@@ -251,22 +428,23 @@ class PlannerRepository:
         todos_json: list[dict[str, Any]] | None = None,
     ) -> PlannerProposal:
         """Create and persist a new draft proposal."""
-        async with self._lock:
-            async with self._get_session() as session:
-                proposal = PlannerProposal(
-                    project_id=project_id,
-                    repo_id=repo_id,
-                    tasks_json=tasks_json,
-                    todos_json=todos_json or [],
-                    status=ProposalStatus.DRAFT,
-                )
-                session.add(proposal)
-                await session.commit()
-                return proposal
+
+        async def _save(session: AsyncSession) -> PlannerProposal:
+            proposal = PlannerProposal(
+                project_id=project_id,
+                repo_id=repo_id,
+                tasks_json=tasks_json,
+                todos_json=todos_json or [],
+                status=ProposalStatus.DRAFT,
+            )
+            session.add(proposal)
+            return proposal
+
+        return await self._session_factory.write(_save)
 
     async def get_proposal(self, proposal_id: str) -> PlannerProposal | None:
         """Fetch a single proposal by ID."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             return await session.get(PlannerProposal, proposal_id)
 
     async def list_pending(
@@ -276,7 +454,7 @@ class PlannerRepository:
         repo_id: str | None = None,
     ) -> list[PlannerProposal]:
         """List draft proposals for a project, optionally filtered by repo."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             stmt = select(PlannerProposal).where(
                 PlannerProposal.project_id == project_id,
                 PlannerProposal.status == ProposalStatus.DRAFT,
@@ -293,27 +471,29 @@ class PlannerRepository:
         status: ProposalStatus,
     ) -> PlannerProposal | None:
         """Transition a proposal to a new status."""
-        async with self._lock:
-            async with self._get_session() as session:
-                proposal = await session.get(PlannerProposal, proposal_id)
-                if proposal is None:
-                    return None
-                proposal.status = status
-                proposal.updated_at = utc_now()
-                session.add(proposal)
-                await session.commit()
-                return proposal
+
+        async def _update(session: AsyncSession) -> PlannerProposal | None:
+            proposal = await session.get(PlannerProposal, proposal_id)
+            if proposal is None:
+                return None
+            proposal.status = status
+            proposal.updated_at = utc_now()
+            session.add(proposal)
+            return proposal
+
+        return await self._session_factory.write(_update)
 
     async def delete_proposal(self, proposal_id: str) -> bool:
         """Delete a proposal by ID. Returns True if deleted."""
-        async with self._lock:
-            async with self._get_session() as session:
-                proposal = await session.get(PlannerProposal, proposal_id)
-                if proposal is None:
-                    return False
-                await session.delete(proposal)
-                await session.commit()
-                return True
+
+        async def _delete(session: AsyncSession) -> bool:
+            proposal = await session.get(PlannerProposal, proposal_id)
+            if proposal is None:
+                return False
+            await session.delete(proposal)
+            return True
+
+        return await self._session_factory.write(_delete)
 
 
 class RepoRepository:
@@ -327,6 +507,9 @@ class RepoRepository:
         """Get a new async session."""
         return self._session_factory()
 
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
+
     async def create(
         self,
         path: str | Path,
@@ -351,13 +534,13 @@ class RepoRepository:
 
     async def get(self, repo_id: str) -> Repo | None:
         """Get a repo by ID."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             return await session.get(Repo, repo_id)
 
     async def get_by_path(self, path: str | Path) -> Repo | None:
         """Find a repo by its filesystem path."""
         resolved_path = str(Path(path).resolve())
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(select(Repo).where(Repo.path == resolved_path))
             return result.scalars().first()
 
@@ -381,7 +564,7 @@ class RepoRepository:
 
     async def list_for_project(self, project_id: str) -> list[Repo]:
         """List all repos for a project via junction table."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(Repo)
                 .join(ProjectRepo, col(ProjectRepo.repo_id) == col(Repo.id))
@@ -392,7 +575,7 @@ class RepoRepository:
 
     async def list_for_workspace(self, workspace_id: str) -> list[WorkspaceRepo]:
         """List all workspace-repo associations for a workspace."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(WorkspaceRepo).where(WorkspaceRepo.workspace_id == workspace_id)
             )
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+from kagan.core.adapters.db.write_executor import WriteExecutor
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+T = TypeVar("T")
+
 
 class RepositoryClosing(Exception):
     """Raised when a DB operation is attempted during repository shutdown."""
 
 
 class ClosingAwareSessionFactory:
-    """Wrapper around ``async_sessionmaker`` with a shared closing flag."""
+    """Wrapper around ``async_sessionmaker`` with a shared closing flag.
+
+    Calling the factory yields a read-write session.  When a ``reader``
+    sessionmaker is supplied, :meth:`read` hands out sessions from that
+    separate read-only pool so queries do not wait for the writer connection.
+    :meth:`write` runs an operation through the shared :class:`WriteExecutor`,
+    which serializes and group-commits writes from every repository.
+    """
 
-    def __init__(self, inner: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        inner: async_sessionmaker[AsyncSession],
+        *,
+        reader: async_sessionmaker[AsyncSession] | None = None,
+        writer: WriteExecutor | None = None,
+    ) -> None:
         self._inner = inner
+        self._reader = reader
+        self._writer = writer or WriteExecutor(inner)
         self._closing = False
 
     def mark_closing(self) -> None:
@@ -30,3 +51,24 @@ class ClosingAwareSessionFactory:
         if self._closing:
             raise RepositoryClosing("Repository is shutting down")
         return self._inner()
+
+    def read(self) -> AsyncSession:
+        """Return a session for queries only; falls back to the writer pool."""
+        if self._closing:
+            raise RepositoryClosing("Repository is shutting down")
+        if self._reader is None:
+            return self._inner()
+        return self._reader()
+
+    @property
+    def writer(self) -> WriteExecutor:
+        return self._writer
+
+    async def write(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run *operation* in a write transaction and return its committed result.
+
+        The operation must not commit; see :class:`WriteExecutor`.
+        """
+        if self._closing:
+            raise RepositoryClosing("Repository is shutting down")
+        return await self._writer.submit(operation)
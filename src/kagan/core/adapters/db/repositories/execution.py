@@ -3,39 +3,258 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func
+from sqlalchemy import case, delete, func, insert, literal, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import col, select
 
 from kagan.core.adapters.db.schema import (
     CodingAgentTurn,
+    ExecutionLogChunk,
     ExecutionProcess,
     ExecutionProcessLog,
     ExecutionProcessRepoState,
     Session,
+    TaskExecutionSummary,
     Workspace,
 )
-from kagan.core.models.enums import ExecutionRunReason, ExecutionStatus
+from kagan.core.adapters.execution_logs import (
+    LogSpan,
+    decode_log_payload,
+    encode_log_payload,
+)
+from kagan.core.instrumentation import increment_counter, record_timing
+from kagan.core.models.enums import ExecutionRunReason, ExecutionStatus, MessageType
 from kagan.core.time import utc_now
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
 
+    from sqlalchemy import ColumnElement, Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from kagan.core.adapters.db.repositories.base import ClosingAwareSessionFactory
+    from kagan.core.adapters.execution_logs import SegmentedLogStore
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionLogEntry:
+    """One chunk of an execution's log stream and its byte range in it."""
+
+    id: str
+    execution_process_id: str
+    logs: str
+    byte_size: int
+    offset: int
+    inserted_at: datetime
+
+    @property
+    def end_offset(self) -> int:
+        return self.offset + self.byte_size
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionLogCompaction:
+    """Entry counts and payload bytes of an execution log before/after compaction."""
+
+    entries_before: int
+    entries_after: int
+    bytes_before: int
+    bytes_after: int
+
+
+_TOOL_CALL_TYPES = frozenset({MessageType.TOOL_CALL, MessageType.TOOL_CALL_UPDATE})
+
+
+def _log_messages(payload: str) -> list[dict[str, Any]] | None:
+    """Return the messages of a ``{"messages": [...]}`` payload, else ``None``."""
+    try:
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or set(data) != {"messages"}:
+        return None
+    messages = data["messages"]
+    if not isinstance(messages, list) or not all(isinstance(m, dict) for m in messages):
+        return None
+    return messages
+
+
+def _plan_log_compaction(
+    payloads: Sequence[str], kinds: Sequence[str]
+) -> list[tuple[list[int], str]]:
+    """Return ``(indexes, merged payload)`` for each run of payloads to merge.
+
+    Consecutive message payloads of the same kind are merged, except the last
+    payload, which is left alone (the review modal shows it as the review
+    output).  A ``tool_call_update`` is dropped when a later message carries
+    the same tool call ID: every update holds the full tool call state and
+    renders by ID.  The first mention of each ID is kept so tool calls keep
+    their position.
+    """
+    parsed = [_log_messages(payload) for payload in payloads]
+    first_seen: dict[str, tuple[int, int]] = {}
+    last_seen: dict[str, tuple[int, int]] = {}
+    for index, messages in enumerate(parsed):
+        for position, message in enumerate(messages or ()):
+            tool_call_id = message.get("id")
+            if message.get("type") in _TOOL_CALL_TYPES and isinstance(tool_call_id, str):
+                first_seen.setdefault(tool_call_id, (index, position))
+                last_seen[tool_call_id] = (index, position)
+
+    def _is_kept(message: dict[str, Any], where: tuple[int, int]) -> bool:
+        if message.get("type") != MessageType.TOOL_CALL_UPDATE:
+            return True
+        tool_call_id = message.get("id")
+        return where in (first_seen.get(tool_call_id), last_seen.get(tool_call_id))
+
+    kept = [
+        None
+        if messages is None
+        else [m for position, m in enumerate(messages) if _is_kept(m, (index, position))]
+        for index, messages in enumerate(parsed)
+    ]
+    plan: list[tuple[list[int], str]] = []
+
+    def _close(run: list[int]) -> None:
+        if len(run) > 1 or any(len(kept[i] or ()) != len(parsed[i] or ()) for i in run):
+            merged = [message for i in run for message in kept[i] or ()]
+            plan.append((run, json.dumps({"messages": merged})))
+
+    run: list[int] = []
+    for index in range(len(payloads) - 1):
+        if kept[index] is not None and run and kinds[index] == kinds[run[0]]:
+            run.append(index)
+            continue
+        _close(run)
+        run = [] if kept[index] is None else [index]
+    _close(run)
+    return plan
 
 
 class ExecutionRepository:
-    """Execution-process repository."""
-
-    def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
+    """Execution-process repository.
+
+    Every write that creates an execution or changes its status also updates
+    the task's ``TaskExecutionSummary`` in the same transaction, so per-task
+    lookups avoid joining through sessions and workspaces.
+
+    With a ``log_store``, execution log chunks are appended to its segment
+    files and only their offsets are indexed in ``execution_log_chunks``;
+    without one they are stored inline in ``execution_process_logs``.  Reads
+    return both kinds as one stream.  Payloads of at least
+    ``compress_min_bytes`` are stored compressed (0 disables compression);
+    offsets and ``byte_size`` of segment chunks count stored bytes.
+    ``compact_execution_logs`` merges a finished execution's entries.
+    """
+
+    def __init__(
+        self,
+        session_factory: ClosingAwareSessionFactory,
+        *,
+        log_store: SegmentedLogStore | None = None,
+        compress_min_bytes: int = 0,
+    ) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
-
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
+        self._log_store = log_store
+        self._compress_min_bytes = compress_min_bytes
+        self._compaction_lock = asyncio.Lock()
+
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
+
+    @staticmethod
+    def _session_task_id(session_id: str) -> Select[tuple[str | None]]:
+        return (
+            select(Workspace.task_id)
+            .join(Session, col(Session.workspace_id) == col(Workspace.id))
+            .where(Session.id == session_id, col(Workspace.task_id).is_not(None))
+        )
+
+    async def _record_created(self, session: AsyncSession, execution: ExecutionProcess) -> None:
+        """Point the task's summary at a new execution with one upsert."""
+        summary = TaskExecutionSummary
+        running_id = execution.id if execution.status == ExecutionStatus.RUNNING else None
+        rows = self._session_task_id(execution.session_id).add_columns(
+            literal(execution.id),
+            literal(execution.status, col(summary.last_status).type),
+            literal(1),
+            literal(running_id, col(summary.running_execution_id).type),
+            literal(utc_now(), col(summary.updated_at).type),
+        )
+        upsert = sqlite_insert(summary).from_select(
+            [
+                "task_id",
+                "latest_execution_id",
+                "last_status",
+                "execution_count",
+                "running_execution_id",
+                "updated_at",
+            ],
+            rows,
+        )
+        await session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=["task_id"],
+                set_={
+                    "latest_execution_id": upsert.excluded.latest_execution_id,
+                    "last_status": upsert.excluded.last_status,
+                    "execution_count": col(summary.execution_count) + 1,
+                    "running_execution_id": func.coalesce(
+                        upsert.excluded.running_execution_id, col(summary.running_execution_id)
+                    ),
+                    "updated_at": upsert.excluded.updated_at,
+                },
+            )
+        )
+
+    async def _record_status(self, session: AsyncSession, execution: ExecutionProcess) -> None:
+        """Apply an execution's new status to its task's summary in one UPDATE."""
+        summary = TaskExecutionSummary
+        latest_running = (
+            select(ExecutionProcess.id)
+            .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
+            .join(Workspace, col(Session.workspace_id) == col(Workspace.id))
+            .where(
+                col(Workspace.task_id) == col(summary.task_id),
+                ExecutionProcess.status == ExecutionStatus.RUNNING,
+            )
+            .order_by(col(ExecutionProcess.created_at).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        running_id = (
+            latest_running
+            if execution.status == ExecutionStatus.RUNNING
+            else case(
+                (col(summary.running_execution_id) == execution.id, latest_running),
+                else_=col(summary.running_execution_id),
+            )
+        )
+        await session.execute(
+            update(summary)
+            .where(
+                col(summary.task_id)
+                == self._session_task_id(execution.session_id).scalar_subquery()
+            )
+            .values(
+                last_status=case(
+                    (
+                        col(summary.latest_execution_id) == execution.id,
+                        literal(execution.status, col(summary.last_status).type),
+                    ),
+                    else_=col(summary.last_status),
+                ),
+                running_execution_id=running_id,
+                updated_at=utc_now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
     async def create_execution(
         self,
@@ -46,100 +265,496 @@ class ExecutionRepository:
         metadata: dict[str, Any] | None = None,
     ) -> ExecutionProcess:
         """Create a new execution process."""
-        async with self._lock:
-            async with self._get_session() as session:
-                execution = ExecutionProcess(
-                    session_id=session_id,
-                    run_reason=run_reason,
-                    executor_action=executor_action or {},
-                    status=ExecutionStatus.RUNNING,
-                    metadata_=metadata or {},
-                    started_at=utc_now(),
-                    created_at=utc_now(),
-                    updated_at=utc_now(),
-                )
-                session.add(execution)
-                await session.commit()
-                await session.refresh(execution)
-                return execution
+
+        async def _create(session: AsyncSession) -> ExecutionProcess:
+            execution = ExecutionProcess(
+                session_id=session_id,
+                run_reason=run_reason,
+                executor_action=executor_action or {},
+                status=ExecutionStatus.RUNNING,
+                metadata_=metadata or {},
+                started_at=utc_now(),
+                created_at=utc_now(),
+                updated_at=utc_now(),
+            )
+            session.add(execution)
+            await session.flush()
+            await self._record_created(session, execution)
+            return execution
+
+        return await self._session_factory.write(_create)
 
     async def update_execution(self, execution_id: str, **kwargs: Any) -> ExecutionProcess | None:
-        """Update an execution process."""
-        async with self._lock:
-            async with self._get_session() as session:
-                execution = await session.get(ExecutionProcess, execution_id)
-                if not execution:
-                    return None
-
-                update_data = {k: v for k, v in kwargs.items() if v is not None}
-                if "metadata" in update_data and "metadata_" not in update_data:
-                    update_data["metadata_"] = update_data.pop("metadata")
-                if update_data:
-                    execution.sqlmodel_update(update_data)
-                execution.updated_at = utc_now()
-
-                session.add(execution)
-                await session.commit()
-                await session.refresh(execution)
-                return execution
-
-    async def append_execution_log(self, execution_id: str, log_line: str) -> ExecutionProcessLog:
-        """Append a JSONL log line for an execution."""
-        async with self._lock:
-            async with self._get_session() as session:
-                log_entry = ExecutionProcessLog(
+        """Update an execution process with one ``UPDATE ... RETURNING``."""
+        update_data = {k: v for k, v in kwargs.items() if v is not None}
+        if "metadata" in update_data and "metadata_" not in update_data:
+            update_data["metadata_"] = update_data.pop("metadata")
+
+        async def _update(session: AsyncSession) -> ExecutionProcess | None:
+            result = await session.execute(
+                update(ExecutionProcess)
+                .where(col(ExecutionProcess.id) == execution_id)
+                .values({**update_data, "updated_at": utc_now()})
+                .returning(ExecutionProcess)
+                .execution_options(populate_existing=True)
+            )
+            execution = result.scalar_one_or_none()
+            if execution is None:
+                return None
+            if "status" in update_data:
+                await self._record_status(session, execution)
+            return execution
+
+        return await self._session_factory.write(_update)
+
+    async def append_execution_log(self, execution_id: str, log_line: str) -> ExecutionLogEntry:
+        """Append a JSONL log chunk for an execution."""
+        stored = encode_log_payload(log_line, min_bytes=self._compress_min_bytes)
+        if self._log_store is None:
+            return await self._append_inline_log(execution_id, log_line, stored)
+
+        span = await asyncio.to_thread(self._log_store.append, execution_id, stored.encode())
+
+        async def _index(session: AsyncSession) -> ExecutionLogEntry:
+            inserted_at = utc_now()
+            result = await session.execute(
+                insert(ExecutionLogChunk)
+                .values(
                     execution_process_id=execution_id,
-                    logs=log_line,
-                    byte_size=len(log_line.encode("utf-8")),
-                    inserted_at=utc_now(),
+                    offset=self._log_end_offset_expr(execution_id),
+                    segment=span.segment,
+                    position=span.position,
+                    byte_size=span.length,
+                    inserted_at=inserted_at,
                 )
-                session.add(log_entry)
-                await session.commit()
-                await session.refresh(log_entry)
-                return log_entry
+                .returning(ExecutionLogChunk.id, ExecutionLogChunk.offset)
+            )
+            chunk_id, offset = result.one()
+            return ExecutionLogEntry(
+                id=chunk_id,
+                execution_process_id=execution_id,
+                logs=log_line,
+                byte_size=span.length,
+                offset=offset,
+                inserted_at=inserted_at,
+            )
 
-    async def get_execution_logs(self, execution_id: str) -> ExecutionProcessLog | None:
-        """Return aggregated execution logs for an execution."""
-        async with self._get_session() as session:
+        return await self._session_factory.write(_index)
+
+    async def _append_inline_log(
+        self, execution_id: str, log_line: str, stored: str
+    ) -> ExecutionLogEntry:
+        byte_size = len(log_line.encode("utf-8"))
+
+        # RETURNING sees the row just inserted, so this chunk's own size is
+        # taken off the inline total to get its offset.
+        async def _append(session: AsyncSession) -> ExecutionLogEntry:
+            inserted_at = utc_now()
             result = await session.execute(
-                select(ExecutionProcessLog)
-                .where(ExecutionProcessLog.execution_process_id == execution_id)
-                .order_by(
-                    col(ExecutionProcessLog.inserted_at).asc(),
-                    col(ExecutionProcessLog.id).asc(),
+                insert(ExecutionProcessLog)
+                .values(
+                    execution_process_id=execution_id,
+                    logs=stored,
+                    byte_size=byte_size,
+                    inserted_at=inserted_at,
+                )
+                .returning(
+                    ExecutionProcessLog.id,
+                    self._log_end_offset_expr(execution_id, uncounted_bytes=byte_size),
                 )
             )
-            entries = result.scalars().all()
-            if not entries:
-                return None
+            log_id, offset = result.one()
+            return ExecutionLogEntry(
+                id=log_id,
+                execution_process_id=execution_id,
+                logs=log_line,
+                byte_size=byte_size,
+                offset=offset,
+                inserted_at=inserted_at,
+            )
+
+        return await self._session_factory.write(_append)
+
+    @staticmethod
+    def _log_end_offset_expr(execution_id: str, *, uncounted_bytes: int = 0) -> ColumnElement[int]:
+        """SQL for the end of an execution's log stream, as one expression.
+
+        The end of the last chunk, or else the total size of the inline
+        rows less ``uncounted_bytes``.
+        """
+        last_chunk_end = (
+            select(col(ExecutionLogChunk.offset) + col(ExecutionLogChunk.byte_size))
+            .where(ExecutionLogChunk.execution_process_id == execution_id)
+            .order_by(col(ExecutionLogChunk.offset).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        inline_bytes = (
+            select(func.coalesce(func.sum(ExecutionProcessLog.byte_size), 0))
+            .where(ExecutionProcessLog.execution_process_id == execution_id)
+            .scalar_subquery()
+        )
+        return func.coalesce(last_chunk_end, inline_bytes - uncounted_bytes)
+
+    @staticmethod
+    async def _log_end_offset(session: AsyncSession, execution_id: str) -> int:
+        end = await session.scalar(select(ExecutionRepository._log_end_offset_expr(execution_id)))
+        return int(end or 0)
+
+    @staticmethod
+    async def _inline_log_entries(
+        session: AsyncSession, execution_id: str
+    ) -> list[ExecutionLogEntry]:
+        result = await session.execute(
+            select(ExecutionProcessLog)
+            .where(ExecutionProcessLog.execution_process_id == execution_id)
+            .order_by(
+                col(ExecutionProcessLog.inserted_at).asc(),
+                col(ExecutionProcessLog.id).asc(),
+            )
+        )
+        entries: list[ExecutionLogEntry] = []
+        offset = 0
+        for row in result.scalars().all():
+            entries.append(
+                ExecutionLogEntry(
+                    id=row.id,
+                    execution_process_id=execution_id,
+                    logs=row.logs,
+                    byte_size=row.byte_size,
+                    offset=offset,
+                    inserted_at=row.inserted_at,
+                )
+            )
+            offset += row.byte_size
+        return entries
+
+    @staticmethod
+    async def _tail_start_offset(
+        session: AsyncSession, execution_id: str, tail_bytes: int, inline_end: int
+    ) -> int:
+        """Return the offset of the first chunk overlapping the last ``tail_bytes``."""
+        end = await ExecutionRepository._log_end_offset(session, execution_id)
+        threshold = max(end, inline_end) - tail_bytes
+        if threshold <= 0:
+            return threshold
+        start = await session.scalar(
+            select(ExecutionLogChunk.offset)
+            .where(
+                ExecutionLogChunk.execution_process_id == execution_id,
+                col(ExecutionLogChunk.offset) <= threshold,
+            )
+            .order_by(col(ExecutionLogChunk.offset).desc())
+            .limit(1)
+        )
+        return threshold if start is None else start
 
-            combined_logs = "\n".join(entry.logs for entry in entries if entry.logs)
-            total_bytes = sum(entry.byte_size for entry in entries)
-            latest = entries[-1]
-            return ExecutionProcessLog(
-                id=latest.id,
+    async def get_execution_log_entries(
+        self,
+        execution_id: str,
+        *,
+        after_offset: int | None = None,
+        tail_bytes: int | None = None,
+        limit: int | None = None,
+    ) -> list[ExecutionLogEntry]:
+        """Return ordered execution log entries for an execution.
+
+        ``after_offset`` skips entries that start before that stream offset
+        (pass the previous read's ``end_offset`` to fetch only new output).
+        ``tail_bytes`` keeps only the entries overlapping the last that many
+        bytes.  ``limit`` caps the number of entries returned, so long logs
+        can be paged with ``after_offset``.  Segment files are only read for
+        the entries returned.
+        """
+        try:
+            return await self._load_log_entries(
+                execution_id, after_offset=after_offset, tail_bytes=tail_bytes, limit=limit
+            )
+        except FileNotFoundError:
+            # Compaction replaced the segments between the index and file reads.
+            return await self._load_log_entries(
+                execution_id, after_offset=after_offset, tail_bytes=tail_bytes, limit=limit
+            )
+
+    async def _load_log_entries(
+        self,
+        execution_id: str,
+        *,
+        after_offset: int | None,
+        tail_bytes: int | None,
+        limit: int | None,
+    ) -> list[ExecutionLogEntry]:
+        async with self._get_read_session() as session:
+            inline = await self._inline_log_entries(session, execution_id)
+            tail_start = -1
+            if tail_bytes is not None:
+                inline_end = inline[-1].end_offset if inline else 0
+                tail_start = await self._tail_start_offset(
+                    session, execution_id, max(tail_bytes, 1), inline_end
+                )
+            after_offset = max(after_offset or 0, 0)
+            entries = [
+                replace(entry, logs=decode_log_payload(entry.logs))
+                for entry in inline
+                if entry.end_offset > tail_start and entry.offset >= after_offset
+            ][:limit]
+            start = max(tail_start, after_offset)
+            if self._log_store is None or (limit is not None and len(entries) >= limit):
+                return entries
+            stmt = (
+                select(ExecutionLogChunk)
+                .where(
+                    ExecutionLogChunk.execution_process_id == execution_id,
+                    col(ExecutionLogChunk.offset) >= start,
+                )
+                .order_by(col(ExecutionLogChunk.offset).asc())
+            )
+            if limit is not None:
+                stmt = stmt.limit(limit - len(entries))
+            result = await session.execute(stmt)
+            chunks = list(result.scalars().all())
+
+        if not chunks:
+            return entries
+        payloads = await asyncio.to_thread(
+            self._read_log_spans,
+            execution_id,
+            [LogSpan(chunk.segment, chunk.position, chunk.byte_size) for chunk in chunks],
+        )
+        entries.extend(
+            ExecutionLogEntry(
+                id=chunk.id,
                 execution_process_id=execution_id,
-                logs=combined_logs,
-                byte_size=total_bytes,
-                inserted_at=latest.inserted_at,
+                logs=payload,
+                byte_size=chunk.byte_size,
+                offset=chunk.offset,
+                inserted_at=chunk.inserted_at,
             )
+            for chunk, payload in zip(chunks, payloads, strict=True)
+        )
+        return entries
 
-    async def get_execution_log_entries(self, execution_id: str) -> list[ExecutionProcessLog]:
-        """Return ordered execution log entries for an execution."""
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(ExecutionProcessLog)
-                .where(ExecutionProcessLog.execution_process_id == execution_id)
-                .order_by(
-                    col(ExecutionProcessLog.inserted_at).asc(),
-                    col(ExecutionProcessLog.id).asc(),
+    def _read_log_spans(self, execution_id: str, spans: list[LogSpan]) -> list[str]:
+        assert self._log_store is not None
+        return [
+            decode_log_payload(payload.decode("utf-8", errors="replace"))
+            for payload in self._log_store.read(execution_id, spans)
+        ]
+
+    async def get_execution_logs(self, execution_id: str) -> ExecutionProcessLog | None:
+        """Return aggregated execution logs for an execution."""
+        entries = await self.get_execution_log_entries(execution_id)
+        if not entries:
+            return None
+
+        latest = entries[-1]
+        return ExecutionProcessLog(
+            id=latest.id,
+            execution_process_id=execution_id,
+            logs="\n".join(entry.logs for entry in entries if entry.logs),
+            byte_size=sum(entry.byte_size for entry in entries),
+            inserted_at=latest.inserted_at,
+        )
+
+    async def compress_inline_logs(self, *, min_bytes: int, batch_size: int = 100) -> int:
+        """Compress ``execution_process_logs`` rows stored before compression.
+
+        Rows are rewritten in batches of ``batch_size``, each in its own write,
+        so the core can keep serving while this runs.  ``byte_size`` keeps the
+        uncompressed size, so stream offsets do not move.  Returns the number
+        of rows rewritten.
+        """
+        if min_bytes <= 0:
+            msg = "min_bytes must be positive"
+            raise ValueError(msg)
+        rewritten = 0
+        after_id = ""
+        while True:
+            async with self._get_read_session() as session:
+                result = await session.execute(
+                    select(ExecutionProcessLog.id, ExecutionProcessLog.logs)
+                    .where(
+                        col(ExecutionProcessLog.id) > after_id,
+                        func.length(ExecutionProcessLog.logs) >= min_bytes,
+                    )
+                    .order_by(col(ExecutionProcessLog.id).asc())
+                    .limit(batch_size)
+                )
+                rows = result.all()
+            if not rows:
+                return rewritten
+            after_id = rows[-1][0]
+            encoded = {
+                row_id: packed
+                for row_id, logs in rows
+                if (packed := encode_log_payload(logs, min_bytes=min_bytes)) is not logs
+            }
+            if encoded:
+                await self._rewrite_inline_logs(encoded)
+                rewritten += len(encoded)
+
+    async def _rewrite_inline_logs(self, payloads: dict[str, str]) -> None:
+        async def _rewrite(session: AsyncSession) -> None:
+            for row_id, packed in payloads.items():
+                await session.execute(
+                    update(ExecutionProcessLog)
+                    .where(col(ExecutionProcessLog.id) == row_id)
+                    .values(logs=packed)
                 )
+
+        await self._session_factory.write(_rewrite)
+
+    async def compact_execution_logs(self, execution_id: str) -> ExecutionLogCompaction:
+        """Merge a finished execution's log entries into as few as possible.
+
+        See ``_plan_log_compaction`` for what is merged and dropped.  Stream
+        offsets of the entries left in place do not move: a merged inline row
+        keeps the ``byte_size`` total of the rows it replaces, and a merged
+        segment chunk keeps the offset of the first chunk it replaces and is
+        written to a fresh segment; segments no chunk points to are deleted.
+        """
+        started_at = time.perf_counter()
+        async with self._compaction_lock:
+            async with self._get_read_session() as session:
+                inline = await self._inline_log_entries(session, execution_id)
+                chunks: list[ExecutionLogChunk] = []
+                if self._log_store is not None:
+                    result = await session.execute(
+                        select(ExecutionLogChunk)
+                        .where(ExecutionLogChunk.execution_process_id == execution_id)
+                        .order_by(col(ExecutionLogChunk.offset).asc())
+                    )
+                    chunks = list(result.scalars().all())
+            payloads = [decode_log_payload(entry.logs) for entry in inline]
+            if chunks:
+                payloads += await asyncio.to_thread(
+                    self._read_log_spans,
+                    execution_id,
+                    [LogSpan(chunk.segment, chunk.position, chunk.byte_size) for chunk in chunks],
+                )
+            kinds = ["inline"] * len(inline) + ["chunk"] * len(chunks)
+            plan = [
+                (indexes, merged)
+                for indexes, merged in _plan_log_compaction(payloads, kinds)
+                if kinds[indexes[0]] == "inline"
+                or self._fits_chunk_span(chunks, len(inline), indexes, merged)
+            ]
+            bytes_before = sum(len(payload.encode("utf-8")) for payload in payloads)
+            bytes_after = bytes_before
+            for indexes, merged in plan:
+                bytes_after -= sum(len(payloads[i].encode("utf-8")) for i in indexes)
+                bytes_after += len(merged.encode("utf-8"))
+            entries_removed = sum(len(indexes) - 1 for indexes, _merged in plan)
+            if plan:
+                await self._apply_log_compaction(execution_id, inline, chunks, plan)
+
+        compaction = ExecutionLogCompaction(
+            entries_before=len(payloads),
+            entries_after=len(payloads) - entries_removed,
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+        )
+        increment_counter("core.execution_logs.compaction.runs")
+        increment_counter("core.execution_logs.compaction.bytes_before", amount=bytes_before)
+        increment_counter("core.execution_logs.compaction.bytes_after", amount=bytes_after)
+        increment_counter("core.execution_logs.compaction.entries_removed", amount=entries_removed)
+        record_timing(
+            "core.execution_logs.compaction.duration_ms",
+            (time.perf_counter() - started_at) * 1000,
+            fields={"execution_id": execution_id},
+        )
+        return compaction
+
+    def _fits_chunk_span(
+        self,
+        chunks: Sequence[ExecutionLogChunk],
+        inline_count: int,
+        indexes: Sequence[int],
+        merged: str,
+    ) -> bool:
+        """Whether a merged chunk ends before the chunk after the ones it replaces."""
+        first = chunks[indexes[0] - inline_count]
+        last = chunks[indexes[-1] - inline_count]
+        stored = encode_log_payload(merged, min_bytes=self._compress_min_bytes)
+        return len(stored.encode("utf-8")) <= last.offset + last.byte_size - first.offset
+
+    async def _apply_log_compaction(
+        self,
+        execution_id: str,
+        inline: Sequence[ExecutionLogEntry],
+        chunks: Sequence[ExecutionLogChunk],
+        plan: Sequence[tuple[list[int], str]],
+    ) -> None:
+        inline_plan = [(indexes, merged) for indexes, merged in plan if indexes[0] < len(inline)]
+        chunk_plan = [(indexes, merged) for indexes, merged in plan if indexes[0] >= len(inline)]
+        spans: list[LogSpan] = []
+        if chunk_plan:
+            assert self._log_store is not None
+            spans = await asyncio.to_thread(
+                self._append_compacted_chunks,
+                execution_id,
+                [merged for _indexes, merged in chunk_plan],
             )
-            return list(result.scalars().all())
+
+        async def _apply(session: AsyncSession) -> set[int]:
+            for indexes, merged in inline_plan:
+                rows = [inline[i] for i in indexes]
+                await session.execute(
+                    update(ExecutionProcessLog)
+                    .where(col(ExecutionProcessLog.id) == rows[0].id)
+                    .values(
+                        logs=encode_log_payload(merged, min_bytes=self._compress_min_bytes),
+                        byte_size=sum(row.byte_size for row in rows),
+                    )
+                )
+                await session.execute(
+                    delete(ExecutionProcessLog).where(
+                        col(ExecutionProcessLog.id).in_([row.id for row in rows[1:]])
+                    )
+                )
+            for (indexes, _merged), span in zip(chunk_plan, spans, strict=True):
+                replaced = [chunks[i - len(inline)] for i in indexes]
+                await session.execute(
+                    update(ExecutionLogChunk)
+                    .where(col(ExecutionLogChunk.id) == replaced[0].id)
+                    .values(segment=span.segment, position=span.position, byte_size=span.length)
+                )
+                await session.execute(
+                    delete(ExecutionLogChunk).where(
+                        col(ExecutionLogChunk.id).in_([chunk.id for chunk in replaced[1:]])
+                    )
+                )
+            result = await session.execute(
+                select(ExecutionLogChunk.segment)
+                .where(ExecutionLogChunk.execution_process_id == execution_id)
+                .distinct()
+            )
+            return set(result.scalars().all())
+
+        live_segments = await self._session_factory.write(_apply)
+        if chunk_plan:
+            assert self._log_store is not None
+            await asyncio.to_thread(self._log_store.prune, execution_id, live_segments)
+
+    def _append_compacted_chunks(self, execution_id: str, payloads: list[str]) -> list[LogSpan]:
+        assert self._log_store is not None
+        return [
+            self._log_store.append(
+                execution_id,
+                encode_log_payload(payload, min_bytes=self._compress_min_bytes).encode(),
+                new_segment=index == 0,
+            )
+            for index, payload in enumerate(payloads)
+        ]
+
+    async def close(self) -> None:
+        """Sync and release the on-disk log store, if any."""
+        if self._log_store is not None:
+            await asyncio.to_thread(self._log_store.close)
 
     async def get_execution(self, execution_id: str) -> ExecutionProcess | None:
         """Return execution record by ID."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             return await session.get(ExecutionProcess, execution_id)
 
     async def append_agent_turn(
@@ -152,26 +767,27 @@ class ExecutionRepository:
         agent_message_id: str | None = None,
     ) -> CodingAgentTurn:
         """Append a coding agent turn."""
-        async with self._lock:
-            async with self._get_session() as session:
-                turn = CodingAgentTurn(
-                    execution_process_id=execution_id,
-                    agent_session_id=agent_session_id,
-                    prompt=prompt,
-                    summary=summary,
-                    agent_message_id=agent_message_id,
-                    seen=False,
-                    created_at=utc_now(),
-                    updated_at=utc_now(),
-                )
-                session.add(turn)
-                await session.commit()
-                await session.refresh(turn)
-                return turn
+
+        async def _append(session: AsyncSession) -> CodingAgentTurn:
+            turn = CodingAgentTurn(
+                execution_process_id=execution_id,
+                agent_session_id=agent_session_id,
+                prompt=prompt,
+                summary=summary,
+                agent_message_id=agent_message_id,
+                seen=False,
+                created_at=utc_now(),
+                updated_at=utc_now(),
+            )
+            session.add(turn)
+            await session.flush()
+            return turn
+
+        return await self._session_factory.write(_append)
 
     async def list_agent_turns(self, execution_id: str) -> Sequence[CodingAgentTurn]:
         """List coding agent turns for an execution."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(CodingAgentTurn)
                 .where(CodingAgentTurn.execution_process_id == execution_id)
@@ -183,7 +799,7 @@ class ExecutionRepository:
         self, execution_id: str
     ) -> CodingAgentTurn | None:
         """Return the latest coding agent turn for an execution."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(CodingAgentTurn)
                 .where(CodingAgentTurn.execution_process_id == execution_id)
@@ -202,32 +818,33 @@ class ExecutionRepository:
         merge_commit: str | None = None,
     ) -> ExecutionProcessRepoState:
         """Persist per-repo state for an execution."""
-        async with self._lock:
-            async with self._get_session() as session:
-                state = ExecutionProcessRepoState(
-                    execution_process_id=execution_id,
-                    repo_id=repo_id,
-                    before_head_commit=before_head_commit,
-                    after_head_commit=after_head_commit,
-                    merge_commit=merge_commit,
-                    created_at=utc_now(),
-                    updated_at=utc_now(),
-                )
-                session.add(state)
-                await session.commit()
-                await session.refresh(state)
-                return state
+
+        async def _add(session: AsyncSession) -> ExecutionProcessRepoState:
+            state = ExecutionProcessRepoState(
+                execution_process_id=execution_id,
+                repo_id=repo_id,
+                before_head_commit=before_head_commit,
+                after_head_commit=after_head_commit,
+                merge_commit=merge_commit,
+                created_at=utc_now(),
+                updated_at=utc_now(),
+            )
+            session.add(state)
+            await session.flush()
+            return state
+
+        return await self._session_factory.write(_add)
 
     async def get_latest_execution_for_task(self, task_id: str) -> ExecutionProcess | None:
         """Return most recent execution for a task."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(ExecutionProcess)
-                .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
-                .join(Workspace, col(Session.workspace_id) == col(Workspace.id))
-                .where(Workspace.task_id == task_id)
-                .order_by(col(ExecutionProcess.created_at).desc())
-                .limit(1)
+                .join(
+                    TaskExecutionSummary,
+                    col(TaskExecutionSummary.latest_execution_id) == col(ExecutionProcess.id),
+                )
+                .where(TaskExecutionSummary.task_id == task_id)
             )
             return result.scalars().first()
 
@@ -235,7 +852,7 @@ class ExecutionRepository:
         self, task_id: str, *, limit: int = 5
     ) -> list[ExecutionProcess]:
         """Return most recent executions for a task."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(ExecutionProcess)
                 .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
@@ -248,7 +865,7 @@ class ExecutionRepository:
 
     async def get_latest_execution_for_session(self, session_id: str) -> ExecutionProcess | None:
         """Return most recent execution for a session."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(ExecutionProcess)
                 .where(ExecutionProcess.session_id == session_id)
@@ -259,7 +876,7 @@ class ExecutionRepository:
 
     async def get_running_execution_for_session(self, session_id: str) -> ExecutionProcess | None:
         """Return running execution for a session, if any."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(ExecutionProcess)
                 .where(
@@ -279,37 +896,24 @@ class ExecutionRepository:
             return {}
 
         unique_task_ids = tuple(dict.fromkeys(task_ids))
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(
-                    Workspace.task_id,
-                    ExecutionProcess.id,
-                    ExecutionProcess.created_at,
+                    TaskExecutionSummary.task_id,
+                    TaskExecutionSummary.running_execution_id,
+                ).where(
+                    col(TaskExecutionSummary.task_id).in_(unique_task_ids),
+                    col(TaskExecutionSummary.running_execution_id).is_not(None),
                 )
-                .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
-                .join(Workspace, col(Session.workspace_id) == col(Workspace.id))
-                .where(
-                    Workspace.task_id.in_(unique_task_ids),
-                    ExecutionProcess.status == ExecutionStatus.RUNNING,
-                )
-                .order_by(col(ExecutionProcess.created_at).desc())
             )
-            rows = result.all()
-
-        latest_by_task: dict[str, str] = {}
-        for task_id, execution_id, _created_at in rows:
-            if task_id not in latest_by_task:
-                latest_by_task[task_id] = execution_id
-        return latest_by_task
+            return {task_id: execution_id for task_id, execution_id in result.all()}
 
     async def count_executions_for_task(self, task_id: str) -> int:
         """Return total executions for a task."""
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(func.count())
-                .select_from(ExecutionProcess)
-                .join(Session, col(ExecutionProcess.session_id) == col(Session.id))
-                .join(Workspace, col(Session.workspace_id) == col(Workspace.id))
-                .where(Workspace.task_id == task_id)
+        async with self._get_read_session() as session:
+            count = await session.scalar(
+                select(TaskExecutionSummary.execution_count).where(
+                    TaskExecutionSummary.task_id == task_id
+                )
             )
-            return int(result.scalar_one() or 0)
+            return int(count or 0)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final
 
 from sqlalchemy import func
 from sqlmodel import col, select
 
-from kagan.core.adapters.db.schema import Job, JobAttempt, JobEventRecord
+from kagan.core.adapters.db.schema import Job, JobAttempt, JobEventCursor, JobEventRecord
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -38,14 +37,20 @@ class JobTransition:
 
 
 class JobRepository:
-    """Repository for durable jobs, lifecycle events, and attempts."""
+    """Repository for durable jobs, lifecycle events, and attempts.
+
+    Each job's ``JobEventCursor`` holds its event count, last event index and
+    current attempt, and is updated in the same transaction as every
+    transition, so appending an event never scans ``job_events`` or
+    ``job_attempts``.  Jobs created before cursors existed get one built from
+    those tables on their first transition.
+    """
 
     def __init__(self, session_factory: ClosingAwareSessionFactory) -> None:
         self._session_factory = session_factory
-        self._lock = asyncio.Lock()
 
-    def _get_session(self) -> AsyncSession:
-        return self._session_factory()
+    def _get_read_session(self) -> AsyncSession:
+        return self._session_factory.read()
 
     async def create_job(
         self,
@@ -59,54 +64,89 @@ class JobRepository:
         queued_code: str,
     ) -> Job:
         """Create a queued job and its initial lifecycle event."""
-        async with self._lock:
-            async with self._get_session() as session:
-                job = Job(
-                    id=job_id,
+
+        async def _create(session: AsyncSession) -> Job:
+            job = Job(
+                id=job_id,
+                task_id=task_id,
+                action=action,
+                status=_JOB_STATUS_QUEUED,
+                params_json=params_json,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            session.add(job)
+            session.add(
+                JobEventRecord(
+                    job_id=job_id,
                     task_id=task_id,
-                    action=action,
+                    event_index=_JOB_EVENT_INDEX_INITIAL,
                     status=_JOB_STATUS_QUEUED,
-                    params_json=params_json,
+                    message=queued_message,
+                    code=queued_code,
                     created_at=created_at,
-                    updated_at=created_at,
                 )
-                session.add(job)
-                session.add(
-                    JobEventRecord(
-                        job_id=job_id,
-                        task_id=task_id,
-                        event_index=_JOB_EVENT_INDEX_INITIAL,
-                        status=_JOB_STATUS_QUEUED,
-                        message=queued_message,
-                        code=queued_code,
-                        created_at=created_at,
-                    )
+            )
+            session.add(
+                JobEventCursor(
+                    job_id=job_id,
+                    event_count=1,
+                    last_event_index=_JOB_EVENT_INDEX_INITIAL,
+                    updated_at=created_at,
                 )
-                await session.commit()
-                return job
+            )
+            return job
+
+        return await self._session_factory.write(_create)
 
     async def get_job(self, job_id: str) -> Job | None:
         """Return a job by ID."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             return await session.get(Job, job_id)
 
-    async def list_events(self, job_id: str) -> list[JobEventRecord]:
-        """Return all lifecycle events for a job in chronological order."""
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(JobEventRecord)
+    async def list_events(
+        self,
+        job_id: str,
+        *,
+        after_index: int | None = None,
+        limit: int | None = None,
+    ) -> list[JobEventRecord]:
+        """Return lifecycle events for a job in chronological order.
+
+        ``after_index`` returns only events with a greater ``event_index``
+        (pass the last index seen to poll for new events); ``limit`` caps
+        the number returned.
+        """
+        statement = select(JobEventRecord).where(JobEventRecord.job_id == job_id)
+        if after_index is not None:
+            statement = statement.where(col(JobEventRecord.event_index) > after_index)
+        statement = statement.order_by(
+            col(JobEventRecord.event_index).asc(),
+            col(JobEventRecord.created_at).asc(),
+            col(JobEventRecord.id).asc(),
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+        async with self._get_read_session() as session:
+            result = await session.execute(statement)
+            return list(result.scalars().all())
+
+    async def count_events(self, job_id: str) -> int:
+        """Return the number of lifecycle events recorded for a job."""
+        async with self._get_read_session() as session:
+            cursor = await session.get(JobEventCursor, job_id)
+            if cursor is not None:
+                return cursor.event_count
+            count = await session.scalar(
+                select(func.count())
+                .select_from(JobEventRecord)
                 .where(JobEventRecord.job_id == job_id)
-                .order_by(
-                    col(JobEventRecord.event_index).asc(),
-                    col(JobEventRecord.created_at).asc(),
-                    col(JobEventRecord.id).asc(),
-                )
             )
-            return list(result.scalars().all())
+            return int(count or 0)
 
     async def list_non_terminal_jobs(self) -> list[Job]:
         """Return jobs that were left queued/running and need recovery."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(Job)
                 .where(col(Job.status).in_(_NON_TERMINAL_JOB_STATUSES))
@@ -114,6 +154,14 @@ class JobRepository:
             )
             return list(result.scalars().all())
 
+    async def count_jobs_by_status(self) -> dict[str, int]:
+        """Return the number of jobs in each status."""
+        async with self._get_read_session() as session:
+            result = await session.execute(
+                select(col(Job.status), func.count()).group_by(col(Job.status))
+            )
+            return {status: int(count) for status, count in result.all()}
+
     async def mark_running(
         self,
         job_id: str,
@@ -123,43 +171,43 @@ class JobRepository:
         code: str,
     ) -> JobTransition | None:
         """Transition a queued job to running and start a new attempt."""
-        async with self._lock:
-            async with self._get_session() as session:
-                job = await session.get(Job, job_id)
-                if job is None:
-                    return None
-                if job.status != _JOB_STATUS_QUEUED:
-                    return JobTransition(job=job, transitioned=False)
-
-                job.status = _JOB_STATUS_RUNNING
-                job.updated_at = timestamp
-                job.message = message
-                job.code = code
-                job.last_attempt_number += 1
-                session.add(job)
 
-                session.add(
-                    JobAttempt(
-                        job_id=job.id,
-                        attempt_number=job.last_attempt_number,
-                        status=_JOB_STATUS_RUNNING,
-                        started_at=timestamp,
-                    )
-                )
+        async def _mark_running(session: AsyncSession) -> JobTransition | None:
+            job = await session.get(Job, job_id)
+            if job is None:
+                return None
+            if job.status != _JOB_STATUS_QUEUED:
+                return JobTransition(job=job, transitioned=False)
+
+            job.status = _JOB_STATUS_RUNNING
+            job.updated_at = timestamp
+            job.message = message
+            job.code = code
+            job.last_attempt_number += 1
+            session.add(job)
+
+            attempt = JobAttempt(
+                job_id=job.id,
+                attempt_number=job.last_attempt_number,
+                status=_JOB_STATUS_RUNNING,
+                started_at=timestamp,
+            )
+            session.add(attempt)
+
+            cursor = (await self._cursors_by_job_id(session, (job.id,)))[job.id]
+            cursor.current_attempt_id = attempt.id
+            self._append_event(
+                session,
+                job,
+                cursor,
+                status=_JOB_STATUS_RUNNING,
+                message=message,
+                code=code,
+                timestamp=timestamp,
+            )
+            return JobTransition(job=job, transitioned=True)
 
-                session.add(
-                    JobEventRecord(
-                        job_id=job.id,
-                        task_id=job.task_id,
-                        event_index=await self._next_event_index(session, job.id),
-                        status=_JOB_STATUS_RUNNING,
-                        message=message,
-                        code=code,
-                        created_at=timestamp,
-                    )
-                )
-                await session.commit()
-                return JobTransition(job=job, transitioned=True)
+        return await self._session_factory.write(_mark_running)
 
     async def complete_job(
         self,
@@ -176,137 +224,175 @@ class JobRepository:
             msg = f"Terminal status required, got '{status}'"
             raise ValueError(msg)
 
-        async with self._lock:
-            async with self._get_session() as session:
-                job = await session.get(Job, job_id)
-                if job is None:
-                    return None
-                if job.status in _TERMINAL_JOB_STATUSES:
-                    return JobTransition(job=job, transitioned=False)
+        async def _complete(session: AsyncSession) -> JobTransition | None:
+            job = await session.get(Job, job_id)
+            if job is None:
+                return None
+            if job.status in _TERMINAL_JOB_STATUSES:
+                return JobTransition(job=job, transitioned=False)
+
+            job.status = status
+            job.updated_at = timestamp
+            job.finished_at = timestamp
+            job.message = message
+            job.code = code
+            if result_json is not None:
+                job.result_json = result_json
+            session.add(job)
+
+            cursor = (await self._cursors_by_job_id(session, (job.id,)))[job.id]
+            attempt = None
+            if cursor.current_attempt_id is not None:
+                attempt = await session.get(JobAttempt, cursor.current_attempt_id)
+            if attempt is not None and attempt.finished_at is None:
+                attempt.status = status
+                attempt.finished_at = timestamp
+                attempt.message = message
+                attempt.code = code
+                attempt.result_json = result_json
+                session.add(attempt)
+
+            self._append_event(
+                session,
+                job,
+                cursor,
+                status=status,
+                message=message,
+                code=code,
+                timestamp=timestamp,
+            )
+            return JobTransition(job=job, transitioned=True)
+
+        return await self._session_factory.write(_complete)
+
+    async def recover_non_terminal_jobs(
+        self,
+        *,
+        timestamp: datetime,
+        message: str,
+        code: str,
+        result_json: dict[str, Any],
+    ) -> list[Job]:
+        """Fail all queued/running jobs left behind by previous service instances."""
+
+        async def _recover(session: AsyncSession) -> list[Job]:
+            result = await session.execute(
+                select(Job)
+                .where(col(Job.status).in_(_NON_TERMINAL_JOB_STATUSES))
+                .order_by(col(Job.created_at).asc(), col(Job.id).asc())
+            )
+            stale_jobs = list(result.scalars().all())
+            if not stale_jobs:
+                return []
+
+            job_ids = tuple(job.id for job in stale_jobs)
+            cursors = await self._cursors_by_job_id(session, job_ids)
+            attempt_ids = [
+                cursor.current_attempt_id
+                for cursor in cursors.values()
+                if cursor.current_attempt_id is not None
+            ]
+            attempts = {
+                attempt.job_id: attempt
+                for attempt in (
+                    await session.execute(
+                        select(JobAttempt).where(col(JobAttempt.id).in_(attempt_ids))
+                    )
+                ).scalars()
+            }
 
-                job.status = status
+            for job in stale_jobs:
+                job.status = _JOB_STATUS_FAILED
                 job.updated_at = timestamp
                 job.finished_at = timestamp
                 job.message = message
                 job.code = code
-                if result_json is not None:
-                    job.result_json = result_json
+                job.result_json = result_json
                 session.add(job)
 
-                attempt = await self._latest_attempt(session, job_id)
+                attempt = attempts.get(job.id)
                 if attempt is not None and attempt.finished_at is None:
-                    attempt.status = status
+                    attempt.status = _JOB_STATUS_FAILED
                     attempt.finished_at = timestamp
                     attempt.message = message
                     attempt.code = code
                     attempt.result_json = result_json
                     session.add(attempt)
 
-                session.add(
-                    JobEventRecord(
-                        job_id=job.id,
-                        task_id=job.task_id,
-                        event_index=await self._next_event_index(session, job.id),
-                        status=status,
-                        message=message,
-                        code=code,
-                        created_at=timestamp,
-                    )
+                self._append_event(
+                    session,
+                    job,
+                    cursors[job.id],
+                    status=_JOB_STATUS_FAILED,
+                    message=message,
+                    code=code,
+                    timestamp=timestamp,
                 )
-                await session.commit()
-                return JobTransition(job=job, transitioned=True)
 
-    async def recover_non_terminal_jobs(
-        self,
-        *,
-        timestamp: datetime,
-        message: str,
-        code: str,
-        result_json: dict[str, Any],
-    ) -> list[Job]:
-        """Fail all queued/running jobs left behind by previous service instances."""
-        async with self._lock:
-            async with self._get_session() as session:
-                result = await session.execute(
-                    select(Job)
-                    .where(col(Job.status).in_(_NON_TERMINAL_JOB_STATUSES))
-                    .order_by(col(Job.created_at).asc(), col(Job.id).asc())
-                )
-                stale_jobs = list(result.scalars().all())
-                if not stale_jobs:
-                    return []
-
-                job_ids = tuple(job.id for job in stale_jobs)
-                latest_attempts = await self._latest_attempts_by_job_id(session, job_ids)
-                next_event_indices = await self._next_event_indices_by_job_id(session, job_ids)
-
-                for job in stale_jobs:
-                    job.status = _JOB_STATUS_FAILED
-                    job.updated_at = timestamp
-                    job.finished_at = timestamp
-                    job.message = message
-                    job.code = code
-                    job.result_json = result_json
-                    session.add(job)
-
-                    attempt = latest_attempts.get(job.id)
-                    if attempt is not None and attempt.finished_at is None:
-                        attempt.status = _JOB_STATUS_FAILED
-                        attempt.finished_at = timestamp
-                        attempt.message = message
-                        attempt.code = code
-                        attempt.result_json = result_json
-                        session.add(attempt)
-
-                    event_index = next_event_indices.get(job.id, _JOB_EVENT_INDEX_INITIAL)
-                    next_event_indices[job.id] = event_index + 1
-                    session.add(
-                        JobEventRecord(
-                            job_id=job.id,
-                            task_id=job.task_id,
-                            event_index=event_index,
-                            status=_JOB_STATUS_FAILED,
-                            message=message,
-                            code=code,
-                            created_at=timestamp,
-                        )
-                    )
+            return stale_jobs
 
-                await session.commit()
-                return stale_jobs
+        return await self._session_factory.write(_recover)
 
-    async def _next_event_index(self, session: AsyncSession, job_id: str) -> int:
-        result = await session.execute(
-            select(func.max(JobEventRecord.event_index)).where(JobEventRecord.job_id == job_id)
+    @staticmethod
+    def _append_event(
+        session: AsyncSession,
+        job: Job,
+        cursor: JobEventCursor,
+        *,
+        status: str,
+        message: str | None,
+        code: str | None,
+        timestamp: datetime,
+    ) -> None:
+        cursor.last_event_index += 1
+        cursor.event_count += 1
+        cursor.updated_at = timestamp
+        session.add(cursor)
+        session.add(
+            JobEventRecord(
+                job_id=job.id,
+                task_id=job.task_id,
+                event_index=cursor.last_event_index,
+                status=status,
+                message=message,
+                code=code,
+                created_at=timestamp,
+            )
         )
-        value = result.scalar_one()
-        return _JOB_EVENT_INDEX_INITIAL if value is None else int(value) + 1
 
-    async def _next_event_indices_by_job_id(
+    async def _cursors_by_job_id(
         self, session: AsyncSession, job_ids: Sequence[str]
-    ) -> dict[str, int]:
-        if not job_ids:
-            return {}
+    ) -> dict[str, JobEventCursor]:
+        """Return the event cursor of each job, building any that are missing."""
         result = await session.execute(
-            select(JobEventRecord.job_id, func.max(JobEventRecord.event_index))
-            .where(col(JobEventRecord.job_id).in_(job_ids))
-            .group_by(JobEventRecord.job_id)
+            select(JobEventCursor).where(col(JobEventCursor.job_id).in_(job_ids))
         )
-        next_indices = {job_id: _JOB_EVENT_INDEX_INITIAL for job_id in job_ids}
-        for job_id, max_index in result.all():
-            next_indices[job_id] = (
-                _JOB_EVENT_INDEX_INITIAL if max_index is None else int(max_index) + 1
+        cursors = {cursor.job_id: cursor for cursor in result.scalars().all()}
+        missing = tuple(job_id for job_id in job_ids if job_id not in cursors)
+        if not missing:
+            return cursors
+
+        event_stats = await session.execute(
+            select(
+                JobEventRecord.job_id,
+                func.count(),
+                func.max(JobEventRecord.event_index),
             )
-        return next_indices
-
-    async def _latest_attempt(self, session: AsyncSession, job_id: str) -> JobAttempt | None:
-        result = await session.execute(
-            select(JobAttempt)
-            .where(JobAttempt.job_id == job_id)
-            .order_by(col(JobAttempt.attempt_number).desc(), col(JobAttempt.id).desc())
-            .limit(1)
+            .where(col(JobEventRecord.job_id).in_(missing))
+            .group_by(JobEventRecord.job_id)
         )
-        return result.scalars().first()
+        stats = {job_id: (int(count), int(last)) for job_id, count, last in event_stats.all()}
+        latest_attempts = await self._latest_attempts_by_job_id(session, missing)
+        for job_id in missing:
+            event_count, last_event_index = stats.get(job_id, (0, 0))
+            attempt = latest_attempts.get(job_id)
+            cursors[job_id] = JobEventCursor(
+                job_id=job_id,
+                event_count=event_count,
+                last_event_index=last_event_index,
+                current_attempt_id=None if attempt is None else attempt.id,
+            )
+        return cursors
 
     async def _latest_attempts_by_job_id(
         self, session: AsyncSession, job_ids: Sequence[str]
@@ -2,22 +2,148 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-from sqlalchemy import case, func, or_
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from sqlalchemy import (
+    and_,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    table,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlmodel import col, delete, select
 
-from kagan.core.adapters.db.engine import create_db_engine, create_db_tables
+from kagan.core.adapters.db.engine import (
+    create_db_engine,
+    create_db_tables,
+    create_reader_engine,
+)
+from kagan.core.adapters.db.maintenance import SqliteMaintenance
 from kagan.core.adapters.db.repositories.base import ClosingAwareSessionFactory
-from kagan.core.adapters.db.schema import Project, Task, TaskLink, TaskStatus
+from kagan.core.adapters.db.schema import (
+    BoardRevision,
+    Project,
+    Task,
+    TaskChange,
+    TaskExecutionSummary,
+    TaskLink,
+    TaskPriority,
+    TaskStatus,
+    TaskType,
+)
+from kagan.core.adapters.db.task_board import (
+    BOARD_PRIORITY_ORDER,
+    BOARD_STATUS_ORDER,
+    board_priority_rank,
+    board_status_rank,
+)
+from kagan.core.adapters.db.task_search import (
+    TASK_SEARCH_RANK,
+    TASK_SEARCH_SNIPPET,
+    TASK_SEARCH_TABLE,
+    build_match_query,
+    task_search_available,
+)
+from kagan.core.adapters.db.write_executor import WriteExecutor
+from kagan.core.instrumentation import increment_counter
 from kagan.core.paths import get_database_path
 from kagan.core.time import utc_now
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping, Sequence
+
+T = TypeVar("T")
+
+StorageProfile = Literal["shared", "split"]
+
+DEFAULT_READER_POOL_SIZE = 4
+DEFAULT_WRITE_BATCH_MAX_OPS = 64
+DEFAULT_TASK_CACHE_SIZE = 0
+
+_task_search = table(TASK_SEARCH_TABLE, column("rowid"))
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSearchHit:
+    """A task matched by :meth:`TaskRepository.search_hits`.
+
+    ``score`` is the bm25 rank (lower is better); ``snippet`` marks matched
+    terms with ``**``.
+    """
+
+    task: Task
+    score: float
+    snippet: str
+
+
+@dataclass(frozen=True, slots=True)
+class TaskChangeSet:
+    """Tasks changed after a board revision, from :meth:`TaskRepository.changed_since`.
+
+    ``full`` means ``tasks`` is the whole board because the caller's revision
+    was unusable (0, or newer than the database); anything not listed is gone.
+    """
+
+    revision: int
+    tasks: list[Task]
+    deleted_ids: list[str]
+    full: bool
+
+
+class TaskCache:
+    """Bounded LRU map of task ID to the last committed :class:`Task` row.
+
+    Every write that touches a task calls :meth:`discard` from inside its
+    write operation and again once it has committed; each call bumps
+    ``version``.  A read miss fills with the version it observed before
+    reading and a write fills with the version of its post-commit discard,
+    so a fill is dropped if any discard happened since.  A slow reader that
+    saw the pre-commit snapshot can therefore never store a row older than
+    one already committed.  Cached rows are shared and must not be mutated.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._rows: OrderedDict[str, Task] = OrderedDict()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, task_id: str) -> Task | None:
+        task = self._rows.get(task_id)
+        if task is not None:
+            self._rows.move_to_end(task_id)
+        return task
+
+    def put(self, tasks: Iterable[Task], *, version: int) -> None:
+        if version != self.version:
+            return
+        for task in tasks:
+            self._rows[task.id] = task
+            self._rows.move_to_end(task.id)
+        while len(self._rows) > self._max_size:
+            self._rows.popitem(last=False)
+
+    def discard(self, task_ids: Iterable[str]) -> int:
+        for task_id in task_ids:
+            self._rows.pop(task_id, None)
+        self.version += 1
+        return self.version
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self.version += 1
 
 
 class TaskRepository:
@@ -30,11 +156,23 @@ class TaskRepository:
         project_root: Path | None = None,
         default_branch: str = "main",
         on_change: Callable[[str], None] | None = None,
+        storage_profile: StorageProfile = "split",
+        reader_pool_size: int = DEFAULT_READER_POOL_SIZE,
+        write_batch_max_ops: int = DEFAULT_WRITE_BATCH_MAX_OPS,
+        write_batch_max_latency_ms: int = 0,
+        task_cache_size: int = DEFAULT_TASK_CACHE_SIZE,
     ) -> None:
         self.db_path = Path(db_path) if db_path else get_database_path()
+        self._storage_profile: StorageProfile = storage_profile
+        self._reader_pool_size = reader_pool_size
+        self._write_batch_max_ops = write_batch_max_ops
+        self._write_batch_max_latency_ms = write_batch_max_latency_ms
         self._engine: AsyncEngine | None = None
+        self._reader_engine: AsyncEngine | None = None
         self._session_factory: ClosingAwareSessionFactory | None = None
-        self._lock = asyncio.Lock()
+        self._writer: WriteExecutor | None = None
+        self._search_index = False
+        self._cache = TaskCache(task_cache_size) if task_cache_size > 0 else None
         self._on_change = on_change
         self._on_status_change: (
             Callable[[str, TaskStatus | None, TaskStatus | None], None] | None
@@ -44,17 +182,52 @@ class TaskRepository:
         self._default_project_id: str | None = None
 
     async def initialize(self) -> None:
-        """Initialize engine and create tables."""
-        self._engine = await create_db_engine(self.db_path)
-        raw_factory = async_sessionmaker(self._engine, class_=AsyncSession, expire_on_commit=False)
-        self._session_factory = ClosingAwareSessionFactory(raw_factory)
+        """Initialize engine and create tables.
+
+        The ``split`` storage profile routes writes through one dedicated
+        connection and reads through a pool of read-only connections; WAL lets
+        those readers proceed while the writer commits.  ``shared`` keeps one
+        pool for both.  In-memory databases always use ``shared``.  Writes from
+        every repository sharing the session factory go through one
+        group-committing :class:`WriteExecutor`.
+        """
+        split = self._storage_profile == "split" and str(self.db_path) != ":memory:"
+        self._engine = await create_db_engine(self.db_path, single_connection=split)
         await create_db_tables(self._engine)
+        async with self._engine.connect() as conn:
+            self._search_index = await conn.run_sync(task_search_available)
+        raw_factory = async_sessionmaker(self._engine, class_=AsyncSession, expire_on_commit=False)
+        reader_factory = None
+        if split:
+            self._reader_engine = await create_reader_engine(
+                self.db_path, pool_size=self._reader_pool_size
+            )
+            reader_factory = async_sessionmaker(
+                self._reader_engine, class_=AsyncSession, expire_on_commit=False
+            )
+        self._writer = WriteExecutor(
+            raw_factory,
+            max_batch=self._write_batch_max_ops,
+            max_latency_ms=self._write_batch_max_latency_ms,
+        )
+        self._writer.start()
+        self._session_factory = ClosingAwareSessionFactory(
+            raw_factory, reader=reader_factory, writer=self._writer
+        )
         await self._ensure_defaults()
 
     async def close(self) -> None:
         """Close engine and release resources."""
+        if self._cache is not None:
+            self._cache.clear()
         if self._session_factory is not None:
             self._session_factory.mark_closing()
+        if self._writer is not None:
+            await self._writer.stop()
+            self._writer = None
+        if self._reader_engine:
+            await self._reader_engine.dispose()
+            self._reader_engine = None
         if self._engine:
             await self._engine.dispose()
             self._engine = None
@@ -70,6 +243,22 @@ class TaskRepository:
         assert self._session_factory, "Repository not initialized"
         return self._session_factory()
 
+    def _get_read_session(self) -> AsyncSession:
+        """Get a new session from the read-only pool (or the writer pool)."""
+        assert self._session_factory, "Repository not initialized"
+        return self._session_factory.read()
+
+    async def _write(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run a write operation through the shared write executor."""
+        assert self._session_factory, "Repository not initialized"
+        return await self._session_factory.write(operation)
+
+    @property
+    def maintenance(self) -> SqliteMaintenance:
+        """Maintenance statements (checkpoint, optimize, vacuum) for this database."""
+        assert self._engine is not None, "Repository not initialized"
+        return SqliteMaintenance(self._engine, self.db_path, writer=self._writer)
+
     @property
     def session_factory(self) -> ClosingAwareSessionFactory:
         """Public session factory accessor for downstream service wiring."""
@@ -82,18 +271,19 @@ class TaskRepository:
 
     async def ensure_test_project(self, name: str = "Test Project") -> str:
         """Create a test project and return its ID."""
-        async with self._get_session() as session:
+
+        async def _ensure(session: AsyncSession) -> str:
             result = await session.execute(select(Project).order_by(col(Project.created_at).asc()))
             project = result.scalars().first()
             if project is None:
                 project = Project(name=name, description="")
                 session.add(project)
-                await session.commit()
-                await session.refresh(project)
-
-            self._default_project_id = project.id
+                await session.flush()
             return project.id
 
+        self._default_project_id = await self._write(_ensure)
+        return self._default_project_id
+
     def set_status_change_callback(
         self,
         callback: Callable[[str, TaskStatus | None, TaskStatus | None], None] | None,
@@ -114,14 +304,33 @@ class TaskRepository:
         if self._on_status_change:
             self._on_status_change(task_id, old_status, new_status)
 
+    def _cache_discard(self, task_ids: Iterable[str]) -> None:
+        """Drop tasks from the cache; call from inside the write operation."""
+        if self._cache is not None:
+            self._cache.discard(task_ids)
+
+    def _cache_commit(self, task_ids: Iterable[str], tasks: Iterable[Task] = ()) -> None:
+        """Invalidate *task_ids* again once their write committed, then cache *tasks*.
+
+        A read that missed after the in-write discard may still have seen the
+        pre-commit snapshot; this second bump drops what it stored and
+        rejects its late fill.
+        """
+        if self._cache is not None:
+            self._cache.put(tasks, version=self._cache.discard(task_ids))
+
     async def create(self, task: Task) -> Task:
         """Create a new task."""
-        async with self._lock:
-            async with self._get_session() as session:
-                session.add(task)
-                await session.commit()
-                await session.refresh(task)
 
+        # Every column default is generated in Python, so the INSERT leaves
+        # nothing to read back.
+        async def _create(session: AsyncSession) -> None:
+            session.add(task)
+            await session.flush()
+            self._cache_discard([task.id])
+
+        await self._write(_create)
+        self._cache_commit([task.id], [task])
         if task.id:
             self._notify_change(task.id)
             self._notify_status_change(task.id, None, task.status)
@@ -129,42 +338,177 @@ class TaskRepository:
 
     async def get(self, task_id: str) -> Task | None:
         """Get a task by ID."""
-        async with self._get_session() as session:
-            return await session.get(Task, task_id)
+        if self._cache is None:
+            async with self._get_read_session() as session:
+                return await session.get(Task, task_id)
+        return (await self.get_many([task_id])).get(task_id)
+
+    async def get_many(self, task_ids: Iterable[str]) -> dict[str, Task]:
+        """Get tasks by ID in one query, keyed by ID; unknown IDs are left out.
+
+        With a task cache, only IDs missing from it are read, and the rows
+        read are cached.
+        """
+        wanted = list(dict.fromkeys(task_ids))
+        found: dict[str, Task] = {}
+        missing = wanted
+        if self._cache is not None:
+            missing = []
+            for task_id in wanted:
+                cached = self._cache.get(task_id)
+                if cached is None:
+                    missing.append(task_id)
+                else:
+                    found[task_id] = cached
+            if found:
+                increment_counter("core.tasks.cache.hits", amount=len(found))
+            if missing:
+                increment_counter("core.tasks.cache.misses", amount=len(missing))
+        if not missing:
+            return found
+
+        version = self._cache.version if self._cache is not None else 0
+        async with self._get_read_session() as session:
+            result = await session.execute(select(Task).where(col(Task.id).in_(missing)))
+            loaded = list(result.scalars())
+        if self._cache is not None:
+            self._cache.put(loaded, version=version)
+        found.update((task.id, task) for task in loaded)
+        return {task_id: found[task_id] for task_id in wanted if task_id in found}
 
     async def get_all(self, *, project_id: str | None = None) -> Sequence[Task]:
         """Get all tasks ordered by status, priority, created_at."""
-        async with self._get_session() as session:
-            query = select(Task)
-            if project_id is not None:
-                query = query.where(Task.project_id == project_id)
-            result = await session.execute(
-                query.order_by(
-                    case(
-                        (col(Task.status) == TaskStatus.BACKLOG, 0),
-                        (col(Task.status) == TaskStatus.IN_PROGRESS, 1),
-                        (col(Task.status) == TaskStatus.REVIEW, 2),
-                        (col(Task.status) == TaskStatus.DONE, 3),
-                        else_=99,
-                    ),
-                    col(Task.priority).desc(),
-                    col(Task.created_at).asc(),
-                )
-            )
-            return result.scalars().all()
+        return await self.list_page(project_id=project_id)
 
     async def get_by_status(
         self, status: TaskStatus, *, project_id: str | None = None
     ) -> Sequence[Task]:
         """Get all tasks with a specific status."""
-        async with self._get_session() as session:
-            query = select(Task).where(Task.status == status)
-            if project_id is not None:
-                query = query.where(Task.project_id == project_id)
-            result = await session.execute(
-                query.order_by(col(Task.priority).desc(), col(Task.created_at).asc())
+        return await self.list_page(project_id=project_id, status=status)
+
+    async def list_page(
+        self,
+        *,
+        project_id: str | None = None,
+        status: TaskStatus | None = None,
+        task_type: TaskType | None = None,
+        exclude_ids: Collection[str] = (),
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> list[Task]:
+        """List tasks in board order, optionally one keyset page at a time.
+
+        Board order is status (see ``BOARD_STATUS_ORDER``), then priority
+        (highest first), ``created_at`` and ID. ``cursor`` is a value from
+        :meth:`cursor_for`; the page starts right after that task via one
+        row-value comparison on that order, so every call is a single query.
+        """
+        board_key = (
+            board_status_rank,
+            board_priority_rank,
+            col(Task.created_at),
+            col(Task.id),
+        )
+        query = select(Task)
+        if project_id is not None:
+            query = query.where(Task.project_id == project_id)
+        status_rank = None
+        if status is not None:
+            # With the status pinned, seek on the rest of the key so SQLite
+            # keeps walking the index in order instead of sorting the page.
+            status_rank = self._board_rank(BOARD_STATUS_ORDER, status)
+            query = query.where(board_status_rank == status_rank, Task.status == status)
+            board_key = board_key[1:]
+        if task_type is not None:
+            query = query.where(Task.task_type == task_type)
+        if exclude_ids:
+            query = query.where(col(Task.id).not_in(list(exclude_ids)))
+        if cursor:
+            after_status, after_priority, created_at, task_id = self._parse_cursor(cursor)
+            after_status_rank = self._board_rank(BOARD_STATUS_ORDER, after_status)
+            after_key = (
+                literal(after_status_rank),
+                literal(self._board_rank(BOARD_PRIORITY_ORDER, after_priority)),
+                literal(created_at, col(Task.created_at).type),
+                literal(task_id),
             )
-            return result.scalars().all()
+            if status_rank is None:
+                query = query.where(tuple_(*board_key) > tuple_(*after_key))
+            elif after_status_rank == status_rank:
+                query = query.where(tuple_(*board_key) > tuple_(*after_key[1:]))
+            elif after_status_rank > status_rank:
+                return []
+        query = query.order_by(*board_key)
+        if limit is not None:
+            query = query.limit(limit)
+        async with self._get_read_session() as session:
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
+    async def get_board_revision(self, project_id: str) -> int:
+        """Return the project's board revision (0 before its first task write)."""
+        async with self._get_read_session() as session:
+            revision = await session.scalar(
+                select(BoardRevision.revision).where(BoardRevision.project_id == project_id)
+            )
+            return revision or 0
+
+    async def changed_since(self, project_id: str, revision: int) -> TaskChangeSet:
+        """Return tasks created, updated or deleted after board *revision*."""
+        async with self._get_read_session() as session:
+            current = await session.scalar(
+                select(BoardRevision.revision).where(BoardRevision.project_id == project_id)
+            )
+            current = current or 0
+            since = revision if 0 <= revision <= current else 0
+            # Rows stamped after ``current`` was read are left for the next call.
+            in_range = (
+                TaskChange.project_id == project_id,
+                col(TaskChange.revision) > since,
+                col(TaskChange.revision) <= current,
+            )
+            tasks = await session.execute(
+                select(Task)
+                .join(
+                    TaskChange,
+                    and_(TaskChange.task_id == Task.id, TaskChange.project_id == Task.project_id),
+                )
+                .where(*in_range, col(TaskChange.deleted).is_(False))
+                .order_by(col(TaskChange.revision))
+            )
+            deleted = await session.execute(
+                select(TaskChange.task_id).where(*in_range, col(TaskChange.deleted).is_(True))
+            )
+            return TaskChangeSet(
+                revision=current,
+                tasks=list(tasks.scalars().all()),
+                deleted_ids=list(deleted.scalars().all()),
+                full=since == 0,
+            )
+
+    @staticmethod
+    def _board_rank(order: Sequence[Any], member: Any) -> int:
+        """Rank of *member* as stored in the ``task_board`` rank columns."""
+        return order.index(member) if member in order else len(order)
+
+    @staticmethod
+    def cursor_for(task: Task) -> str:
+        """Return the ``list_page`` cursor that resumes after *task*."""
+        return f"{task.status.value}|{task.priority.name}|{task.created_at.isoformat()}|{task.id}"
+
+    @staticmethod
+    def _parse_cursor(cursor: str) -> tuple[TaskStatus, TaskPriority, datetime, str]:
+        try:
+            status, priority, created_at, task_id = cursor.split("|", 3)
+            return (
+                TaskStatus(status),
+                TaskPriority[priority],
+                datetime.fromisoformat(created_at),
+                task_id,
+            )
+        except (KeyError, ValueError):
+            msg = f"Invalid task cursor: {cursor!r}"
+            raise ValueError(msg) from None
 
     async def get_tasks_by_ids(
         self, task_ids: set[str], *, project_id: str | None = None
@@ -173,7 +517,7 @@ class TaskRepository:
         if not task_ids:
             return []
 
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             query = select(Task).where(col(Task.id).in_(task_ids))
             if project_id is not None:
                 query = query.where(Task.project_id == project_id)
@@ -181,49 +525,77 @@ class TaskRepository:
             return result.scalars().all()
 
     async def update(self, task_id: str, **kwargs: Any) -> Task | None:
-        """Update a task with keyword arguments."""
-        async with self._lock:
-            async with self._get_session() as session:
-                task = await session.get(Task, task_id)
-                if not task:
+        """Update a task with keyword arguments.
+
+        One ``UPDATE ... RETURNING`` statement; a status change first reads
+        the old status, which ``RETURNING`` cannot report.
+        """
+        update_data = dict(kwargs)
+
+        async def _update(session: AsyncSession) -> tuple[Task, TaskStatus] | None:
+            old_status: TaskStatus | None = None
+            if "status" in update_data:
+                old_status = await session.scalar(
+                    select(Task.status).where(col(Task.id) == task_id)
+                )
+                if old_status is None:
                     return None
 
+            result = await session.execute(
+                update(Task)
+                .where(col(Task.id) == task_id)
+                .values({**update_data, "updated_at": utc_now()})
+                .returning(Task)
+                .execution_options(populate_existing=True)
+            )
+            task = result.scalar_one_or_none()
+            if task is None:
+                return None
+            if old_status is None:
                 old_status = task.status
-                update_data = dict(kwargs)
-                if update_data:
-                    task.sqlmodel_update(update_data)
-                task.updated_at = utc_now()
+            self._cache_discard([task_id])
+            return task, old_status
 
-                session.add(task)
-                await session.commit()
-                await session.refresh(task)
+        updated = await self._write(_update)
+        if updated is None:
+            return None
 
-                if "status" in update_data and update_data["status"] != old_status:
-                    self._notify_status_change(task_id, old_status, update_data["status"])
+        task, old_status = updated
+        self._cache_commit([task_id], [task])
+        if "status" in update_data and update_data["status"] != old_status:
+            self._notify_status_change(task_id, old_status, update_data["status"])
 
-                self._notify_change(task_id)
-                return task
+        self._notify_change(task_id)
+        return task
 
     async def delete(self, task_id: str) -> bool:
         """Delete a task. Returns True if deleted."""
-        async with self._lock:
-            async with self._get_session() as session:
-                task = await session.get(Task, task_id)
-                if not task:
-                    return False
 
-                old_status = task.status
-                await session.execute(
-                    delete(TaskLink).where(
-                        or_(
-                            col(TaskLink.task_id) == task_id,
-                            col(TaskLink.ref_task_id) == task_id,
-                        )
+        async def _delete(session: AsyncSession) -> TaskStatus | None:
+            task = await session.get(Task, task_id)
+            if not task:
+                return None
+
+            await session.execute(
+                delete(TaskLink).where(
+                    or_(
+                        col(TaskLink.task_id) == task_id,
+                        col(TaskLink.ref_task_id) == task_id,
                     )
                 )
-                await session.delete(task)
-                await session.commit()
+            )
+            await session.execute(
+                delete(TaskExecutionSummary).where(col(TaskExecutionSummary.task_id) == task_id)
+            )
+            await session.delete(task)
+            self._cache_discard([task_id])
+            return task.status
+
+        old_status = await self._write(_delete)
+        if old_status is None:
+            return False
 
+        self._cache_commit([task_id])
         self._notify_change(task_id)
         self._notify_status_change(task_id, old_status, None)
         return True
@@ -232,9 +604,88 @@ class TaskRepository:
         """Move a task to a new status."""
         return await self.update(task_id, status=new_status)
 
+    async def create_many(
+        self,
+        tasks: Sequence[Task],
+        *,
+        mentions: Mapping[str, Collection[str]] | None = None,
+    ) -> list[Task]:
+        """Create several tasks in one transaction.
+
+        ``mentions`` maps a task ID to the task IDs its description mentions;
+        see :meth:`update_many`.
+        """
+
+        async def _create(session: AsyncSession) -> list[Task]:
+            session.add_all(tasks)
+            await session.flush()
+            if mentions:
+                await self._replace_links(session, mentions)
+            self._cache_discard(task.id for task in tasks)
+            return list(tasks)
+
+        created = await self._write(_create)
+        self._cache_commit([task.id for task in created], created)
+        for task in created:
+            self._notify_change(task.id)
+            self._notify_status_change(task.id, None, task.status)
+        return created
+
+    async def update_many(
+        self,
+        updates: Mapping[str, Mapping[str, Any]],
+        *,
+        mentions: Mapping[str, Collection[str]] | None = None,
+    ) -> list[tuple[Task, TaskStatus]]:
+        """Apply per-task field updates in one transaction.
+
+        Returns ``(task, old_status)`` for every task found, in ``updates``
+        order; unknown IDs are skipped.  The links of each task in
+        ``mentions`` are replaced by the mentioned tasks of the same project.
+        """
+
+        async def _update(session: AsyncSession) -> list[tuple[Task, TaskStatus]]:
+            result = await session.execute(select(Task).where(col(Task.id).in_(list(updates))))
+            found = {task.id: task for task in result.scalars()}
+            now = utc_now()
+            changed: list[tuple[Task, TaskStatus]] = []
+            for task_id, fields in updates.items():
+                task = found.get(task_id)
+                if task is None:
+                    continue
+                old_status = task.status
+                if fields:
+                    task.sqlmodel_update(dict(fields))
+                task.updated_at = now
+                changed.append((task, old_status))
+            await session.flush()
+            if mentions:
+                await self._replace_links(
+                    session,
+                    {task_id: refs for task_id, refs in mentions.items() if task_id in found},
+                )
+            self._cache_discard(found)
+            return changed
+
+        changed = await self._write(_update)
+        self._cache_commit(
+            [task.id for task, _old_status in changed], [task for task, _old_status in changed]
+        )
+        for task, old_status in changed:
+            if task.status != old_status:
+                self._notify_status_change(task.id, old_status, task.status)
+            self._notify_change(task.id)
+        return changed
+
+    async def move_many(
+        self, task_ids: Collection[str], new_status: TaskStatus
+    ) -> list[tuple[Task, TaskStatus]]:
+        """Move several tasks to a new status in one transaction."""
+        return await self.update_many({task_id: {"status": new_status} for task_id in task_ids})
+
     async def get_counts(self) -> dict[TaskStatus, int]:
         """Get task counts by status."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(Task.status, func.count(col(Task.id))).group_by(Task.status)
             )
@@ -243,40 +694,110 @@ class TaskRepository:
                 counts[status] = count
             return counts
 
-    async def search(self, query: str) -> Sequence[Task]:
-        """Search tasks by title, description, or ID."""
+    async def search(self, query: str, *, limit: int | None = None) -> Sequence[Task]:
+        """Search tasks by text or ID, best match first."""
+        return [hit.task for hit in await self.search_hits(query, limit=limit)]
+
+    async def search_hits(self, query: str, *, limit: int | None = None) -> list[TaskSearchHit]:
+        """Rank tasks matching *query* with bm25 and return them with snippets.
+
+        Every word in *query* must prefix-match the title, description,
+        acceptance criteria or scratchpad.  A task whose ID equals *query* comes
+        first.  Without FTS5 this falls back to an unranked ``LIKE`` scan.
+        """
         if not query or not query.strip():
             return []
 
         query = query.strip()
+        async with self._get_read_session() as session:
+            if self._search_index:
+                hits = await self._search_index_hits(session, query, limit)
+            else:
+                hits = await self._search_like_hits(session, query, limit)
+            if all(hit.task.id != query for hit in hits):
+                exact = await session.get(Task, query)
+                if exact is not None:
+                    hits.insert(0, TaskSearchHit(task=exact, score=0.0, snippet=""))
+                    if limit is not None:
+                        del hits[limit:]
+            return hits
+
+    async def _search_index_hits(
+        self, session: AsyncSession, query: str, limit: int | None
+    ) -> list[TaskSearchHit]:
+        match = build_match_query(query)
+        if match is None:
+            return []
+        score = literal_column(TASK_SEARCH_RANK).label("score")
+        snippet = literal_column(TASK_SEARCH_SNIPPET).label("snippet")
+        stmt = (
+            select(Task, score, snippet)
+            .join(_task_search, literal_column("tasks.rowid") == _task_search.c.rowid)
+            .where(text(f"{TASK_SEARCH_TABLE} MATCH :match").bindparams(match=match))
+            .order_by(score)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await session.execute(stmt)
+        return [
+            TaskSearchHit(task=task, score=float(rank), snippet=str(text_snippet or ""))
+            for task, rank, text_snippet in result.all()
+        ]
+
+    async def _search_like_hits(
+        self, session: AsyncSession, query: str, limit: int | None
+    ) -> list[TaskSearchHit]:
         pattern = f"%{query}%"
-
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(Task)
-                .where(
-                    (col(Task.id) == query)
-                    | (col(Task.title).ilike(pattern))
-                    | (col(Task.description).ilike(pattern))
-                )
-                .order_by(col(Task.updated_at).desc())
-            )
-            return result.scalars().all()
+        stmt = (
+            select(Task)
+            .where((col(Task.title).ilike(pattern)) | (col(Task.description).ilike(pattern)))
+            .order_by(col(Task.updated_at).desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await session.execute(stmt)
+        return [TaskSearchHit(task=task, score=0.0, snippet="") for task in result.scalars()]
 
     async def replace_task_links(self, task_id: str, ref_task_ids: set[str]) -> None:
         """Replace all references for a task."""
-        async with self._lock:
-            async with self._get_session() as session:
-                await session.execute(delete(TaskLink).where(col(TaskLink.task_id) == task_id))
-                for ref_id in sorted(ref_task_ids):
-                    if ref_id == task_id:
-                        continue
-                    session.add(TaskLink(task_id=task_id, ref_task_id=ref_id))
-                await session.commit()
+
+        async def _replace(session: AsyncSession) -> None:
+            await session.execute(delete(TaskLink).where(col(TaskLink.task_id) == task_id))
+            for ref_id in sorted(ref_task_ids):
+                if ref_id == task_id:
+                    continue
+                session.add(TaskLink(task_id=task_id, ref_task_id=ref_id))
+
+        await self._write(_replace)
+
+    @staticmethod
+    async def _replace_links(
+        session: AsyncSession, mentions: Mapping[str, Collection[str]]
+    ) -> None:
+        """Replace the links of every task in ``mentions`` with one delete."""
+        if not mentions:
+            return
+        await session.execute(delete(TaskLink).where(col(TaskLink.task_id).in_(list(mentions))))
+        wanted = {ref for refs in mentions.values() for ref in refs}
+        if not wanted:
+            return
+        result = await session.execute(
+            select(Task.id, Task.project_id).where(col(Task.id).in_(wanted | set(mentions)))
+        )
+        projects: dict[str, str] = {task_id: project_id for task_id, project_id in result.all()}
+        for task_id, refs in mentions.items():
+            project_id = projects.get(task_id)
+            session.add_all(
+                TaskLink(task_id=task_id, ref_task_id=ref_id)
+                for ref_id in sorted(set(refs))
+                if ref_id != task_id
+                and project_id is not None
+                and projects.get(ref_id) == project_id
+            )
 
     async def get_task_links(self, task_id: str) -> list[str]:
         """Return referenced task IDs for a task."""
-        async with self._get_session() as session:
+        async with self._get_read_session() as session:
             result = await session.execute(
                 select(TaskLink.ref_task_id).where(TaskLink.task_id == task_id)
             )
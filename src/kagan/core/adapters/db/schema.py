@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import JSON, Column, Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from kagan.core.models.enums import (
@@ -104,6 +104,7 @@ class Task(SQLModel, table=True):
     """Unit of work (Kanban card)."""
 
     __tablename__ = "tasks"  # type: ignore[bad-override]
+    # Board-order rank columns and their index live in ``task_board``.
 
     id: str = Field(default_factory=_new_id, primary_key=True)
     project_id: str = Field(foreign_key="projects.id", index=True)
@@ -189,6 +190,27 @@ class Task(SQLModel, table=True):
         return get_fallback_agent_config()
 
 
+class BoardRevision(SQLModel, table=True):
+    """Per-project counter bumped by every task insert, update and delete."""
+
+    __tablename__ = "board_revisions"  # type: ignore[bad-override]
+
+    project_id: str = Field(primary_key=True)
+    revision: int = Field(default=0)
+
+
+class TaskChange(SQLModel, table=True):
+    """Board revision at which a task last changed; ``deleted`` rows are tombstones."""
+
+    __tablename__ = "task_changes"  # type: ignore[bad-override]
+    __table_args__ = (Index("ix_task_changes_project_revision", "project_id", "revision"),)
+
+    project_id: str = Field(primary_key=True)
+    task_id: str = Field(primary_key=True)
+    revision: int
+    deleted: bool = Field(default=False)
+
+
 class Workspace(SQLModel, table=True):
     """Worktree + branch pairing for a task."""
 
@@ -266,6 +288,19 @@ class ExecutionProcess(SQLModel, table=True):
         return super().sqlmodel_update(obj, update=update)
 
 
+class TaskExecutionSummary(SQLModel, table=True):
+    """Per-task execution pointers kept current by ``ExecutionRepository``."""
+
+    __tablename__ = "task_execution_summaries"  # type: ignore[bad-override]
+
+    task_id: str = Field(primary_key=True)
+    latest_execution_id: str
+    running_execution_id: str | None = Field(default=None)
+    execution_count: int = Field(default=0)
+    last_status: ExecutionStatus
+    updated_at: datetime = Field(default_factory=utc_now)
+
+
 class ExecutionProcessLog(SQLModel, table=True):
     """JSONL log stream for an execution process."""
 
@@ -280,6 +315,27 @@ class ExecutionProcessLog(SQLModel, table=True):
     execution: ExecutionProcess = Relationship(back_populates="logs")
 
 
+class ExecutionLogChunk(SQLModel, table=True):
+    """Offset index for one chunk of an execution's on-disk log segments.
+
+    ``offset`` is the chunk's position in the execution's logical log stream;
+    ``segment`` and ``position`` locate its bytes in the segment files.
+    """
+
+    __tablename__ = "execution_log_chunks"  # type: ignore[bad-override]
+    __table_args__ = (
+        Index("ix_execution_log_chunks_execution_offset", "execution_process_id", "offset"),
+    )
+
+    id: str = Field(default_factory=_new_id, primary_key=True)
+    execution_process_id: str = Field(foreign_key="execution_processes.id")
+    offset: int
+    segment: int
+    position: int
+    byte_size: int
+    inserted_at: datetime = Field(default_factory=utc_now)
+
+
 class CodingAgentTurn(SQLModel, table=True):
     """Prompt/summary data for an agent run."""
 
@@ -374,6 +430,18 @@ class JobAttempt(SQLModel, table=True):
     job: "Job" = Relationship(back_populates="attempts")
 
 
+class JobEventCursor(SQLModel, table=True):
+    """Per-job event counter and current attempt kept current by ``JobRepository``."""
+
+    __tablename__ = "job_event_cursors"  # type: ignore[bad-override]
+
+    job_id: str = Field(foreign_key="jobs.id", primary_key=True)
+    event_count: int = Field(default=0)
+    last_event_index: int = Field(default=0)
+    current_attempt_id: str | None = Field(default=None)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+
 class Merge(SQLModel, table=True):
     """Merge action and result."""
 
@@ -408,10 +476,23 @@ class Scratch(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=utc_now)
 
 
+class ScratchpadEntry(SQLModel, table=True):
+    """A note appended to a task scratchpad after its ``scratches`` snapshot."""
+
+    __tablename__ = "scratchpad_entries"  # type: ignore[bad-override]
+    __table_args__ = (Index("ix_scratchpad_entries_task_id", "task_id", "id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    task_id: str
+    content: str
+    created_at: datetime = Field(default_factory=utc_now)
+
+
 class AuditEvent(SQLModel, table=True):
     """Immutable audit log entry for command/capability invocations."""
 
     __tablename__ = "audit_events"  # type: ignore[bad-override]
+    __table_args__ = (Index("ix_audit_events_occurred_at_id", "occurred_at", "id"),)
 
     id: str = Field(default_factory=_new_id, primary_key=True)
     occurred_at: datetime = Field(default_factory=utc_now, index=True)
@@ -425,6 +506,20 @@ class AuditEvent(SQLModel, table=True):
     success: bool = Field(default=True)
 
 
+class AuditRollup(SQLModel, table=True):
+    """Per-minute invocation counters for pruned read-only audit events."""
+
+    __tablename__ = "audit_rollups"  # type: ignore[bad-override]
+    __table_args__ = (UniqueConstraint("bucket_start", "capability", "command_name"),)
+
+    id: str = Field(default_factory=_new_id, primary_key=True)
+    bucket_start: datetime = Field(index=True)
+    capability: str = Field(default="")
+    command_name: str = Field(default="")
+    count: int = Field(default=0)
+    failure_count: int = Field(default=0)
+
+
 class ProjectRepo(SQLModel, table=True):
     """Junction table linking projects to repos."""
 
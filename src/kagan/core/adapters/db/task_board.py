@@ -0,0 +1,67 @@
+"""Integer board-order ranks on ``tasks`` and the index that serves board pages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Integer, column
+
+from kagan.core.models.enums import TaskPriority, TaskStatus
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+# Board order: status column, then priority (highest first). Both are stored
+# by name, so they sort by these explicit ranks rather than their text.
+BOARD_STATUS_ORDER = (
+    TaskStatus.BACKLOG,
+    TaskStatus.IN_PROGRESS,
+    TaskStatus.REVIEW,
+    TaskStatus.DONE,
+)
+BOARD_PRIORITY_ORDER = tuple(sorted(TaskPriority, reverse=True))
+
+BOARD_ORDER_INDEX = "ix_tasks_board_rank"
+
+board_status_rank = column("board_status_rank", Integer)
+board_priority_rank = column("board_priority_rank", Integer)
+
+
+def _rank_case(source: str, order: tuple[TaskStatus, ...] | tuple[TaskPriority, ...]) -> str:
+    whens = " ".join(f"WHEN '{member.name}' THEN {rank}" for rank, member in enumerate(order))
+    return f"CASE {source} {whens} ELSE {len(order)} END"
+
+
+# Virtual generated columns cost no storage and always follow the row, but
+# unlike a CASE in ORDER BY they can be indexed and range-scanned.
+_RANK_COLUMNS = {
+    board_status_rank.name: _rank_case("status", BOARD_STATUS_ORDER),
+    board_priority_rank.name: _rank_case("priority", BOARD_PRIORITY_ORDER),
+}
+
+
+def create_task_board_index(connection: Connection) -> None:
+    """Add the rank columns to ``tasks`` if missing and index board order on them."""
+    existing = {row[1] for row in connection.exec_driver_sql("PRAGMA table_xinfo(tasks)")}
+    for name, expression in _RANK_COLUMNS.items():
+        if name not in existing:
+            connection.exec_driver_sql(
+                f"ALTER TABLE tasks ADD COLUMN {name} INTEGER "
+                f"GENERATED ALWAYS AS ({expression}) VIRTUAL"
+            )
+    # Superseded: ordering on the CASE ranks could never use it.
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_tasks_board_order")
+    connection.exec_driver_sql(
+        f"CREATE INDEX IF NOT EXISTS {BOARD_ORDER_INDEX} ON tasks "
+        f"(project_id, {board_status_rank.name}, {board_priority_rank.name}, created_at, id)"
+    )
+
+
+__all__ = [
+    "BOARD_ORDER_INDEX",
+    "BOARD_PRIORITY_ORDER",
+    "BOARD_STATUS_ORDER",
+    "board_priority_rank",
+    "board_status_rank",
+    "create_task_board_index",
+]
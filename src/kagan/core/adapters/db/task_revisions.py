@@ -0,0 +1,76 @@
+"""Per-project board revisions and task change log, kept current by triggers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+
+def _record_change(row: str, *, deleted: bool) -> str:
+    """SQL that bumps ``row``'s project revision and stamps the task with it."""
+    return f"""
+        INSERT INTO board_revisions (project_id, revision) VALUES ({row}.project_id, 1)
+        ON CONFLICT (project_id) DO UPDATE SET revision = revision + 1;
+        INSERT INTO task_changes (project_id, task_id, revision, deleted)
+        SELECT {row}.project_id, {row}.id, revision, {int(deleted)}
+        FROM board_revisions WHERE project_id = {row}.project_id
+        ON CONFLICT (project_id, task_id)
+        DO UPDATE SET revision = excluded.revision, deleted = excluded.deleted;
+    """
+
+
+_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_revision_insert AFTER INSERT ON tasks BEGIN
+        {_record_change("NEW", deleted=False)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_revision_update AFTER UPDATE ON tasks BEGIN
+        {_record_change("NEW", deleted=False)}
+    END
+    """,
+    # A task moved to another project disappears from the old board.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_revision_move AFTER UPDATE OF project_id ON tasks
+    WHEN OLD.project_id IS NOT NEW.project_id BEGIN
+        {_record_change("OLD", deleted=True)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_revision_delete AFTER DELETE ON tasks BEGIN
+        {_record_change("OLD", deleted=True)}
+    END
+    """,
+)
+
+
+def create_task_revision_triggers(connection: Connection) -> None:
+    """Install the change-tracking triggers and seed an empty change log.
+
+    Tasks that predate the change log are recorded at revision 1 of their
+    project, so a client starting from revision 0 still sees all of them.
+    """
+    for trigger in _TRIGGERS:
+        connection.exec_driver_sql(trigger)
+    if connection.exec_driver_sql("SELECT 1 FROM task_changes LIMIT 1").first() is not None:
+        return
+    connection.exec_driver_sql(
+        """
+        INSERT INTO board_revisions (project_id, revision)
+        SELECT DISTINCT project_id, 1 FROM tasks WHERE true
+        ON CONFLICT (project_id) DO NOTHING
+        """
+    )
+    connection.exec_driver_sql(
+        """
+        INSERT INTO task_changes (project_id, task_id, revision, deleted)
+        SELECT t.project_id, t.id, b.revision, 0
+        FROM tasks AS t JOIN board_revisions AS b ON b.project_id = t.project_id
+        """
+    )
+
+
+__all__ = ["create_task_revision_triggers"]
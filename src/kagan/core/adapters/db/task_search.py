@@ -0,0 +1,217 @@
+"""SQLite FTS5 index over task text, kept in sync by triggers."""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger(__name__)
+
+TASK_SEARCH_TABLE = "tasks_fts"
+
+# Column weights for bm25(): task_id (unindexed), title, description,
+# acceptance criteria, scratchpad.
+TASK_SEARCH_RANK = f"bm25({TASK_SEARCH_TABLE}, 0.0, 10.0, 5.0, 2.0, 1.0)"
+TASK_SEARCH_SNIPPET = f"snippet({TASK_SEARCH_TABLE}, -1, '**', '**', '…', 12)"
+
+_SCRATCHPAD_TYPE = "WORKSPACE_NOTES"
+
+_CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE {TASK_SEARCH_TABLE} USING fts5(
+    task_id UNINDEXED,
+    title,
+    description,
+    acceptance_criteria,
+    scratchpad,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+
+def _criteria_text(row: str) -> str:
+    column = f"{row}.acceptance_criteria"
+    return (
+        f"CASE WHEN json_valid({column}) THEN "
+        f"COALESCE((SELECT group_concat(value, ' ') FROM json_each({column})), '') "
+        "ELSE '' END"
+    )
+
+
+def _scratchpad_snapshot_text(task_id: str) -> str:
+    return (
+        "COALESCE((SELECT json_extract(payload, '$.content') FROM scratches "
+        f"WHERE id = {task_id} AND scratch_type = '{_SCRATCHPAD_TYPE}'), '')"
+    )
+
+
+def _scratchpad_text(task_id: str) -> str:
+    """Snapshot followed by the notes appended to ``scratchpad_entries`` since."""
+    return (
+        f"{_scratchpad_snapshot_text(task_id)} || COALESCE((SELECT group_concat(content, '') "
+        f"FROM (SELECT content FROM scratchpad_entries WHERE task_id = {task_id} "
+        "ORDER BY id)), '')"
+    )
+
+
+# The FTS rowid mirrors ``tasks.rowid`` so every trigger updates one row by
+# key instead of scanning the index for a matching ``task_id``.
+_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO {TASK_SEARCH_TABLE}
+            (rowid, task_id, title, description, acceptance_criteria, scratchpad)
+        VALUES (
+            NEW.rowid, NEW.id, NEW.title, NEW.description,
+            {_criteria_text("NEW")}, {_scratchpad_text("NEW.id")}
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+    AFTER UPDATE OF title, description, acceptance_criteria ON tasks BEGIN
+        UPDATE {TASK_SEARCH_TABLE}
+        SET title = NEW.title,
+            description = NEW.description,
+            acceptance_criteria = {_criteria_text("NEW")}
+        WHERE rowid = NEW.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        DELETE FROM {TASK_SEARCH_TABLE} WHERE rowid = OLD.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS scratches_fts_insert AFTER INSERT ON scratches
+    WHEN NEW.scratch_type = '{_SCRATCHPAD_TYPE}' BEGIN
+        UPDATE {TASK_SEARCH_TABLE}
+        SET scratchpad = COALESCE(json_extract(NEW.payload, '$.content'), '')
+        WHERE rowid = (SELECT rowid FROM tasks WHERE id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS scratches_fts_update AFTER UPDATE OF payload ON scratches
+    WHEN NEW.scratch_type = '{_SCRATCHPAD_TYPE}' BEGIN
+        UPDATE {TASK_SEARCH_TABLE}
+        SET scratchpad = COALESCE(json_extract(NEW.payload, '$.content'), '')
+        WHERE rowid = (SELECT rowid FROM tasks WHERE id = NEW.id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS scratches_fts_delete AFTER DELETE ON scratches
+    WHEN OLD.scratch_type = '{_SCRATCHPAD_TYPE}' BEGIN
+        UPDATE {TASK_SEARCH_TABLE} SET scratchpad = ''
+        WHERE rowid = (SELECT rowid FROM tasks WHERE id = OLD.id);
+    END
+    """,
+    # Snapshot writes clear a task's notes first, so appending to the indexed
+    # text and falling back to the snapshot once the last note is gone is enough.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS scratchpad_entries_fts_insert
+    AFTER INSERT ON scratchpad_entries BEGIN
+        UPDATE {TASK_SEARCH_TABLE} SET scratchpad = scratchpad || NEW.content
+        WHERE rowid = (SELECT rowid FROM tasks WHERE id = NEW.task_id);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS scratchpad_entries_fts_delete
+    AFTER DELETE ON scratchpad_entries
+    WHEN NOT EXISTS (SELECT 1 FROM scratchpad_entries WHERE task_id = OLD.task_id) BEGIN
+        UPDATE {TASK_SEARCH_TABLE} SET scratchpad = {_scratchpad_snapshot_text("OLD.task_id")}
+        WHERE rowid = (SELECT rowid FROM tasks WHERE id = OLD.task_id);
+    END
+    """,
+)
+
+_TERM = re.compile(r"\w+")
+
+
+def _table_exists(connection: Connection) -> bool:
+    return (
+        connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (TASK_SEARCH_TABLE,),
+        ).first()
+        is not None
+    )
+
+
+def rebuild_task_search_index(connection: Connection) -> None:
+    """Repopulate the index from ``tasks`` and their scratchpads.
+
+    Needed after anything that can renumber ``tasks.rowid``, such as ``VACUUM``.
+    """
+    connection.exec_driver_sql(f"DELETE FROM {TASK_SEARCH_TABLE}")
+    connection.exec_driver_sql(
+        f"""
+        INSERT INTO {TASK_SEARCH_TABLE}
+            (rowid, task_id, title, description, acceptance_criteria, scratchpad)
+        SELECT t.rowid, t.id, t.title, t.description,
+               {_criteria_text("t")}, {_scratchpad_text("t.id")}
+        FROM tasks AS t
+        """
+    )
+
+
+def create_task_search_index(connection: Connection) -> bool:
+    """Create the FTS5 table and sync triggers; return ``False`` without FTS5.
+
+    A new or out-of-sync index is rebuilt from the ``tasks`` table.
+    """
+    created = False
+    if not _table_exists(connection):
+        try:
+            connection.exec_driver_sql(_CREATE_TABLE)
+        except OperationalError:
+            logger.warning("SQLite FTS5 is unavailable; task search falls back to LIKE")
+            return False
+        created = True
+    for trigger in _TRIGGERS:
+        connection.exec_driver_sql(trigger)
+    if created or _row_count(connection, TASK_SEARCH_TABLE) != _row_count(connection, "tasks"):
+        rebuild_task_search_index(connection)
+    return True
+
+
+def drop_task_search_index(connection: Connection) -> None:
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {TASK_SEARCH_TABLE}")
+
+
+def task_search_available(connection: Connection) -> bool:
+    return _table_exists(connection)
+
+
+def _row_count(connection: Connection, table: str) -> int:
+    return int(connection.execute(text(f"SELECT count(*) FROM {table}")).scalar_one())
+
+
+def build_match_query(query: str) -> str | None:
+    """Turn free text into an FTS5 query matching every term as a prefix.
+
+    Terms are quoted, so FTS5 operators and column filters typed by the user
+    are matched literally.  Returns ``None`` when *query* has no word characters.
+    """
+    terms = _TERM.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+__all__ = [
+    "TASK_SEARCH_RANK",
+    "TASK_SEARCH_SNIPPET",
+    "TASK_SEARCH_TABLE",
+    "build_match_query",
+    "create_task_search_index",
+    "drop_task_search_index",
+    "rebuild_task_search_index",
+    "task_search_available",
+]
@@ -0,0 +1,192 @@
+"""Serialized group-commit executor for repository writes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from sqlalchemy import text
+
+from kagan.core.instrumentation import increment_counter, record_timing
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+_DEFAULT_QUEUE_SIZE = 4096
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    operation: Callable[[AsyncSession], Awaitable[Any]]
+    future: asyncio.Future[Any] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class WriteExecutor:
+    """Run write operations from every repository on one queue.
+
+    An operation is an ``async`` callable that receives an ``AsyncSession``
+    and must not commit.  A background task takes up to ``max_batch`` queued
+    operations, waiting at most ``max_latency_ms`` for the batch to fill, and
+    runs them in one ``BEGIN IMMEDIATE`` transaction with a savepoint per
+    operation: a failing operation rolls back only its own savepoint and its
+    exception is raised to its caller, while the rest share a single commit.
+    :meth:`submit` returns once the operation's result is committed.
+
+    Before :meth:`start` (and after :meth:`stop`) each submission commits on
+    its own, still one at a time.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_batch: int = 64,
+        max_latency_ms: int = 0,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if max_batch < 1 or max_latency_ms < 0 or queue_size < 1:
+            msg = "max_batch and queue_size must be positive and max_latency_ms not negative"
+            raise ValueError(msg)
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._max_latency = max_latency_ms / 1000.0
+        self._queue: asyncio.Queue[_PendingWrite] = asyncio.Queue(maxsize=queue_size)
+        self._direct_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        # Operations taken off the queue but not yet committed, and the commit
+        # in progress; both survive cancellation so stop() loses nothing.
+        self._collecting: list[_PendingWrite] = []
+        self._flushing: asyncio.Future[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of operations queued but not yet picked up."""
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background batching task."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="core-db-write-executor")
+
+    async def stop(self) -> None:
+        """Stop the batching task after committing everything already queued."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        leftover, self._collecting = self._collecting, []
+        async with self._direct_lock:
+            await self._commit(leftover)
+            while not self._queue.empty():
+                await self._commit(self._drain(self._max_batch))
+
+    async def submit(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run *operation* in a write transaction and return its result.
+
+        Cancelling the caller does not withdraw an operation that a batch has
+        already started.
+        """
+        pending = _PendingWrite(operation)
+        if self.is_running:
+            await self._queue.put(pending)
+        else:
+            async with self._direct_lock:
+                await self._commit([pending])
+        return cast("T", await pending.future)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._collecting
+            batch.append(await self._queue.get())
+            # Let writers scheduled in the same loop iteration join the batch.
+            await asyncio.sleep(0)
+            deadline = loop.time() + self._max_latency
+            while len(batch) < self._max_batch:
+                batch.extend(self._drain(self._max_batch - len(batch)))
+                remaining = deadline - loop.time()
+                if len(batch) >= self._max_batch or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            self._collecting = []
+            self._flushing = asyncio.ensure_future(self._commit(batch))
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+
+    def _drain(self, limit: int) -> list[_PendingWrite]:
+        batch: list[_PendingWrite] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _commit(self, batch: list[_PendingWrite]) -> None:
+        batch = [pending for pending in batch if not pending.future.cancelled()]
+        if not batch:
+            return
+        started_at = time.perf_counter()
+        outcomes: list[tuple[_PendingWrite, Any, BaseException | None]] = []
+        try:
+            async with self._session_factory() as session:
+                # Take SQLite's write lock up front; this also opens a real
+                # transaction so the savepoints below nest inside it.
+                await session.execute(text("BEGIN IMMEDIATE"))
+                for pending in batch:
+                    try:
+                        async with session.begin_nested():
+                            result = await pending.operation(session)
+                    except Exception as exc:  # quality-allow-broad-except
+                        outcomes.append((pending, None, exc))
+                    else:
+                        outcomes.append((pending, result, None))
+                    # Each caller gets its own detached instances.
+                    session.expunge_all()
+                await session.commit()
+        except Exception as exc:  # quality-allow-broad-except
+            increment_counter("core.db.write_batch.failures")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+        except BaseException:
+            for pending in batch:
+                pending.future.cancel()
+            raise
+
+        record_timing("core.db.write_batch.duration_ms", (time.perf_counter() - started_at) * 1000)
+        increment_counter("core.db.write_batch.batches")
+        increment_counter("core.db.write_batch.operations", amount=len(batch))
+        for pending, result, error in outcomes:
+            if pending.future.done():
+                continue
+            if error is None:
+                pending.future.set_result(result)
+            else:
+                pending.future.set_exception(error)
+
+
+__all__ = ["WriteExecutor"]
@@ -0,0 +1,251 @@
+"""Append-only, segmented on-disk storage for execution logs.
+
+Log payloads above a size threshold are stored compressed.  A compressed
+payload is text-safe: a NUL byte, the codec name and a colon, then the
+base64 of the compressed bytes.  Agent output is JSON lines, which never
+start with NUL, so a plain payload needs no marker.  ``zstandard`` is
+optional; when it is not installed payloads are compressed with ``zlib``.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import shutil
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from pathlib import Path
+
+LogFsyncPolicy = Literal["always", "rollover", "never"]
+
+LOG_FSYNC_POLICIES: frozenset[str] = frozenset({"always", "rollover", "never"})
+
+_SEGMENT_NAME = re.compile(r"^(\d{6})\.jsonl$")
+_SAFE_EXECUTION_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+DEFAULT_LOG_COMPRESS_MIN_BYTES = 4096
+
+_CODEC_MARKER = "\x00"
+
+
+def is_compressed_log_payload(payload: str) -> bool:
+    return payload.startswith(_CODEC_MARKER)
+
+
+def encode_log_payload(payload: str, *, min_bytes: int) -> str:
+    """Return ``payload`` compressed if it is at least ``min_bytes`` (0 = never).
+
+    Payloads that are too small, already compressed, or that would not
+    shrink are returned unchanged.
+    """
+    if min_bytes <= 0 or is_compressed_log_payload(payload):
+        return payload
+    raw = payload.encode("utf-8")
+    if len(raw) < min_bytes:
+        return payload
+    if zstandard is not None:
+        codec, packed = "zstd", zstandard.ZstdCompressor().compress(raw)
+    else:
+        codec, packed = "zlib", zlib.compress(raw, 6)
+    encoded = f"{_CODEC_MARKER}{codec}:{base64.b64encode(packed).decode('ascii')}"
+    return encoded if len(encoded) < len(raw) else payload
+
+
+def decode_log_payload(payload: str) -> str:
+    """Return the original text of a payload written by ``encode_log_payload``."""
+    if not is_compressed_log_payload(payload):
+        return payload
+    codec, _, body = payload[1:].partition(":")
+    packed = base64.b64decode(body)
+    if codec == "zlib":
+        return zlib.decompress(packed).decode("utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            msg = "Execution log is zstd-compressed but 'zstandard' is not installed"
+            raise RuntimeError(msg)
+        return zstandard.ZstdDecompressor().decompress(packed).decode("utf-8")
+    msg = f"Unknown execution log codec: {codec!r}"
+    raise RuntimeError(msg)
+
+
+def execution_log_root(db_path: Path) -> Path:
+    """Return the directory holding execution log segments for a database."""
+    return db_path.parent / "execution-logs"
+
+
+@dataclass(frozen=True, slots=True)
+class LogSpan:
+    """Where one appended chunk lives: segment number, byte position, length."""
+
+    segment: int
+    position: int
+    length: int
+
+
+class SegmentedLogStore:
+    """Per-execution JSONL segment files under ``root``.
+
+    Each execution gets a directory of numbered segment files.  Chunks are
+    appended to the newest segment, which is closed once it would grow past
+    ``segment_max_bytes``; a chunk larger than that gets a segment of its
+    own.  Only the returned ``LogSpan`` needs to be indexed elsewhere, and
+    reads seek straight to it.
+
+    ``fsync`` controls durability: ``always`` syncs after every append,
+    ``rollover`` syncs a segment when it is closed, and ``never`` leaves it
+    to the OS.  Methods block on file I/O and are meant to be run through
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        fsync: LogFsyncPolicy = "rollover",
+    ) -> None:
+        if segment_max_bytes < 1:
+            msg = "segment_max_bytes must be positive"
+            raise ValueError(msg)
+        if fsync not in LOG_FSYNC_POLICIES:
+            msg = f"Unknown fsync policy: {fsync!r}"
+            raise ValueError(msg)
+        self.root = root
+        self._segment_max_bytes = segment_max_bytes
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._tails: dict[str, tuple[int, int]] = {}
+
+    def _execution_dir(self, execution_id: str) -> Path:
+        if not _SAFE_EXECUTION_ID.match(execution_id):
+            msg = f"Invalid execution ID for log storage: {execution_id!r}"
+            raise ValueError(msg)
+        return self.root / execution_id
+
+    @staticmethod
+    def _segment_path(directory: Path, segment: int) -> Path:
+        return directory / f"{segment:06d}.jsonl"
+
+    def _find_tail(self, directory: Path) -> tuple[int, int]:
+        segments = [
+            int(match.group(1))
+            for entry in (directory.iterdir() if directory.is_dir() else ())
+            if (match := _SEGMENT_NAME.match(entry.name))
+        ]
+        if not segments:
+            return 0, 0
+        last = max(segments)
+        return last, self._segment_path(directory, last).stat().st_size
+
+    def append(self, execution_id: str, data: bytes, *, new_segment: bool = False) -> LogSpan:
+        """Append ``data`` as one newline-terminated chunk and return its span.
+
+        ``new_segment`` closes the current segment first, so the chunk starts
+        a segment that shares nothing with earlier chunks.
+        """
+        directory = self._execution_dir(execution_id)
+        record = data + b"\n"
+        with self._lock:
+            tail = self._tails.get(execution_id)
+            if tail is None:
+                tail = self._find_tail(directory)
+            segment, size = tail
+            if size > 0 and (new_segment or size + len(record) > self._segment_max_bytes):
+                if self._fsync == "rollover":
+                    self._sync(self._segment_path(directory, segment))
+                segment, size = segment + 1, 0
+            directory.mkdir(parents=True, exist_ok=True)
+            with self._segment_path(directory, segment).open("ab") as handle:
+                handle.write(record)
+                handle.flush()
+                if self._fsync == "always":
+                    os.fsync(handle.fileno())
+            self._tails[execution_id] = (segment, size + len(record))
+        return LogSpan(segment=segment, position=size, length=len(data))
+
+    def read(self, execution_id: str, spans: Sequence[LogSpan]) -> list[bytes]:
+        """Return the bytes of each span, opening every segment at most once."""
+        directory = self._execution_dir(execution_id)
+        chunks: list[bytes] = []
+        handle = None
+        open_segment = -1
+        try:
+            for span in spans:
+                if span.segment != open_segment:
+                    if handle is not None:
+                        handle.close()
+                    handle = self._segment_path(directory, span.segment).open("rb")
+                    open_segment = span.segment
+                assert handle is not None
+                handle.seek(span.position)
+                chunks.append(handle.read(span.length))
+        finally:
+            if handle is not None:
+                handle.close()
+        return chunks
+
+    def prune(self, execution_id: str, keep: Collection[int]) -> int:
+        """Delete the segments of an execution not in ``keep``; return how many."""
+        directory = self._execution_dir(execution_id)
+        removed = 0
+        with self._lock:
+            if not directory.is_dir():
+                return 0
+            for entry in directory.iterdir():
+                match = _SEGMENT_NAME.match(entry.name)
+                if match is None or int(match.group(1)) in keep:
+                    continue
+                entry.unlink(missing_ok=True)
+                removed += 1
+            tail = self._tails.get(execution_id)
+            if tail is not None and tail[0] not in keep:
+                self._tails.pop(execution_id)
+        return removed
+
+    def remove(self, execution_id: str) -> None:
+        """Delete every segment of an execution."""
+        directory = self._execution_dir(execution_id)
+        with self._lock:
+            self._tails.pop(execution_id, None)
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def close(self) -> None:
+        """Sync the open segment of every execution appended to (``rollover``)."""
+        with self._lock:
+            if self._fsync == "rollover":
+                for execution_id, (segment, _size) in self._tails.items():
+                    self._sync(self._segment_path(self.root / execution_id, segment))
+            self._tails.clear()
+
+    @staticmethod
+    def _sync(path: Path) -> None:
+        try:
+            with path.open("rb") as handle:
+                os.fsync(handle.fileno())
+        except FileNotFoundError:
+            pass
+
+
+__all__ = [
+    "DEFAULT_LOG_COMPRESS_MIN_BYTES",
+    "LOG_FSYNC_POLICIES",
+    "LogFsyncPolicy",
+    "LogSpan",
+    "SegmentedLogStore",
+    "decode_log_payload",
+    "encode_log_payload",
+    "execution_log_root",
+    "is_compressed_log_payload",
+]
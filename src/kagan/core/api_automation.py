@@ -80,9 +80,11 @@ class AutomationApiMixin:
             job_id, task_id=task_id, timeout_seconds=timeout_seconds
         )
 
-    async def get_job_events(self, job_id: str, *, task_id: str) -> list[JobEvent] | None:
-        """List events emitted by a submitted job."""
-        return await self._ctx.job_service.events(job_id, task_id=task_id)
+    async def get_job_events(
+        self, job_id: str, *, task_id: str, after_index: int | None = None
+    ) -> list[JobEvent] | None:
+        """List events emitted by a submitted job, optionally only those after ``after_index``."""
+        return await self._ctx.job_service.events(job_id, task_id=task_id, after_index=after_index)
 
     # ── Sessions ───────────────────────────────────────────────────────
 
@@ -198,9 +200,19 @@ class AutomationApiMixin:
         """Return execution record by ID."""
         return await self._ctx.execution_service.get_execution(execution_id)
 
-    async def get_execution_log_entries(self, execution_id: str) -> list[Any]:
-        """Return ordered execution log entries for an execution."""
-        return await self._ctx.execution_service.get_execution_log_entries(execution_id)
+    async def get_execution_log_entries(
+        self,
+        execution_id: str,
+        *,
+        after_offset: int | None = None,
+        tail_bytes: int | None = None,
+    ) -> list[Any]:
+        """Return ordered execution log entries, optionally only a byte range of them."""
+        if after_offset is None and tail_bytes is None:
+            return await self._ctx.execution_service.get_execution_log_entries(execution_id)
+        return await self._ctx.execution_service.get_execution_log_entries(
+            execution_id, after_offset=after_offset, tail_bytes=tail_bytes
+        )
 
     async def get_latest_execution_for_task(self, task_id: str) -> Any:
         """Return most recent execution for a task."""
@@ -207,3 +207,8 @@ class ProjectApiMixin:
     async def get_instrumentation(self) -> dict[str, Any]:
         """Return in-memory instrumentation aggregates."""
         return instrumentation_snapshot()
+
+    async def get_db_maintenance_status(self) -> dict[str, Any] | None:
+        """Return database storage stats and the last run of each maintenance job."""
+        maintenance = getattr(self._ctx, "db_maintenance", None)
+        return None if maintenance is None else maintenance.status()
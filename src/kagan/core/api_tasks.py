@@ -13,14 +13,21 @@ from kagan.core.expose import expose
 from kagan.core.models.enums import TaskStatus, TaskType
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
 
+    from kagan.core.adapters.db.repositories.task import TaskChangeSet, TaskSearchHit
     from kagan.core.adapters.db.schema import Task
     from kagan.core.bootstrap import AppContext
     from kagan.core.models.enums import PairTerminalBackend, TaskPriority
 
 logger = logging.getLogger(__name__)
 
+# Log entries read per query while streaming a run.
+_LOG_ENTRY_PAGE_SIZE = 64
+# Characters of log text per streamed chunk.  Even fully escaped as JSON
+# this stays well under the IPC frame limit.
+_LOG_CHUNK_CHARS = 256 * 1024
+
 
 class TaskApiMixin:
     """Mixin providing task-related API methods.
@@ -94,9 +101,33 @@ class TaskApiMixin:
         *,
         project_id: str | None = None,
         status: TaskStatus | None = None,
+        task_type: TaskType | None = None,
+        exclude_task_ids: Sequence[str] = (),
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[Task]:
-        """List tasks with optional project/status filter."""
-        return await self._ctx.task_service.list_tasks(project_id=project_id, status=status)
+        """List tasks in board order with optional filters and keyset paging.
+
+        Pass :meth:`TaskRepository.cursor_for` of the last task as ``cursor``
+        to fetch the next page.
+        """
+        return await self._ctx.task_service.list_tasks(
+            project_id=project_id,
+            status=status,
+            task_type=task_type,
+            exclude_task_ids=exclude_task_ids,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    @expose("tasks", "changed_since", description="List tasks changed since a board revision.")
+    async def list_tasks_changed_since(self, project_id: str, revision: int = 0) -> TaskChangeSet:
+        """Return tasks changed or deleted after board *revision* of a project.
+
+        Revision 0 (or one the database has never reached) returns the whole
+        board with ``full`` set.
+        """
+        return await self._ctx.task_service.changed_since(project_id, revision)
 
     @expose("tasks", "update", profile="operator", mutating=True, description="Update task fields.")
     async def update_task(
@@ -135,6 +166,81 @@ class TaskApiMixin:
         """Move a task to a new status column."""
         return await self._ctx.task_service.move(task_id, status)
 
+    @expose(
+        "tasks",
+        "create_many",
+        profile="operator",
+        mutating=True,
+        description="Create several tasks in one transaction.",
+    )
+    async def create_tasks(
+        self,
+        tasks: Sequence[dict[str, object]],
+        *,
+        project_id: str | None = None,
+    ) -> list[Task]:
+        """Create several tasks at once.
+
+        Each entry holds the fields of one task (``title`` is required) and
+        may override ``project_id``.  Observers get one ``TasksChanged`` event.
+        """
+        return await self._ctx.task_service.create_many(tasks, project_id=project_id)
+
+    @expose(
+        "tasks",
+        "update_many",
+        profile="operator",
+        mutating=True,
+        description="Update several tasks in one transaction.",
+    )
+    async def update_tasks(
+        self, updates: dict[str, dict[str, object]]
+    ) -> tuple[list[Task], list[str]]:
+        """Update several tasks at once, keyed by task ID.
+
+        Returns the updated tasks and the IDs that were not found; nothing is
+        written unless every task exists.  Task type transitions are handled
+        as in :meth:`update_task`.
+        """
+        current = {task.id: task for task in await self._ctx.task_service.get_tasks(updates)}
+        missing = [task_id for task_id in updates if task_id not in current]
+        if missing:
+            return [], missing
+
+        for task_id, fields in updates.items():
+            new_task_type = fields.get("task_type")
+            current_type = current[task_id].task_type
+            if isinstance(new_task_type, TaskType) and new_task_type != current_type:
+                await self._handle_task_type_transition(
+                    task_id=task_id,
+                    current_type=current_type,
+                    new_type=new_task_type,
+                    fields=fields,
+                )
+
+        return await self._ctx.task_service.update_many(updates), []
+
+    @expose(
+        "tasks",
+        "move_many",
+        profile="operator",
+        mutating=True,
+        description="Move several tasks to a status column in one transaction.",
+    )
+    async def move_tasks(
+        self, task_ids: Sequence[str], status: TaskStatus
+    ) -> tuple[list[Task], list[str]]:
+        """Move several tasks to a new status column.
+
+        Returns the moved tasks and the IDs that were not found; nothing is
+        moved unless every task exists.
+        """
+        found = {task.id for task in await self._ctx.task_service.get_tasks(task_ids)}
+        missing = [task_id for task_id in task_ids if task_id not in found]
+        if missing:
+            return [], missing
+        return await self._ctx.task_service.move_many(task_ids, status), []
+
     @expose(
         "tasks",
         "delete",
@@ -176,9 +282,7 @@ class TaskApiMixin:
     )
     async def update_scratchpad(self, task_id: str, content: str) -> None:
         """Append content to a task's scratchpad."""
-        existing = await self._ctx.task_service.get_scratchpad(task_id)
-        updated = f"{existing}\n{content}".strip() if existing else content
-        await self._ctx.task_service.update_scratchpad(task_id, updated)
+        await self._ctx.task_service.append_scratchpad(task_id, content, separator="\n")
 
     @expose("tasks", "scratchpad", description="Get a task's scratchpad content.")
     async def get_scratchpad(self, task_id: str) -> str:
@@ -279,11 +383,65 @@ class TaskApiMixin:
     @expose("tasks", "logs", description="Return execution logs for a task.")
     async def get_task_logs(self, task_id: str, *, limit: int = 5) -> list[dict[str, Any]]:
         """Return execution logs for a task."""
+        return [entry async for entry in self.iter_task_logs(task_id, limit=limit)]
+
+    async def iter_task_logs(
+        self, task_id: str, *, limit: int = 5
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield execution logs for a task one run at a time, oldest first."""
+        for run_number, execution in await self._task_log_runs(task_id, limit=limit):
+            try:
+                log_entries = await self._ctx.execution_service.get_execution_log_entries(
+                    execution.id
+                )
+                content = "\n".join(entry.logs for entry in log_entries if entry.logs).strip()
+                created_at = execution.created_at.isoformat()
+            except (AttributeError, KeyError, RuntimeError):
+                continue
+            if not content:
+                continue
+            yield {"run": run_number, "content": content, "created_at": created_at}
+
+    async def iter_task_log_chunks(
+        self, task_id: str, *, limit: int = 5
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield execution logs for a task in bounded pieces, oldest first.
+
+        Each piece holds part of one log entry and its byte ``offset`` in the
+        run's log stream.  Entries are read a page at a time, so neither
+        memory nor piece size grows with the length of a run.
+        """
+        for run_number, execution in await self._task_log_runs(task_id, limit=limit):
+            created_at = execution.created_at.isoformat()
+            after_offset = 0
+            while True:
+                try:
+                    log_entries = await self._ctx.execution_service.get_execution_log_entries(
+                        execution.id, after_offset=after_offset, limit=_LOG_ENTRY_PAGE_SIZE
+                    )
+                except (AttributeError, KeyError, RuntimeError):
+                    break
+                for entry in log_entries:
+                    offset = entry.offset
+                    for start in range(0, len(entry.logs), _LOG_CHUNK_CHARS):
+                        content = entry.logs[start : start + _LOG_CHUNK_CHARS]
+                        yield {
+                            "run": run_number,
+                            "offset": offset,
+                            "content": content,
+                            "created_at": created_at,
+                        }
+                        offset += len(content.encode("utf-8"))
+                if len(log_entries) < _LOG_ENTRY_PAGE_SIZE:
+                    break
+                after_offset = log_entries[-1].end_offset
+
+    async def _task_log_runs(self, task_id: str, *, limit: int) -> list[tuple[int, Any]]:
+        """Return the task's latest ``limit`` executions with their run numbers, oldest first."""
         limit = max(1, min(limit, 20))
         executions = await self._ctx.execution_service.list_executions_for_task(
             task_id, limit=limit
         )
-        logs: list[dict[str, Any]] = []
         total_runs = len(executions)
         with contextlib.suppress(AttributeError, KeyError, RuntimeError):
             total_runs = max(
@@ -292,32 +450,22 @@ class TaskApiMixin:
             )
 
         run_start = max(1, total_runs - len(executions) + 1)
-        for run_number, execution in enumerate(reversed(executions), start=run_start):
-            try:
-                log_entries = await self._ctx.execution_service.get_execution_log_entries(
-                    execution.id
-                )
-                content = "\n".join(entry.logs for entry in log_entries if entry.logs).strip()
-                if not content:
-                    continue
-                logs.append(
-                    {
-                        "run": run_number,
-                        "content": content,
-                        "created_at": execution.created_at.isoformat(),
-                    }
-                )
-            except (AttributeError, KeyError, RuntimeError):
-                pass
-
-        return logs
+        return list(enumerate(reversed(executions), start=run_start))
 
     @expose("tasks", "search", description="Search tasks by text query.")
-    async def search_tasks(self, query: str) -> Sequence[Task]:
-        """Search tasks by text query."""
+    async def search_tasks(self, query: str, *, limit: int | None = None) -> Sequence[Task]:
+        """Search tasks by text query, best match first."""
+        if not query.strip():
+            return []
+        return await self._ctx.task_service.search(query, limit=limit)
+
+    async def search_task_hits(
+        self, query: str, *, limit: int | None = None
+    ) -> list[TaskSearchHit]:
+        """Search tasks by text query and return ranked hits with snippets."""
         if not query.strip():
             return []
-        return await self._ctx.task_service.search(query)
+        return await self._ctx.task_service.search_hits(query, limit=limit)
 
     # ── Reviews ────────────────────────────────────────────────────────
 
@@ -0,0 +1,216 @@
+"""Periodic pruning, summarization and archiving of the audit log."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import json
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from kagan.core.adapters.db.schema import AuditRollup
+from kagan.core.instrumentation import increment_counter, record_timing
+from kagan.core.security import CAPABILITY_PROFILES, CapabilityProfile
+from kagan.core.time import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+    from pathlib import Path
+
+    from kagan.core.adapters.db.repositories import AuditRepository
+    from kagan.core.adapters.db.schema import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(slots=True)
+class AuditPruneResult:
+    """Row counts from one retention pass."""
+
+    deleted: int = 0
+    archived: int = 0
+    summarized: int = 0
+
+
+class AuditRetention:
+    """Keep the audit log within an age and row budget.
+
+    Each pass deletes the oldest events in batches of ``batch_size``: first
+    everything older than ``max_age_days``, then whatever still exceeds
+    ``max_rows``.  A zero limit disables that check.  Before a batch is
+    deleted, read-only queries are folded into per-minute ``AuditRollup``
+    counters when ``summarize_reads`` is set, and the remaining rows are
+    appended to a gzip-compressed JSONL file in ``archive_dir`` when one is
+    configured.  A batch is only deleted once its archive write succeeded.
+    """
+
+    def __init__(
+        self,
+        repository: AuditRepository,
+        *,
+        max_age_days: int,
+        max_rows: int,
+        summarize_reads: bool = False,
+        archive_dir: Path | None = None,
+        interval_seconds: int = 3600,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if max_age_days < 0 or max_rows < 0:
+            msg = "max_age_days and max_rows must not be negative"
+            raise ValueError(msg)
+        if interval_seconds < 1 or batch_size < 1:
+            msg = "interval_seconds and batch_size must be positive"
+            raise ValueError(msg)
+        self._repository = repository
+        self._max_age_days = max_age_days
+        self._max_rows = max_rows
+        self._summarize_reads = summarize_reads
+        self._archive_dir = archive_dir
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_age_days > 0 or self._max_rows > 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the periodic pruning task (no-op when both limits are disabled)."""
+        if not self.enabled or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="core-audit-retention")
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def prune(self, *, now: datetime | None = None) -> AuditPruneResult:
+        """Run one retention pass and return what it removed."""
+        result = AuditPruneResult()
+        started_at = time.perf_counter()
+        archive_path = self._archive_path(now or utc_now())
+
+        if self._max_age_days > 0:
+            cutoff = (now or utc_now()) - timedelta(days=self._max_age_days)
+            while batch := await self._repository.list_oldest_events(
+                limit=self._batch_size, before=cutoff
+            ):
+                await self._prune_batch(batch, archive_path, result)
+
+        if self._max_rows > 0:
+            overflow = await self._repository.count_events() - self._max_rows
+            while overflow > 0:
+                batch = await self._repository.list_oldest_events(
+                    limit=min(overflow, self._batch_size)
+                )
+                if not batch:
+                    break
+                await self._prune_batch(batch, archive_path, result)
+                overflow -= len(batch)
+
+        record_timing("core.audit.retention.duration_ms", (time.perf_counter() - started_at) * 1000)
+        if result.deleted:
+            logger.info(
+                "Pruned %d audit events (%d archived, %d summarized)",
+                result.deleted,
+                result.archived,
+                result.summarized,
+            )
+        return result
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.prune()
+            except Exception:  # quality-allow-broad-except
+                increment_counter("core.audit.retention.failures")
+                logger.exception("Audit retention pass failed")
+            await asyncio.sleep(self._interval)
+
+    async def _prune_batch(
+        self,
+        batch: Sequence[AuditEvent],
+        archive_path: Path | None,
+        result: AuditPruneResult,
+    ) -> None:
+        reads: list[AuditEvent] = []
+        kept: list[AuditEvent] = []
+        for event in batch:
+            if self._summarize_reads and _is_read_only(event):
+                reads.append(event)
+            else:
+                kept.append(event)
+
+        if archive_path is not None and kept:
+            await asyncio.to_thread(_append_archive, archive_path, kept)
+            result.archived += len(kept)
+            increment_counter("core.audit.retention.archived", amount=len(kept))
+
+        deleted = await self._repository.prune_events(
+            [event.id for event in batch], rollups=_rollups(reads)
+        )
+        result.deleted += deleted
+        result.summarized += len(reads)
+        increment_counter("core.audit.retention.deleted", amount=deleted)
+        if reads:
+            increment_counter("core.audit.retention.summarized", amount=len(reads))
+
+    def _archive_path(self, now: datetime) -> Path | None:
+        if self._archive_dir is None:
+            return None
+        return self._archive_dir / f"audit-{now:%Y%m%dT%H%M%SZ}.jsonl.gz"
+
+
+def _is_read_only(event: AuditEvent) -> bool:
+    return (event.capability, event.command_name) in CAPABILITY_PROFILES[CapabilityProfile.VIEWER]
+
+
+def _rollups(events: Sequence[AuditEvent]) -> list[AuditRollup]:
+    totals: Counter[tuple[datetime, str, str]] = Counter()
+    failures: Counter[tuple[datetime, str, str]] = Counter()
+    for event in events:
+        key = (
+            event.occurred_at.replace(second=0, microsecond=0),
+            event.capability,
+            event.command_name,
+        )
+        totals[key] += 1
+        if not event.success:
+            failures[key] += 1
+    return [
+        AuditRollup(
+            bucket_start=bucket_start,
+            capability=capability,
+            command_name=command_name,
+            count=count,
+            failure_count=failures[(bucket_start, capability, command_name)],
+        )
+        for (bucket_start, capability, command_name), count in totals.items()
+    ]
+
+
+def _append_archive(path: Path, events: Sequence[AuditEvent]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        for event in events:
+            archive.write(json.dumps(event.model_dump(mode="json"), separators=(",", ":")))
+            archive.write("\n")
+
+
+__all__ = ["AuditPruneResult", "AuditRetention"]
@@ -0,0 +1,153 @@
+"""Background group-commit writer for IPC audit events."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Literal
+
+from kagan.core.instrumentation import increment_counter, record_timing
+
+if TYPE_CHECKING:
+    from kagan.core.adapters.db.repositories import AuditRepository
+    from kagan.core.adapters.db.schema import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+AuditDurability = Literal["sync", "batched", "best_effort"]
+
+_DEFAULT_QUEUE_SIZE = 4096
+
+
+class AuditSink:
+    """Buffer audit events and persist them in multi-row transactions.
+
+    Events are queued by :meth:`submit` and written by a background task
+    whenever ``max_batch`` events are waiting or ``flush_interval_ms`` has
+    elapsed since the oldest one was queued.  ``durability`` decides what
+    happens when the bounded queue is full: ``batched`` makes the submitter
+    wait for space, ``best_effort`` drops the event.  ``sync`` bypasses the
+    queue and commits each event before :meth:`submit` returns.
+    """
+
+    def __init__(
+        self,
+        repository: AuditRepository,
+        *,
+        durability: AuditDurability = "batched",
+        max_batch: int = 64,
+        flush_interval_ms: int = 50,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if max_batch < 1 or flush_interval_ms < 1 or queue_size < 1:
+            msg = "max_batch, flush_interval_ms and queue_size must be positive"
+            raise ValueError(msg)
+        self._repository = repository
+        self._durability: AuditDurability = durability
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._queue: asyncio.Queue[AuditEvent] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task[None] | None = None
+        # Events taken off the queue but not yet handed to a write, and the
+        # write in progress; both survive cancellation so stop() loses nothing.
+        self._collecting: list[AuditEvent] = []
+        self._flushing: asyncio.Future[None] | None = None
+
+    @property
+    def durability(self) -> AuditDurability:
+        return self._durability
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events queued but not yet written."""
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task (no-op in ``sync`` mode)."""
+        if self._durability == "sync" or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="core-audit-sink")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write every event still queued."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        leftover, self._collecting = self._collecting, []
+        await self._write(leftover)
+        while not self._queue.empty():
+            await self._write(self._drain(self._max_batch))
+
+    async def submit(self, event: AuditEvent) -> None:
+        """Queue *event* for writing according to the durability mode."""
+        if self._durability == "sync" or not self.is_running:
+            await self._write([event])
+            return
+        try:
+            self._queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+        if self._durability == "best_effort":
+            increment_counter("core.audit.dropped")
+            return
+        increment_counter("core.audit.backpressure")
+        await self._queue.put(event)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._collecting
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._max_batch:
+                batch.extend(self._drain(self._max_batch - len(batch)))
+                remaining = deadline - loop.time()
+                if len(batch) >= self._max_batch or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            self._collecting = []
+            self._flushing = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+
+    def _drain(self, limit: int) -> list[AuditEvent]:
+        batch: list[AuditEvent] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _write(self, batch: list[AuditEvent]) -> None:
+        if not batch:
+            return
+        started_at = time.perf_counter()
+        try:
+            await self._repository.record_many(batch)
+        except Exception:  # quality-allow-broad-except
+            increment_counter("core.audit.write_failures", amount=len(batch))
+            logger.exception("Failed to write %d audit events", len(batch))
+            return
+        record_timing("core.audit.flush.duration_ms", (time.perf_counter() - started_at) * 1000)
+        increment_counter("core.audit.flush.batches")
+        increment_counter("core.audit.flush.events", amount=len(batch))
+
+
+__all__ = ["AuditDurability", "AuditSink"]
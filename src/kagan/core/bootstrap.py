@@ -35,14 +35,17 @@ from kagan.core.events import (
     ScriptCompleted,
     TaskCreated,
     TaskDeleted,
+    TasksChanged,
     TaskStatusChanged,
     TaskUpdated,
 )
+from kagan.core.models.enums import ExecutionStatus
 from kagan.core.plugins.examples import register_example_plugins
 from kagan.core.plugins.sdk import PluginRegistry
+from kagan.core.utils import BackgroundTasks
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Iterable
 
     from textual.signal import Signal
 
@@ -52,8 +55,11 @@ if TYPE_CHECKING:
         PlannerRepository,
         TaskRepository,
     )
+    from kagan.core.adapters.db.repositories.task import StorageProfile
+    from kagan.core.adapters.execution_logs import LogFsyncPolicy
     from kagan.core.agents.agent_factory import AgentFactory
     from kagan.core.api import KaganAPI
+    from kagan.core.db_maintenance import DbMaintenance
     from kagan.core.services.agent_health import AgentHealthService
     from kagan.core.services.automation import AutomationService
     from kagan.core.services.diffs import DiffService
@@ -127,6 +133,7 @@ class SignalBinding:
     event_type: type[DomainEvent]
     signal: Signal
     extractor: Callable[[DomainEvent], object] | None = None
+    fan_out: bool = False
 
 
 TDomainEvent = TypeVar("TDomainEvent", bound=DomainEvent)
@@ -158,6 +165,7 @@ class SignalBridge:
         signal: Signal,
         *,
         extractor: Callable[[TDomainEvent], object] | None = None,
+        fan_out: bool = False,
     ) -> None:
         """Bind an event type to a Textual Signal.
 
@@ -166,12 +174,14 @@ class SignalBridge:
             signal: The Textual Signal to publish to.
             extractor: Optional function to extract the signal payload from
                        the event. If None, the full event is published.
+            fan_out: Treat the extracted payload as an iterable and publish
+                     each item separately.
         """
         binding_extractor = cast(
             "Callable[[DomainEvent], object] | None",
             extractor,
         )  # cast-justified: generic callback erasure for SignalBinding storage
-        self._bindings.append(SignalBinding(event_type, signal, binding_extractor))
+        self._bindings.append(SignalBinding(event_type, signal, binding_extractor, fan_out))
         if not self._handler_registered:
             self._event_bus.add_handler(self._on_event)
             self._handler_registered = True
@@ -181,8 +191,14 @@ class SignalBridge:
         for binding in self._bindings:
             if isinstance(event, binding.event_type):
                 payload = binding.extractor(event) if binding.extractor else event
-                with contextlib.suppress(Exception):  # quality-allow-broad-except
-                    binding.signal.publish(payload)
+                payloads = (
+                    cast("Iterable[object]", payload)  # cast-justified: fan_out payloads iterate
+                    if binding.fan_out
+                    else (payload,)
+                )
+                for item in payloads:
+                    with contextlib.suppress(Exception):  # quality-allow-broad-except
+                        binding.signal.publish(item)
 
     def unbind_all(self) -> None:
         """Remove all bindings and unregister from event bus."""
@@ -239,6 +255,7 @@ class AppContext:
     project_service: ProjectService = field(init=False)
     agent_health: AgentHealthService = field(init=False)
     audit_repository: AuditRepository = field(init=False)
+    db_maintenance: DbMaintenance = field(init=False)
     planner_repository: PlannerRepository = field(init=False)
     api: KaganAPI = field(init=False)
     plugin_registry: PluginRegistry = field(init=False)
@@ -247,6 +264,7 @@ class AppContext:
     active_repo_id: str | None = None
 
     _task_repo: TaskRepository | None = field(default=None, repr=False)
+    _background_tasks: BackgroundTasks = field(default_factory=BackgroundTasks, repr=False)
 
     async def close(self) -> None:
         """Clean up all resources.
@@ -266,11 +284,16 @@ class AppContext:
 
         if hasattr(self, "automation_service"):
             await self.automation_service.stop()
+        await self._background_tasks.shutdown()
         if hasattr(self, "job_service"):
             await self.job_service.shutdown()
+        if hasattr(self, "db_maintenance"):
+            await self.db_maintenance.stop()
 
         if self._task_repo is not None:
             await self._task_repo.close()
+        if hasattr(self, "execution_service"):
+            await self.execution_service.close()
 
 
 def create_signal_bridge(event_bus: EventBus) -> SignalBridge:
@@ -310,6 +333,12 @@ def wire_default_signals(bridge: SignalBridge, app: object) -> None:
             app.task_changed_signal,
             extractor=lambda e: e.task_id,
         )
+        bridge.bind(
+            TasksChanged,
+            app.task_changed_signal,
+            extractor=lambda e: e.task_ids,
+            fan_out=True,
+        )
         bridge.bind(
             AutomationTaskStarted,
             app.task_changed_signal,
@@ -400,9 +429,11 @@ async def create_app_context(
         SessionRecordRepository,
         TaskRepository,
     )
+    from kagan.core.adapters.execution_logs import SegmentedLogStore, execution_log_root
     from kagan.core.adapters.git.operations import GitOperationsAdapter
     from kagan.core.adapters.git.worktrees import GitWorktreeAdapter
     from kagan.core.agents.agent_factory import create_agent
+    from kagan.core.db_maintenance import DbMaintenance
     from kagan.core.services import (
         AutomationServiceImpl,
         DiffServiceImpl,
@@ -422,6 +453,11 @@ async def create_app_context(
         db_path,
         project_root=project_root,
         default_branch=config.general.default_base_branch,
+        storage_profile=cast("StorageProfile", config.general.db_storage_profile),
+        reader_pool_size=config.general.db_reader_pool_size,
+        write_batch_max_ops=config.general.db_write_batch_max_ops,
+        write_batch_max_latency_ms=config.general.db_write_batch_max_latency_ms,
+        task_cache_size=config.general.db_task_cache_size,
     )
     await task_repo.initialize()
 
@@ -433,7 +469,18 @@ async def create_app_context(
 
     session_factory = task_repo.session_factory
     repo_repository = RepoRepository(session_factory)
-    execution_repository = ExecutionRepository(session_factory)
+    log_store = None
+    if str(db_path) != ":memory:":
+        log_store = SegmentedLogStore(
+            execution_log_root(db_path),
+            segment_max_bytes=config.general.execution_log_segment_max_bytes,
+            fsync=cast("LogFsyncPolicy", config.general.execution_log_fsync),
+        )
+    execution_repository = ExecutionRepository(
+        session_factory,
+        log_store=log_store,
+        compress_min_bytes=config.general.execution_log_compress_min_bytes,
+    )
     session_record_repository = SessionRecordRepository(session_factory)
     scratch_repository = ScratchRepository(session_factory)
     audit_repository = AuditRepository(session_factory)
@@ -442,6 +489,13 @@ async def create_app_context(
 
     ctx._task_repo = task_repo
     ctx.audit_repository = audit_repository
+    ctx.db_maintenance = DbMaintenance(
+        task_repo.maintenance,
+        interval_seconds=config.general.db_maintenance_interval_seconds,
+        wal_checkpoint_bytes=config.general.db_wal_checkpoint_bytes,
+        optimize_interval_seconds=config.general.db_optimize_interval_seconds,
+        vacuum_free_ratio=config.general.db_vacuum_free_ratio,
+    )
     ctx.planner_repository = planner_repository
     ctx.task_service = TaskServiceImpl(
         task_repo,
@@ -497,6 +551,30 @@ async def create_app_context(
         return await execute_job_action(ctx, action=action, params=params)
 
     ctx.job_service = JobServiceImpl(_job_executor, repository=job_repository)
+
+    async def _submit_log_compaction(task_id: str) -> None:
+        from kagan.core.adapters.db.repositories.base import RepositoryClosing
+        from kagan.core.commands.job_action_executor import JobAction
+
+        with contextlib.suppress(RepositoryClosing):
+            execution = await execution_repository.get_latest_execution_for_task(task_id)
+            if execution is None or execution.status == ExecutionStatus.RUNNING:
+                return
+            await ctx.job_service.submit(
+                task_id=task_id,
+                action=JobAction.COMPACT_EXECUTION_LOGS,
+                params={"task_id": task_id, "execution_id": execution.id},
+            )
+
+    def _compact_finished_logs(event: DomainEvent) -> None:
+        if isinstance(event, AutomationTaskEnded):
+            ctx._background_tasks.spawn(
+                _submit_log_compaction(event.task_id),
+                name=f"compact-logs-{event.task_id}",
+            )
+
+    if config.general.execution_log_compaction:
+        event_bus.add_handler(_compact_finished_logs, AutomationTaskEnded)
     ctx.merge_service = MergeServiceImpl(
         ctx.task_service,
         ctx.workspace_service,
@@ -534,6 +612,7 @@ __all__ = [
     "TaskDeleted",
     "TaskStatusChanged",
     "TaskUpdated",
+    "TasksChanged",
     "bootstrap_app",
     "create_app_context",
     "create_signal_bridge",
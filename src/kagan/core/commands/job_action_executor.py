@@ -14,9 +14,13 @@ if TYPE_CHECKING:
 class JobAction(StrEnum):
     START_AGENT = "start_agent"
     STOP_AGENT = "stop_agent"
+    # Internal: submitted by the core itself, never accepted from jobs.submit.
+    COMPACT_EXECUTION_LOGS = "compact_execution_logs"
 
 
-SUPPORTED_JOB_ACTIONS: frozenset[str] = frozenset(action.value for action in JobAction)
+SUPPORTED_JOB_ACTIONS: frozenset[str] = frozenset(
+    {JobAction.START_AGENT.value, JobAction.STOP_AGENT.value}
+)
 
 
 def _runtime_snapshot(ctx: AppContext, task_id: str) -> dict[str, Any]:
@@ -172,6 +176,51 @@ async def _execute_stop_agent(ctx: AppContext, params: dict[str, Any]) -> dict[s
     }
 
 
+async def _execute_compact_execution_logs(
+    ctx: AppContext, params: dict[str, Any]
+) -> dict[str, Any]:
+    from kagan.core.models.enums import ExecutionStatus
+
+    task_id = _task_id_from_params(params)
+    execution_id = params.get("execution_id")
+    if task_id is None or not isinstance(execution_id, str) or not execution_id:
+        return {
+            "success": False,
+            "message": "task_id and execution_id are required",
+            "code": "INVALID_PARAMS",
+        }
+
+    execution = await ctx.execution_service.get_execution(execution_id)
+    if execution is None:
+        return {
+            "success": False,
+            "task_id": task_id,
+            "message": f"Execution {execution_id} not found",
+            "code": "EXECUTION_NOT_FOUND",
+        }
+    if execution.status == ExecutionStatus.RUNNING:
+        return {
+            "success": False,
+            "task_id": task_id,
+            "message": "Execution is still running",
+            "code": "EXECUTION_RUNNING",
+        }
+
+    compaction = await ctx.execution_service.compact_execution_logs(execution_id)
+    compacted = compaction.entries_after < compaction.entries_before
+    return {
+        "success": True,
+        "task_id": task_id,
+        "execution_id": execution_id,
+        "message": "Execution logs compacted" if compacted else "Nothing to compact",
+        "code": "COMPACTED" if compacted else "NOTHING_TO_COMPACT",
+        "entries_before": compaction.entries_before,
+        "entries_after": compaction.entries_after,
+        "bytes_before": compaction.bytes_before,
+        "bytes_after": compaction.bytes_after,
+    }
+
+
 async def execute_job_action(
     ctx: AppContext,
     *,
@@ -183,6 +232,8 @@ async def execute_job_action(
         return await _execute_start_agent(ctx, params)
     if resolved_action is JobAction.STOP_AGENT:
         return await _execute_stop_agent(ctx, params)
+    if resolved_action is JobAction.COMPACT_EXECUTION_LOGS:
+        return await _execute_compact_execution_logs(ctx, params)
 
     return {
         "success": False,
@@ -195,4 +246,4 @@ async def execute_job_action(
     }
 
 
-__all__ = ["SUPPORTED_JOB_ACTIONS", "execute_job_action"]
+__all__ = ["SUPPORTED_JOB_ACTIONS", "JobAction", "execute_job_action"]
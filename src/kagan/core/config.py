@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Literal
 import tomlkit
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from kagan.core.adapters.execution_logs import DEFAULT_LOG_COMPRESS_MIN_BYTES, LOG_FSYNC_POLICIES
 from kagan.core.paths import ensure_directories, get_config_path
 
 if TYPE_CHECKING:
@@ -131,6 +132,143 @@ class GeneralConfig(BaseModel):
         default="auto",
         description="IPC transport preference: auto|socket|tcp",
     )
+    core_audit_durability: str = Field(
+        default="batched",
+        description=(
+            "Audit write mode: sync (commit per request) | batched (group commit, "
+            "back-pressure when the queue is full) | best_effort (group commit, drop when full)"
+        ),
+    )
+    core_audit_flush_max_events: int = Field(
+        default=64,
+        ge=1,
+        description="Flush buffered audit events after this many are queued",
+    )
+    core_audit_flush_interval_ms: int = Field(
+        default=50,
+        ge=1,
+        description="Flush buffered audit events at least this often (milliseconds)",
+    )
+    core_audit_retention_days: int = Field(
+        default=30,
+        ge=0,
+        description="Prune audit events older than this many days (0 = keep forever)",
+    )
+    core_audit_max_rows: int = Field(
+        default=100_000,
+        ge=0,
+        description="Prune the oldest audit events beyond this many rows (0 = unlimited)",
+    )
+    core_audit_summarize_reads: bool = Field(
+        default=False,
+        description="Fold pruned read-only audit events into per-minute counters",
+    )
+    core_audit_archive: bool = Field(
+        default=True,
+        description="Export pruned audit events to gzip JSONL before deleting them",
+    )
+    core_audit_retention_interval_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="How often the core runs an audit retention pass (seconds)",
+    )
+
+    db_storage_profile: str = Field(
+        default="split",
+        description=(
+            "SQLite connection layout: split (one writer connection plus a read-only "
+            "reader pool) | shared (one pool for reads and writes)"
+        ),
+    )
+    db_reader_pool_size: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Read-only connections kept open by the split storage profile",
+    )
+    db_write_batch_max_ops: int = Field(
+        default=64,
+        ge=1,
+        le=1024,
+        description="Most repository writes committed together in one transaction",
+    )
+    db_write_batch_max_latency_ms: int = Field(
+        default=0,
+        ge=0,
+        le=1000,
+        description=(
+            "How long the write executor waits for a batch to fill before committing "
+            "(0 = commit whatever is queued)"
+        ),
+    )
+    db_task_cache_size: int = Field(
+        default=0,
+        ge=0,
+        le=65536,
+        description=(
+            "Tasks kept in the repository's write-through cache (0 = no cache); only safe "
+            "when a single process writes the database"
+        ),
+    )
+    db_maintenance_interval_seconds: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description="How often the core checks whether SQLite needs maintenance (0 = never)",
+    )
+    db_maintenance_quiet_seconds: int = Field(
+        default=10,
+        ge=0,
+        le=3600,
+        description="Idle time without client requests before maintenance may run (seconds)",
+    )
+    db_wal_checkpoint_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Checkpoint and truncate the WAL once it grows past this size (0 = never)",
+    )
+    db_optimize_interval_seconds: int = Field(
+        default=6 * 3600,
+        ge=0,
+        description="Time between query planner statistics refreshes (0 = never)",
+    )
+    db_vacuum_free_ratio: float = Field(
+        default=0.25,
+        ge=0.0,
+        le=1.0,
+        description="Vacuum once this share of database pages is unused (0 = never)",
+    )
+    execution_log_segment_max_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=64 * 1024,
+        description="Size at which an execution's on-disk log segment is rolled over",
+    )
+    execution_log_fsync: str = Field(
+        default="rollover",
+        description=(
+            "When execution log segments are fsynced: always (every chunk) | "
+            "rollover (when a segment is closed) | never"
+        ),
+    )
+    execution_log_compress_min_bytes: int = Field(
+        default=DEFAULT_LOG_COMPRESS_MIN_BYTES,
+        ge=0,
+        description="Compress execution log chunks of at least this many bytes (0 = never)",
+    )
+    execution_log_compaction: bool = Field(
+        default=True,
+        description="Merge an execution's log chunks in a background job once it finishes",
+    )
+    core_metrics_exporter: str = Field(
+        default="off",
+        description="Local OpenMetrics exporter: off | socket (runtime dir) | http (loopback)",
+    )
+    core_metrics_port: int = Field(
+        default=0,
+        ge=0,
+        le=65535,
+        description="Loopback port for the http metrics exporter (0 = pick a free port)",
+    )
 
     @field_validator("default_pair_terminal_backend", mode="before")
     @classmethod
@@ -155,6 +293,51 @@ class GeneralConfig(BaseModel):
                 pass
         return "auto"
 
+    @field_validator("core_audit_durability", mode="before")
+    @classmethod
+    def validate_core_audit_durability(cls, value: object) -> str:
+        """Coerce invalid audit durability values to 'batched'."""
+        valid = {"sync", "batched", "best_effort"}
+        match value:
+            case str() as mode if mode in valid:
+                return mode
+            case _:
+                pass
+        return "batched"
+
+    @field_validator("db_storage_profile", mode="before")
+    @classmethod
+    def validate_db_storage_profile(cls, value: object) -> str:
+        """Coerce invalid storage profiles to 'split'."""
+        match value:
+            case str() as profile if profile in {"split", "shared"}:
+                return profile
+            case _:
+                pass
+        return "split"
+
+    @field_validator("execution_log_fsync", mode="before")
+    @classmethod
+    def validate_execution_log_fsync(cls, value: object) -> str:
+        """Coerce invalid fsync policies to 'rollover'."""
+        match value:
+            case str() as policy if policy in LOG_FSYNC_POLICIES:
+                return policy
+            case _:
+                pass
+        return "rollover"
+
+    @field_validator("core_metrics_exporter", mode="before")
+    @classmethod
+    def validate_core_metrics_exporter(cls, value: object) -> str:
+        """Coerce invalid metrics exporter values to 'off'."""
+        match value:
+            case str() as mode if mode in {"off", "socket", "http"}:
+                return mode
+            case _:
+                pass
+        return "off"
+
 
 class UIConfig(BaseModel):
     """UI-related user preferences."""
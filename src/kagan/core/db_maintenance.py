@@ -0,0 +1,215 @@
+"""Scheduled SQLite maintenance: WAL checkpoints, ANALYZE and vacuuming."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from kagan.core.instrumentation import increment_counter, record_timing
+from kagan.core.time import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime
+
+    from kagan.core.adapters.db.maintenance import DbStorageStats, SqliteMaintenance
+
+logger = logging.getLogger(__name__)
+
+MaintenanceKind = Literal["optimize", "vacuum", "checkpoint"]
+
+
+@dataclass(slots=True)
+class DbMaintenanceRun:
+    """One completed maintenance job."""
+
+    kind: MaintenanceKind
+    finished_at: datetime
+    duration_ms: float
+    detail: dict[str, Any]
+
+
+class DbMaintenance:
+    """Keep the SQLite file checkpointed, analyzed and compact.
+
+    Every ``interval_seconds`` the scheduler reads the database's page and
+    WAL sizes and decides what is due: a ``wal_checkpoint(TRUNCATE)`` once
+    the WAL exceeds ``wal_checkpoint_bytes``, a planner statistics refresh
+    every ``optimize_interval_seconds``, and a vacuum once the unused share
+    of pages reaches ``vacuum_free_ratio``.  A zero threshold disables that
+    job.  Due jobs only run while the ``is_quiet`` callback given to
+    :meth:`start` reports no client traffic and no writes are queued;
+    otherwise the pass is deferred to the next interval.
+    """
+
+    def __init__(
+        self,
+        maintenance: SqliteMaintenance,
+        *,
+        interval_seconds: int = 300,
+        wal_checkpoint_bytes: int = 16 * 1024 * 1024,
+        optimize_interval_seconds: int = 6 * 3600,
+        vacuum_free_ratio: float = 0.25,
+    ) -> None:
+        if interval_seconds < 0 or wal_checkpoint_bytes < 0 or optimize_interval_seconds < 0:
+            msg = "interval and threshold settings must not be negative"
+            raise ValueError(msg)
+        if not 0.0 <= vacuum_free_ratio <= 1.0:
+            msg = "vacuum_free_ratio must be between 0 and 1"
+            raise ValueError(msg)
+        self._maintenance = maintenance
+        self._interval = interval_seconds
+        self._wal_checkpoint_bytes = wal_checkpoint_bytes
+        self._optimize_interval = optimize_interval_seconds
+        self._vacuum_free_ratio = vacuum_free_ratio
+        self._is_quiet: Callable[[], bool] = lambda: True
+        self._last_optimized_at: float | None = None
+        self._last_stats: DbStorageStats | None = None
+        self._last_runs: dict[MaintenanceKind, DbMaintenanceRun] = {}
+        self._deferred = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._interval > 0 and (
+            self._wal_checkpoint_bytes > 0
+            or self._optimize_interval > 0
+            or self._vacuum_free_ratio > 0
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, *, is_quiet: Callable[[], bool] | None = None) -> None:
+        """Start the periodic maintenance task (no-op when every job is disabled)."""
+        if is_quiet is not None:
+            self._is_quiet = is_quiet
+        if not self.enabled or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="core-db-maintenance")
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def run_once(self, *, force: bool = False) -> list[DbMaintenanceRun]:
+        """Run every due job and return what ran.
+
+        With ``force`` the quiet check is skipped; thresholds still apply.
+        """
+        stats = self._last_stats = await self._maintenance.stats()
+        due = self._due(stats)
+        if not due:
+            return []
+        if not force and not self._quiet():
+            self._deferred += 1
+            increment_counter("core.db.maintenance.deferred")
+            return []
+
+        runs: list[DbMaintenanceRun] = []
+        if "optimize" in due:
+            runs.append(await self._timed("optimize", self._optimize))
+        if "vacuum" in due:
+            runs.append(await self._timed("vacuum", self._vacuum))
+        if runs:
+            # Vacuuming and ANALYZE write to the WAL themselves.
+            stats = self._last_stats = await self._maintenance.stats()
+        if self._checkpoint_due(stats):
+            runs.append(await self._timed("checkpoint", self._checkpoint))
+            self._last_stats = await self._maintenance.stats()
+        return runs
+
+    def status(self) -> dict[str, Any]:
+        """Return the latest storage stats and the last run of each job."""
+        stats = self._last_stats
+        return {
+            "enabled": self.enabled,
+            "running": self.is_running,
+            "deferred_passes": self._deferred,
+            "storage": None if stats is None else {**asdict(stats), "free_ratio": stats.free_ratio},
+            "last_runs": {
+                kind: {
+                    "finished_at": run.finished_at.isoformat(),
+                    "duration_ms": round(run.duration_ms, 3),
+                    **run.detail,
+                }
+                for kind, run in self._last_runs.items()
+            },
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except Exception:  # quality-allow-broad-except
+                increment_counter("core.db.maintenance.failures")
+                logger.exception("Database maintenance pass failed")
+
+    def _quiet(self) -> bool:
+        return self._maintenance.pending_writes == 0 and self._is_quiet()
+
+    def _due(self, stats: DbStorageStats) -> set[MaintenanceKind]:
+        due: set[MaintenanceKind] = set()
+        if self._optimize_interval > 0 and (
+            self._last_optimized_at is None
+            or time.monotonic() - self._last_optimized_at >= self._optimize_interval
+        ):
+            due.add("optimize")
+        if (
+            self._vacuum_free_ratio > 0
+            and stats.freelist_count > 0
+            and stats.free_ratio >= self._vacuum_free_ratio
+        ):
+            due.add("vacuum")
+        if self._checkpoint_due(stats):
+            due.add("checkpoint")
+        return due
+
+    def _checkpoint_due(self, stats: DbStorageStats) -> bool:
+        return self._wal_checkpoint_bytes > 0 and stats.wal_bytes >= self._wal_checkpoint_bytes
+
+    async def _timed(
+        self,
+        kind: MaintenanceKind,
+        job: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> DbMaintenanceRun:
+        started_at = time.perf_counter()
+        detail = await job()
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        record_timing(f"core.db.maintenance.{kind}.duration_ms", duration_ms)
+        increment_counter(f"core.db.maintenance.{kind}.runs")
+        run = DbMaintenanceRun(
+            kind=kind, finished_at=utc_now(), duration_ms=duration_ms, detail=detail
+        )
+        self._last_runs[kind] = run
+        return run
+
+    async def _optimize(self) -> dict[str, Any]:
+        analyzed = await self._maintenance.optimize()
+        self._last_optimized_at = time.monotonic()
+        return {"full_analyze": analyzed}
+
+    async def _vacuum(self) -> dict[str, Any]:
+        freed = await self._maintenance.vacuum()
+        if freed:
+            logger.info("Vacuumed %d free database pages", freed)
+        return {"pages_freed": freed}
+
+    async def _checkpoint(self) -> dict[str, Any]:
+        result = await self._maintenance.checkpoint()
+        if result.busy:
+            increment_counter("core.db.maintenance.checkpoint.busy")
+        return asdict(result)
+
+
+__all__ = ["DbMaintenance", "DbMaintenanceRun"]
@@ -0,0 +1,245 @@
+"""Forward domain events from the event bus to IPC subscribers as push frames."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from kagan.core.events import (
+    AutomationAgentAttached,
+    AutomationReviewAgentAttached,
+    AutomationTaskEnded,
+    AutomationTaskStarted,
+    MergeCompleted,
+    MergeFailed,
+    PRCreated,
+    ProjectCreated,
+    ProjectOpened,
+    ScriptCompleted,
+    TaskCreated,
+    TaskDeleted,
+    TasksChanged,
+    TaskStatusChanged,
+    TaskUpdated,
+)
+from kagan.core.ipc.contracts import CoreEventFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from kagan.core.events import DomainEvent, EventBus
+    from kagan.core.ipc.server import ServerConnection
+
+    ProjectResolver = Callable[[str], Awaitable[str | None]]
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_QUEUE_SIZE = 100
+
+_live_subscriptions: set[EventSubscription] = set()
+
+SUBSCRIBABLE_EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    event_type.__name__: event_type
+    for event_type in (
+        TaskCreated,
+        TaskUpdated,
+        TaskDeleted,
+        TaskStatusChanged,
+        TasksChanged,
+        AutomationTaskStarted,
+        AutomationAgentAttached,
+        AutomationReviewAgentAttached,
+        AutomationTaskEnded,
+        MergeCompleted,
+        MergeFailed,
+        ProjectOpened,
+        ProjectCreated,
+        PRCreated,
+        ScriptCompleted,
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EventSubscriptionFilter:
+    """Which events a subscriber wants to receive.
+
+    Empty filters match everything.  ``project_id`` is matched against the
+    event's own ``project_id`` or, for task events, the owning task's project;
+    events that cannot be attributed to a project (workspace/merge events,
+    deleted tasks) are always delivered.
+    """
+
+    event_types: frozenset[str] = frozenset()
+    task_ids: frozenset[str] = frozenset()
+    project_id: str | None = None
+
+    @classmethod
+    def from_params(cls, params: dict[str, Any]) -> EventSubscriptionFilter:
+        """Parse ``events.subscribe`` params, raising ``ValueError`` on bad input."""
+        event_types = frozenset(_str_items(params.get("event_types"), "event_types"))
+        unknown = sorted(event_types - SUBSCRIBABLE_EVENT_TYPES.keys())
+        if unknown:
+            msg = f"Unknown event types: {', '.join(unknown)}"
+            raise ValueError(msg)
+        project_id = params.get("project_id")
+        if project_id is not None and not isinstance(project_id, str):
+            msg = "project_id must be a string"
+            raise ValueError(msg)
+        return cls(
+            event_types=event_types,
+            task_ids=frozenset(_str_items(params.get("task_ids"), "task_ids")),
+            project_id=project_id or None,
+        )
+
+    def accepts_type(self, event: DomainEvent) -> bool:
+        """Cheap synchronous pre-filter applied on the publisher's side."""
+        name = type(event).__name__
+        if name not in SUBSCRIBABLE_EVENT_TYPES:
+            return False
+        if self.event_types and name not in self.event_types:
+            return False
+        if self.task_ids:
+            if isinstance(event, TasksChanged):
+                return not self.task_ids.isdisjoint(event.task_ids)
+            task_id = getattr(event, "task_id", None)
+            return task_id is None or task_id in self.task_ids
+        return True
+
+
+def _str_items(value: object, field_name: str) -> list[str]:
+    match value:
+        case None:
+            return []
+        case list() as values if all(isinstance(item, str) for item in values):
+            return [item for item in values if item]
+        case _:
+            msg = f"{field_name} must be a list of strings"
+            raise ValueError(msg)
+
+
+def event_to_frame(subscription_id: str, event: DomainEvent) -> CoreEventFrame:
+    """Convert a domain event dataclass into a push frame."""
+    payload = {
+        field.name: getattr(event, field.name)
+        for field in dataclasses.fields(event)  # type: ignore[arg-type]
+        if field.name not in {"event_id", "occurred_at"}
+    }
+    return CoreEventFrame(
+        subscription_id=subscription_id,
+        event_type=type(event).__name__,
+        event_id=event.event_id,
+        occurred_at=event.occurred_at,
+        payload=payload,
+    )
+
+
+class EventSubscription:
+    """One ``events.subscribe`` stream bound to an IPC connection.
+
+    The bus handler is registered on construction, so no event published after
+    the subscribe call returns can be missed.  Events are buffered in a bounded
+    queue; when a slow client lets it fill up, further events are dropped and
+    counted rather than blocking publishers.
+    """
+
+    def __init__(
+        self,
+        subscription_id: str,
+        event_bus: EventBus,
+        event_filter: EventSubscriptionFilter,
+        *,
+        resolve_project: ProjectResolver,
+    ) -> None:
+        self._subscription_id = subscription_id
+        self._event_bus = event_bus
+        self._filter = event_filter
+        self._resolve_project = resolve_project
+        self._queue: asyncio.Queue[DomainEvent] = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+        self._task_projects: dict[str, str | None] = {}
+        self._dropped = 0
+        self._closed = False
+        # Keep one bound method: the bus removes handlers by identity.
+        self._handler = self._on_event
+        event_bus.add_handler(self._handler)
+        _live_subscriptions.add(self)
+
+    @property
+    def subscription_id(self) -> str:
+        return self._subscription_id
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded because the subscriber fell behind."""
+        return self._dropped
+
+    @property
+    def queue_depth(self) -> int:
+        """Events buffered but not yet pushed to the subscriber."""
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        """Detach from the event bus.  Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        self._event_bus.remove_handler(self._handler)
+        _live_subscriptions.discard(self)
+
+    def _on_event(self, event: DomainEvent) -> None:
+        if not self._filter.accepts_type(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._dropped += 1
+
+    async def forward(self, connection: ServerConnection) -> None:
+        """Push matching events to *connection* until cancelled or disconnected."""
+        try:
+            while True:
+                event = await self._queue.get()
+                if not await self._matches_project(event):
+                    continue
+                await connection.send(event_to_frame(self._subscription_id, event))
+        except (ConnectionError, OSError):
+            logger.debug("Event subscriber %s went away", self._subscription_id)
+        finally:
+            self.close()
+
+    async def _matches_project(self, event: DomainEvent) -> bool:
+        project_id = self._filter.project_id
+        if project_id is None:
+            return True
+        event_project = getattr(event, "project_id", None)
+        if event_project is not None:
+            return event_project == project_id
+        task_id = getattr(event, "task_id", None)
+        if task_id is None:
+            return True
+        if task_id not in self._task_projects:
+            task_project: str | None = None
+            with contextlib.suppress(Exception):  # quality-allow-broad-except
+                task_project = await self._resolve_project(task_id)
+            self._task_projects[task_id] = task_project
+        task_project = self._task_projects[task_id]
+        return task_project is None or task_project == project_id
+
+
+def subscription_queue_depths() -> list[int]:
+    """Return the buffered event count of every open subscription."""
+    return [subscription.queue_depth for subscription in _live_subscriptions]
+
+
+__all__ = [
+    "SUBSCRIBABLE_EVENT_TYPES",
+    "SUBSCRIPTION_QUEUE_SIZE",
+    "EventSubscription",
+    "EventSubscriptionFilter",
+    "event_to_frame",
+    "subscription_queue_depths",
+]
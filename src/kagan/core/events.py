@@ -97,6 +97,22 @@ class TaskStatusChanged:
     occurred_at: datetime = field(default_factory=_now)
 
 
+@dataclass(frozen=True)
+class TasksChanged:
+    """Emitted once for a bulk create, update or move instead of per-task events.
+
+    ``status_changes`` holds ``(task_id, from_status, to_status)`` for every
+    task whose status changed.
+    """
+
+    task_ids: list[str]
+    fields_changed: list[str]
+    status_changes: list[tuple[str, TaskStatus, TaskStatus]]
+    updated_at: datetime
+    event_id: str = field(default_factory=_new_event_id)
+    occurred_at: datetime = field(default_factory=_now)
+
+
 @dataclass(frozen=True)
 class AutomationTaskStarted:
     """Emitted when an AUTO task enters automation running state."""
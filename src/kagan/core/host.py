@@ -10,10 +10,14 @@ import json
 import logging
 import os
 from collections import OrderedDict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from kagan.core.adapters.db.schema import AuditEvent
+from kagan.core.audit_retention import AuditRetention
+from kagan.core.audit_sink import AuditSink
 from kagan.core.bootstrap import create_app_context
 from kagan.core.config import KaganConfig
+from kagan.core.event_stream import subscription_queue_depths
 from kagan.core.events import (
     CoreHostDraining,
     CoreHostRunning,
@@ -24,18 +28,27 @@ from kagan.core.instance_lease import (
     CORE_LEASE_HEARTBEAT_SECONDS,
     CoreInstanceLock,
 )
-from kagan.core.ipc.contracts import CoreRequest, CoreResponse
-from kagan.core.ipc.server import IPCServer
+from kagan.core.instrumentation import configure as configure_instrumentation
+from kagan.core.instrumentation import snapshot as instrumentation_snapshot
+from kagan.core.instrumentation import timed_operation
+from kagan.core.ipc.contracts import MAX_BATCH_ITEMS, CoreChunkFrame, CoreRequest, CoreResponse
+from kagan.core.ipc.server import IPCServer, current_connection
+from kagan.core.metrics_exporter import GaugeSample, MetricsExporter, render_openmetrics
 from kagan.core.models.enums import TaskType
 from kagan.core.paths import (
     get_config_path,
     get_core_endpoint_path,
     get_core_instance_lock_path,
+    get_core_metrics_endpoint_path,
+    get_core_metrics_socket_path,
     get_core_runtime_dir,
     get_core_token_path,
     get_database_path,
 )
-from kagan.core.request_dispatch_map import build_request_dispatch_map
+from kagan.core.request_dispatch_map import (
+    build_request_dispatch_map,
+    build_stream_dispatch_map,
+)
 from kagan.core.runtime_helpers import (
     IDEMPOTENCY_CACHE_LIMIT,
     IDEMPOTENT_MUTATION_METHODS,
@@ -44,6 +57,7 @@ from kagan.core.runtime_helpers import (
     IdempotencyReservation,
 )
 from kagan.core.security import AuthorizationError, CapabilityProfile
+from kagan.core.services.jobs import JobStatus
 from kagan.core.session_binding import (
     SessionBinding,
     SessionBindingError,
@@ -63,10 +77,11 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any
 
+    from kagan.core.audit_sink import AuditDurability
     from kagan.core.bootstrap import AppContext
     from kagan.core.ipc.transports import ServerHandle
     from kagan.core.plugins.sdk import PluginOperation, PluginPolicyDecision, PluginRegistry
-    from kagan.core.request_dispatch_map import RequestHandler
+    from kagan.core.request_dispatch_map import RequestHandler, StreamHandler
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +91,19 @@ def _core_lease_path() -> Path:
 
 
 _REQUEST_DISPATCH_MAP: dict[tuple[str, str], RequestHandler] | None = None
+_STREAM_DISPATCH_MAP: dict[tuple[str, str], StreamHandler] | None = None
+
+# Timing names for requests whose capability/method is not a known operation,
+# so clients cannot mint an unbounded number of metric series.
+_UNKNOWN_REQUEST_TIMING = "core.request.unknown.duration_ms"
+_BATCH_REQUEST_TIMING = "core.request.batch.duration_ms"
+
+
+def _request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
+    global _REQUEST_DISPATCH_MAP
+    if _REQUEST_DISPATCH_MAP is None:
+        _REQUEST_DISPATCH_MAP = build_request_dispatch_map()
+    return _REQUEST_DISPATCH_MAP
 
 
 class CoreHostStatus(enum.Enum):
@@ -117,11 +145,16 @@ class CoreHost:
         self._status = CoreHostStatus.STOPPED
         self._ctx: AppContext | None = None
         self._ipc_server: IPCServer | None = None
+        self._audit_sink: AuditSink | None = None
+        self._audit_retention: AuditRetention | None = None
+        self._metrics_exporter: MetricsExporter | None = None
         self._idle_task: asyncio.Task[None] | None = None
         self._lease_heartbeat_task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
         self._client_count = 0
         self._last_disconnected_time: float | None = None
+        self._inflight_requests = 0
+        self._last_request_time: float | None = None
         self._session_bindings: dict[str, SessionBinding] = {}
         self._idempotency_records: OrderedDict[tuple[str, str], IdempotencyRecord] = OrderedDict()
         self._idempotency_lock = asyncio.Lock()
@@ -214,6 +247,9 @@ class CoreHost:
             )
             await self._reconcile_startup_runtime_state()
             await self._ctx.automation_service.start()
+            self._start_audit_sink()
+            self._start_audit_retention()
+            self._start_db_maintenance()
 
             await self._ctx.event_bus.publish(CoreHostStarting())
 
@@ -223,11 +259,13 @@ class CoreHost:
                 transport_preference=transport_pref,
                 on_client_connect=self._on_client_connected,
                 on_client_disconnect=self._on_client_disconnected,
+                concurrent_dispatch=True,
             )
             handle = await self._ipc_server.start()
 
             self._write_runtime_files(handle)
             runtime_files_written = True
+            await self._start_metrics_exporter()
             self._lease_heartbeat_task = asyncio.create_task(
                 self._lease_heartbeat_loop(),
                 name="core-lease-heartbeat",
@@ -258,6 +296,10 @@ class CoreHost:
                 os.getpid(),
             )
         except Exception:  # quality-allow-broad-except
+            if self._metrics_exporter is not None:
+                with contextlib.suppress(Exception):  # quality-allow-broad-except
+                    await self._metrics_exporter.stop()
+                self._metrics_exporter = None
             if self._lease_heartbeat_task is not None:
                 self._lease_heartbeat_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
@@ -269,6 +311,14 @@ class CoreHost:
                 with contextlib.suppress(Exception):  # quality-allow-broad-except
                     await self._ipc_server.stop()
                 self._ipc_server = None
+            if self._audit_retention is not None:
+                with contextlib.suppress(Exception):  # quality-allow-broad-except
+                    await self._audit_retention.stop()
+                self._audit_retention = None
+            if self._audit_sink is not None:
+                with contextlib.suppress(Exception):  # quality-allow-broad-except
+                    await self._audit_sink.stop()
+                self._audit_sink = None
             if self._ctx is not None:
                 with contextlib.suppress(Exception):  # quality-allow-broad-except
                     await self._ctx.close()
@@ -298,10 +348,22 @@ class CoreHost:
                 await self._lease_heartbeat_task
             self._lease_heartbeat_task = None
 
+        if self._metrics_exporter is not None:
+            await self._metrics_exporter.stop()
+            self._metrics_exporter = None
+
         if self._ipc_server is not None:
             await self._ipc_server.stop()
             self._ipc_server = None
 
+        if self._audit_retention is not None:
+            await self._audit_retention.stop()
+            self._audit_retention = None
+
+        if self._audit_sink is not None:
+            await self._audit_sink.stop()
+            self._audit_sink = None
+
         self._cleanup_runtime_files()
 
         if self._ctx is not None:
@@ -324,7 +386,29 @@ class CoreHost:
         await self._stop_event.wait()
 
     async def handle_request(self, request: CoreRequest) -> CoreResponse:
-        """Dispatch an IPC request through the canonical request dispatch map."""
+        """Dispatch an IPC request through the canonical request dispatch map.
+
+        Each built-in or plugin operation is timed under
+        ``core.request.<capability>.<method>.duration_ms``; batch envelopes and
+        unknown methods share one fixed name each.
+        """
+        self._inflight_requests += 1
+        try:
+            with timed_operation(self._request_timing_name(request)):
+                return await self._handle_request(request)
+        finally:
+            self._inflight_requests -= 1
+            self._last_request_time = asyncio.get_running_loop().time()
+
+    def _request_timing_name(self, request: CoreRequest) -> str:
+        if request.is_batch:
+            return _BATCH_REQUEST_TIMING
+        key = (request.capability, request.method)
+        if key in _request_dispatch_map() or self._plugin_operation(request) is not None:
+            return f"core.request.{request.capability}.{request.method}.duration_ms"
+        return _UNKNOWN_REQUEST_TIMING
+
+    async def _handle_request(self, request: CoreRequest) -> CoreResponse:
         response: CoreResponse
 
         if self._ctx is None:
@@ -335,6 +419,9 @@ class CoreHost:
             )
             return response
 
+        if request.is_batch:
+            return await self._handle_batch(request)
+
         try:
             binding = get_session_binding(self._session_bindings, request)
             plugin_decision = self._plugin_policy_decision(request, binding=binding)
@@ -364,6 +451,23 @@ class CoreHost:
         await self._record_audit_event(request, response)
         return response
 
+    async def _handle_batch(self, request: CoreRequest) -> CoreResponse:
+        """Authorize and dispatch each item of a ``core.batch`` envelope concurrently.
+
+        Items go through ``handle_request`` individually, so every item is
+        checked against the session binding, de-duplicated, and audited exactly
+        as if it had been sent on its own.  Items must not depend on each other.
+        """
+        items = request.batch_requests()
+        if not items or len(items) > MAX_BATCH_ITEMS:
+            return CoreResponse.failure(
+                request.request_id,
+                code="INVALID_PARAMS",
+                message=f"batch must contain between 1 and {MAX_BATCH_ITEMS} requests",
+            )
+        responses = await asyncio.gather(*(self.handle_request(item) for item in items))
+        return CoreResponse.batch(request.request_id, list(responses))
+
     @staticmethod
     def _idempotency_cache_key(request: CoreRequest) -> tuple[str, str] | None:
         key = request.idempotency_key
@@ -614,26 +718,48 @@ class CoreHost:
 
         Returns the formatted result dict if the (capability, method) pair is
         in the request dispatch map, or ``None`` when no built-in handler
-        exists for that pair.
+        exists for that pair.  Streaming requests over an IPC connection send
+        their result as chunk frames and return only a summary.
 
         Authorization has already been enforced before this method is called.
         """
-        global _REQUEST_DISPATCH_MAP
         assert self._ctx is not None
         api = getattr(self._ctx, "api", None)
         if api is None:
             return None
 
-        if _REQUEST_DISPATCH_MAP is None:
-            _REQUEST_DISPATCH_MAP = build_request_dispatch_map()
-
+        dispatch_map = _request_dispatch_map()
         key = (request.capability, request.method)
-        if key not in _REQUEST_DISPATCH_MAP:
+        if key not in dispatch_map:
             return None
 
-        handler = _REQUEST_DISPATCH_MAP[key]
+        if request.stream:
+            stream_handler = self._stream_handler(key)
+            connection = current_connection()
+            if stream_handler is not None and connection is not None:
+                sequence = 0
+                async for chunk in stream_handler(api, request.params):
+                    await connection.send(
+                        CoreChunkFrame(
+                            request_id=request.request_id,
+                            sequence=sequence,
+                            result=chunk,
+                        )
+                    )
+                    sequence += 1
+                return {"success": True, "streamed": True, "chunk_count": sequence}
+
+        handler = dispatch_map[key]
         return await handler(api, request.params)
 
+    @staticmethod
+    def _stream_handler(key: tuple[str, str]) -> StreamHandler | None:
+        """Return the chunk generator for *key*, or ``None`` if it cannot stream."""
+        global _STREAM_DISPATCH_MAP
+        if _STREAM_DISPATCH_MAP is None:
+            _STREAM_DISPATCH_MAP = build_stream_dispatch_map()
+        return _STREAM_DISPATCH_MAP.get(key)
+
     async def _try_plugin_dispatch(
         self,
         request: CoreRequest,
@@ -645,8 +771,152 @@ class CoreHost:
             return None
         return await operation.handler(self._ctx, request.params)
 
+    def _start_audit_sink(self) -> None:
+        assert self._config is not None
+        if self._ctx is None or not hasattr(self._ctx, "audit_repository"):
+            return
+        general = self._config.general
+        self._audit_sink = AuditSink(
+            self._ctx.audit_repository,
+            durability=cast("AuditDurability", general.core_audit_durability),
+            max_batch=general.core_audit_flush_max_events,
+            flush_interval_ms=general.core_audit_flush_interval_ms,
+        )
+        self._audit_sink.start()
+
+    def _start_audit_retention(self) -> None:
+        assert self._config is not None
+        if self._ctx is None or not hasattr(self._ctx, "audit_repository"):
+            return
+        general = self._config.general
+        archive_dir = self._db_path.parent / "audit-archive" if general.core_audit_archive else None
+        self._audit_retention = AuditRetention(
+            self._ctx.audit_repository,
+            max_age_days=general.core_audit_retention_days,
+            max_rows=general.core_audit_max_rows,
+            summarize_reads=general.core_audit_summarize_reads,
+            archive_dir=archive_dir,
+            interval_seconds=general.core_audit_retention_interval_seconds,
+        )
+        self._audit_retention.start()
+
+    def _start_db_maintenance(self) -> None:
+        if self._ctx is None or not hasattr(self._ctx, "db_maintenance"):
+            return
+        self._ctx.db_maintenance.start(is_quiet=self._is_quiet)
+
+    def _is_quiet(self) -> bool:
+        """Whether no request is running or arrived within the maintenance quiet period."""
+        assert self._config is not None
+        if self._inflight_requests > 0:
+            return False
+        if self._last_request_time is None:
+            return True
+        idle = asyncio.get_running_loop().time() - self._last_request_time
+        return idle >= self._config.general.db_maintenance_quiet_seconds
+
+    async def _start_metrics_exporter(self) -> None:
+        """Start the optional local OpenMetrics exporter.
+
+        The exporter is a diagnostics aid: failing to bind it is logged and
+        does not prevent the core from starting.
+        """
+        assert self._config is not None
+        general = self._config.general
+        if general.core_metrics_exporter == "off":
+            return
+        configure_instrumentation(enabled=True)
+        exporter = MetricsExporter(
+            self.collect_metrics,
+            transport="socket" if general.core_metrics_exporter == "socket" else "http",
+            socket_path=get_core_metrics_socket_path(),
+            port=general.core_metrics_port,
+        )
+        try:
+            await exporter.start()
+        except OSError as exc:
+            logger.warning("Metrics exporter could not start: %s", exc)
+            return
+        self._metrics_exporter = exporter
+        get_core_metrics_endpoint_path().write_text(
+            json.dumps(exporter.address, indent=2),
+            encoding="utf-8",
+        )
+
+    async def collect_metrics(self) -> str:
+        """Render instrumentation and core gauges in OpenMetrics text format."""
+        return render_openmetrics(instrumentation_snapshot(), await self._metric_gauges())
+
+    async def _metric_gauges(self) -> list[GaugeSample]:
+        gauges = [
+            GaugeSample("core.clients.connected", self._client_count, help="Connected IPC clients"),
+        ]
+        depths = subscription_queue_depths()
+        gauges.extend(
+            [
+                GaugeSample("core.events.subscribers", len(depths), help="Open event streams"),
+                GaugeSample(
+                    "core.events.subscriber_queue_depth",
+                    max(depths, default=0),
+                    labels=(("stat", "max"),),
+                    help="Events buffered for event-stream subscribers",
+                ),
+                GaugeSample(
+                    "core.events.subscriber_queue_depth", sum(depths), labels=(("stat", "sum"),)
+                ),
+            ]
+        )
+        if self._audit_sink is not None:
+            gauges.append(
+                GaugeSample(
+                    "core.audit.pending",
+                    self._audit_sink.pending_count,
+                    help="Audit events queued but not yet written",
+                )
+            )
+        ctx = self._ctx
+        if ctx is None:
+            return gauges
+        if hasattr(ctx, "automation_service"):
+            automation = ctx.automation_service
+            gauges.append(
+                GaugeSample(
+                    "core.agents.running", len(automation.running_tasks), help="Running agents"
+                )
+            )
+            gauges.append(
+                GaugeSample(
+                    "core.automation.pending_spawns",
+                    automation.pending_spawn_count,
+                    help="Tasks waiting for an agent slot",
+                )
+            )
+        if hasattr(ctx, "job_service"):
+            counts = await ctx.job_service.status_counts()
+            for status in JobStatus:
+                gauges.append(
+                    GaugeSample(
+                        "core.jobs",
+                        counts.get(status.value, 0),
+                        labels=(("status", status.value),),
+                        help="Jobs by status",
+                    )
+                )
+        db_size = 0
+        for path in (self._db_path, self._db_path.with_name(f"{self._db_path.name}-wal")):
+            with contextlib.suppress(OSError):
+                db_size += path.stat().st_size
+        gauges.append(
+            GaugeSample("core.db.size_bytes", db_size, help="Database plus WAL file size")
+        )
+        return gauges
+
     async def _record_audit_event(self, request: CoreRequest, response: CoreResponse) -> None:
-        """Persist an immutable audit event for every handled request."""
+        """Persist an immutable audit event for every handled request.
+
+        While the host is running events go through the ``AuditSink`` and are
+        group-committed off the response path, per ``core_audit_durability``.
+        """
         if self._ctx is None or not hasattr(self._ctx, "audit_repository"):
             return
         try:
@@ -673,16 +943,20 @@ class CoreHost:
                 nested_success = result_payload.get("success")
                 if isinstance(nested_success, bool):
                     operation_success = nested_success
-            await self._ctx.audit_repository.record(
-                actor_type="session",
-                actor_id=request.session_id,
-                session_id=request.session_id,
-                capability=request.capability,
-                command_name=request.method,
-                payload_json=json.dumps(payload, default=str),
-                result_json=json.dumps(result_payload, default=str),
-                success=operation_success,
-            )
+            fields: dict[str, Any] = {
+                "actor_type": "session",
+                "actor_id": request.session_id,
+                "session_id": request.session_id,
+                "capability": request.capability,
+                "command_name": request.method,
+                "payload_json": json.dumps(payload, default=str),
+                "result_json": json.dumps(result_payload, default=str),
+                "success": operation_success,
+            }
+            if self._audit_sink is not None:
+                await self._audit_sink.submit(AuditEvent(**fields))
+            else:
+                await self._ctx.audit_repository.record(**fields)
         except Exception:  # quality-allow-broad-except
             logger.exception(
                 "Failed to record audit event for %s.%s", request.capability, request.method
@@ -765,6 +1039,7 @@ class CoreHost:
         """Remove runtime files on shutdown."""
         for path_fn in (
             get_core_endpoint_path,
+            get_core_metrics_endpoint_path,
             get_core_token_path,
             _core_lease_path,
         ):
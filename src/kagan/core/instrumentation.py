@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
 import threading
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -28,12 +29,38 @@ def _is_env_enabled(name: str) -> bool:
     return raw.strip().lower() in _ENABLED_VALUES
 
 
+# Log-linear histogram buckets: every power of two above 1 µs is split into
+# eight equal sub-buckets, so a bucket's upper bound overstates a sample by at
+# most 12.5%.  240 buckets reach ~12 days, beyond any duration we record.
+_HISTOGRAM_MIN_MS = 0.001
+_HISTOGRAM_SUB_BUCKETS = 8
+_HISTOGRAM_BUCKETS = 1 + 30 * _HISTOGRAM_SUB_BUCKETS
+_PERCENTILES = (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99))
+
+
+def _bucket_index(duration_ms: float) -> int:
+    if duration_ms <= _HISTOGRAM_MIN_MS:
+        return 0
+    mantissa, exponent = math.frexp(duration_ms / _HISTOGRAM_MIN_MS)
+    sub_bucket = min(int((mantissa * 2 - 1) * _HISTOGRAM_SUB_BUCKETS), _HISTOGRAM_SUB_BUCKETS - 1)
+    return min((exponent - 1) * _HISTOGRAM_SUB_BUCKETS + sub_bucket + 1, _HISTOGRAM_BUCKETS - 1)
+
+
+def bucket_upper_bound_ms(index: int) -> float:
+    """Return the inclusive upper bound of histogram bucket *index* in milliseconds."""
+    if index <= 0:
+        return _HISTOGRAM_MIN_MS
+    exponent, sub_bucket = divmod(index - 1, _HISTOGRAM_SUB_BUCKETS)
+    return _HISTOGRAM_MIN_MS * 2**exponent * (1 + (sub_bucket + 1) / _HISTOGRAM_SUB_BUCKETS)
+
+
 @dataclass(slots=True)
 class _TimingStats:
     count: int = 0
     total_ms: float = 0.0
     min_ms: float = float("inf")
     max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * _HISTOGRAM_BUCKETS)
 
     def add(self, duration_ms: float) -> None:
         self.count += 1
@@ -42,17 +69,41 @@ class _TimingStats:
             self.min_ms = duration_ms
         if duration_ms > self.max_ms:
             self.max_ms = duration_ms
+        self.buckets[_bucket_index(duration_ms)] += 1
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate a percentile from the histogram, clamped to the observed range."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return max(self.min_ms, min(bucket_upper_bound_ms(index), self.max_ms))
+        return self.max_ms
 
     def to_dict(self) -> dict[str, float | int]:
         min_ms = 0.0 if self.min_ms == float("inf") else self.min_ms
         avg_ms = self.total_ms / self.count if self.count else 0.0
-        return {
+        stats: dict[str, float | int] = {
             "count": self.count,
             "total_ms": self.total_ms,
             "avg_ms": avg_ms,
             "min_ms": min_ms,
             "max_ms": self.max_ms,
         }
+        for key, quantile in _PERCENTILES:
+            stats[key] = self.percentile(quantile)
+        return stats
+
+    def histogram(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound_ms, count)`` pairs for non-empty buckets."""
+        return [
+            (bucket_upper_bound_ms(index), bucket_count)
+            for index, bucket_count in enumerate(self.buckets)
+            if bucket_count
+        ]
 
 
 _lock = threading.Lock()
@@ -88,11 +139,13 @@ def snapshot() -> dict[str, Any]:
     with _lock:
         counters = dict(_counters)
         timings = {name: stats.to_dict() for name, stats in _timings.items()}
+        histograms = {name: stats.histogram() for name, stats in _timings.items()}
     return {
         "enabled": _enabled,
         "log_events": _log_events,
         "counters": counters,
         "timings": timings,
+        "histograms": histograms,
     }
 
 
@@ -166,6 +219,7 @@ def timed_operation(
 
 
 __all__ = [
+    "bucket_upper_bound_ms",
     "configure",
     "increment_counter",
     "is_enabled",
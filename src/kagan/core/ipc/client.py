@@ -3,20 +3,148 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import logging
 from typing import TYPE_CHECKING, Any
-
-from kagan.core.ipc.contracts import CoreRequest, CoreResponse
+from uuid import uuid4
+
+from kagan.core.ipc.codec import (
+    CODEC_ACCEPT_KEY,
+    CODEC_OFFER_KEY,
+    JSON_LINES,
+    available_codecs,
+    resolve_codec_preference,
+)
+from kagan.core.ipc.contracts import CoreChunkFrame, CoreEventFrame, CoreRequest, CoreResponse
 from kagan.core.ipc.transports import DefaultTransport, TCPLoopbackTransport, UnixSocketTransport
 
 if TYPE_CHECKING:
+    from kagan.core.ipc.codec import FrameCodec
+    from kagan.core.ipc.contracts import CoreBatchItem
     from kagan.core.ipc.discovery import CoreEndpoint
 
 logger = logging.getLogger(__name__)
 
-_MAX_LINE_BYTES = 4 * 1024 * 1024  # 4 MiB per JSON line
 _DEFAULT_TIMEOUT = 30.0
+_EVENT_QUEUE_SIZE = 1000
+
+
+class IPCEventStream:
+    """Async iterator over event frames pushed for one ``events.subscribe`` call.
+
+    Iteration ends when the subscription is closed or the connection drops.
+    """
+
+    def __init__(
+        self,
+        client: IPCClient,
+        subscription_id: str,
+        queue: asyncio.Queue[CoreEventFrame | None],
+        *,
+        session_id: str,
+        session_profile: str | None,
+        session_origin: str | None,
+    ) -> None:
+        self._client = client
+        self._subscription_id = subscription_id
+        self._queue = queue
+        self._session_id = session_id
+        self._session_profile = session_profile
+        self._session_origin = session_origin
+        self._closed = False
+
+    @property
+    def subscription_id(self) -> str:
+        return self._subscription_id
+
+    def __aiter__(self) -> IPCEventStream:
+        return self
+
+    async def __anext__(self) -> CoreEventFrame:
+        if self._closed:
+            raise StopAsyncIteration
+        frame = await self._queue.get()
+        if frame is None:
+            self._closed = True
+            raise StopAsyncIteration
+        return frame
+
+    async def close(self) -> None:
+        """Cancel the subscription on the core and stop iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self._client._drop_subscription(self._subscription_id)
+        if not self._client.is_connected:
+            return
+        with contextlib.suppress(ConnectionError, TimeoutError):
+            await self._client.request(
+                session_id=self._session_id,
+                session_profile=self._session_profile,
+                session_origin=self._session_origin,
+                capability="events",
+                method="unsubscribe",
+                params={"subscription_id": self._subscription_id},
+            )
+
+
+class IPCResponseStream:
+    """Async iterator over the chunks of one ``stream=True`` request.
+
+    Yields each chunk's ``result`` as it arrives.  Once iteration ends the
+    request's final ``CoreResponse`` is available as :attr:`response`; methods
+    that cannot stream answer with a full response and no chunks.
+    """
+
+    def __init__(
+        self,
+        client: IPCClient,
+        request_id: str,
+        queue: asyncio.Queue[CoreChunkFrame | CoreResponse | None],
+        *,
+        timeout: float,
+    ) -> None:
+        self._client = client
+        self._request_id = request_id
+        self._queue = queue
+        self._timeout = timeout
+        self._response: CoreResponse | None = None
+        self._closed = False
+
+    @property
+    def request_id(self) -> str:
+        return self._request_id
+
+    @property
+    def response(self) -> CoreResponse | None:
+        """Final response, or *None* until the stream is exhausted."""
+        return self._response
+
+    def __aiter__(self) -> IPCResponseStream:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if self._closed:
+            raise StopAsyncIteration
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout=self._timeout)
+        except TimeoutError:
+            self.close()
+            raise
+        if item is None:
+            self.close()
+            msg = "Connection closed before the stream completed"
+            raise ConnectionError(msg)
+        if isinstance(item, CoreResponse):
+            self._response = item
+            self.close()
+            raise StopAsyncIteration
+        return item.result
+
+    def close(self) -> None:
+        """Stop routing frames to this stream; late chunks are dropped."""
+        self._closed = True
+        self._client._drop_response_stream(self._request_id)
 
 
 class IPCClient:
@@ -40,6 +168,17 @@ class IPCClient:
 
         async with IPCClient(endpoint=endpoint) as client:
             response = await client.request(...)
+
+    By default requests on one connection are strictly serialized.  With
+    ``multiplexed=True`` many requests may be in flight at once: a background
+    reader task matches each response to its caller by ``request_id``, and a
+    timeout only abandons the affected request instead of closing the socket.
+    Multiplexed clients can also receive pushed events via ``subscribe_events``
+    and consume large results incrementally via ``request_stream``.
+
+    ``codec`` selects the wire format negotiated during ``connect``: ``auto``
+    offers every installed codec (msgpack when available), ``json`` skips
+    negotiation.  Cores that do not understand the offer keep JSON lines.
     """
 
     def __init__(
@@ -48,13 +187,22 @@ class IPCClient:
         *,
         transport: TCPLoopbackTransport | UnixSocketTransport | None = None,
         timeout: float = _DEFAULT_TIMEOUT,
+        multiplexed: bool = False,
+        codec: str = "auto",
     ) -> None:
         self._endpoint = endpoint
+        self._codec_offer = resolve_codec_preference(codec)
+        self._codec: FrameCodec = JSON_LINES
         self._transport = transport or self._transport_for_endpoint(endpoint)
         self._timeout = timeout
+        self._multiplexed = multiplexed
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Future[CoreResponse]] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+        self._subscriptions: dict[str, asyncio.Queue[CoreEventFrame | None]] = {}
+        self._response_streams: dict[str, asyncio.Queue[CoreChunkFrame | CoreResponse | None]] = {}
 
     async def __aenter__(self) -> IPCClient:
         await self.connect()
@@ -73,6 +221,21 @@ class IPCClient:
         """Endpoint descriptor currently used by this client."""
         return self._endpoint
 
+    @property
+    def multiplexed(self) -> bool:
+        """Whether requests are pipelined and correlated by ``request_id``."""
+        return self._multiplexed
+
+    @property
+    def codec_name(self) -> str:
+        """Wire codec in use on the current connection."""
+        return self._codec.name
+
+    @property
+    def pending_count(self) -> int:
+        """Number of multiplexed requests currently awaiting a response."""
+        return len(self._pending)
+
     async def connect(self) -> None:
         """Open a connection to the core.
 
@@ -93,14 +256,59 @@ class IPCClient:
                 ep.address,
                 ep.port,
             )
+        try:
+            await self._negotiate_codec(self._reader, self._writer)
+        except BaseException:
+            await self.close()
+            raise
+        if self._multiplexed:
+            self._reader_task = asyncio.create_task(
+                self._read_responses(self._reader),
+                name="ipc-client-reader",
+            )
         logger.debug(
             "IPC client connected: transport=%s address=%s",
             ep.transport,
             ep.address,
         )
 
+    async def _negotiate_codec(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Offer compact codecs to the core and switch to the one it accepts."""
+        self._codec = JSON_LINES
+        if self._codec_offer == [JSON_LINES.name]:
+            return
+        writer.write(JSON_LINES.encode({CODEC_OFFER_KEY: self._codec_offer}))
+        await writer.drain()
+        raw = await asyncio.wait_for(JSON_LINES.read_frame(reader), timeout=self._timeout)
+        if not raw:
+            msg = "Connection closed by server during codec negotiation"
+            raise ConnectionError(msg)
+        try:
+            data = JSON_LINES.decode(raw)
+        except ValueError:
+            data = None
+        accepted = data.get(CODEC_ACCEPT_KEY) if isinstance(data, dict) else None
+        # Older cores answer the offer with an ordinary error response.
+        codec = available_codecs().get(accepted) if isinstance(accepted, str) else None
+        if codec is not None:
+            self._codec = codec
+        logger.debug("IPC codec: %s", self._codec.name)
+
     async def close(self) -> None:
         """Close the connection to the core."""
+        reader_task = self._reader_task
+        self._reader_task = None
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader_task
+        self._fail_pending(ConnectionError("Connection closed"))
+        self._end_subscriptions()
+        self._end_response_streams()
         if self._writer is not None:
             try:
                 self._writer.close()
@@ -109,6 +317,7 @@ class IPCClient:
                 pass
             self._writer = None
             self._reader = None
+            self._codec = JSON_LINES
             logger.debug("IPC client disconnected")
 
     async def request(
@@ -136,11 +345,95 @@ class IPCClient:
         Returns:
             The ``CoreResponse`` from the core.
 
+        Raises:
+            ConnectionError: If the client is not connected.
+            asyncio.TimeoutError: If the core does not respond in time.  In
+                multiplexed mode only this request is abandoned; the
+                connection stays open for other in-flight requests.
+        """
+        req = CoreRequest(
+            session_id=session_id,
+            session_profile=session_profile,
+            session_origin=session_origin,
+            capability=capability,
+            method=method,
+            params=params or {},
+            idempotency_key=idempotency_key,
+        )
+        return await self._send(req)
+
+    async def request_batch(
+        self,
+        items: list[CoreBatchItem],
+        *,
+        session_id: str,
+        session_profile: str | None = None,
+        session_origin: str | None = None,
+    ) -> list[CoreResponse]:
+        """Send independent sub-requests as one ``core.batch`` round trip.
+
+        The core authorizes and dispatches each item on its own, so one item
+        failing does not affect the others.
+
+        Args:
+            items: Sub-requests to send; they must not depend on each other.
+            session_id: Identifier of the originating client session.
+
+        Returns:
+            One ``CoreResponse`` per item, in the order of *items*.
+
         Raises:
             ConnectionError: If the client is not connected.
             asyncio.TimeoutError: If the core does not respond in time.
+            ValueError: If the core rejects the batch envelope itself.
         """
-        if not self.is_connected or self._reader is None or self._writer is None:
+        req = CoreRequest.for_batch(
+            items,
+            session_id=session_id,
+            session_profile=session_profile,
+            session_origin=session_origin,
+        )
+        response = await self._send(req)
+        if not response.ok:
+            error = response.error
+            code = error.code if error else "UNKNOWN"
+            msg = f"Batch request rejected [{code}]: {error.message if error else 'unknown error'}"
+            raise ValueError(msg)
+        return response.batch_responses()
+
+    async def request_stream(
+        self,
+        *,
+        session_id: str,
+        session_profile: str | None = None,
+        session_origin: str | None = None,
+        capability: str,
+        method: str,
+        params: dict[str, Any] | None = None,
+    ) -> IPCResponseStream:
+        """Send a ``stream=True`` request and iterate its result chunks as they arrive.
+
+        Usage::
+
+            stream = await client.request_stream(
+                session_id="s1", capability="tasks", method="logs", params={"task_id": tid}
+            )
+            async for chunk in stream:
+                render(chunk["log"]["content"])
+            assert stream.response is not None and stream.response.ok
+
+        Returns:
+            An ``IPCResponseStream``.  The client timeout applies to the gap
+            between consecutive frames rather than to the whole stream.
+
+        Raises:
+            RuntimeError: If the client is not multiplexed.
+            ConnectionError: If the client is not connected.
+        """
+        if not self._multiplexed:
+            msg = "Streaming requests require a multiplexed client"
+            raise RuntimeError(msg)
+        if not self.is_connected or self._writer is None:
             msg = "Client is not connected; call connect() first"
             raise ConnectionError(msg)
 
@@ -151,21 +444,151 @@ class IPCClient:
             capability=capability,
             method=method,
             params=params or {},
-            idempotency_key=idempotency_key,
+            stream=True,
         )
+        queue: asyncio.Queue[CoreChunkFrame | CoreResponse | None] = asyncio.Queue()
+        self._response_streams[req.request_id] = queue
+        stream = IPCResponseStream(self, req.request_id, queue, timeout=self._timeout)
+        try:
+            async with self._lock:
+                self._writer.write(self._encode_request(req))
+                await self._writer.drain()
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+    def _drop_response_stream(self, request_id: str) -> None:
+        self._response_streams.pop(request_id, None)
+
+    def _end_response_streams(self) -> None:
+        """Wake every response stream consumer with the end-of-stream sentinel."""
+        queues = list(self._response_streams.values())
+        self._response_streams.clear()
+        for queue in queues:
+            queue.put_nowait(None)
+
+    async def subscribe_events(
+        self,
+        *,
+        session_id: str,
+        session_profile: str | None = None,
+        session_origin: str | None = None,
+        project_id: str | None = None,
+        task_ids: list[str] | None = None,
+        event_types: list[str] | None = None,
+    ) -> IPCEventStream:
+        """Subscribe to domain events pushed by the core.
 
-        payload: dict[str, Any] = req.model_dump()
-        payload["bearer_token"] = self._endpoint.token
+        Args:
+            session_id: Identifier of the originating client session.
+            project_id: Only deliver events attributable to this project.
+            task_ids: Only deliver task events for these task IDs.
+            event_types: Only deliver these event class names
+                (e.g. ``TaskStatusChanged``).
+
+        Returns:
+            An ``IPCEventStream`` yielding ``CoreEventFrame`` objects.  Events
+            published after this call returns are not missed.
 
-        line = json.dumps(payload, separators=(",", ":")) + "\n"
+        Raises:
+            RuntimeError: If the client is not multiplexed.
+            ConnectionError: If the client is not connected.
+            ValueError: If the core rejects the subscription.
+        """
+        if not self._multiplexed:
+            msg = "Event subscriptions require a multiplexed client"
+            raise RuntimeError(msg)
+
+        subscription_id = uuid4().hex
+        queue: asyncio.Queue[CoreEventFrame | None] = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        self._subscriptions[subscription_id] = queue
+        params: dict[str, Any] = {"subscription_id": subscription_id}
+        if project_id is not None:
+            params["project_id"] = project_id
+        if task_ids is not None:
+            params["task_ids"] = task_ids
+        if event_types is not None:
+            params["event_types"] = event_types
+        try:
+            response = await self.request(
+                session_id=session_id,
+                session_profile=session_profile,
+                session_origin=session_origin,
+                capability="events",
+                method="subscribe",
+                params=params,
+            )
+        except BaseException:
+            self._drop_subscription(subscription_id)
+            raise
+        result = response.result or {}
+        if not response.ok or not result.get("success", False):
+            self._drop_subscription(subscription_id)
+            message = response.error.message if response.error else result.get("message")
+            msg = f"Event subscription rejected: {message or 'unknown error'}"
+            raise ValueError(msg)
+        return IPCEventStream(
+            self,
+            subscription_id,
+            queue,
+            session_id=session_id,
+            session_profile=session_profile,
+            session_origin=session_origin,
+        )
+
+    def _drop_subscription(self, subscription_id: str) -> None:
+        queue = self._subscriptions.pop(subscription_id, None)
+        if queue is not None:
+            _end_queue(queue)
+
+    def _end_subscriptions(self) -> None:
+        """Terminate every local event stream (the connection is gone)."""
+        queues = list(self._subscriptions.values())
+        self._subscriptions.clear()
+        for queue in queues:
+            _end_queue(queue)
+
+    def _route_event(self, frame: CoreEventFrame) -> None:
+        queue = self._subscriptions.get(frame.subscription_id)
+        if queue is None:
+            logger.debug("Dropping event for unknown subscription %s", frame.subscription_id)
+            return
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Event queue full for subscription %s; dropping %s",
+                frame.subscription_id,
+                frame.event_type,
+            )
+
+    def _route_chunk(self, frame: CoreChunkFrame) -> None:
+        queue = self._response_streams.get(frame.request_id)
+        if queue is None:
+            logger.debug("Dropping chunk for unknown or closed stream %s", frame.request_id)
+            return
+        queue.put_nowait(frame)
+
+    async def _send(self, req: CoreRequest) -> CoreResponse:
+        """Write *req* with the bearer token and wait for its response."""
+        if not self.is_connected or self._reader is None or self._writer is None:
+            msg = "Client is not connected; call connect() first"
+            raise ConnectionError(msg)
+
+        codec = self._codec
+        frame = self._encode_request(req)
+
+        if self._multiplexed:
+            return await self._request_multiplexed(req.request_id, frame)
 
         async with self._lock:
-            self._writer.write(line.encode("utf-8"))
+            self._writer.write(frame)
             await self._writer.drain()
 
             try:
                 raw = await asyncio.wait_for(
-                    self._reader.readline(),
+                    codec.read_frame(self._reader),
                     timeout=self._timeout,
                 )
             except TimeoutError:
@@ -178,7 +601,7 @@ class IPCClient:
             raise ConnectionError(msg)
 
         try:
-            response = CoreResponse.model_validate_json(raw)
+            response = CoreResponse.model_validate(codec.decode(raw))
         except Exception as exc:
             await self.close()
             msg = "Invalid response from server"
@@ -194,6 +617,77 @@ class IPCClient:
 
         return response
 
+    def _encode_request(self, req: CoreRequest) -> bytes:
+        """Encode *req* with the bearer token using the negotiated codec."""
+        payload: dict[str, Any] = req.model_dump()
+        payload["bearer_token"] = self._endpoint.token
+        return self._codec.encode(payload)
+
+    async def _request_multiplexed(self, request_id: str, data: bytes) -> CoreResponse:
+        """Write one request frame and await the response routed by the reader task."""
+        assert self._writer is not None
+        future: asyncio.Future[CoreResponse] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            async with self._lock:
+                self._writer.write(data)
+                await self._writer.drain()
+            return await asyncio.wait_for(future, timeout=self._timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Route response frames to pending futures until the connection ends."""
+        error: ConnectionError = ConnectionError("Connection closed by server")
+        codec = self._codec
+        try:
+            while True:
+                raw = await codec.read_frame(reader)
+                if not raw:
+                    break
+                try:
+                    data = codec.decode(raw)
+                    if isinstance(data, dict) and data.get("frame") == "event":
+                        self._route_event(CoreEventFrame.model_validate(data))
+                        continue
+                    if isinstance(data, dict) and data.get("frame") == "chunk":
+                        self._route_chunk(CoreChunkFrame.model_validate(data))
+                        continue
+                    response = CoreResponse.model_validate(data)
+                except Exception as exc:
+                    error = ConnectionError("Invalid response from server")
+                    error.__cause__ = exc
+                    break
+                stream_queue = self._response_streams.pop(response.request_id, None)
+                if stream_queue is not None:
+                    stream_queue.put_nowait(response)
+                    continue
+                future = self._pending.get(response.request_id)
+                if future is None:
+                    logger.debug(
+                        "Dropping response for unknown or abandoned request %s",
+                        response.request_id,
+                    )
+                    continue
+                if not future.done():
+                    future.set_result(response)
+        except (ConnectionError, OSError, ValueError) as exc:
+            error = ConnectionError(f"Connection lost: {exc}")
+        self._fail_pending(error)
+        self._end_subscriptions()
+        self._end_response_streams()
+        if self._reader_task is asyncio.current_task():
+            self._reader_task = None
+            await self.close()
+
+    def _fail_pending(self, error: ConnectionError) -> None:
+        """Fail every in-flight multiplexed request with *error*."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
     @staticmethod
     def _transport_for_endpoint(
         endpoint: CoreEndpoint,
@@ -206,4 +700,12 @@ class IPCClient:
         return DefaultTransport()
 
 
-__all__ = ["IPCClient"]
+def _end_queue(queue: asyncio.Queue[CoreEventFrame | None]) -> None:
+    """Wake a stream consumer with the end-of-stream sentinel, evicting if full."""
+    if queue.full():
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+    queue.put_nowait(None)
+
+
+__all__ = ["IPCClient", "IPCEventStream", "IPCResponseStream"]
@@ -0,0 +1,182 @@
+"""Wire codecs for IPC frames and the connect-time codec negotiation.
+
+Every connection starts in JSON-lines mode.  A client that prefers a compact
+codec sends a *codec offer* as its first line; the server answers with the
+codec it picked (always JSON-encoded) and both sides switch codecs for every
+following frame.  Servers that predate negotiation reject the offer as an
+ordinary bad request, so the client simply stays on JSON lines.
+
+``orjson`` and ``msgpack`` are optional: when installed, JSON lines are
+encoded with ``orjson`` and the length-prefixed ``msgpack`` codec becomes
+available for negotiation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+MAX_FRAME_BYTES = 4 * 1024 * 1024  # 4 MiB per frame
+CODEC_OFFER_KEY = "codec_offer"
+CODEC_ACCEPT_KEY = "codec"
+_LENGTH_PREFIX_BYTES = 4
+
+
+class FrameTooLargeError(ValueError):
+    """Raised when a peer sends a frame above ``MAX_FRAME_BYTES``."""
+
+
+class FrameCodec(Protocol):
+    """Encodes payloads to wire frames and reads frames back off a stream."""
+
+    @property
+    def name(self) -> str: ...
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        """Read one raw frame; returns ``b""`` at end of stream."""
+        ...
+
+    def decode(self, frame: bytes) -> Any:
+        """Decode a raw frame, raising ``ValueError`` for malformed input."""
+        ...
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Encode a JSON-compatible payload into a complete frame."""
+        ...
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        """Encode a pydantic contract model into a complete frame."""
+        ...
+
+
+class JsonLinesCodec:
+    """Newline-delimited JSON, the default and fallback codec."""
+
+    name = "json"
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        raw = await reader.readline()
+        if len(raw) > MAX_FRAME_BYTES:
+            msg = f"Frame of {len(raw)} bytes exceeds {MAX_FRAME_BYTES}"
+            raise FrameTooLargeError(msg)
+        return raw
+
+    def decode(self, frame: bytes) -> Any:
+        if orjson is not None:
+            try:
+                return orjson.loads(frame)
+            except orjson.JSONDecodeError as exc:
+                raise ValueError(str(exc)) from exc
+        return json.loads(frame)
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(payload) + b"\n"
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        return model.model_dump_json().encode("utf-8") + b"\n"
+
+
+class MsgpackCodec:
+    """Length-prefixed msgpack frames (4-byte big-endian length, then body)."""
+
+    name = "msgpack"
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        try:
+            prefix = await reader.readexactly(_LENGTH_PREFIX_BYTES)
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial:
+                return b""
+            raise ConnectionError("Truncated frame header") from exc
+        size = int.from_bytes(prefix, "big")
+        if size > MAX_FRAME_BYTES:
+            msg = f"Frame of {size} bytes exceeds {MAX_FRAME_BYTES}"
+            raise FrameTooLargeError(msg)
+        try:
+            return await reader.readexactly(size)
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("Truncated frame body") from exc
+
+    def decode(self, frame: bytes) -> Any:
+        assert msgpack is not None
+        try:
+            return msgpack.unpackb(frame, raw=False)
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as exc:
+            raise ValueError(str(exc)) from exc
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        assert msgpack is not None
+        body = msgpack.packb(payload, use_bin_type=True)
+        return len(body).to_bytes(_LENGTH_PREFIX_BYTES, "big") + body
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        return self.encode(model.model_dump(mode="json"))
+
+
+JSON_LINES = JsonLinesCodec()
+
+
+def available_codecs() -> dict[str, FrameCodec]:
+    """Return installed codecs keyed by wire name, most compact first."""
+    codecs: dict[str, FrameCodec] = {}
+    if msgpack is not None:
+        codecs[MsgpackCodec.name] = MsgpackCodec()
+    codecs[JSON_LINES.name] = JSON_LINES
+    return codecs
+
+
+def resolve_codec_preference(preference: str) -> list[str]:
+    """Expand a client preference (``auto``, ``json``, or a codec name) to an offer list.
+
+    Raises:
+        ValueError: If *preference* names a codec that is not installed.
+    """
+    installed = available_codecs()
+    if preference == "auto":
+        return list(installed)
+    if preference not in installed:
+        valid = ", ".join(["auto", *installed])
+        msg = f"IPC codec '{preference}' is not available. Valid codecs: {valid}"
+        raise ValueError(msg)
+    return [preference] if preference == JSON_LINES.name else [preference, JSON_LINES.name]
+
+
+def choose_codec(offer: object) -> FrameCodec:
+    """Pick the first codec from a client offer that this process supports."""
+    installed = available_codecs()
+    if isinstance(offer, list):
+        for name in offer:
+            if isinstance(name, str) and name in installed:
+                return installed[name]
+    return JSON_LINES
+
+
+__all__ = [
+    "CODEC_ACCEPT_KEY",
+    "CODEC_OFFER_KEY",
+    "JSON_LINES",
+    "MAX_FRAME_BYTES",
+    "FrameCodec",
+    "FrameTooLargeError",
+    "JsonLinesCodec",
+    "MsgpackCodec",
+    "available_codecs",
+    "choose_codec",
+    "resolve_codec_preference",
+]
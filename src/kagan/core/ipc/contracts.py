@@ -2,22 +2,57 @@
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime  # noqa: TC003 (used at runtime by pydantic)
+from typing import Any, Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+BATCH_CAPABILITY = "core"
+BATCH_METHOD = "batch"
+MAX_BATCH_ITEMS = 32
+
 
 def _new_request_id() -> str:
     return uuid4().hex
 
 
+class CoreBatchItem(BaseModel):
+    """One sub-request carried inside a batch ``CoreRequest``.
+
+    Items inherit the session identity of the enclosing envelope and are
+    authorized, dispatched, and audited individually by the core.
+    """
+
+    capability: str = Field(
+        description="Logical service group (e.g. 'tasks', 'agents', 'config')",
+    )
+    method: str = Field(
+        description="Method name within the capability (e.g. 'list', 'create')",
+    )
+    params: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Method-specific parameters",
+    )
+    idempotency_key: str | None = Field(
+        default=None,
+        description="Optional key for request de-duplication on retries",
+    )
+
+
 class CoreRequest(BaseModel):
     """Envelope for a single IPC request sent from a client to the core.
 
     Each request targets a *capability* (logical service group) and a *method*
     within that capability.  ``params`` carries the method-specific payload.
     ``idempotency_key`` allows the core to de-duplicate retried requests.
+
+    With ``stream=True`` methods that support it send their result as a
+    series of ``CoreChunkFrame`` frames before the final response.
+
+    A *batch* request targets ``core.batch`` and carries independent
+    sub-requests in ``batch``; the core answers with one response whose
+    result holds a per-item response list (see ``CoreResponse.batch``).
     """
 
     request_id: str = Field(
@@ -54,6 +89,58 @@ class CoreRequest(BaseModel):
         default=None,
         description="Optional key for request de-duplication on retries",
     )
+    batch: list[CoreBatchItem] | None = Field(
+        default=None,
+        description="Independent sub-requests when this is a core.batch envelope",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Ask the core to send the result as CoreChunkFrame frames when supported",
+    )
+
+    @classmethod
+    def for_batch(
+        cls,
+        items: list[CoreBatchItem],
+        *,
+        session_id: str,
+        session_profile: str | None = None,
+        session_origin: str | None = None,
+    ) -> CoreRequest:
+        """Build a ``core.batch`` envelope carrying *items*."""
+        return cls(
+            session_id=session_id,
+            session_profile=session_profile,
+            session_origin=session_origin,
+            capability=BATCH_CAPABILITY,
+            method=BATCH_METHOD,
+            batch=items,
+        )
+
+    @property
+    def is_batch(self) -> bool:
+        """Whether this request is a ``core.batch`` envelope."""
+        return self.batch is not None
+
+    def batch_requests(self) -> list[CoreRequest]:
+        """Expand a batch envelope into standalone requests, one per item.
+
+        Item request IDs are derived from the envelope ID so audit records
+        can be correlated back to the batch.
+        """
+        return [
+            CoreRequest(
+                request_id=f"{self.request_id}.{index}",
+                session_id=self.session_id,
+                session_profile=self.session_profile,
+                session_origin=self.session_origin,
+                capability=item.capability,
+                method=item.method,
+                params=item.params,
+                idempotency_key=item.idempotency_key,
+            )
+            for index, item in enumerate(self.batch or [])
+        ]
 
 
 class CoreErrorDetail(BaseModel):
@@ -112,9 +199,84 @@ class CoreResponse(BaseModel):
             error=CoreErrorDetail(code=code, message=message),
         )
 
+    @staticmethod
+    def batch(request_id: str, responses: list[CoreResponse]) -> CoreResponse:
+        """Create the envelope response for a ``core.batch`` request.
+
+        The envelope itself always succeeds; each item carries its own
+        ``ok``/``result``/``error`` in ``result["responses"]``.
+        """
+        return CoreResponse.success(
+            request_id,
+            result={"responses": [response.model_dump(mode="json") for response in responses]},
+        )
+
+    def batch_responses(self) -> list[CoreResponse]:
+        """Unpack per-item responses from a ``core.batch`` envelope response."""
+        raw_responses = (self.result or {}).get("responses", [])
+        return [CoreResponse.model_validate(raw) for raw in raw_responses]
+
+
+class CoreEventFrame(BaseModel):
+    """Push frame carrying one domain event for an ``events.subscribe`` stream.
+
+    Event frames share the connection with responses; clients tell them apart
+    by ``frame == "event"`` and route them by ``subscription_id``.
+    """
+
+    frame: Literal["event"] = Field(
+        default="event",
+        description="Frame discriminator; responses carry no ``frame`` field",
+    )
+    subscription_id: str = Field(
+        description="Subscription this event was delivered for",
+    )
+    event_type: str = Field(
+        description="Domain event class name (e.g. 'TaskStatusChanged')",
+    )
+    event_id: str = Field(
+        description="Unique identifier of the domain event",
+    )
+    occurred_at: datetime = Field(
+        description="When the domain event occurred",
+    )
+    payload: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Event-specific fields (e.g. task_id, to_status)",
+    )
+
+
+class CoreChunkFrame(BaseModel):
+    """Continuation frame carrying one piece of a streamed response.
+
+    Chunks share the ``request_id`` of the request they answer and arrive in
+    ``sequence`` order; the stream ends with the request's ``CoreResponse``.
+    """
+
+    frame: Literal["chunk"] = Field(
+        default="chunk",
+        description="Frame discriminator; responses carry no ``frame`` field",
+    )
+    request_id: str = Field(
+        description="Echoed request_id from the originating CoreRequest",
+    )
+    sequence: int = Field(
+        description="Zero-based position of this chunk within the stream",
+    )
+    result: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Method-specific piece of the result (e.g. one log entry)",
+    )
+
 
 __all__ = [
+    "BATCH_CAPABILITY",
+    "BATCH_METHOD",
+    "MAX_BATCH_ITEMS",
+    "CoreBatchItem",
+    "CoreChunkFrame",
     "CoreErrorDetail",
+    "CoreEventFrame",
     "CoreRequest",
     "CoreResponse",
 ]
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
-import json
 import logging
 import secrets
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
+from kagan.core.ipc.codec import (
+    CODEC_ACCEPT_KEY,
+    CODEC_OFFER_KEY,
+    JSON_LINES,
+    FrameTooLargeError,
+    choose_codec,
+)
 from kagan.core.ipc.contracts import CoreRequest, CoreResponse
 from kagan.core.ipc.transports import DefaultTransport, TCPLoopbackTransport, UnixSocketTransport
 
 if TYPE_CHECKING:
-    import asyncio
     from collections.abc import Callable, Coroutine
     from typing import Any
 
+    from pydantic import BaseModel
+
+    from kagan.core.ipc.codec import FrameCodec
     from kagan.core.ipc.transports import ServerHandle
 
     RequestHandler = Callable[[CoreRequest], Coroutine[Any, Any, CoreResponse]]
@@ -23,7 +33,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _TOKEN_BYTES = 32
-_MAX_LINE_BYTES = 4 * 1024 * 1024  # 4 MiB per JSON line
+_DEFAULT_MAX_IN_FLIGHT_PER_CONNECTION = 32
 
 _TRANSPORT_MAP: dict[str, type[TCPLoopbackTransport] | type[UnixSocketTransport]] = {
     "tcp": TCPLoopbackTransport,
@@ -39,6 +49,80 @@ def _transport_for_preference(preference: str) -> TCPLoopbackTransport | UnixSoc
     return DefaultTransport()
 
 
+class ServerConnection:
+    """Server-side view of one accepted client connection.
+
+    Request handlers reach the connection that is serving them through
+    :func:`current_connection`.  Besides writing responses, a connection can
+    own long-lived *streams*: background tasks that push frames to the client
+    (e.g. event subscriptions) and are cancelled when the client goes away.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self._writer = writer
+        self._write_lock = asyncio.Lock()
+        self._streams: dict[str, asyncio.Task[None]] = {}
+        self.codec: FrameCodec = JSON_LINES
+
+    @property
+    def stream_count(self) -> int:
+        """Number of streams currently running on this connection."""
+        return len(self._streams)
+
+    async def send(self, frame: BaseModel) -> None:
+        """Encode *frame* with the connection's codec and flush it to the client."""
+        await self.send_bytes(self.codec.encode_model(frame))
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Write an already-encoded frame and flush it to the client."""
+        async with self._write_lock:
+            self._writer.write(data)
+            await self._writer.drain()
+
+    def start_stream(
+        self,
+        stream_id: str,
+        stream: Coroutine[Any, Any, None],
+    ) -> asyncio.Task[None]:
+        """Run *stream* in the background until it finishes or is cancelled."""
+        if stream_id in self._streams:
+            stream.close()
+            msg = f"Stream {stream_id} is already running"
+            raise ValueError(msg)
+        task = asyncio.create_task(stream, name=f"ipc-stream-{stream_id}")
+        self._streams[stream_id] = task
+        task.add_done_callback(lambda _task: self._streams.pop(stream_id, None))
+        return task
+
+    def cancel_stream(self, stream_id: str) -> bool:
+        """Cancel a running stream.  Returns *False* when no such stream exists."""
+        task = self._streams.pop(stream_id, None)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    def cancel_all_streams(self) -> None:
+        """Cancel every stream owned by this connection."""
+        for stream_id in list(self._streams):
+            self.cancel_stream(stream_id)
+
+
+_current_connection: ContextVar[ServerConnection | None] = ContextVar(
+    "kagan_ipc_current_connection",
+    default=None,
+)
+
+
+def current_connection() -> ServerConnection | None:
+    """Return the connection serving the current request, if any.
+
+    Only set while a request received by :class:`IPCServer` is being handled;
+    in-process callers of the request handler get *None*.
+    """
+    return _current_connection.get()
+
+
 class IPCServer:
     """Asynchronous IPC server for Kagan core.
 
@@ -55,6 +139,12 @@ class IPCServer:
         await server.start()
         ...
         await server.stop()
+
+    By default each connection is served lock-step: one line is dispatched and
+    answered before the next is read.  With ``concurrent_dispatch=True`` every
+    line is dispatched in its own task (at most ``max_in_flight_per_connection``
+    at a time per connection) and responses are written as they complete, so
+    clients that pipeline requests must correlate responses by ``request_id``.
     """
 
     def __init__(
@@ -66,12 +156,19 @@ class IPCServer:
         token: str | None = None,
         on_client_connect: Callable[[], None] | None = None,
         on_client_disconnect: Callable[[], None] | None = None,
+        concurrent_dispatch: bool = False,
+        max_in_flight_per_connection: int = _DEFAULT_MAX_IN_FLIGHT_PER_CONNECTION,
     ) -> None:
+        if max_in_flight_per_connection < 1:
+            msg = "max_in_flight_per_connection must be at least 1"
+            raise ValueError(msg)
         self._handler = handler
         self._transport = transport or _transport_for_preference(transport_preference)
         self._token = token or secrets.token_hex(_TOKEN_BYTES)
         self._on_client_connect = on_client_connect
         self._on_client_disconnect = on_client_disconnect
+        self._concurrent_dispatch = concurrent_dispatch
+        self._max_in_flight = max_in_flight_per_connection
         if isinstance(self._transport, TCPLoopbackTransport):
             self._transport.set_handshake_token(self._token)
         self._handle: ServerHandle | None = None
@@ -86,6 +183,11 @@ class IPCServer:
         """The server handle, available after ``start()``."""
         return self._handle
 
+    @property
+    def concurrent_dispatch(self) -> bool:
+        """Whether requests on one connection are dispatched concurrently."""
+        return self._concurrent_dispatch
+
     @property
     def is_running(self) -> bool:
         """Whether the server is currently listening."""
@@ -130,20 +232,52 @@ class IPCServer:
         if self._on_client_connect is not None:
             with contextlib.suppress(Exception):
                 self._on_client_connect()
+        connection = ServerConnection(writer)
+        _current_connection.set(connection)
+        in_flight: set[asyncio.Task[None]] = set()
+        slots = asyncio.Semaphore(self._max_in_flight)
+        first_frame = True
         try:
             while True:
-                raw = await reader.readline()
+                if self._concurrent_dispatch:
+                    # Stop reading while the connection is at its in-flight limit so
+                    # a flooding client is back-pressured through the socket buffer.
+                    await slots.acquire()
+                try:
+                    raw = await connection.codec.read_frame(reader)
+                except FrameTooLargeError as exc:
+                    logger.warning("Oversized message from %s: %s", peer, exc)
+                    break
                 if not raw:
                     break  # Client disconnected
 
-                if len(raw) > _MAX_LINE_BYTES:
-                    logger.warning("Oversized message from %s (%d bytes)", peer, len(raw))
-                    break
-
-                await self._process_line(raw, writer)
+                if first_frame:
+                    first_frame = False
+                    if await self._negotiate_codec(raw, connection):
+                        if self._concurrent_dispatch:
+                            slots.release()
+                        continue
+
+                if not self._concurrent_dispatch:
+                    await self._process_line(raw, connection)
+                    continue
+
+                task = asyncio.create_task(
+                    self._process_line_concurrently(raw, connection, slots),
+                    name="ipc-server-dispatch",
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                # Let requests already read finish so a half-closed client still
+                # receives every response it is owed.
+                await asyncio.gather(*in_flight, return_exceptions=True)
         except (ConnectionError, OSError):
             logger.debug("Client disconnected: %s", peer)
         finally:
+            for task in in_flight:
+                task.cancel()
+            connection.cancel_all_streams()
             if self._on_client_disconnect is not None:
                 with contextlib.suppress(Exception):
                     self._on_client_disconnect()
@@ -153,49 +287,79 @@ class IPCServer:
             except (ConnectionError, OSError):
                 pass
 
+    @staticmethod
+    async def _negotiate_codec(raw: bytes, connection: ServerConnection) -> bool:
+        """Answer a codec offer sent as the first frame; returns *False* for requests."""
+        try:
+            data = JSON_LINES.decode(raw)
+        except ValueError:
+            return False
+        if not isinstance(data, dict) or CODEC_OFFER_KEY not in data:
+            return False
+        codec = choose_codec(data[CODEC_OFFER_KEY])
+        await connection.send_bytes(JSON_LINES.encode({CODEC_ACCEPT_KEY: codec.name}))
+        connection.codec = codec
+        logger.debug("Negotiated IPC codec: %s", codec.name)
+        return True
+
     async def _process_line(
         self,
         raw: bytes,
-        writer: asyncio.StreamWriter,
+        connection: ServerConnection,
     ) -> None:
-        """Parse, authenticate, dispatch, and respond for one JSON line."""
-        line = raw.decode("utf-8").strip()
-        if not line:
-            return
+        """Parse, authenticate, dispatch, and respond for one frame."""
+        response = await self._respond_to_line(raw, connection.codec)
+        if response is not None:
+            await connection.send(response)
 
+    async def _process_line_concurrently(
+        self,
+        raw: bytes,
+        connection: ServerConnection,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Dispatch one JSON line in its own task and write the response when ready."""
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
-            response = CoreResponse.failure(
+            await self._process_line(raw, connection)
+        except (ConnectionError, OSError):
+            logger.debug("Client went away before its response was written")
+        finally:
+            slots.release()
+
+    async def _respond_to_line(self, raw: bytes, codec: FrameCodec) -> CoreResponse | None:
+        """Parse, authenticate, and dispatch one frame into a response."""
+        if codec is JSON_LINES and not raw.strip():
+            return None
+
+        try:
+            data = codec.decode(raw)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return CoreResponse.failure(
                 request_id="unknown",
                 code="PARSE_ERROR",
-                message="Invalid JSON",
+                message=f"Invalid {codec.name} frame",
             )
-            await self._write_response(writer, response)
-            return
 
         bearer = data.pop("bearer_token", None)
         if bearer != self._token:
             request_id = data.get("request_id", "unknown")
-            response = CoreResponse.failure(
+            return CoreResponse.failure(
                 request_id=request_id,
                 code="AUTH_FAILED",
                 message="Invalid or missing bearer token",
             )
-            await self._write_response(writer, response)
-            return
 
         try:
             request = CoreRequest.model_validate(data)
         except Exception as exc:
             request_id = data.get("request_id", "unknown")
-            response = CoreResponse.failure(
+            return CoreResponse.failure(
                 request_id=request_id,
                 code="VALIDATION_ERROR",
                 message=str(exc),
             )
-            await self._write_response(writer, response)
-            return
 
         try:
             response = await self._handler(request)
@@ -207,17 +371,7 @@ class IPCServer:
                 message=str(exc),
             )
 
-        await self._write_response(writer, response)
-
-    @staticmethod
-    async def _write_response(
-        writer: asyncio.StreamWriter,
-        response: CoreResponse,
-    ) -> None:
-        """Serialise a response as a JSON line and flush it to the writer."""
-        payload = response.model_dump_json() + "\n"
-        writer.write(payload.encode("utf-8"))
-        await writer.drain()
+        return response
 
 
-__all__ = ["IPCServer"]
+__all__ = ["IPCServer", "ServerConnection", "current_connection"]
@@ -0,0 +1,239 @@
+"""Serve core instrumentation and gauges in OpenMetrics text format."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MetricsTransport = Literal["socket", "http"]
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_METRIC_PREFIX = "kagan_"
+_REQUEST_TIMING = re.compile(
+    r"^core\.request\.(?P<capability>[^.]+)\.(?P<method>[^.]+)\.duration_ms$"
+)
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+_READ_TIMEOUT_SECONDS = 5.0
+_MAX_REQUEST_HEADER_LINES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class GaugeSample:
+    """One gauge value; samples sharing a ``name`` form one metric family."""
+
+    name: str
+    value: float
+    labels: tuple[tuple[str, str], ...] = ()
+    help: str = ""
+
+
+def _metric_name(name: str) -> str:
+    return _METRIC_PREFIX + _INVALID_NAME_CHARS.sub("_", name)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    rendered = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _timing_family(name: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Map a timing name to its family; per-request timings become labels."""
+    match = _REQUEST_TIMING.match(name)
+    if match is None:
+        return _metric_name(name), ()
+    labels = (("capability", match["capability"]), ("method", match["method"]))
+    return _metric_name("core.request.duration_ms"), labels
+
+
+def render_openmetrics(
+    snapshot: Mapping[str, Any],
+    gauges: Iterable[GaugeSample] = (),
+) -> str:
+    """Render an ``instrumentation.snapshot()`` plus *gauges* as OpenMetrics text.
+
+    Counters become ``counter`` families and timings become ``histogram``
+    families built from the snapshot's cumulative latency buckets.
+    """
+    lines: list[str] = []
+
+    gauge_families: dict[str, list[GaugeSample]] = {}
+    for gauge in gauges:
+        gauge_families.setdefault(_metric_name(gauge.name), []).append(gauge)
+    for family, samples in sorted(gauge_families.items()):
+        help_text = next((sample.help for sample in samples if sample.help), "")
+        lines.append(f"# TYPE {family} gauge")
+        if help_text:
+            lines.append(f"# HELP {family} {help_text}")
+        for sample in samples:
+            lines.append(f"{family}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+
+    counters: Mapping[str, int] = snapshot.get("counters", {})
+    for name, value in sorted(counters.items()):
+        family = _metric_name(name)
+        lines.append(f"# TYPE {family} counter")
+        lines.append(f"{family}_total {_format_value(value)}")
+
+    timings: Mapping[str, Mapping[str, float]] = snapshot.get("timings", {})
+    histograms: Mapping[str, list[tuple[float, int]]] = snapshot.get("histograms", {})
+    timing_families: dict[str, list[tuple[tuple[tuple[str, str], ...], str]]] = {}
+    for name in sorted(timings):
+        family, labels = _timing_family(name)
+        timing_families.setdefault(family, []).append((labels, name))
+    for family, members in timing_families.items():
+        lines.append(f"# TYPE {family} histogram")
+        for labels, name in members:
+            stats = timings[name]
+            cumulative = 0
+            for upper_ms, count in histograms.get(name, []):
+                cumulative += count
+                bucket_labels = _format_labels((*labels, ("le", repr(float(upper_ms)))))
+                lines.append(f"{family}_bucket{bucket_labels} {cumulative}")
+            inf_labels = _format_labels((*labels, ("le", "+Inf")))
+            lines.append(f"{family}_bucket{inf_labels} {_format_value(stats.get('count', 0))}")
+            lines.append(
+                f"{family}_count{_format_labels(labels)} {_format_value(stats.get('count', 0))}"
+            )
+            lines.append(
+                f"{family}_sum{_format_labels(labels)} {_format_value(stats.get('total_ms', 0.0))}"
+            )
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Minimal HTTP endpoint that answers ``GET /metrics`` with *collect()*.
+
+    Serves either a Unix socket (mode ``0600``) or a loopback TCP port; it is
+    meant for a local scraper, not for exposure beyond the machine.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], Awaitable[str]],
+        *,
+        transport: MetricsTransport,
+        socket_path: Path | None = None,
+        port: int = 0,
+    ) -> None:
+        if transport == "socket" and socket_path is None:
+            msg = "socket_path is required for the socket transport"
+            raise ValueError(msg)
+        self._collect = collect
+        self._transport: MetricsTransport = transport
+        self._socket_path = socket_path
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def address(self) -> dict[str, str | int]:
+        """Describe where the exporter listens, for the runtime descriptor file."""
+        if self._transport == "socket":
+            assert self._socket_path is not None
+            return {"transport": "socket", "address": str(self._socket_path)}
+        port = self._port
+        if self._server is not None and self._server.sockets:
+            port = self._server.sockets[0].getsockname()[1]
+        return {"transport": "http", "address": "127.0.0.1", "port": port}
+
+    async def start(self) -> None:
+        if self._transport == "socket":
+            assert self._socket_path is not None
+            self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._socket_path)
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=str(self._socket_path)
+            )
+            os.chmod(self._socket_path, 0o600)
+        else:
+            self._server = await asyncio.start_server(self._handle, "127.0.0.1", self._port)
+        logger.info("Metrics exporter listening on %s", self.address)
+
+    async def stop(self) -> None:
+        server = self._server
+        self._server = None
+        if server is None:
+            return
+        server.close()
+        await server.wait_closed()
+        if self._transport == "socket" and self._socket_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(self._socket_path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS)
+            for _ in range(_MAX_REQUEST_HEADER_LINES):
+                header = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS)
+                if header in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._respond(writer, 405, "text/plain", "method not allowed\n")
+            elif parts[1].split("?", 1)[0] not in ("/metrics", "/"):
+                await self._respond(writer, 404, "text/plain", "not found\n")
+            else:
+                await self._respond(writer, 200, OPENMETRICS_CONTENT_TYPE, await self._collect())
+        except (TimeoutError, ConnectionError, OSError):
+            pass
+        except Exception:  # quality-allow-broad-except
+            logger.exception("Metrics collection failed")
+            with contextlib.suppress(ConnectionError, OSError):
+                await self._respond(writer, 500, "text/plain", "collection failed\n")
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError, OSError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        content_type: str,
+        body: str,
+    ) -> None:
+        reasons = {200: "OK", 404: "Not Found", 405: "Method Not Allowed", 500: "Error"}
+        payload = body.encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {reasons[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
+
+
+__all__ = [
+    "OPENMETRICS_CONTENT_TYPE",
+    "GaugeSample",
+    "MetricsExporter",
+    "MetricsTransport",
+    "render_openmetrics",
+]
@@ -112,6 +112,20 @@ def get_core_instance_lock_path() -> Path:
     return get_core_runtime_dir() / "core.instance.lock"
 
 
+def get_core_metrics_socket_path() -> Path:
+    """Get the path to the Unix socket served by the core metrics exporter."""
+    return get_core_runtime_dir() / "metrics.sock"
+
+
+def get_core_metrics_endpoint_path() -> Path:
+    """Get the path to the core metrics exporter descriptor file.
+
+    Written only while the exporter runs; holds a JSON object with the
+    transport, address and (for loopback HTTP) port to scrape.
+    """
+    return get_core_runtime_dir() / "metrics.json"
+
+
 def ensure_directories() -> None:
     """Create all necessary directories if they don't exist."""
     get_data_dir().mkdir(parents=True, exist_ok=True)
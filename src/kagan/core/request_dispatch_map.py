@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 RequestHandler = Callable[[Any, dict[str, Any]], Awaitable[dict[str, Any]]]
+StreamHandler = Callable[[Any, dict[str, Any]], AsyncIterator[dict[str, Any]]]
 
 
 def build_request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
@@ -13,6 +14,8 @@ def build_request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
     from kagan.core.request_handlers import (
         handle_audit_list,
         handle_diagnostics_instrumentation,
+        handle_events_subscribe,
+        handle_events_unsubscribe,
         handle_job_cancel,
         handle_job_events,
         handle_job_get,
@@ -37,23 +40,28 @@ def build_request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
         handle_session_kill,
         handle_settings_get,
         handle_settings_update,
+        handle_task_changed_since,
         handle_task_context,
         handle_task_create,
+        handle_task_create_many,
         handle_task_delete,
         handle_task_get,
         handle_task_list,
         handle_task_logs,
         handle_task_move,
+        handle_task_move_many,
         handle_task_scratchpad,
         handle_task_search,
         handle_task_update,
+        handle_task_update_many,
         handle_task_update_scratchpad,
     )
 
     return {
-        # Tasks (11)
+        # Tasks (15)
         ("tasks", "get"): handle_task_get,
         ("tasks", "list"): handle_task_list,
+        ("tasks", "changed_since"): handle_task_changed_since,
         ("tasks", "search"): handle_task_search,
         ("tasks", "scratchpad"): handle_task_scratchpad,
         ("tasks", "context"): handle_task_context,
@@ -61,6 +69,9 @@ def build_request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
         ("tasks", "create"): handle_task_create,
         ("tasks", "update"): handle_task_update,
         ("tasks", "move"): handle_task_move,
+        ("tasks", "create_many"): handle_task_create_many,
+        ("tasks", "update_many"): handle_task_update_many,
+        ("tasks", "move_many"): handle_task_move_many,
         ("tasks", "delete"): handle_task_delete,
         ("tasks", "update_scratchpad"): handle_task_update_scratchpad,
         # Review (5)
@@ -96,7 +107,29 @@ def build_request_dispatch_map() -> dict[tuple[str, str], RequestHandler]:
         ("audit", "list"): handle_audit_list,
         # Diagnostics (1)
         ("diagnostics", "instrumentation"): handle_diagnostics_instrumentation,
+        # Events (2)
+        ("events", "subscribe"): handle_events_subscribe,
+        ("events", "unsubscribe"): handle_events_unsubscribe,
     }
 
 
-__all__ = ["RequestHandler", "build_request_dispatch_map"]
+def build_stream_dispatch_map() -> dict[tuple[str, str], StreamHandler]:
+    """Build the capability.method -> chunk generator map for ``stream=True`` requests.
+
+    Every entry must also exist in the request dispatch map, which answers the
+    same method in one response when the caller cannot receive chunks.
+    """
+    from kagan.core.request_handlers import stream_audit_list, stream_task_logs
+
+    return {
+        ("tasks", "logs"): stream_task_logs,
+        ("audit", "list"): stream_audit_list,
+    }
+
+
+__all__ = [
+    "RequestHandler",
+    "StreamHandler",
+    "build_request_dispatch_map",
+    "build_stream_dispatch_map",
+]
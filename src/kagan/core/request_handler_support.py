@@ -244,7 +244,7 @@ def build_job_response(job: JobRecord, *, timed_out: bool = False) -> dict[str,
     return result
 
 
-def parse_timeout_seconds(value: object) -> float | None | str:
+def parse_timeout_seconds(value: object) -> float | str | None:
     if value is None:
         return None
     if isinstance(value, bool):
@@ -275,3 +275,11 @@ def parse_events_offset(value: object) -> int | str:
     if value < 0:
         return "offset must be an integer >= 0"
     return value
+
+
+def parse_events_after_index(value: object) -> int | str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        return "after_index must be an integer >= 0"
+    return value
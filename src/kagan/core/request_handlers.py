@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import logging
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
+from kagan.core.adapters.db.repositories import AuditRepository, TaskRepository
 from kagan.core.commands.job_action_executor import SUPPORTED_JOB_ACTIONS
 from kagan.core.request_handler_support import (
     SESSION_PROMPT_PATH,
@@ -19,6 +21,7 @@ from kagan.core.request_handler_support import (
     invalid_job_id_response,
     invalid_task_id_response,
     job_not_found_response,
+    parse_events_after_index,
     parse_events_limit,
     parse_events_offset,
     parse_requested_worktree,
@@ -30,11 +33,17 @@ from kagan.core.request_handler_support import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from kagan.core.adapters.db.schema import AuditEvent
     from kagan.core.api import KaganAPI
     from kagan.core.models.enums import PairTerminalBackend, TaskPriority, TaskStatus, TaskType
 
 logger = logging.getLogger(__name__)
 
+# Audit events read per query while streaming ``audit.list``.
+_AUDIT_STREAM_PAGE_SIZE = 20
+
 
 def _task_not_found_response(task_id: str) -> dict[str, Any]:
     return {
@@ -200,33 +209,74 @@ async def handle_task_get(api: KaganAPI, params: dict[str, Any]) -> dict[str, An
     return {"found": True, "task": task_to_dict(task)}
 
 
-async def handle_task_list(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
-    from kagan.core.models.enums import TaskStatus
+def _task_list_limit(params: dict[str, Any]) -> int | None:
+    raw_limit = params.get("limit")
+    if isinstance(raw_limit, int) and not isinstance(raw_limit, bool):
+        return max(1, min(raw_limit, 500))
+    return None
+
 
+async def handle_task_list(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     project_id = params.get("project_id")
-    status: TaskStatus | None = None
     status_filter = _non_empty_str(params.get("filter"))
-    if status_filter is not None:
-        status = TaskStatus(status_filter.upper())
-
-    tasks = await api.list_tasks(project_id=project_id, status=status)
+    status = _parse_task_status(status_filter) if status_filter is not None else None
+    type_filter = _non_empty_str(params.get("task_type"))
+    task_type = _parse_task_type(type_filter) if type_filter is not None else None
+    limit = _task_list_limit(params)
+
+    tasks = await api.list_tasks(
+        project_id=project_id,
+        status=status,
+        task_type=task_type,
+        exclude_task_ids=_str_list(params.get("exclude_task_ids")),
+        limit=limit,
+        cursor=_non_empty_str(params.get("cursor")),
+    )
+    next_cursor = (
+        TaskRepository.cursor_for(tasks[-1]) if limit is not None and len(tasks) >= limit else None
+    )
+    return {
+        "tasks": [task_to_dict(t) for t in tasks],
+        "count": len(tasks),
+        "next_cursor": next_cursor,
+    }
 
-    excluded_task_ids = set(_str_list(params.get("exclude_task_ids")))
-    filtered_tasks = [t for t in tasks if t.id not in excluded_task_ids]
 
+async def handle_task_changed_since(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    f = _assert_api(api)
+    raw_revision = params.get("revision", 0)
+    if not isinstance(raw_revision, int) or isinstance(raw_revision, bool) or raw_revision < 0:
+        raise ValueError(f"Invalid revision value: {raw_revision!r}. Expected an integer >= 0.")
+    changes = await f.list_tasks_changed_since(params["project_id"], raw_revision)
     return {
-        "tasks": [task_to_dict(t) for t in filtered_tasks],
-        "count": len(filtered_tasks),
+        "revision": changes.revision,
+        "full": changes.full,
+        "tasks": [task_to_dict(t) for t in changes.tasks],
+        "deleted_task_ids": changes.deleted_ids,
+        "count": len(changes.tasks),
     }
 
 
+def _task_search_limit(params: dict[str, Any]) -> int:
+    raw_limit = params.get("limit", 50)
+    if isinstance(raw_limit, int) and not isinstance(raw_limit, bool):
+        return max(1, min(raw_limit, 500))
+    return 50
+
+
 async def handle_task_search(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     f = _assert_api(api)
     query = str(params.get("query", "")).strip()
     if not query:
-        return {"tasks": [], "count": 0}
-    tasks = await f.search_tasks(query)
-    return {"tasks": [task_to_dict(t) for t in tasks], "count": len(tasks)}
+        return {"tasks": [], "hits": [], "count": 0}
+    hits = await f.search_task_hits(query, limit=_task_search_limit(params))
+    return {
+        "tasks": [task_to_dict(hit.task) for hit in hits],
+        "hits": [
+            {"task_id": hit.task.id, "score": hit.score, "snippet": hit.snippet} for hit in hits
+        ],
+        "count": len(hits),
+    }
 
 
 async def handle_task_scratchpad(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
@@ -241,17 +291,28 @@ async def handle_task_context(api: KaganAPI, params: dict[str, Any]) -> dict[str
     return await f.get_task_context(params["task_id"])
 
 
+def _task_logs_limit(params: dict[str, Any]) -> int:
+    raw_limit = params.get("limit", 5)
+    if isinstance(raw_limit, int) and not isinstance(raw_limit, bool):
+        return max(1, min(raw_limit, 20))
+    return 5
+
+
 async def handle_task_logs(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     f = _assert_api(api)
     task_id = params["task_id"]
-    raw_limit = params.get("limit", 5)
-    limit = 5
-    if isinstance(raw_limit, int) and not isinstance(raw_limit, bool):
-        limit = max(1, min(raw_limit, 20))
-    logs = await f.get_task_logs(task_id, limit=limit)
+    logs = await f.get_task_logs(task_id, limit=_task_logs_limit(params))
     return {"task_id": task_id, "logs": logs, "count": len(logs)}
 
 
+async def stream_task_logs(api: KaganAPI, params: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """Stream ``tasks.logs`` in bounded pieces of each run's log entries."""
+    f = _assert_api(api)
+    task_id = params["task_id"]
+    async for piece in f.iter_task_log_chunks(task_id, limit=_task_logs_limit(params)):
+        yield {"task_id": task_id, "log": piece}
+
+
 async def handle_task_create(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     f = _assert_api(api)
     title = params["title"]
@@ -290,6 +351,91 @@ async def handle_task_move(api: KaganAPI, params: dict[str, Any]) -> dict[str, A
     return {"success": True, "task_id": task.id, "new_status": task.status.value, "code": "MOVED"}
 
 
+def _tasks_not_found_response(task_ids: list[str]) -> dict[str, Any]:
+    return {
+        "success": False,
+        "task_ids": task_ids,
+        "message": f"Tasks not found: {', '.join(task_ids)}",
+        "code": "TASK_NOT_FOUND",
+    }
+
+
+def _bulk_items(params: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    match params[key]:
+        case list() as items if items and all(isinstance(item, dict) for item in items):
+            return items
+        case _:
+            raise ValueError(f"{key} must be a non-empty list of objects")
+
+
+def _bulk_task_ids(params: dict[str, Any]) -> list[str]:
+    task_ids = _str_list(params["task_ids"])
+    if not task_ids:
+        raise ValueError("task_ids must be a non-empty list of task IDs")
+    return list(dict.fromkeys(task_ids))
+
+
+async def handle_task_create_many(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    f = _assert_api(api)
+    specs: list[dict[str, object]] = []
+    for item in _bulk_items(params, "tasks"):
+        title = _non_empty_str(item.get("title"))
+        if title is None:
+            raise ValueError("Every task needs a non-empty title")
+        fields = _build_update_fields(item)
+        fields["title"] = title
+        fields.setdefault("description", "")
+        specs.append(fields)
+
+    tasks = await f.create_tasks(specs, project_id=params.get("project_id"))
+    return {
+        "success": True,
+        "tasks": [
+            {"task_id": task.id, "title": task.title, "status": task.status.value} for task in tasks
+        ],
+        "count": len(tasks),
+        "code": "CREATED",
+    }
+
+
+async def handle_task_update_many(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    f = _assert_api(api)
+    updates: dict[str, dict[str, object]] = {}
+    for item in _bulk_items(params, "updates"):
+        task_id = _non_empty_str(item.get("task_id"))
+        if task_id is None:
+            raise ValueError("Every update needs a task_id")
+        if task_id in updates:
+            raise ValueError(f"Task {task_id} appears more than once in updates")
+        updates[task_id] = _build_update_fields(item)
+
+    tasks, missing = await f.update_tasks(updates)
+    if missing:
+        return _tasks_not_found_response(missing)
+    return {
+        "success": True,
+        "task_ids": [task.id for task in tasks],
+        "count": len(tasks),
+        "code": "UPDATED",
+    }
+
+
+async def handle_task_move_many(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    f = _assert_api(api)
+    task_ids = _bulk_task_ids(params)
+    new_status = _parse_task_status(params["status"])
+    tasks, missing = await f.move_tasks(task_ids, new_status)
+    if missing:
+        return _tasks_not_found_response(missing)
+    return {
+        "success": True,
+        "task_ids": [task.id for task in tasks],
+        "new_status": new_status.value,
+        "count": len(tasks),
+        "code": "MOVED",
+    }
+
+
 async def handle_task_delete(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     f = _assert_api(api)
     task_id = params["task_id"]
@@ -522,8 +668,17 @@ async def handle_job_events(api: KaganAPI, params: dict[str, Any]) -> dict[str,
             }
         case _:
             pass
+    after_index = parse_events_after_index(params.get("after_index"))
+    if isinstance(after_index, str):
+        return {
+            "success": False,
+            "job_id": job_id_raw,
+            "task_id": task_id_raw,
+            "message": after_index,
+            "code": "INVALID_AFTER_INDEX",
+        }
 
-    events = await f.get_job_events(job_id_raw, task_id=task_id_raw)
+    events = await f.get_job_events(job_id_raw, task_id=task_id_raw, after_index=after_index)
     if events is None:
         return job_not_found_response(job_id_raw, task_id_raw)
 
@@ -531,6 +686,8 @@ async def handle_job_events(api: KaganAPI, params: dict[str, Any]) -> dict[str,
     page = events[offset_value : offset_value + limit_value]
     next_offset = offset_value + len(page)
     has_more = next_offset < total_events
+    # Event indexes count up from 1, so the cursor is the number of events seen.
+    next_index = (after_index or 0) + next_offset
     return {
         "success": True,
         "job_id": job_id_raw,
@@ -542,6 +699,8 @@ async def handle_job_events(api: KaganAPI, params: dict[str, Any]) -> dict[str,
         "limit": limit_value,
         "has_more": has_more,
         "next_offset": next_offset if has_more else None,
+        "after_index": after_index,
+        "next_index": next_index,
     }
 
 
@@ -749,34 +908,114 @@ async def handle_settings_update(api: KaganAPI, params: dict[str, Any]) -> dict[
     }
 
 
+def _audit_event_to_dict(event: AuditEvent) -> dict[str, Any]:
+    return {
+        "id": event.id,
+        "occurred_at": event.occurred_at.isoformat() if event.occurred_at else None,
+        "actor_type": event.actor_type,
+        "actor_id": event.actor_id,
+        "session_id": event.session_id,
+        "capability": event.capability,
+        "command_name": event.command_name,
+        "payload_json": event.payload_json,
+        "result_json": event.result_json,
+        "success": event.success,
+    }
+
+
 async def handle_audit_list(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
     f = _assert_api(api)
     capability = params.get("capability")
     limit = params.get("limit", 50)
     cursor = params.get("cursor")
     events = await f.list_audit_events(capability=capability, limit=limit, cursor=cursor)
+    next_cursor = AuditRepository.cursor_for(events[-1]) if len(events) >= limit else None
     return {
-        "events": [
-            {
-                "id": e.id,
-                "occurred_at": e.occurred_at.isoformat() if e.occurred_at else None,
-                "actor_type": e.actor_type,
-                "actor_id": e.actor_id,
-                "session_id": e.session_id,
-                "capability": e.capability,
-                "command_name": e.command_name,
-                "payload_json": e.payload_json,
-                "result_json": e.result_json,
-                "success": e.success,
-            }
-            for e in events
-        ],
+        "events": [_audit_event_to_dict(e) for e in events],
         "count": len(events),
+        "next_cursor": next_cursor,
     }
 
 
+async def stream_audit_list(api: KaganAPI, params: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """Stream ``audit.list`` as one chunk per audit event, a page at a time."""
+    f = _assert_api(api)
+    capability = params.get("capability")
+    remaining = params.get("limit", 50)
+    cursor = params.get("cursor")
+    while remaining > 0:
+        page_size = min(remaining, _AUDIT_STREAM_PAGE_SIZE)
+        events = await f.list_audit_events(capability=capability, limit=page_size, cursor=cursor)
+        for event in events:
+            yield {"event": _audit_event_to_dict(event)}
+        if len(events) < page_size:
+            return
+        remaining -= len(events)
+        cursor = AuditRepository.cursor_for(events[-1])
+
+
+async def handle_events_subscribe(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    from kagan.core.event_stream import EventSubscription, EventSubscriptionFilter
+    from kagan.core.ipc.server import current_connection
+
+    f = _assert_api(api)
+    connection = current_connection()
+    if connection is None:
+        return {
+            "success": False,
+            "message": "events.subscribe is only available over an IPC connection",
+            "code": "STREAMING_UNAVAILABLE",
+        }
+    event_filter = EventSubscriptionFilter.from_params(params)
+
+    async def resolve_project(task_id: str) -> str | None:
+        task = await f.get_task(task_id)
+        return task.project_id if task is not None else None
+
+    # Clients may pick the ID so they can route frames that race the response.
+    subscription = EventSubscription(
+        _non_empty_str(params.get("subscription_id")) or uuid4().hex,
+        f.ctx.event_bus,
+        event_filter,
+        resolve_project=resolve_project,
+    )
+    try:
+        stream = connection.start_stream(
+            subscription.subscription_id,
+            subscription.forward(connection),
+        )
+    except ValueError:
+        subscription.close()
+        raise
+    stream.add_done_callback(lambda _stream: subscription.close())
+    return {
+        "success": True,
+        "subscription_id": subscription.subscription_id,
+        "event_types": sorted(event_filter.event_types),
+    }
+
+
+async def handle_events_unsubscribe(api: KaganAPI, params: dict[str, Any]) -> dict[str, Any]:
+    from kagan.core.ipc.server import current_connection
+
+    _assert_api(api)
+    subscription_id = str(params["subscription_id"])
+    connection = current_connection()
+    if connection is None or not connection.cancel_stream(subscription_id):
+        return {
+            "success": False,
+            "subscription_id": subscription_id,
+            "message": f"Subscription {subscription_id} not found on this connection",
+            "code": "SUBSCRIPTION_NOT_FOUND",
+        }
+    return {"success": True, "subscription_id": subscription_id}
+
+
 async def handle_diagnostics_instrumentation(
     api: KaganAPI, params: dict[str, Any]
 ) -> dict[str, Any]:
     f = _assert_api(api)
-    return {"instrumentation": await f.get_instrumentation()}
+    return {
+        "instrumentation": await f.get_instrumentation(),
+        "db_maintenance": await f.get_db_maintenance_status(),
+    }
@@ -19,6 +19,9 @@ IDEMPOTENT_MUTATION_METHODS: set[tuple[str, str]] = {
     ("tasks", "create"),
     ("tasks", "update"),
     ("tasks", "move"),
+    ("tasks", "create_many"),
+    ("tasks", "update_many"),
+    ("tasks", "move_many"),
     ("tasks", "delete"),
     ("tasks", "update_scratchpad"),
     ("review", "request"),
@@ -37,6 +37,7 @@ class ProtocolCapability(StrEnum):
     SESSIONS = "sessions"
     DIAGNOSTICS = "diagnostics"
     SETTINGS = "settings"
+    EVENTS = "events"
 
 
 class TasksMethod(StrEnum):
@@ -45,12 +46,16 @@ class TasksMethod(StrEnum):
     CONTEXT = "context"
     GET = "get"
     LIST = "list"
+    CHANGED_SINCE = "changed_since"
     LOGS = "logs"
     SCRATCHPAD = "scratchpad"
     UPDATE_SCRATCHPAD = "update_scratchpad"
     CREATE = "create"
     UPDATE = "update"
     MOVE = "move"
+    CREATE_MANY = "create_many"
+    UPDATE_MANY = "update_many"
+    MOVE_MANY = "move_many"
     DELETE = "delete"
 
 
@@ -118,6 +123,13 @@ class SettingsMethod(StrEnum):
     UPDATE = "update"
 
 
+class EventsMethod(StrEnum):
+    """Event subscription capability methods."""
+
+    SUBSCRIBE = "subscribe"
+    UNSUBSCRIBE = "unsubscribe"
+
+
 type ProtocolMethod = (
     TasksMethod
     | ProjectsMethod
@@ -128,6 +140,7 @@ type ProtocolMethod = (
     | SessionsMethod
     | DiagnosticsMethod
     | SettingsMethod
+    | EventsMethod
 )
 
 type CapabilityMethod = tuple[str, str]
@@ -177,12 +190,15 @@ _VIEWER_METHODS: frozenset[CapabilityMethod] = frozenset(
         protocol_call(ProtocolCapability.TASKS, TasksMethod.CONTEXT),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.GET),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.LIST),
+        protocol_call(ProtocolCapability.TASKS, TasksMethod.CHANGED_SINCE),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.LOGS),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.SCRATCHPAD),
         protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.GET),
         protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.LIST),
         protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.REPOS),
         protocol_call(ProtocolCapability.AUDIT, AuditMethod.LIST),
+        protocol_call(ProtocolCapability.EVENTS, EventsMethod.SUBSCRIBE),
+        protocol_call(ProtocolCapability.EVENTS, EventsMethod.UNSUBSCRIBE),
     }
 )
 
@@ -216,6 +232,9 @@ _OPERATOR_METHODS: frozenset[CapabilityMethod] = _PAIR_WORKER_METHODS | frozense
         protocol_call(ProtocolCapability.TASKS, TasksMethod.CREATE),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.UPDATE),
         protocol_call(ProtocolCapability.TASKS, TasksMethod.MOVE),
+        protocol_call(ProtocolCapability.TASKS, TasksMethod.CREATE_MANY),
+        protocol_call(ProtocolCapability.TASKS, TasksMethod.UPDATE_MANY),
+        protocol_call(ProtocolCapability.TASKS, TasksMethod.MOVE_MANY),
         protocol_call(ProtocolCapability.REVIEW, ReviewMethod.APPROVE),
         protocol_call(ProtocolCapability.REVIEW, ReviewMethod.REJECT),
     }
@@ -39,6 +39,9 @@ class AutomationService(Protocol):
     @property
     def running_tasks(self) -> set[str]: ...
 
+    @property
+    def pending_spawn_count(self) -> int: ...
+
     async def start(self) -> None: ...
 
     async def stop(self) -> None: ...
@@ -148,6 +151,10 @@ class AutomationServiceImpl:
     def running_tasks(self) -> set[str]:
         return self._engine.running_tasks
 
+    @property
+    def pending_spawn_count(self) -> int:
+        return self._engine.pending_spawn_count
+
     async def start(self) -> None:
         await self._engine.start()
 
@@ -23,6 +23,7 @@ from kagan.core.events import (
     AutomationTaskStarted,
     DomainEvent,
     EventBus,
+    TasksChanged,
     TaskStatusChanged,
 )
 from kagan.core.git_utils import get_git_user_identity
@@ -42,7 +43,7 @@ from kagan.core.time import utc_now
 from kagan.core.utils import BackgroundTasks, truncate_queue_payload
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Collection
     from datetime import datetime
     from pathlib import Path
 
@@ -346,9 +347,7 @@ class AutomationReviewer:
                 )
 
         if review_note:
-            scratchpad = await self._tasks.get_scratchpad(task.id)
-            note = f"\n\n--- REVIEW ---\n{review_note}"
-            await self._tasks.update_scratchpad(task.id, scratchpad + note)
+            await self._tasks.append_scratchpad(task.id, f"\n\n--- REVIEW ---\n{review_note}")
             self._notify_task_changed()
 
         if review_attempted and execution_id is not None and self._executions is not None:
@@ -364,9 +363,8 @@ class AutomationReviewer:
 
     async def _handle_blocked(self, task: TaskLike, reason: str) -> None:
         """Handle blocked task by moving it back to backlog with context."""
-        scratchpad = await self._tasks.get_scratchpad(task.id)
         block_note = f"\n\n--- BLOCKED ---\nReason: {reason}\n"
-        await self._tasks.update_scratchpad(task.id, scratchpad + block_note)
+        await self._tasks.append_scratchpad(task.id, block_note)
 
         await self._tasks.update_fields(task.id, status=TaskStatus.BACKLOG)
         self._notify_task_changed()
@@ -516,6 +514,11 @@ class AutomationEngine:
                     new_status=event.to_status,
                 )
             )
+        elif isinstance(event, TasksChanged):
+            for task_id, old_status, new_status in event.status_changes:
+                await self._event_queue.put(
+                    AutomationEvent(task_id=task_id, old_status=old_status, new_status=new_status)
+                )
 
     async def handle_status_change(
         self, task_id: str, old_status: TaskStatus | None, new_status: TaskStatus | None
@@ -533,8 +536,9 @@ class AutomationEngine:
     async def _event_loop(self) -> None:
         """Subscribe to domain events and enqueue relevant automation work."""
         assert self._event_bus is not None
-        async for event in self._event_bus.subscribe(TaskStatusChanged):
-            await self.handle_event(event)
+        async for event in self._event_bus.subscribe():
+            if isinstance(event, (TaskStatusChanged, TasksChanged)):
+                await self.handle_event(event)
 
     async def _worker_loop(self) -> None:
         """Single worker that processes status events sequentially."""
@@ -602,6 +606,11 @@ class AutomationEngine:
     def running_tasks(self) -> set[str]:
         return self._runtime_service.running_tasks()
 
+    @property
+    def pending_spawn_count(self) -> int:
+        """Number of tasks waiting in the spawn queue."""
+        return len(self._pending_spawn_queue)
+
     def is_running(self, task_id: str) -> bool:
         view = self._runtime_view(task_id)
         if view is not None and view.is_running:
@@ -757,8 +766,11 @@ class AutomationEngine:
                 max_agents=max_agents,
             ):
                 started = False
-                for next_task_id in tuple(self._pending_spawn_queue):
-                    task = await self._tasks.get_task(next_task_id)
+                queued = tuple(self._pending_spawn_queue)
+                queued_tasks = await self._get_tasks_by_id(queued)
+                running_auto_tasks = await self._list_running_auto_tasks()
+                for next_task_id in queued:
+                    task = queued_tasks.get(next_task_id)
                     if (
                         task is None
                         or not is_auto_task(task.task_type)
@@ -769,9 +781,11 @@ class AutomationEngine:
                         self._clear_runtime_blocked(next_task_id)
                         continue
 
-                    running_tasks = await self._list_running_auto_tasks(
-                        exclude_task_id=task.id,
-                    )
+                    running_tasks = {
+                        task_id: running_task
+                        for task_id, running_task in running_auto_tasks.items()
+                        if task_id != task.id
+                    }
                     conflict = assess_conflict(task, running_tasks)
                     if conflict.is_blocked:
                         self._discard_pending_spawn(task.id)
@@ -822,16 +836,19 @@ class AutomationEngine:
     # Preparation: conflict detection and blocked-spawn management
     # ------------------------------------------------------------------
 
-    async def _list_running_auto_tasks(self, *, exclude_task_id: str) -> dict[str, TaskLike]:
-        running: dict[str, TaskLike] = {}
-        for running_task_id in tuple(self._running.keys()):
-            if running_task_id == exclude_task_id:
-                continue
-            task = await self._tasks.get_task(running_task_id)
-            if task is None or not is_auto_task(task.task_type):
-                continue
-            running[running_task_id] = task
-        return running
+    async def _get_tasks_by_id(self, task_ids: Collection[str]) -> dict[str, TaskLike]:
+        """Look up several tasks with one task-service call."""
+        if not task_ids:
+            return {}
+        return {task.id: task for task in await self._tasks.get_tasks(task_ids)}
+
+    async def _list_running_auto_tasks(self) -> dict[str, TaskLike]:
+        tasks = await self._get_tasks_by_id(tuple(self._running))
+        return {
+            task_id: task
+            for task_id in self._running
+            if (task := tasks.get(task_id)) is not None and is_auto_task(task.task_type)
+        }
 
     async def _mark_spawn_blocked(self, task: TaskLike, conflict: ConflictAssessment) -> None:
         overlap_preview = ", ".join(conflict.overlap_hints[:3])
@@ -882,8 +899,7 @@ class AutomationEngine:
             f"- Overlap hints: {overlap}"
         )
         try:
-            scratchpad = await self._tasks.get_scratchpad(task_id)
-            await self._tasks.update_scratchpad(task_id, (scratchpad or "") + entry)
+            await self._tasks.append_scratchpad(task_id, entry)
         except Exception as exc:  # quality-allow-broad-except
             log.debug("Unable to persist blocked history for %s: %s", task_id, exc)
 
@@ -892,17 +908,24 @@ class AutomationEngine:
             return
 
         resumed_task_ids: list[str] = []
-        for task_id, blocked in tuple(self._blocked_pending.items()):
-            task = await self._tasks.get_task(task_id)
+        blocked_items = tuple(self._blocked_pending.items())
+        tasks = await self._get_tasks_by_id(
+            {task_id for task_id, _ in blocked_items}.union(
+                *(blocked.blocker_task_ids for _, blocked in blocked_items)
+            )
+        )
+        for task_id, blocked in blocked_items:
+            task = tasks.get(task_id)
             if task is None or not is_auto_task(task.task_type):
                 self._blocked_pending.pop(task_id, None)
                 self._clear_runtime_blocked(task_id)
                 continue
 
-            waiting_on: list[str] = []
-            for blocker_task_id in blocked.blocker_task_ids:
-                if await self._blocker_is_active(blocker_task_id):
-                    waiting_on.append(blocker_task_id)
+            waiting_on = [
+                blocker_task_id
+                for blocker_task_id in blocked.blocker_task_ids
+                if self._blocker_is_active(blocker_task_id, tasks.get(blocker_task_id))
+            ]
             if waiting_on:
                 continue
 
@@ -916,12 +939,11 @@ class AutomationEngine:
             self._notify_task_changed()
             await self._admit_pending_spawns()
 
-    async def _blocker_is_active(self, blocker_task_id: str) -> bool:
+    def _blocker_is_active(self, blocker_task_id: str, blocker: TaskLike | None) -> bool:
         """Return whether blocker task should keep dependent task in blocked state."""
         if blocker_task_id in self._running:
             return True
 
-        blocker = await self._tasks.get_task(blocker_task_id)
         if blocker is None:
             return False
 
@@ -1084,7 +1106,7 @@ class AutomationEngine:
             )
 
         progress_note = f"\n\n--- Run {run_count} ---\n{response[-2000:]}"
-        await self._tasks.update_scratchpad(task.id, scratchpad + progress_note)
+        await self._tasks.append_scratchpad(task.id, progress_note)
 
         return (signal_result, agent)
 
@@ -1366,9 +1388,8 @@ class AutomationEngine:
         return await self._queued.take_queued(session_id, lane="implementation")
 
     async def _append_queued_message_to_scratchpad(self, task_id: str, content: str) -> None:
-        scratchpad = await self._tasks.get_scratchpad(task_id)
         user_note = f"\n\n--- USER MESSAGE ---\n{truncate_queue_payload(content)}"
-        await self._tasks.update_scratchpad(task_id, scratchpad + user_note)
+        await self._tasks.append_scratchpad(task_id, user_note)
 
     # ------------------------------------------------------------------
     # Preparation: runtime state markers
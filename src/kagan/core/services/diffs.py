@@ -5,8 +5,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
-from kagan.core.adapters.db.session import get_session
-
 if TYPE_CHECKING:
     from kagan.core.adapters.db.repositories import ClosingAwareSessionFactory
     from kagan.core.adapters.git.operations import GitOperationsProtocol
@@ -71,7 +69,7 @@ class DiffServiceImpl:
 
         from kagan.core.adapters.db.schema import Repo, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(WorkspaceRepo, Repo)
                 .join(Repo)
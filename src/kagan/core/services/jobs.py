@@ -95,7 +95,9 @@ class JobService(Protocol):
 
     async def get(self, job_id: str) -> JobRecord | None: ...
 
-    async def events(self, job_id: str, *, task_id: str) -> list[JobEvent] | None: ...
+    async def events(
+        self, job_id: str, *, task_id: str, after_index: int | None = None
+    ) -> list[JobEvent] | None: ...
 
     async def wait(
         self,
@@ -107,6 +109,8 @@ class JobService(Protocol):
 
     async def cancel(self, job_id: str, *, task_id: str) -> JobRecord | None: ...
 
+    async def status_counts(self) -> dict[str, int]: ...
+
     async def shutdown(self) -> None: ...
 
 
@@ -154,13 +158,16 @@ class JobServiceImpl:
         job = await self._repository.get_job(job_id)
         return None if job is None else self._job_to_record(job)
 
-    async def events(self, job_id: str, *, task_id: str) -> list[JobEvent] | None:
+    async def events(
+        self, job_id: str, *, task_id: str, after_index: int | None = None
+    ) -> list[JobEvent] | None:
+        """Return a job's events; ``after_index`` skips the first that many."""
         await self._ensure_recovered()
         job = await self._repository.get_job(job_id)
         if job is None or job.task_id != task_id:
             return None
 
-        events = await self._repository.list_events(job_id)
+        events = await self._repository.list_events(job_id, after_index=after_index)
         return [self._event_to_record(event) for event in events]
 
     async def wait(
@@ -259,6 +266,10 @@ class JobServiceImpl:
 
         return record
 
+    async def status_counts(self) -> dict[str, int]:
+        """Return persisted job counts keyed by status."""
+        return await self._repository.count_jobs_by_status()
+
     async def shutdown(self) -> None:
         await self._ensure_recovered()
         async with self._lock:
@@ -9,12 +9,13 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING, Protocol
 
-from kagan.core.adapters.db.session import get_required_session
 from kagan.core.adapters.process import ProcessExecutionError, ProcessRetryPolicy, run_exec_checked
 from kagan.core.models.enums import MergeStatus, MergeType, RejectionAction, TaskStatus
 from kagan.core.time import utc_now
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from kagan.core.adapters.db.repositories import ClosingAwareSessionFactory
     from kagan.core.adapters.db.schema import Task
     from kagan.core.adapters.git.operations import GitOperationsProtocol
@@ -369,16 +370,16 @@ class MergeServiceImpl:
         """Merge a single repo's changes."""
         if self._events is None or self._git is None:
             raise RuntimeError("Merge service missing dependencies for per-repo operations")
+        session_factory = self._session_factory
+        if session_factory is None:
+            raise RuntimeError("Merge service missing session factory for per-repo operations")
 
         from sqlmodel import col, select
 
         from kagan.core.adapters.db.schema import Merge, Repo, Workspace, WorkspaceRepo
         from kagan.core.events import MergeCompleted, MergeFailed, PRCreated
 
-        async with get_required_session(
-            self._session_factory,
-            error_message="Merge service missing session factory for per-repo operations",
-        ) as session:
+        async with session_factory.read() as session:
             result = await session.execute(
                 select(WorkspaceRepo, Repo, Workspace)
                 .join(Repo, col(WorkspaceRepo.repo_id) == col(Repo.id))
@@ -510,36 +511,31 @@ class MergeServiceImpl:
                         )
                     )
 
-        async with get_required_session(
-            self._session_factory,
-            error_message="Merge service missing session factory for per-repo operations",
-        ) as session:
-            merge_type = (
-                MergeType.PR if strategy == MergeStrategy.PULL_REQUEST else MergeType.DIRECT
-            )
-            merge_record = Merge(
-                workspace_id=workspace_id,
-                repo_id=repo_id,
-                merge_type=merge_type,
-                target_branch_name=workspace_repo.target_branch,
-                merge_commit=merge_result.commit_sha if merge_type == MergeType.DIRECT else None,
-                pr_url=merge_result.pr_url if merge_type == MergeType.PR else None,
-                pr_status=(
-                    MergeStatus.OPEN
-                    if merge_type == MergeType.PR and merge_result.success
-                    else MergeStatus.MERGED
-                    if merge_result.success
-                    else MergeStatus.CLOSED
-                ),
-                pr_merged_at=utc_now()
-                if merge_type == MergeType.PR and merge_result.success
-                else None,
-                pr_merge_commit_sha=merge_result.commit_sha
+        merge_type = MergeType.PR if strategy == MergeStrategy.PULL_REQUEST else MergeType.DIRECT
+        merge_record = Merge(
+            workspace_id=workspace_id,
+            repo_id=repo_id,
+            merge_type=merge_type,
+            target_branch_name=workspace_repo.target_branch,
+            merge_commit=merge_result.commit_sha if merge_type == MergeType.DIRECT else None,
+            pr_url=merge_result.pr_url if merge_type == MergeType.PR else None,
+            pr_status=(
+                MergeStatus.OPEN
                 if merge_type == MergeType.PR and merge_result.success
-                else None,
-            )
+                else MergeStatus.MERGED
+                if merge_result.success
+                else MergeStatus.CLOSED
+            ),
+            pr_merged_at=utc_now() if merge_type == MergeType.PR and merge_result.success else None,
+            pr_merge_commit_sha=merge_result.commit_sha
+            if merge_type == MergeType.PR and merge_result.success
+            else None,
+        )
+
+        async def _record(session: AsyncSession) -> None:
             session.add(merge_record)
-            await session.commit()
+
+        await session_factory.write(_record)
 
         return merge_result
 
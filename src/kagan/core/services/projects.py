@@ -7,13 +7,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
-from sqlalchemy import func, literal, or_
+from sqlalchemy import delete, func, literal, or_, update
 from sqlmodel import col, select
 
-from kagan.core.adapters.db.session import get_session
 from kagan.core.time import utc_now
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from kagan.core.adapters.db.repositories import ClosingAwareSessionFactory, RepoRepository
     from kagan.core.adapters.db.schema import Project, Repo
     from kagan.core.events import EventBus
@@ -99,17 +100,18 @@ class ProjectServiceImpl:
 
         repo_paths = repo_paths or []
 
-        async with get_session(self._session_factory) as session:
-            project = DbProject(
-                name=name,
-                description=description or "",
-                last_opened_at=utc_now(),
-            )
+        project = DbProject(
+            name=name,
+            description=description or "",
+            last_opened_at=utc_now(),
+        )
+
+        async def _insert(session: AsyncSession) -> str:
             session.add(project)
-            await session.commit()
-            await session.refresh(project)
+            await session.flush()
+            return project.id
 
-            project_id = project.id
+        project_id = await self._session_factory.write(_insert)
 
         try:
             for i, repo_path in enumerate(repo_paths):
@@ -118,18 +120,13 @@ class ProjectServiceImpl:
         except Exception:
             from kagan.core.adapters.db.schema import ProjectRepo
 
-            async with get_session(self._session_factory) as session:
-                links_result = await session.execute(
-                    select(ProjectRepo).where(ProjectRepo.project_id == project_id)
+            async def _rollback_project(session: AsyncSession) -> None:
+                await session.execute(
+                    delete(ProjectRepo).where(col(ProjectRepo.project_id) == project_id)
                 )
-                for link in links_result.scalars():
-                    await session.delete(link)
+                await session.execute(delete(DbProject).where(col(DbProject.id) == project_id))
 
-                project = await session.get(DbProject, project_id)
-                if project is not None:
-                    await session.delete(project)
-
-                await session.commit()
+            await self._session_factory.write(_rollback_project)
             raise
 
         await self._events.publish(
@@ -147,33 +144,36 @@ class ProjectServiceImpl:
         from kagan.core.adapters.db.schema import Project as DbProject
         from kagan.core.events import ProjectOpened
 
-        async with get_session(self._session_factory) as session:
-            project = await session.get(DbProject, project_id)
-            if project is None:
-                raise ValueError(f"Project not found: {project_id}")
+        async def _touch(session: AsyncSession) -> Project | None:
+            now = utc_now()
+            result = await session.execute(
+                update(DbProject)
+                .where(col(DbProject.id) == project_id)
+                .values(last_opened_at=now, updated_at=now)
+                .returning(DbProject)
+            )
+            return result.scalar_one_or_none()
 
-            project.last_opened_at = utc_now()
-            project.updated_at = utc_now()
-            session.add(project)
-            await session.commit()
-            await session.refresh(project)
+        project = await self._session_factory.write(_touch)
+        if project is None:
+            raise ValueError(f"Project not found: {project_id}")
 
-            await self._events.publish(ProjectOpened(project_id=project_id))
+        await self._events.publish(ProjectOpened(project_id=project_id))
 
-            return project
+        return project
 
     async def get_project(self, project_id: ProjectId) -> Project | None:
         """Return a project by ID."""
         from kagan.core.adapters.db.schema import Project as DbProject
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             return await session.get(DbProject, project_id)
 
     async def list_recent_projects(self, limit: int = 10) -> list[Project]:
         """Get recently opened projects sorted by last_opened_at desc."""
         from kagan.core.adapters.db.schema import Project as DbProject
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(DbProject)
                 .order_by(
@@ -224,7 +224,7 @@ class ProjectServiceImpl:
         """Get all repos for a project with junction metadata."""
         from kagan.core.adapters.db.schema import ProjectRepo, Repo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(ProjectRepo, Repo)
                 .join(Repo)
@@ -252,7 +252,7 @@ class ProjectServiceImpl:
         resolved_path = str(resolved)
         path_separator = os.sep
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(DbProject, Repo.path)
                 .join(ProjectRepo, col(ProjectRepo.project_id) == col(DbProject.id))
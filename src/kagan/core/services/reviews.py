@@ -64,9 +64,8 @@ class ReviewServiceImpl:
         await self._update_execution_metadata(execution_id, approved, summary)
 
         if summary:
-            scratchpad = await self._tasks.get_scratchpad(task_id)
             header = f"\n\n--- REVIEW ({status_label.upper()}) ---\n"
-            await self._tasks.update_scratchpad(task_id, scratchpad + header + summary)
+            await self._tasks.append_scratchpad(task_id, header + summary)
 
     async def _update_execution_metadata(
         self,
@@ -15,7 +15,6 @@ from sqlalchemy.exc import OperationalError
 
 from kagan.core.adapters.db.repositories.base import RepositoryClosing
 from kagan.core.adapters.db.schema import AppState
-from kagan.core.adapters.db.session import AsyncSessionFactory, get_session
 from kagan.core.git_utils import has_git_repo
 from kagan.core.models.enums import ExecutionStatus, TaskType
 from kagan.core.time import utc_now
@@ -25,8 +24,13 @@ if TYPE_CHECKING:
     from datetime import datetime
     from pathlib import Path
 
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from kagan.core.acp import Agent
-    from kagan.core.adapters.db.repositories import ExecutionRepository
+    from kagan.core.adapters.db.repositories import (
+        ClosingAwareSessionFactory,
+        ExecutionRepository,
+    )
     from kagan.core.services.automation import AutomationService
     from kagan.core.services.projects import ProjectService
     from kagan.core.services.types import TaskLike
@@ -236,7 +240,7 @@ class RuntimeServiceImpl:
     def __init__(
         self,
         project_service: ProjectService,
-        session_factory: AsyncSessionFactory,
+        session_factory: ClosingAwareSessionFactory,
         execution_service: ExecutionRepository,
         automation_resolver: Callable[[], AutomationService | None] | None = None,
     ) -> None:
@@ -254,7 +258,7 @@ class RuntimeServiceImpl:
         return self._state
 
     async def get_last_active_context(self) -> RuntimeContextState:
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             row = await session.get(AppState, self._RUNTIME_CONTEXT_KEY)
             if row is None:
                 self._state = RuntimeContextState()
@@ -266,7 +270,8 @@ class RuntimeServiceImpl:
             return self._state
 
     async def set_last_active_context(self, project_id: str | None, repo_id: str | None) -> None:
-        async with get_session(self._session_factory) as session:
+
+        async def _save(session: AsyncSession) -> None:
             row = await session.get(AppState, self._RUNTIME_CONTEXT_KEY)
             if row is None:
                 row = AppState(
@@ -280,7 +285,8 @@ class RuntimeServiceImpl:
                 row.last_active_repo_id = repo_id
                 row.updated_at = utc_now()
                 session.add(row)
-            await session.commit()
+
+        await self._session_factory.write(_save)
         self._state = RuntimeContextState(project_id=project_id, repo_id=repo_id)
 
     def _resolve_context_transition(
@@ -535,7 +541,7 @@ class RuntimeServiceImpl:
             return None
 
     async def _has_persisted_execution_logs(self, execution_id: str) -> bool:
-        entries = await self._executions.get_execution_log_entries(execution_id)
+        entries = await self._executions.get_execution_log_entries(execution_id, tail_bytes=1)
         return any(entry.logs for entry in entries)
 
     @classmethod
@@ -14,13 +14,14 @@ from kagan.core.models.enums import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Mapping, Sequence
 
     from kagan.core.adapters.db.repositories import TaskRepository
     from kagan.core.adapters.db.repositories.auxiliary import (
         ScratchRepository,
         SessionRecordRepository,
     )
+    from kagan.core.adapters.db.repositories.task import TaskChangeSet, TaskSearchHit
     from kagan.core.adapters.db.schema import Session, Task
     from kagan.core.events import EventBus
     from kagan.core.models.enums import TaskPriority, TaskStatus, TaskType
@@ -75,14 +76,35 @@ class TaskService(Protocol):
         *,
         project_id: ProjectId | None = None,
         status: TaskStatus | None = None,
+        task_type: TaskType | None = None,
+        exclude_task_ids: Collection[TaskId] = (),
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[Task]: ...
 
+    async def changed_since(self, project_id: ProjectId, revision: int) -> TaskChangeSet: ...
+
     async def delete_task(self, task_id: TaskId) -> bool: ...
 
     async def update_fields(self, task_id: TaskId, **kwargs: object) -> Task | None: ...
 
     async def move(self, task_id: TaskId, new_status: TaskStatus) -> Task | None: ...
 
+    async def get_tasks(self, task_ids: Collection[TaskId]) -> list[Task]: ...
+
+    async def create_many(
+        self,
+        tasks: Sequence[Mapping[str, object]],
+        *,
+        project_id: ProjectId | None = None,
+    ) -> list[Task]: ...
+
+    async def update_many(self, updates: Mapping[TaskId, Mapping[str, object]]) -> list[Task]: ...
+
+    async def move_many(
+        self, task_ids: Collection[TaskId], new_status: TaskStatus
+    ) -> list[Task]: ...
+
     async def create_session_record(
         self,
         *,
@@ -107,7 +129,9 @@ class TaskService(Protocol):
 
     async def get_by_status(self, status: TaskStatus) -> Sequence[Task]: ...
 
-    async def search(self, query: str) -> Sequence[Task]: ...
+    async def search(self, query: str, *, limit: int | None = None) -> Sequence[Task]: ...
+
+    async def search_hits(self, query: str, *, limit: int | None = None) -> list[TaskSearchHit]: ...
 
     async def get_task_links(self, task_id: TaskId) -> list[str]: ...
 
@@ -115,6 +139,10 @@ class TaskService(Protocol):
 
     async def update_scratchpad(self, task_id: TaskId, content: str) -> None: ...
 
+    async def append_scratchpad(
+        self, task_id: TaskId, text: str, *, separator: str = ""
+    ) -> None: ...
+
     async def sync_status_from_agent_complete(
         self, task_id: TaskId, success: bool
     ) -> Task | None: ...
@@ -241,12 +269,22 @@ class TaskServiceImpl:
         *,
         project_id: ProjectId | None = None,
         status: TaskStatus | None = None,
+        task_type: TaskType | None = None,
+        exclude_task_ids: Collection[TaskId] = (),
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[Task]:
-        if status:
-            tasks = await self._repo.get_by_status(status, project_id=project_id)
-        else:
-            tasks = await self._repo.get_all(project_id=project_id)
-        return list(tasks)
+        return await self._repo.list_page(
+            project_id=project_id,
+            status=status,
+            task_type=task_type,
+            exclude_ids=exclude_task_ids,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def changed_since(self, project_id: ProjectId, revision: int) -> TaskChangeSet:
+        return await self._repo.changed_since(project_id, revision)
 
     async def delete_task(self, task_id: TaskId) -> bool:
         from kagan.core.events import TaskDeleted
@@ -294,6 +332,79 @@ class TaskServiceImpl:
     async def move(self, task_id: TaskId, new_status: TaskStatus) -> Task | None:
         return await self.set_status(task_id, new_status)
 
+    async def get_tasks(self, task_ids: Collection[TaskId]) -> list[Task]:
+        return list((await self._repo.get_many(task_ids)).values())
+
+    async def create_many(
+        self,
+        tasks: Sequence[Mapping[str, object]],
+        *,
+        project_id: ProjectId | None = None,
+    ) -> list[Task]:
+        from kagan.core.adapters.db.schema import Task as DbTask
+        from kagan.core.events import TasksChanged
+        from kagan.core.models.enums import TaskStatus
+
+        default_project_id = project_id or self._repo.default_project_id
+        db_tasks: list[DbTask] = []
+        fields_changed: set[str] = set()
+        for spec in tasks:
+            fields = dict(spec)
+            task_project_id = fields.pop("project_id", None) or default_project_id
+            if task_project_id is None:
+                raise ValueError("Project ID is required to create a task")
+            fields_changed.update(fields)
+            db_tasks.append(DbTask(project_id=task_project_id, **fields))
+        if not db_tasks:
+            return []
+
+        mentions = {
+            task.id: refs for task in db_tasks if (refs := _extract_task_mentions(task.description))
+        }
+        created = await self._repo.create_many(db_tasks, mentions=mentions)
+        await self._events.publish(
+            TasksChanged(
+                task_ids=[task.id for task in created],
+                fields_changed=sorted(fields_changed),
+                status_changes=[
+                    (task.id, TaskStatus.BACKLOG, task.status)
+                    for task in created
+                    if task.status != TaskStatus.BACKLOG
+                ],
+                updated_at=max(task.updated_at for task in created),
+            )
+        )
+        return created
+
+    async def update_many(self, updates: Mapping[TaskId, Mapping[str, object]]) -> list[Task]:
+        from kagan.core.events import TasksChanged
+
+        mentions = {
+            task_id: _extract_task_mentions(description)
+            for task_id, fields in updates.items()
+            if isinstance(description := fields.get("description"), str)
+        }
+        changed = await self._repo.update_many(updates, mentions=mentions)
+        if not changed:
+            return []
+
+        await self._events.publish(
+            TasksChanged(
+                task_ids=[task.id for task, _ in changed],
+                fields_changed=sorted({key for fields in updates.values() for key in fields}),
+                status_changes=[
+                    (task.id, old_status, task.status)
+                    for task, old_status in changed
+                    if task.status != old_status
+                ],
+                updated_at=changed[0][0].updated_at,
+            )
+        )
+        return [task for task, _ in changed]
+
+    async def move_many(self, task_ids: Collection[TaskId], new_status: TaskStatus) -> list[Task]:
+        return await self.update_many({task_id: {"status": new_status} for task_id in task_ids})
+
     async def create_session_record(
         self,
         *,
@@ -327,10 +438,13 @@ class TaskServiceImpl:
         tasks = await self._repo.get_by_status(status)
         return tasks
 
-    async def search(self, query: str) -> Sequence[Task]:
-        tasks = await self._repo.search(query)
+    async def search(self, query: str, *, limit: int | None = None) -> Sequence[Task]:
+        tasks = await self._repo.search(query, limit=limit)
         return tasks
 
+    async def search_hits(self, query: str, *, limit: int | None = None) -> list[TaskSearchHit]:
+        return await self._repo.search_hits(query, limit=limit)
+
     async def get_task_links(self, task_id: TaskId) -> list[str]:
         return await self._repo.get_task_links(task_id)
 
@@ -340,6 +454,9 @@ class TaskServiceImpl:
     async def update_scratchpad(self, task_id: TaskId, content: str) -> None:
         await self._scratch.update_scratchpad(task_id, content)
 
+    async def append_scratchpad(self, task_id: TaskId, text: str, *, separator: str = "") -> None:
+        await self._scratch.append_scratchpad(task_id, text, separator=separator)
+
     async def sync_status_from_agent_complete(self, task_id: TaskId, success: bool) -> Task | None:
         task = await self._repo.get(task_id)
         if task is None:
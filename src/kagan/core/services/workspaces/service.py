@@ -8,9 +8,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
+from sqlalchemy import update
 from sqlmodel import col, select
 
-from kagan.core.adapters.db.session import AsyncSessionFactory, get_session
 from kagan.core.models.enums import WorkspaceStatus
 from kagan.core.paths import get_worktree_base_dir
 from kagan.core.time import utc_now
@@ -18,6 +18,9 @@ from kagan.core.time import utc_now
 from .merge_ops import WorkspaceMergeOpsMixin
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kagan.core.adapters.db.repositories import ClosingAwareSessionFactory
     from kagan.core.adapters.db.schema import Repo, WorkspaceRepo
     from kagan.core.adapters.db.schema import Workspace as DbWorkspace
     from kagan.core.adapters.git.worktrees import GitWorktreeProtocol
@@ -112,7 +115,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
 
     def __init__(
         self,
-        session_factory: AsyncSessionFactory,
+        session_factory: ClosingAwareSessionFactory,
         git_adapter: GitWorktreeProtocol,
         task_service: TaskService,
         project_service: ProjectService,
@@ -185,11 +188,11 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
                     )
                 )
 
-            async with get_session(self._session_factory) as session:
+            async def _insert(session: AsyncSession) -> None:
                 session.add(workspace)
-                for wr in workspace_repos:
-                    session.add(wr)
-                await session.commit()
+                session.add_all(workspace_repos)
+
+            await self._session_factory.write(_insert)
 
         except Exception:
             for path in created_paths:
@@ -210,7 +213,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
         """Provision workspace using all project repos."""
         from kagan.core.adapters.db.schema import ProjectRepo, Repo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(ProjectRepo, Repo)
                 .join(Repo)
@@ -243,37 +246,43 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
         """Release workspace and clean up worktrees."""
         from kagan.core.adapters.db.schema import Workspace, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
-            result = await session.execute(select(Workspace).where(Workspace.id == workspace_id))
-            workspace = result.scalars().first()
-
+        async with self._session_factory.read() as session:
+            workspace = await session.get(Workspace, workspace_id)
             if not workspace:
                 raise ValueError(f"Workspace {workspace_id} not found")
 
+            worktree_paths: list[str] = []
             if cleanup:
                 result = await session.execute(
-                    select(WorkspaceRepo).where(WorkspaceRepo.workspace_id == workspace_id)
+                    select(WorkspaceRepo.worktree_path).where(
+                        WorkspaceRepo.workspace_id == workspace_id
+                    )
                 )
-                workspace_repos = result.scalars().all()
-
-                for wr in workspace_repos:
-                    if wr.worktree_path and Path(wr.worktree_path).exists():
-                        with contextlib.suppress(Exception):
-                            await self._git.delete_worktree(wr.worktree_path)
-
-                if workspace.path and Path(workspace.path).exists():
-                    shutil.rmtree(workspace.path, ignore_errors=True)
+                worktree_paths = [path for path in result.scalars().all() if path]
+
+        if cleanup:
+            for worktree_path in worktree_paths:
+                if Path(worktree_path).exists():
+                    with contextlib.suppress(Exception):
+                        await self._git.delete_worktree(worktree_path)
+
+            if workspace.path and Path(workspace.path).exists():
+                shutil.rmtree(workspace.path, ignore_errors=True)
+
+        async def _archive(session: AsyncSession) -> None:
+            await session.execute(
+                update(Workspace)
+                .where(col(Workspace.id) == workspace_id)
+                .values(status=WorkspaceStatus.ARCHIVED, updated_at=utc_now())
+            )
 
-            workspace.status = WorkspaceStatus.ARCHIVED
-            workspace.updated_at = utc_now()
-            session.add(workspace)
-            await session.commit()
+        await self._session_factory.write(_archive)
 
     async def get_workspace_repos(self, workspace_id: str) -> list[dict]:
         """Get all repos for a workspace with paths and status."""
         from kagan.core.adapters.db.schema import Repo, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(WorkspaceRepo, Repo)
                 .join(Repo)
@@ -331,7 +340,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
     ) -> list[DbWorkspace]:
         from kagan.core.adapters.db.schema import Workspace, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             statement = select(Workspace).order_by(col(Workspace.created_at).desc())
             if task_id is not None:
                 statement = statement.where(Workspace.task_id == task_id)
@@ -345,7 +354,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
     async def cleanup_orphans(self, valid_task_ids: set[str]) -> list[str]:
         from kagan.core.adapters.db.schema import Workspace
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(select(Workspace))
             workspaces = result.scalars().all()
 
@@ -490,7 +499,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
     async def _get_workspace_repo_rows(self, workspace_id: str) -> list[tuple[WorkspaceRepo, Repo]]:
         from kagan.core.adapters.db.schema import Repo, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(WorkspaceRepo, Repo)
                 .join(Repo)
@@ -503,13 +512,13 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
     async def _get_workspace(self, workspace_id: str) -> DbWorkspace | None:
         from kagan.core.adapters.db.schema import Workspace
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             return await session.get(Workspace, workspace_id)
 
     async def _get_latest_workspace_for_task(self, task_id: str) -> DbWorkspace | None:
         from kagan.core.adapters.db.schema import Workspace
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             result = await session.execute(
                 select(Workspace)
                 .where(Workspace.task_id == task_id)
@@ -520,7 +529,7 @@ class WorkspaceServiceImpl(WorkspaceMergeOpsMixin):
     async def _get_primary_workspace_repo(self, workspace_id: str) -> WorkspaceRepo | None:
         from kagan.core.adapters.db.schema import ProjectRepo, Workspace, WorkspaceRepo
 
-        async with get_session(self._session_factory) as session:
+        async with self._session_factory.read() as session:
             workspace = await session.get(Workspace, workspace_id)
             if workspace is None:
                 return None
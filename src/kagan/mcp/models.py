@@ -198,6 +198,25 @@ class TaskListResponse(BaseModel):
 
     tasks: list[TaskSummary] = Field(default_factory=list, description="List of tasks")
     count: int = Field(default=0, description="Total number of tasks returned")
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page; null on the last page"
+    )
+
+
+class TaskChangesResponse(BaseModel):
+    """Response from tasks_changed_since tool."""
+
+    revision: int = Field(description="Board revision to pass on the next call")
+    full: bool = Field(
+        default=False,
+        description="True when tasks is the whole board; drop any task not listed",
+    )
+    tasks: list[TaskSummary] = Field(
+        default_factory=list, description="Tasks created or updated since the revision"
+    )
+    deleted_task_ids: list[str] = Field(
+        default_factory=list, description="Tasks deleted since the revision"
+    )
 
 
 class TaskCreateResponse(TaskScopedMutatingResponse):
@@ -226,6 +245,26 @@ class TaskMoveResponse(TaskScopedMutatingResponse):
     new_status: str | None = Field(default=None, description="The new status after the move")
 
 
+class TaskBulkCreateResponse(MutatingResponse):
+    """Response from tasks_create_many tool."""
+
+    tasks: list[TaskCreateResponse] = Field(
+        default_factory=list, description="Created tasks, in request order"
+    )
+    count: int = Field(default=0, description="Number of tasks created")
+
+
+class TaskBulkMutationResponse(MutatingResponse):
+    """Response from tasks_update_many and tasks_move_many tools."""
+
+    task_ids: list[str] = Field(
+        default_factory=list,
+        description="Changed task IDs, or the missing ones when code is TASK_NOT_FOUND",
+    )
+    count: int = Field(default=0, description="Number of tasks changed")
+    new_status: str | None = Field(default=None, description="The new status after a move")
+
+
 class JobResponse(JobScopedResponse):
     """Response from jobs_submit, jobs_get, jobs_wait, and jobs_cancel tools."""
 
@@ -291,6 +330,12 @@ class JobEventsResponse(JobScopedResponse):
     limit: int = Field(default=0, description="Page limit used for this response")
     has_more: bool = Field(default=False, description="Whether additional events are available")
     next_offset: int | None = Field(default=None, description="Offset for the next page")
+    after_index: int | None = Field(
+        default=None, description="Event cursor the events were read after, if any"
+    )
+    next_index: int | None = Field(
+        default=None, description="Pass as after_index to fetch only newer events"
+    )
 
 
 class SessionCreateResponse(TaskScopedMutatingResponse):
@@ -420,7 +465,11 @@ class InstrumentationSnapshotResponse(BaseModel):
     )
     timings: dict[str, dict[str, float | int]] = Field(
         default_factory=dict,
-        description="Timing aggregates keyed by metric name",
+        description="Timing aggregates (including p50/p95/p99) keyed by metric name",
+    )
+    histograms: dict[str, list[tuple[float, int]]] = Field(
+        default_factory=dict,
+        description="Non-empty latency buckets as (upper_bound_ms, count) keyed by metric name",
     )
 
 
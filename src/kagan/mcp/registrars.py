@@ -52,6 +52,9 @@ from kagan.mcp.models import (
     SessionKillResponse,
     SettingsGetResponse,
     SettingsUpdateResponse,
+    TaskBulkCreateResponse,
+    TaskBulkMutationResponse,
+    TaskChangesResponse,
     TaskContext,
     TaskCreateResponse,
     TaskDeleteResponse,
@@ -154,6 +157,7 @@ _PLAN_PROPOSE = protocol_call(ProtocolCapability.PLAN, PlanMethod.PROPOSE)
 _TASKS_GET = protocol_call(ProtocolCapability.TASKS, TasksMethod.GET)
 _TASKS_SCRATCHPAD = protocol_call(ProtocolCapability.TASKS, TasksMethod.SCRATCHPAD)
 _TASKS_LIST = protocol_call(ProtocolCapability.TASKS, TasksMethod.LIST)
+_TASKS_CHANGED_SINCE = protocol_call(ProtocolCapability.TASKS, TasksMethod.CHANGED_SINCE)
 _PROJECTS_LIST = protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.LIST)
 _PROJECTS_REPOS = protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.REPOS)
 _AUDIT_LIST = protocol_call(ProtocolCapability.AUDIT, AuditMethod.LIST)
@@ -163,6 +167,9 @@ _TASKS_UPDATE_SCRATCHPAD = protocol_call(ProtocolCapability.TASKS, TasksMethod.U
 _TASKS_CREATE = protocol_call(ProtocolCapability.TASKS, TasksMethod.CREATE)
 _TASKS_UPDATE = protocol_call(ProtocolCapability.TASKS, TasksMethod.UPDATE)
 _TASKS_MOVE = protocol_call(ProtocolCapability.TASKS, TasksMethod.MOVE)
+_TASKS_CREATE_MANY = protocol_call(ProtocolCapability.TASKS, TasksMethod.CREATE_MANY)
+_TASKS_UPDATE_MANY = protocol_call(ProtocolCapability.TASKS, TasksMethod.UPDATE_MANY)
+_TASKS_MOVE_MANY = protocol_call(ProtocolCapability.TASKS, TasksMethod.MOVE_MANY)
 _TASKS_DELETE = protocol_call(ProtocolCapability.TASKS, TasksMethod.DELETE)
 _PROJECTS_CREATE = protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.CREATE)
 _PROJECTS_OPEN = protocol_call(ProtocolCapability.PROJECTS, ProjectsMethod.OPEN)
@@ -346,9 +353,16 @@ def register_shared_tools(
             filter: str | None = None,
             exclude_task_ids: list[str] | None = None,
             include_scratchpad: bool = False,
+            task_type: str | None = None,
+            limit: int = 100,
+            cursor: str | None = None,
             ctx: MCPContext | None = None,
         ) -> TaskListResponse:
-            """List tasks with optional coordination filters."""
+            """List tasks in board order with optional coordination filters.
+
+            Returns at most ``limit`` tasks (max 500); pass ``next_cursor`` back as
+            ``cursor`` to fetch the next page.
+            """
             bridge = _require_bridge(ctx)
 
             raw = await bridge.list_tasks(
@@ -356,6 +370,9 @@ def register_shared_tools(
                 filter=filter,
                 exclude_task_ids=exclude_task_ids,
                 include_scratchpad=include_scratchpad,
+                task_type=task_type,
+                limit=limit,
+                cursor=cursor,
             )
             tasks = [
                 TaskSummary(
@@ -369,7 +386,43 @@ def register_shared_tools(
                 )
                 for t in raw.get("tasks", [])
             ]
-            return TaskListResponse(tasks=tasks, count=raw.get("count", len(tasks)))
+            return TaskListResponse(
+                tasks=tasks,
+                count=raw.get("count", len(tasks)),
+                next_cursor=raw.get("next_cursor"),
+            )
+
+    if allows_all(_TASKS_CHANGED_SINCE):
+
+        @mcp.tool(annotations=_READ_ONLY)
+        async def tasks_changed_since(
+            project_id: str,
+            revision: int = 0,
+            ctx: MCPContext | None = None,
+        ) -> TaskChangesResponse:
+            """List tasks changed or deleted since a board revision.
+
+            Start with revision 0 and pass the returned ``revision`` on the next
+            call to receive only what changed in between.
+            """
+            bridge = _require_bridge(ctx)
+
+            raw = await bridge.list_tasks_changed_since(project_id, revision)
+            return TaskChangesResponse(
+                revision=raw.get("revision", revision),
+                full=raw.get("full", False),
+                tasks=[
+                    TaskSummary(
+                        task_id=t["id"],
+                        title=t["title"],
+                        status=t.get("status"),
+                        description=t.get("description"),
+                        acceptance_criteria=t.get("acceptance_criteria"),
+                    )
+                    for t in raw.get("tasks", [])
+                ],
+                deleted_task_ids=raw.get("deleted_task_ids", []),
+            )
 
     if allows_all(_PROJECTS_LIST):
 
@@ -752,6 +805,100 @@ def register_task_tools(
                 **_envelope_recovery_fields(envelope),
             )
 
+    if allows_all(_TASKS_CREATE_MANY):
+
+        @mcp.tool(annotations=_MUTATING)
+        async def tasks_create_many(
+            tasks: list[dict[str, Any]],
+            project_id: str | None = None,
+            ctx: MCPContext | None = None,
+        ) -> TaskBulkCreateResponse:
+            """Create several tasks in one transaction.
+
+            Each item takes the tasks_create fields (title required). Prefer this
+            over repeated tasks_create calls when importing or splitting work.
+            Recovery policy: if response includes next_tool and next_arguments,
+            call that tool exactly once before any retry.
+            """
+            bridge = _require_bridge(ctx)
+
+            raw = await bridge.create_tasks(tasks, project_id=project_id)
+            envelope = _envelope_fields(raw, default_success=True)
+            created = raw.get("tasks") or []
+            return TaskBulkCreateResponse(
+                tasks=[
+                    TaskCreateResponse(
+                        success=True,
+                        task_id=item["task_id"],
+                        title=item.get("title", ""),
+                        status=item.get("status", TaskStatus.BACKLOG.value),
+                    )
+                    for item in created
+                ],
+                count=raw.get("count", len(created)),
+                **_envelope_recovery_fields(envelope),
+            )
+
+    if allows_all(_TASKS_UPDATE_MANY):
+
+        @mcp.tool(annotations=_MUTATING)
+        async def tasks_update_many(
+            updates: list[dict[str, Any]],
+            ctx: MCPContext | None = None,
+        ) -> TaskBulkMutationResponse:
+            """Update several tasks in one transaction.
+
+            Each item takes task_id plus the tasks_update fields to change.
+            Nothing is written if any task_id is unknown.
+            Recovery policy: if response includes next_tool and next_arguments,
+            call that tool exactly once before any retry.
+            """
+            bridge = _require_bridge(ctx)
+
+            raw = await bridge.update_tasks(updates)
+            envelope = _envelope_fields(raw, default_success=True)
+            task_ids = raw.get("task_ids") or []
+            return TaskBulkMutationResponse(
+                task_ids=task_ids,
+                count=raw.get("count", 0),
+                **_envelope_recovery_fields(envelope),
+            )
+
+    if allows_all(_TASKS_MOVE_MANY):
+
+        @mcp.tool(annotations=_MUTATING)
+        async def tasks_move_many(
+            task_ids: list[str],
+            status: WorkflowStatusInput,
+            ctx: MCPContext | None = None,
+        ) -> TaskBulkMutationResponse:
+            """Move several tasks to the same Kanban column in one transaction.
+
+            Nothing is moved if any task_id is unknown.
+            Recovery policy: if response includes next_tool and next_arguments,
+            call that tool exactly once before any retry.
+            """
+            bridge = _require_bridge(ctx)
+            if _normalized_mode(str(status)) is not None:
+                return TaskBulkMutationResponse(
+                    success=False,
+                    message=(
+                        f"Invalid status value {status!r}. "
+                        "AUTO/PAIR are task_type values, not status values."
+                    ),
+                    code=TASK_CODE_TASK_TYPE_VALUE_IN_STATUS,
+                    hint="Call tasks_update_many with task_type to set execution mode.",
+                )
+
+            raw = await bridge.move_tasks(task_ids, status)
+            envelope = _envelope_fields(raw, default_success=True)
+            return TaskBulkMutationResponse(
+                task_ids=raw.get("task_ids") or [],
+                count=raw.get("count", 0),
+                new_status=raw.get("new_status"),
+                **_envelope_recovery_fields(envelope),
+            )
+
     if allows_all(_TASKS_DELETE):
 
         @mcp.tool(annotations=_DESTRUCTIVE)
@@ -1089,10 +1236,14 @@ def register_job_tools(
             task_id: str,
             limit: int = 50,
             offset: int = 0,
+            after_index: int | None = None,
             ctx: MCPContext | None = None,
         ) -> JobEventsResponse:
             """List paginated events emitted by a submitted core job.
 
+            Pass the previous response's next_index as after_index to fetch
+            only events emitted since then.
+
             Recovery policy: if response includes next_tool and next_arguments,
             call that tool exactly once before any retry.
             """
@@ -1102,6 +1253,7 @@ def register_job_tools(
                 task_id=task_id,
                 limit=limit,
                 offset=offset,
+                after_index=after_index,
             )
             envelope = _envelope_fields(raw, default_success=False, default_message=None)
             events: list[JobEvent] = []
@@ -1145,6 +1297,8 @@ def register_job_tools(
                 limit=page_limit if page_limit is not None else limit,
                 has_more=has_more,
                 next_offset=next_offset,
+                after_index=_int_or_none(raw.get("after_index")),
+                next_index=_int_or_none(raw.get("next_index")),
             )
 
     if allows_all(_JOBS_CANCEL):
@@ -1439,11 +1593,24 @@ def register_admin_tools(
                             normalized_stats[str(field_name)] = field_value
                     timings[str(metric_name)] = normalized_stats
 
+            histograms_raw = raw.get("histograms", {})
+            histograms: dict[str, list[tuple[float, int]]] = {}
+            if isinstance(histograms_raw, dict):
+                for metric_name, buckets in histograms_raw.items():
+                    if not isinstance(buckets, list):
+                        continue
+                    histograms[str(metric_name)] = [
+                        (float(bucket[0]), int(bucket[1]))
+                        for bucket in buckets
+                        if isinstance(bucket, list | tuple) and len(bucket) == 2
+                    ]
+
             return InstrumentationSnapshotResponse(
                 enabled=bool(raw.get("enabled", False)),
                 log_events=bool(raw.get("log_events", False)),
                 counters=counters,
                 timings=timings,
+                histograms=histograms,
             )
 
     if allows_all(_SETTINGS_UPDATE):
@@ -299,7 +299,7 @@ async def _mcp_lifespan(
     session_id = config.session_id or MCP_DEFAULT_SESSION_ID
     capability_profile = config.capability_profile or MCP_FALLBACK_CAPABILITY
     session_origin = config.identity or MCP_IDENTITY_DEFAULT
-    client = IPCClient(endpoint)
+    client = IPCClient(endpoint, multiplexed=True)
 
     try:
         await client.connect()
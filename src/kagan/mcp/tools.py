@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 _AUTH_FAILED_CODE = "AUTH_FAILED"
+_STALE_TOKEN_MESSAGE = (
+    "MCP session token became stale after core restart; restart MCP or reconnect client."
+)
 _SUMMARY_TEXT_LIMIT = 8_000
 _FULL_TEXT_LIMIT = 32_000
 _SUMMARY_LOG_ENTRY_LIMIT = 2_500
@@ -167,7 +170,7 @@ class CoreClientBridge:
         if endpoint is None:
             return False
 
-        new_client = IPCClient(endpoint)
+        new_client = IPCClient(endpoint, multiplexed=True)
         try:
             await new_client.connect()
         except Exception:
@@ -244,10 +247,7 @@ class CoreClientBridge:
                 if await self._recover_client(refresh_endpoint=True):
                     continue
                 code = "AUTH_STALE_TOKEN"
-                message = (
-                    "MCP session token became stale after core restart; "
-                    "restart MCP or reconnect client."
-                )
+                message = _STALE_TOKEN_MESSAGE
             raise MCPBridgeError.core_failure(
                 kind=kind,
                 capability=capability,
@@ -264,6 +264,79 @@ class CoreClientBridge:
             message="unexpected retry state",
         )
 
+    async def _query_batch(
+        self, queries: list[tuple[str, str, dict[str, Any]]]
+    ) -> list[dict[str, Any] | MCPBridgeError]:
+        """Send independent queries to the core in one ``core.batch`` round trip.
+
+        Returns each query's result, or the ``MCPBridgeError`` it failed with,
+        in the order of *queries*.
+        """
+        from kagan.core.ipc.contracts import BATCH_CAPABILITY, BATCH_METHOD, CoreBatchItem
+
+        items = [
+            CoreBatchItem(capability=capability, method=method, params=params)
+            for capability, method, params in queries
+        ]
+        max_attempts = 3
+        for attempt in range(max_attempts):
+            try:
+                responses = await self._client.request_batch(
+                    items,
+                    session_id=self._session_id,
+                    session_profile=self._capability_profile,
+                    session_origin=self._session_origin,
+                )
+            except ConnectionError as exc:
+                if attempt < max_attempts - 1 and await self._recover_client(
+                    refresh_endpoint=False
+                ):
+                    continue
+                raise MCPBridgeError.core_failure(
+                    kind="query",
+                    capability=BATCH_CAPABILITY,
+                    method=BATCH_METHOD,
+                    code="DISCONNECTED",
+                    message=str(exc),
+                    hint="Ensure Kagan core is running and reachable, then retry.",
+                ) from exc
+            except ValueError as exc:
+                stale = f"[{_AUTH_FAILED_CODE}]" in str(exc)
+                if stale and attempt < max_attempts - 1:
+                    if await self._recover_client(refresh_endpoint=True):
+                        continue
+                raise MCPBridgeError.core_failure(
+                    kind="query",
+                    capability=BATCH_CAPABILITY,
+                    method=BATCH_METHOD,
+                    code="AUTH_STALE_TOKEN" if stale else "BATCH_REJECTED",
+                    message=_STALE_TOKEN_MESSAGE if stale else str(exc),
+                ) from exc
+
+            results: list[dict[str, Any] | MCPBridgeError] = []
+            for (capability, method, _params), resp in zip(queries, responses, strict=True):
+                if resp.ok:
+                    results.append(resp.result or {})
+                    continue
+                results.append(
+                    MCPBridgeError.core_failure(
+                        kind="query",
+                        capability=capability,
+                        method=method,
+                        code=resp.error.code if resp.error else "UNKNOWN",
+                        message=resp.error.message if resp.error else "Unknown error",
+                    )
+                )
+            return results
+
+        raise MCPBridgeError.core_failure(
+            kind="query",
+            capability=BATCH_CAPABILITY,
+            method=BATCH_METHOD,
+            code="UNKNOWN",
+            message="unexpected retry state",
+        )
+
     async def get_context(self, task_id: str) -> dict:
         """Get task context for AI tools."""
         return await self._query("tasks", "context", {"task_id": task_id})
@@ -277,8 +350,26 @@ class CoreClientBridge:
         include_review: bool | None = None,
         mode: str = "summary",
     ) -> dict:
-        """Get task details with optional extended context."""
-        result = await self._query("tasks", "get", {"task_id": task_id})
+        """Get task details with optional extended context.
+
+        The task, its scratchpad and its logs are fetched in one round trip.
+        """
+        extra_methods = [
+            method
+            for method, wanted in (("scratchpad", include_scratchpad), ("logs", include_logs))
+            if wanted
+        ]
+        extras: dict[str, dict[str, Any] | MCPBridgeError] = {}
+        if extra_methods:
+            outcomes = await self._query_batch(
+                [("tasks", method, {"task_id": task_id}) for method in ("get", *extra_methods)]
+            )
+            result = outcomes[0]
+            if isinstance(result, MCPBridgeError):
+                raise result
+            extras = dict(zip(extra_methods, outcomes[1:], strict=True))
+        else:
+            result = await self._query("tasks", "get", {"task_id": task_id})
         task_data = result.get("task")
         if not result.get("found") or task_data is None:
             raise MCPBridgeError.task_not_found(task_id)
@@ -295,7 +386,9 @@ class CoreClientBridge:
         }
 
         if include_scratchpad:
-            scratchpad_result = await self._query("tasks", "scratchpad", {"task_id": task_id})
+            scratchpad_result = extras["scratchpad"]
+            if isinstance(scratchpad_result, MCPBridgeError):
+                raise scratchpad_result
             response["scratchpad"] = self._truncate_text(
                 scratchpad_result.get("content"),
                 limit=text_limit,
@@ -303,11 +396,10 @@ class CoreClientBridge:
 
         if include_logs:
             logs: list[dict[str, Any]] = []
-            try:
-                logs_result = await self._query("tasks", "logs", {"task_id": task_id})
-            except MCPBridgeError as exc:
-                if not self._is_query_unavailable(exc):
-                    raise
+            logs_result = extras["logs"]
+            if isinstance(logs_result, MCPBridgeError):
+                if not self._is_query_unavailable(logs_result):
+                    raise logs_result
                 logger.debug(
                     "tasks.logs unavailable; returning empty logs list for task %s", task_id
                 )
@@ -377,8 +469,11 @@ class CoreClientBridge:
         filter: str | None = None,
         exclude_task_ids: list[str] | None = None,
         include_scratchpad: bool = False,
+        task_type: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> dict:
-        """List tasks with optional coordination filters."""
+        """List tasks with optional coordination filters and keyset paging."""
         params: dict[str, Any] = {}
         if project_id:
             params["project_id"] = project_id
@@ -388,8 +483,20 @@ class CoreClientBridge:
             params["exclude_task_ids"] = exclude_task_ids
         if include_scratchpad:
             params["include_scratchpad"] = include_scratchpad
+        if task_type:
+            params["task_type"] = task_type
+        if limit is not None:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
         return await self._query("tasks", "list", params)
 
+    async def list_tasks_changed_since(self, project_id: str, revision: int = 0) -> dict:
+        """List tasks changed or deleted after a board revision."""
+        return await self._query(
+            "tasks", "changed_since", {"project_id": project_id, "revision": revision}
+        )
+
     async def list_projects(self, limit: int = 10) -> dict:
         """List recent projects."""
         return await self._query("projects", "list", {"limit": limit})
@@ -467,6 +574,23 @@ class CoreClientBridge:
         """Move task to new status column."""
         return await self._command("tasks", "move", {"task_id": task_id, "status": status})
 
+    async def create_tasks(
+        self, tasks: list[dict[str, Any]], project_id: str | None = None
+    ) -> dict:
+        """Create several tasks in one transaction."""
+        params: dict[str, Any] = {"tasks": tasks}
+        if project_id:
+            params["project_id"] = project_id
+        return await self._command("tasks", "create_many", params)
+
+    async def update_tasks(self, updates: list[dict[str, Any]]) -> dict:
+        """Update several tasks in one transaction."""
+        return await self._command("tasks", "update_many", {"updates": updates})
+
+    async def move_tasks(self, task_ids: list[str], status: str) -> dict:
+        """Move several tasks to a status column in one transaction."""
+        return await self._command("tasks", "move_many", {"task_ids": task_ids, "status": status})
+
     async def submit_job(
         self,
         *,
@@ -504,13 +628,18 @@ class CoreClientBridge:
         task_id: str,
         limit: int = 50,
         offset: int = 0,
+        after_index: int | None = None,
     ) -> dict:
         """List paginated events emitted for a submitted core job."""
-        return await self._query(
-            "jobs",
-            "events",
-            {"job_id": job_id, "task_id": task_id, "limit": limit, "offset": offset},
-        )
+        params: dict[str, Any] = {
+            "job_id": job_id,
+            "task_id": task_id,
+            "limit": limit,
+            "offset": offset,
+        }
+        if after_index is not None:
+            params["after_index"] = after_index
+        return await self._query("jobs", "events", params)
 
     async def cancel_job(self, *, job_id: str, task_id: str) -> dict:
         """Cancel a submitted core job."""
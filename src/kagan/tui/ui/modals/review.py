@@ -78,6 +78,7 @@ class ReviewModal(KaganModalScreen[str | None]):
     STOP_JOB_PENDING_MESSAGE = "Agent stop requested; waiting for scheduler."
 
     _LIVE_ATTACH_TIMEOUT_SECONDS = 1.5
+    _AGENT_OUTPUT_HISTORY_BYTES = 256 * 1024
 
     _agent: Agent | None
     _live_output_agent: Agent | None
@@ -86,6 +87,7 @@ class ReviewModal(KaganModalScreen[str | None]):
     _live_output_wait_noted: bool
     _live_review_attached: bool
     _loaded_agent_output_entry_ids: set[str]
+    _agent_output_end_offset: int | None
     _runtime_poll_timer: Timer | None
 
     def __init__(
@@ -138,6 +140,7 @@ class ReviewModal(KaganModalScreen[str | None]):
         self._live_output_wait_noted = False
         self._live_review_attached = False
         self._loaded_agent_output_entry_ids: set[str] = set()
+        self._agent_output_end_offset: int | None = None
         self._review_log_loaded = False
         self._phase: StreamPhase = StreamPhase.IDLE
         self._diff_stats: str = ""
@@ -501,6 +504,7 @@ class ReviewModal(KaganModalScreen[str | None]):
             self._execution_id = runtime_view.execution_id
         if self._execution_id != previous_execution_id:
             self._loaded_agent_output_entry_ids.clear()
+            self._agent_output_end_offset = None
         self._live_output_agent = runtime_view.running_agent if runtime_view is not None else None
         self._live_review_agent = runtime_view.review_agent if runtime_view is not None else None
 
@@ -708,6 +712,7 @@ class ReviewModal(KaganModalScreen[str | None]):
             return None
         if self._execution_id != execution.id:
             self._loaded_agent_output_entry_ids.clear()
+            self._agent_output_end_offset = None
         self._execution_id = execution.id
         return self._execution_id
 
@@ -732,7 +737,15 @@ class ReviewModal(KaganModalScreen[str | None]):
                 await panel.output.post_note("No execution logs available", classes="warning")
             return
 
-        entries = await self.ctx.api.get_execution_log_entries(execution_id)
+        # Load the tail of the history first, then only what was appended since.
+        if self._agent_output_end_offset is None:
+            entries = await self.ctx.api.get_execution_log_entries(
+                execution_id, tail_bytes=self._AGENT_OUTPUT_HISTORY_BYTES
+            )
+        else:
+            entries = await self.ctx.api.get_execution_log_entries(
+                execution_id, after_offset=self._agent_output_end_offset
+            )
         if not entries:
             if not self._is_running and not self._loaded_agent_output_entry_ids:
                 await panel.output.post_note("No execution logs available", classes="warning")
@@ -755,9 +768,20 @@ class ReviewModal(KaganModalScreen[str | None]):
         if execution and execution.metadata_:
             has_review_result = "review_result" in execution.metadata_
 
+        has_earlier_entries = (
+            len(indexed_entries) > 1
+            or bool(self._loaded_agent_output_entry_ids)
+            or getattr(entries[0], "offset", 0) > 0
+        )
         review_entry_id = (
-            indexed_entries[-1][0] if has_review_result and len(indexed_entries) > 1 else None
+            indexed_entries[-1][0] if has_review_result and has_earlier_entries else None
         )
+        if self._agent_output_end_offset is None and getattr(entries[0], "offset", 0) > 0:
+            await panel.output.post_note(
+                f"Showing the last {self._AGENT_OUTPUT_HISTORY_BYTES // 1024} KiB of output.",
+                classes="info",
+            )
+        self._agent_output_end_offset = getattr(entries[-1], "end_offset", None)
         rendered_impl_output = False
         has_impl_entries = False
         for entry_id, entry in new_entries:
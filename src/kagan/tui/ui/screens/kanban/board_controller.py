@@ -25,7 +25,8 @@ from kagan.tui.ui.widgets.keybinding_hint import KanbanHintBar
 from kagan.tui.ui.widgets.offline_banner import OfflineBanner
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Sequence
+    from datetime import datetime
     from typing import Protocol
 
     from kagan.core.adapters.db.schema import Task
@@ -136,6 +137,25 @@ def compute_board_task_diff(
     )
 
 
+def board_order_key(task: Task) -> tuple[int, int, datetime, str]:
+    """Sort key matching the order ``tasks.list`` returns."""
+    return (COLUMN_ORDER.index(task.status), -int(task.priority), task.created_at, task.id)
+
+
+def merge_board_task_changes(
+    previous: Sequence[Task],
+    changed: Sequence[Task],
+    deleted_ids: Collection[str],
+) -> list[Task]:
+    """Apply a ``tasks.changed_since`` result to the previously loaded board."""
+    by_id = {task.id: task for task in previous}
+    for task_id in deleted_ids:
+        by_id.pop(task_id, None)
+    for task in changed:
+        by_id[task.id] = task
+    return sorted(by_id.values(), key=board_order_key)
+
+
 def group_tasks_by_status[T: BoardTaskLike](
     display_tasks: Sequence[T],
     *,
@@ -274,6 +294,7 @@ class KanbanBoardController:
         self.screen._ui_state.filtered_tasks = None
         self.screen._task_hashes.clear()
         self.screen._tasks = []
+        self.screen._board_revision = None
         await self.refresh_and_sync()
         self.screen.focus_first_card()
 
@@ -472,9 +493,7 @@ class KanbanBoardController:
             focused_task_id = focused.task_model.id
 
         try:
-            new_tasks = await self.screen.ctx.api.list_tasks(
-                project_id=self.screen.ctx.active_project_id
-            )
+            new_tasks, revision = await self._fetch_board_tasks()
         except (RepositoryClosing, OperationalError):
             return
 
@@ -482,8 +501,27 @@ class KanbanBoardController:
         await self.screen.ctx.api.reconcile_running_tasks(auto_task_ids)
         model = self._build_refresh_model(new_tasks)
         self._apply_refresh_model(model, focused_task_id=focused_task_id)
+        self.screen._board_revision = revision
         self.sync_agent_states()
 
+    async def _fetch_board_tasks(self) -> tuple[list[Task], tuple[str, int] | None]:
+        """Load the board, fetching only tasks changed since the last refresh."""
+        api = self.screen.ctx.api
+        project_id = self.screen.ctx.active_project_id
+        if project_id is None:
+            return await api.list_tasks(project_id=None), None
+
+        known = self.screen._board_revision
+        since = known[1] if known is not None and known[0] == project_id else 0
+        changes = await api.list_tasks_changed_since(project_id, since)
+        if changes.full:
+            new_tasks = sorted(changes.tasks, key=board_order_key)
+        else:
+            new_tasks = merge_board_task_changes(
+                self.screen._tasks, changes.tasks, changes.deleted_ids
+            )
+        return new_tasks, (project_id, changes.revision)
+
     def notify_status_changes(
         self,
         new_tasks: list[Task],
@@ -124,6 +124,8 @@ class KanbanScreen(KaganScreen):
         self._board_sync_interval_seconds: float | None = None
         self._board_fast_ticks_remaining: int = 0
         self._task_hashes: dict[str, int] = {}
+        # (project_id, board revision) that ``_tasks`` reflects.
+        self._board_revision: tuple[str, int] | None = None
         self._agent_offline: bool = False
         self._merge_failed_tasks: set[str] = set()
         self._search_request_id: int = 0
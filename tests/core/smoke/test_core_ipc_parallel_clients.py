@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from kagan.core.ipc.client import IPCClient
-from kagan.core.ipc.contracts import CoreRequest, CoreResponse
+from kagan.core.ipc.contracts import CoreBatchItem, CoreRequest, CoreResponse
 from kagan.core.ipc.discovery import CoreEndpoint
 from kagan.core.ipc.server import IPCServer
 from kagan.core.ipc.transports import UnixSocketTransport
@@ -228,3 +228,225 @@ async def test_client_rejects_mismatched_request_id(short_tmp) -> None:
     finally:
         await client.close()
         await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_multiplexed_client_matches_concurrent_responses_by_request_id(short_tmp) -> None:
+    """Many in-flight requests on one multiplexed connection each get their own response."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    server = IPCServer(handler=_make_echo_handler(), transport=transport)
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(ep, transport=UnixSocketTransport(path=sock), multiplexed=True)
+    await client.connect()
+
+    try:
+        methods = [f"m{index}" for index in range(10)]
+        responses = await asyncio.gather(
+            *(
+                client.request(session_id="mcp", capability="tasks", method=method)
+                for method in methods
+            )
+        )
+        assert [resp.result["method"] for resp in responses if resp.result] == methods
+        assert client.pending_count == 0
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_multiplexed_timeout_abandons_only_the_slow_request(short_tmp) -> None:
+    """A timed-out multiplexed request keeps the connection usable for later requests."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    release = asyncio.Event()
+    echo = _make_echo_handler()
+
+    async def handler(req: CoreRequest) -> CoreResponse:
+        if req.method == "slow":
+            await release.wait()
+        return await echo(req)
+
+    server = IPCServer(handler=handler, transport=transport)
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(
+        ep,
+        transport=UnixSocketTransport(path=sock),
+        timeout=0.2,
+        multiplexed=True,
+    )
+    await client.connect()
+
+    try:
+        with pytest.raises(TimeoutError):
+            await client.request(session_id="mcp", capability="tasks", method="slow")
+        assert client.is_connected
+
+        release.set()
+        resp = await client.request(session_id="mcp", capability="tasks", method="get")
+        assert resp.ok and resp.result is not None
+        assert resp.result["method"] == "get"
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_multiplexed_client_fails_pending_requests_on_close(short_tmp) -> None:
+    """In-flight multiplexed requests fail with ConnectionError when the connection closes."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    received = asyncio.Event()
+    release = asyncio.Event()
+    echo = _make_echo_handler()
+
+    async def handler(req: CoreRequest) -> CoreResponse:
+        received.set()
+        await release.wait()
+        return await echo(req)
+
+    server = IPCServer(handler=handler, transport=transport)
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(ep, transport=UnixSocketTransport(path=sock), multiplexed=True)
+    await client.connect()
+
+    try:
+        pending = asyncio.create_task(
+            client.request(session_id="mcp", capability="tasks", method="list")
+        )
+        await received.wait()
+        await client.close()
+        with pytest.raises(ConnectionError):
+            await pending
+    finally:
+        release.set()
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_concurrent_dispatch_answers_fast_request_before_slow_one(short_tmp) -> None:
+    """A slow request does not block a later fast one pipelined on the same connection."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    release = asyncio.Event()
+    echo = _make_echo_handler()
+
+    async def handler(req: CoreRequest) -> CoreResponse:
+        if req.method == "slow":
+            await release.wait()
+        return await echo(req)
+
+    server = IPCServer(handler=handler, transport=transport, concurrent_dispatch=True)
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(ep, transport=UnixSocketTransport(path=sock), multiplexed=True)
+    await client.connect()
+
+    try:
+        slow = asyncio.create_task(
+            client.request(session_id="mcp", capability="tasks", method="slow")
+        )
+        fast = await client.request(session_id="mcp", capability="tasks", method="fast")
+        assert fast.ok and fast.result is not None
+        assert fast.result["method"] == "fast"
+        assert not slow.done()
+
+        release.set()
+        slow_resp = await slow
+        assert slow_resp.ok and slow_resp.result is not None
+        assert slow_resp.result["method"] == "slow"
+    finally:
+        release.set()
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_concurrent_dispatch_bounds_in_flight_requests_per_connection(short_tmp) -> None:
+    """No more than ``max_in_flight_per_connection`` handlers run at once for one client."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    running = 0
+    peak = 0
+    echo = _make_echo_handler()
+
+    async def handler(req: CoreRequest) -> CoreResponse:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return await echo(req)
+
+    server = IPCServer(
+        handler=handler,
+        transport=transport,
+        concurrent_dispatch=True,
+        max_in_flight_per_connection=3,
+    )
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(ep, transport=UnixSocketTransport(path=sock), multiplexed=True)
+    await client.connect()
+
+    try:
+        responses = await asyncio.gather(
+            *(
+                client.request(session_id="mcp", capability="tasks", method=f"m{index}")
+                for index in range(12)
+            )
+        )
+        assert all(resp.ok for resp in responses)
+        assert 1 < peak <= 3
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_request_batch_round_trips_per_item_responses(short_tmp) -> None:
+    """``request_batch`` sends one envelope and unpacks per-item responses in order."""
+    sock = str(short_tmp / "t.sock")
+    transport = UnixSocketTransport(path=sock)
+    echo = _make_echo_handler()
+    envelopes: list[CoreRequest] = []
+
+    async def handler(req: CoreRequest) -> CoreResponse:
+        envelopes.append(req)
+        items = [await echo(item) for item in req.batch_requests()]
+        return CoreResponse.batch(req.request_id, items)
+
+    server = IPCServer(handler=handler, transport=transport)
+    await server.start()
+
+    ep = _endpoint(sock, server.token)
+    client = IPCClient(ep, transport=UnixSocketTransport(path=sock))
+    await client.connect()
+
+    try:
+        responses = await client.request_batch(
+            [
+                CoreBatchItem(capability="tasks", method="get", params={"task_id": "T1"}),
+                CoreBatchItem(capability="tasks", method="scratchpad"),
+            ],
+            session_id="mcp",
+        )
+        assert len(envelopes) == 1
+        assert envelopes[0].is_batch
+        assert [resp.result["method"] for resp in responses if resp.result] == [
+            "get",
+            "scratchpad",
+        ]
+    finally:
+        await client.close()
+        await server.stop()
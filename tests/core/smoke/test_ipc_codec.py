@@ -0,0 +1,228 @@
+"""Integration tests and benchmark for IPC wire codec negotiation."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kagan.core.ipc.client import IPCClient
+from kagan.core.ipc.codec import (
+    CODEC_ACCEPT_KEY,
+    CODEC_OFFER_KEY,
+    JSON_LINES,
+    MsgpackCodec,
+    available_codecs,
+    choose_codec,
+    resolve_codec_preference,
+)
+from kagan.core.ipc.contracts import CoreRequest, CoreResponse
+from kagan.core.ipc.discovery import CoreEndpoint
+from kagan.core.ipc.server import IPCServer
+from kagan.core.ipc.transports import UnixSocketTransport
+
+_HAS_MSGPACK = MsgpackCodec.name in available_codecs()
+_unix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix sockets unavailable on Windows"
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _task_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"task-{i:05d}",
+            "project_id": "proj-1",
+            "title": f"Implement feature number {i}",
+            "description": "Short description of the work to be done. " * 3,
+            "status": "IN_PROGRESS" if i % 3 else "BACKLOG",
+            "priority": i % 4,
+            "task_type": "AUTO",
+            "created_at": "2026-01-01T12:00:00+00:00",
+            "updated_at": "2026-01-02T08:30:00+00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def _log_entries(count: int, size: int) -> list[dict[str, Any]]:
+    chunk = ("$ uv run pytest -q\n" + "." * 70 + "\n") * (size // 90)
+    return [
+        {"id": f"log-{i}", "execution_id": "exec-1", "logs": chunk, "sequence": i}
+        for i in range(count)
+    ]
+
+
+def _make_payload_handler(result: dict[str, Any]):
+    async def handler(req: CoreRequest) -> CoreResponse:
+        return CoreResponse.success(req.request_id, result=result)
+
+    return handler
+
+
+def _endpoint(socket_path: str, token: str) -> CoreEndpoint:
+    return CoreEndpoint(transport="socket", address=socket_path, token=token)
+
+
+@pytest.fixture
+def short_tmp():  # type: ignore[override]
+    """Create a short temp directory for Unix socket paths (macOS 104-byte limit)."""
+    d = tempfile.mkdtemp(prefix="k-", dir="/tmp")
+    yield Path(d)
+    import shutil
+
+    shutil.rmtree(d, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Negotiation
+# ---------------------------------------------------------------------------
+
+
+def test_choose_codec_falls_back_to_json_for_unknown_offers() -> None:
+    assert choose_codec(["brotli-cbor"]) is JSON_LINES
+    assert choose_codec("msgpack") is JSON_LINES
+    assert choose_codec(None) is JSON_LINES
+
+
+def test_resolve_codec_preference_rejects_unknown_codec() -> None:
+    assert resolve_codec_preference("json") == ["json"]
+    with pytest.raises(ValueError, match="not available"):
+        resolve_codec_preference("brotli-cbor")
+
+
+@_unix_only
+async def test_json_client_skips_negotiation(short_tmp) -> None:
+    sock = str(short_tmp / "t.sock")
+    server = IPCServer(
+        handler=_make_payload_handler({"tasks": _task_rows(3)}),
+        transport=UnixSocketTransport(path=sock),
+    )
+    await server.start()
+    client = IPCClient(
+        _endpoint(sock, server.token), transport=UnixSocketTransport(path=sock), codec="json"
+    )
+    await client.connect()
+    try:
+        assert client.codec_name == "json"
+        resp = await client.request(session_id="s", capability="tasks", method="list")
+        assert resp.ok and resp.result is not None
+        assert len(resp.result["tasks"]) == 3
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@_unix_only
+@pytest.mark.skipif(not _HAS_MSGPACK, reason="msgpack not installed")
+@pytest.mark.parametrize("multiplexed", [False, True])
+async def test_auto_client_negotiates_msgpack(short_tmp, multiplexed: bool) -> None:
+    sock = str(short_tmp / "t.sock")
+    logs = _log_entries(4, 256 * 1024)
+    server = IPCServer(
+        handler=_make_payload_handler({"logs": logs}),
+        transport=UnixSocketTransport(path=sock),
+        concurrent_dispatch=multiplexed,
+    )
+    await server.start()
+    client = IPCClient(
+        _endpoint(sock, server.token),
+        transport=UnixSocketTransport(path=sock),
+        multiplexed=multiplexed,
+    )
+    await client.connect()
+    try:
+        assert client.codec_name == "msgpack"
+        responses = await asyncio.gather(
+            *(client.request(session_id="s", capability="tasks", method="logs") for _ in range(3))
+        )
+        for resp in responses:
+            assert resp.ok and resp.result is not None
+            assert resp.result["logs"] == logs
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@_unix_only
+async def test_client_keeps_json_when_core_ignores_offer(short_tmp) -> None:
+    """A core that predates negotiation answers the offer with an error line."""
+    sock = str(short_tmp / "t.sock")
+
+    async def legacy_core(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while raw := await reader.readline():
+            data = JSON_LINES.decode(raw)
+            if CODEC_OFFER_KEY in data:
+                reply = CoreResponse.failure("unknown", code="AUTH_FAILED", message="Invalid token")
+            else:
+                reply = CoreResponse.success(data["request_id"], result={"legacy": True})
+            writer.write(JSON_LINES.encode_model(reply))
+            await writer.drain()
+        writer.close()
+
+    legacy = await asyncio.start_unix_server(legacy_core, path=sock)
+    client = IPCClient(_endpoint(sock, "tok"), transport=UnixSocketTransport(path=sock))
+    await client.connect()
+    try:
+        assert client.codec_name == "json"
+        resp = await client.request(session_id="s", capability="tasks", method="list")
+        assert resp.result == {"legacy": True}
+    finally:
+        await client.close()
+        legacy.close()
+        await legacy.wait_closed()
+
+
+def test_offer_reply_uses_accept_key() -> None:
+    reply = JSON_LINES.decode(JSON_LINES.encode({CODEC_ACCEPT_KEY: "json"}))
+    assert reply == {"codec": "json"}
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def _measure(codec: Any, response: CoreResponse, rounds: int) -> tuple[int, float, float]:
+    frame = codec.encode_model(response)
+    body = frame.rstrip(b"\n") if codec is JSON_LINES else frame[4:]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        codec.encode_model(response)
+    encode_ms = (time.perf_counter() - start) * 1000 / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        CoreResponse.model_validate(codec.decode(body))
+    decode_ms = (time.perf_counter() - start) * 1000 / rounds
+    return len(frame), encode_ms, decode_ms
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("label", "result"),
+    [
+        ("tasks.list x1000", {"tasks": _task_rows(1000)}),
+        ("tasks.logs 3 MiB", {"logs": _log_entries(12, 256 * 1024)}),
+    ],
+)
+def test_codec_benchmark(label: str, result: dict[str, Any]) -> None:
+    """Report bytes on the wire and encode/decode cost per codec (run with ``-s``)."""
+    response = CoreResponse.success("bench", result=result)
+    sizes: dict[str, int] = {}
+    for name, codec in available_codecs().items():
+        size, encode_ms, decode_ms = _measure(codec, response, rounds=5)
+        sizes[name] = size
+        print(
+            f"\n{label:<18} {name:<8} {size / 1024:>9.1f} KiB "
+            f"encode {encode_ms:>7.2f} ms decode {decode_ms:>7.2f} ms"
+        )
+    if _HAS_MSGPACK:
+        assert sizes["msgpack"] <= sizes["json"]
@@ -49,6 +49,9 @@ def _build_engine(
     async def _get_task(task_id: str) -> _Task | None:
         return tasks_by_id.get(task_id)
 
+    async def _get_tasks(task_ids) -> list[_Task]:
+        return [tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id]
+
     async def _update_fields(task_id: str, **kwargs):
         task = tasks_by_id.get(task_id)
         if task is None:
@@ -65,11 +68,17 @@ def _build_engine(
     async def _update_scratchpad(task_id: str, content: str) -> None:
         scratchpads[task_id] = content
 
+    async def _append_scratchpad(task_id: str, text: str, *, separator: str = "") -> None:
+        existing = scratchpads.get(task_id, "")
+        scratchpads[task_id] = existing + (separator if existing else "") + text
+
     task_service = SimpleNamespace(
         get_task=AsyncMock(side_effect=_get_task),
+        get_tasks=AsyncMock(side_effect=_get_tasks),
         update_fields=AsyncMock(side_effect=_update_fields),
         get_scratchpad=AsyncMock(side_effect=_get_scratchpad),
         update_scratchpad=AsyncMock(side_effect=_update_scratchpad),
+        append_scratchpad=AsyncMock(side_effect=_append_scratchpad),
     )
     blocked_calls: list[tuple[str, str, tuple[str, ...], tuple[str, ...]]] = []
     cleared_calls: list[str] = []
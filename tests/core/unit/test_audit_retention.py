@@ -0,0 +1,151 @@
+"""Unit tests for audit log retention, summarization and archiving."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from kagan.core.adapters.db.repositories import AuditRepository, TaskRepository
+from kagan.core.adapters.db.schema import AuditEvent
+from kagan.core.audit_retention import AuditRetention
+from kagan.core.time import utc_now
+
+
+@pytest.fixture
+async def audit_repo():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        task_repo = TaskRepository(Path(tmpdir) / "test_audit.db")
+        await task_repo.initialize()
+        yield AuditRepository(task_repo.session_factory)
+        await task_repo.close()
+
+
+def _event(
+    minutes_ago: float,
+    *,
+    capability: str = "tasks",
+    command_name: str = "create",
+    success: bool = True,
+) -> AuditEvent:
+    return AuditEvent(
+        occurred_at=utc_now() - timedelta(minutes=minutes_ago),
+        actor_type="session",
+        actor_id="s",
+        capability=capability,
+        command_name=command_name,
+        success=success,
+    )
+
+
+async def test_prune_deletes_events_older_than_max_age(audit_repo: AuditRepository) -> None:
+    await audit_repo.record_many([_event(3 * 24 * 60), _event(2 * 24 * 60), _event(5), _event(1)])
+    retention = AuditRetention(audit_repo, max_age_days=1, max_rows=0, batch_size=1)
+
+    result = await retention.prune()
+
+    assert result.deleted == 2
+    assert result.archived == 0
+    assert await audit_repo.count_events() == 2
+
+
+async def test_prune_trims_oldest_events_beyond_max_rows(audit_repo: AuditRepository) -> None:
+    await audit_repo.record_many(
+        [_event(minutes, command_name=f"m{minutes}") for minutes in range(10)]
+    )
+    retention = AuditRetention(audit_repo, max_age_days=0, max_rows=4, batch_size=3)
+
+    result = await retention.prune()
+
+    assert result.deleted == 6
+    remaining = await audit_repo.list_events(limit=10)
+    assert [event.command_name for event in remaining] == ["m0", "m1", "m2", "m3"]
+
+
+async def test_prune_archives_rows_before_deleting(
+    audit_repo: AuditRepository, tmp_path: Path
+) -> None:
+    await audit_repo.record_many([_event(3 * 24 * 60, command_name="old"), _event(1)])
+    retention = AuditRetention(audit_repo, max_age_days=1, max_rows=0, archive_dir=tmp_path)
+
+    result = await retention.prune()
+
+    assert result.archived == 1
+    archives = list(tmp_path.glob("audit-*.jsonl.gz"))
+    assert len(archives) == 1
+    with gzip.open(archives[0], "rt", encoding="utf-8") as archive:
+        rows = [json.loads(line) for line in archive]
+    assert [row["command_name"] for row in rows] == ["old"]
+    assert await audit_repo.count_events() == 1
+
+
+async def test_prune_summarizes_read_only_events_into_minute_rollups(
+    audit_repo: AuditRepository, tmp_path: Path
+) -> None:
+    base = (utc_now() - timedelta(days=3)).replace(second=10, microsecond=0)
+    reads = [
+        AuditEvent(
+            occurred_at=base + timedelta(seconds=offset),
+            capability="tasks",
+            command_name="list",
+            success=offset != 20,
+        )
+        for offset in (0, 10, 20)
+    ]
+    write = AuditEvent(occurred_at=base, capability="tasks", command_name="create")
+    await audit_repo.record_many([*reads, write])
+    retention = AuditRetention(
+        audit_repo,
+        max_age_days=1,
+        max_rows=0,
+        summarize_reads=True,
+        archive_dir=tmp_path,
+    )
+
+    result = await retention.prune()
+
+    assert (result.deleted, result.summarized, result.archived) == (4, 3, 1)
+    rollups = await audit_repo.list_rollups()
+    assert len(rollups) == 1
+    assert (rollups[0].capability, rollups[0].command_name) == ("tasks", "list")
+    assert (rollups[0].count, rollups[0].failure_count) == (3, 1)
+
+
+async def test_rollups_accumulate_across_passes(audit_repo: AuditRepository) -> None:
+    occurred_at = (utc_now() - timedelta(days=3)).replace(second=0, microsecond=0)
+    retention = AuditRetention(audit_repo, max_age_days=1, max_rows=0, summarize_reads=True)
+
+    for _ in range(2):
+        await audit_repo.record_many(
+            [AuditEvent(occurred_at=occurred_at, capability="audit", command_name="list")]
+        )
+        await retention.prune()
+
+    rollups = await audit_repo.list_rollups(capability="audit")
+    assert [rollup.count for rollup in rollups] == [2]
+
+
+async def test_list_events_cursor_pages_through_identical_timestamps(
+    audit_repo: AuditRepository,
+) -> None:
+    occurred_at = utc_now()
+    await audit_repo.record_many(
+        [AuditEvent(occurred_at=occurred_at, command_name=f"m{i}") for i in range(5)]
+    )
+
+    seen: list[str] = []
+    cursor = None
+    while page := await audit_repo.list_events(limit=2, cursor=cursor):
+        seen.extend(event.id for event in page)
+        cursor = AuditRepository.cursor_for(page[-1])
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+def test_retention_is_disabled_without_limits(audit_repo: AuditRepository) -> None:
+    assert not AuditRetention(audit_repo, max_age_days=0, max_rows=0).enabled
@@ -0,0 +1,134 @@
+"""Unit tests for the group-committing AuditSink."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kagan.core import instrumentation
+from kagan.core.adapters.db.repositories import AuditRepository, TaskRepository
+from kagan.core.adapters.db.schema import AuditEvent
+from kagan.core.audit_sink import AuditSink
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class _CountingAuditRepository(AuditRepository):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_sizes: list[int] = []
+
+    async def record_many(self, events: Sequence[AuditEvent]) -> None:
+        self.batch_sizes.append(len(events))
+        await super().record_many(events)
+
+
+@pytest.fixture
+async def audit_repo():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        task_repo = TaskRepository(Path(tmpdir) / "test_audit.db")
+        await task_repo.initialize()
+        yield _CountingAuditRepository(task_repo.session_factory)
+        await task_repo.close()
+
+
+@pytest.fixture
+def enabled_instrumentation():
+    previous = instrumentation.snapshot()
+    instrumentation.configure(enabled=True)
+    instrumentation.reset()
+    yield
+    instrumentation.configure(enabled=bool(previous["enabled"]))
+    instrumentation.reset()
+
+
+def _event(index: int) -> AuditEvent:
+    return AuditEvent(
+        actor_type="session", actor_id="s", capability="tasks", command_name=f"m{index}"
+    )
+
+
+async def test_batched_sink_group_commits_queued_events(
+    audit_repo: _CountingAuditRepository,
+) -> None:
+    sink = AuditSink(audit_repo, max_batch=10, flush_interval_ms=1000)
+    sink.start()
+
+    for index in range(25):
+        await sink.submit(_event(index))
+    await asyncio.sleep(0.05)
+
+    assert audit_repo.batch_sizes == [10, 10]
+    assert sink.pending_count == 0
+
+    await sink.stop()
+
+    assert audit_repo.batch_sizes == [10, 10, 5]
+    events = await audit_repo.list_events(limit=100)
+    assert sorted(e.command_name for e in events) == sorted(f"m{i}" for i in range(25))
+
+
+async def test_batched_sink_flushes_partial_batch_after_interval(
+    audit_repo: _CountingAuditRepository,
+) -> None:
+    sink = AuditSink(audit_repo, max_batch=64, flush_interval_ms=10)
+    sink.start()
+    try:
+        await sink.submit(_event(0))
+        await sink.submit(_event(1))
+        await asyncio.sleep(0.1)
+
+        assert audit_repo.batch_sizes == [2]
+    finally:
+        await sink.stop()
+
+
+async def test_sync_sink_commits_before_submit_returns(
+    audit_repo: _CountingAuditRepository,
+) -> None:
+    sink = AuditSink(audit_repo, durability="sync")
+    sink.start()
+
+    await sink.submit(_event(0))
+
+    assert not sink.is_running
+    assert audit_repo.batch_sizes == [1]
+
+
+@pytest.mark.usefixtures("enabled_instrumentation")
+async def test_best_effort_sink_drops_when_queue_is_full(
+    audit_repo: _CountingAuditRepository,
+) -> None:
+    sink = AuditSink(audit_repo, durability="best_effort", queue_size=2, flush_interval_ms=1000)
+    sink.start()
+    # Let the flush task take the first event, then fill the queue behind it.
+    await sink.submit(_event(0))
+    await asyncio.sleep(0)
+    for index in range(1, 6):
+        await sink.submit(_event(index))
+
+    await sink.stop()
+
+    assert instrumentation.snapshot()["counters"]["core.audit.dropped"] == 3
+    assert sum(audit_repo.batch_sizes) == 3
+
+
+@pytest.mark.usefixtures("enabled_instrumentation")
+async def test_batched_sink_applies_backpressure_when_queue_is_full(
+    audit_repo: _CountingAuditRepository,
+) -> None:
+    sink = AuditSink(audit_repo, queue_size=2, max_batch=2, flush_interval_ms=1000)
+    sink.start()
+
+    await asyncio.gather(*(sink.submit(_event(index)) for index in range(8)))
+    await sink.stop()
+
+    counters = instrumentation.snapshot()["counters"]
+    assert counters["core.audit.backpressure"] >= 1
+    assert counters["core.audit.flush.events"] == 8
+    assert sum(audit_repo.batch_sizes) == 8
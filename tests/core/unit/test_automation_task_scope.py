@@ -70,6 +70,7 @@ async def test_auto_execution_sets_task_scope_on_agent(monkeypatch, tmp_path) ->
     task_service = SimpleNamespace(
         get_scratchpad=AsyncMock(return_value=""),
         update_scratchpad=AsyncMock(return_value=None),
+        append_scratchpad=AsyncMock(return_value=None),
     )
     runtime_service = SimpleNamespace(
         get=lambda _task_id: None,
@@ -187,6 +188,7 @@ async def test_auto_execution_persists_incremental_output_during_run(monkeypatch
     task_service = SimpleNamespace(
         get_scratchpad=AsyncMock(return_value=""),
         update_scratchpad=AsyncMock(return_value=None),
+        append_scratchpad=AsyncMock(return_value=None),
     )
     runtime_service = SimpleNamespace(
         get=lambda _task_id: None,
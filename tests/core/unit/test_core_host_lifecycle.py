@@ -24,11 +24,13 @@ class _FakeIPCServer:
         transport_preference: str,
         on_client_connect: Callable[[], None] | None = None,
         on_client_disconnect: Callable[[], None] | None = None,
+        concurrent_dispatch: bool = False,
     ) -> None:
         del handler
         self.transport_preference = transport_preference
         self.on_client_connect = on_client_connect
         self.on_client_disconnect = on_client_disconnect
+        self.concurrent_dispatch = concurrent_dispatch
         self.stop = AsyncMock()
 
     async def start(self) -> ServerHandle:
@@ -111,6 +113,7 @@ async def test_core_host_idle_timeout_waits_for_disconnect(monkeypatch) -> None:
     assert fake_server is not None
     assert callable(fake_server.on_client_connect)
     assert callable(fake_server.on_client_disconnect)
+    assert fake_server.concurrent_dispatch is True
 
     fake_server.on_client_connect()
     start = monotonic()
@@ -28,11 +28,13 @@ class _FakeIPCServer:
         transport_preference: str,
         on_client_connect: Callable[[], None] | None = None,
         on_client_disconnect: Callable[[], None] | None = None,
+        concurrent_dispatch: bool = False,
     ) -> None:
         del handler
         self.transport_preference = transport_preference
         self.on_client_connect = on_client_connect
         self.on_client_disconnect = on_client_disconnect
+        self.concurrent_dispatch = concurrent_dispatch
         self.token = "test-token"
         self.stop = AsyncMock()
 
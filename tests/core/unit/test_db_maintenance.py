@@ -0,0 +1,92 @@
+"""Tests for scheduled SQLite checkpoints, ANALYZE and vacuuming."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from kagan.core.adapters.db.maintenance import AUTO_VACUUM_INCREMENTAL
+from kagan.core.adapters.db.repositories import TaskRepository
+from kagan.core.adapters.db.schema import Task
+from kagan.core.db_maintenance import DbMaintenance
+from kagan.core.instrumentation import configure, reset, snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+async def _repo_with_deleted_tasks(db_path: Path) -> tuple[TaskRepository, list[Task]]:
+    repo = TaskRepository(db_path)
+    await repo.initialize()
+    project_id = await repo.ensure_test_project()
+    tasks = await repo.create_many(
+        [Task(project_id=project_id, title=f"bulky {i}", description="x" * 4000) for i in range(60)]
+    )
+    for task in tasks[1:]:
+        await repo.delete(task.id)
+    return repo, tasks
+
+
+async def test_due_jobs_run_when_quiet_and_are_timed(tmp_path: Path) -> None:
+    repo, _ = await _repo_with_deleted_tasks(tmp_path / "maint.db")
+    maintenance = DbMaintenance(
+        repo.maintenance,
+        wal_checkpoint_bytes=1,
+        optimize_interval_seconds=3600,
+        vacuum_free_ratio=0.1,
+    )
+    previous = snapshot()
+    try:
+        configure(enabled=True, log_events=False)
+        reset()
+        maintenance.start(is_quiet=lambda: False)
+        assert await maintenance.run_once() == []
+        assert maintenance.status()["deferred_passes"] == 1
+        await maintenance.stop()
+
+        runs = await maintenance.run_once(force=True)
+
+        assert [run.kind for run in runs] == ["optimize", "vacuum", "checkpoint"]
+        optimize, vacuum, checkpoint = (run.detail for run in runs)
+        assert optimize == {"full_analyze": True}
+        assert vacuum["pages_freed"] > 0
+        assert checkpoint["busy"] is False
+        timings = snapshot()["timings"]
+        for kind in ("optimize", "vacuum", "checkpoint"):
+            assert timings[f"core.db.maintenance.{kind}.duration_ms"]["count"] == 1
+
+        status = maintenance.status()
+        assert status["storage"]["wal_bytes"] == 0
+        assert status["storage"]["auto_vacuum"] == AUTO_VACUUM_INCREMENTAL
+        assert status["storage"]["freelist_count"] == 0
+        assert set(status["last_runs"]) == {"optimize", "vacuum", "checkpoint"}
+
+        # Nothing is due again until the WAL grows or pages are freed.
+        assert await maintenance.run_once(force=True) == []
+    finally:
+        configure(
+            enabled=bool(previous["enabled"]),
+            log_events=bool(previous["log_events"]),
+        )
+        reset()
+        await repo.close()
+
+
+async def test_vacuum_converts_legacy_database_and_keeps_search_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as legacy:
+        legacy.execute("CREATE TABLE legacy_marker (id INTEGER)")
+    repo, tasks = await _repo_with_deleted_tasks(db_path)
+    try:
+        before = await repo.maintenance.stats()
+        assert before.auto_vacuum != AUTO_VACUUM_INCREMENTAL
+        assert before.free_ratio > 0.25
+
+        assert await repo.maintenance.vacuum() == before.freelist_count
+
+        after = await repo.maintenance.stats()
+        assert after.auto_vacuum == AUTO_VACUUM_INCREMENTAL
+        assert after.page_count < before.page_count
+        assert [task.id for task in await repo.search("bulky")] == [tasks[0].id]
+    finally:
+        await repo.close()
@@ -0,0 +1,78 @@
+"""Tests for SQLite pragmas and the split reader/writer storage profile."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from kagan.core.adapters.db.repositories import TaskRepository
+from kagan.core.adapters.db.schema import Task
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+async def _pragma(session, name: str) -> int:
+    return (await session.execute(text(f"PRAGMA {name}"))).scalar_one()
+
+
+async def test_connections_use_tuned_pragmas(tmp_path: Path) -> None:
+    repo = TaskRepository(tmp_path / "kagan.db")
+    await repo.initialize()
+    try:
+        for factory in (repo.session_factory, repo.session_factory.read):
+            async with factory() as session:
+                assert await _pragma(session, "foreign_keys") == 1
+                assert await _pragma(session, "synchronous") == 1  # NORMAL
+                assert await _pragma(session, "busy_timeout") == 5000
+                assert await _pragma(session, "temp_store") == 2  # MEMORY
+                assert await _pragma(session, "journal_mode") == "wal"
+    finally:
+        await repo.close()
+
+
+async def test_split_profile_reader_sessions_are_read_only(tmp_path: Path) -> None:
+    repo = TaskRepository(tmp_path / "kagan.db")
+    await repo.initialize()
+    try:
+        async with repo.session_factory.read() as session:
+            assert await _pragma(session, "query_only") == 1
+            with pytest.raises(OperationalError):
+                await session.execute(text("DELETE FROM tasks"))
+    finally:
+        await repo.close()
+
+
+async def test_split_profile_reads_do_not_wait_for_open_write(tmp_path: Path) -> None:
+    repo = TaskRepository(tmp_path / "kagan.db")
+    await repo.initialize()
+    project_id = await repo.ensure_test_project()
+    created = await repo.create(Task(project_id=project_id, title="Committed"))
+    try:
+        async with repo.session_factory() as writer:
+            await writer.execute(text("UPDATE tasks SET title = 'Uncommitted'"))
+
+            tasks = await asyncio.wait_for(repo.get_all(), timeout=2)
+
+            assert [task.title for task in tasks] == ["Committed"]
+            await writer.commit()
+
+        fetched = await repo.get(created.id)
+        assert fetched is not None
+        assert fetched.title == "Uncommitted"
+    finally:
+        await repo.close()
+
+
+async def test_shared_profile_reads_use_the_writer_pool(tmp_path: Path) -> None:
+    repo = TaskRepository(tmp_path / "kagan.db", storage_profile="shared")
+    await repo.initialize()
+    try:
+        async with repo.session_factory.read() as session:
+            assert await _pragma(session, "query_only") == 0
+    finally:
+        await repo.close()
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from _api_helpers import build_api
+
+from kagan.core import instrumentation
 from kagan.core.api import KaganAPI
+from kagan.core.host import CoreHost
+from kagan.core.ipc.contracts import CoreRequest
 from kagan.core.request_handlers import handle_diagnostics_instrumentation
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from kagan.core.bootstrap import AppContext
+
 
 async def test_instrumentation_snapshot_returns_core_state(monkeypatch) -> None:
     sentinel = {
@@ -26,3 +36,48 @@ async def test_instrumentation_snapshot_returns_core_state(monkeypatch) -> None:
     result = await handle_diagnostics_instrumentation(f, {})
 
     assert result["instrumentation"] == sentinel
+
+
+async def test_dispatched_requests_report_latency_percentiles(tmp_path: Path) -> None:
+    previous = instrumentation.snapshot()
+    instrumentation.configure(enabled=True)
+    instrumentation.reset()
+    repo, api, ctx = await build_api(tmp_path)
+    ctx.api = api
+    host = CoreHost()
+    host._ctx = cast("AppContext", ctx)
+    host.register_session("maintainer-session", "maintainer")
+    try:
+        for _ in range(3):
+            await host.handle_request(
+                CoreRequest(session_id="maintainer-session", capability="tasks", method="list")
+            )
+        for capability, method in (("tasks", "bogus-1"), ("bogus", "bogus-2")):
+            await host.handle_request(
+                CoreRequest(session_id="maintainer-session", capability=capability, method=method)
+            )
+        response = await host.handle_request(
+            CoreRequest(
+                session_id="maintainer-session",
+                capability="diagnostics",
+                method="instrumentation",
+            )
+        )
+    finally:
+        await repo.close()
+        instrumentation.configure(enabled=bool(previous["enabled"]))
+        instrumentation.reset()
+
+    assert response.ok and response.result is not None
+    snapshot = response.result["instrumentation"]
+    stats = snapshot["timings"]["core.request.tasks.list.duration_ms"]
+    assert stats["count"] == 3
+    assert stats["min_ms"] <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    assert stats["p99_ms"] <= stats["max_ms"]
+    assert (
+        sum(count for _, count in snapshot["histograms"]["core.request.tasks.list.duration_ms"])
+        == 3
+    )
+    assert snapshot["timings"]["core.db.transaction.duration_ms"]["count"] >= 3
+    assert snapshot["timings"]["core.request.unknown.duration_ms"]["count"] == 2
+    assert not [name for name in snapshot["timings"] if "bogus" in name]
@@ -0,0 +1,158 @@
+"""Behavior tests for pushing domain events to IPC subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from _api_helpers import build_api
+
+from kagan.core.bootstrap import InMemoryEventBus
+from kagan.core.event_stream import EventSubscription, EventSubscriptionFilter
+from kagan.core.events import TaskCreated, TaskDeleted, TaskUpdated
+from kagan.core.host import CoreHost
+from kagan.core.ipc.client import IPCClient
+from kagan.core.ipc.contracts import CoreEventFrame, CoreRequest
+from kagan.core.ipc.discovery import CoreEndpoint
+from kagan.core.ipc.server import IPCServer, ServerConnection
+from kagan.core.ipc.transports import UnixSocketTransport
+from kagan.core.models.enums import TaskStatus
+from kagan.core.time import utc_now
+
+if TYPE_CHECKING:
+    from kagan.core.bootstrap import AppContext
+
+
+class _RecordingConnection:
+    def __init__(self) -> None:
+        self.frames: list[CoreEventFrame] = []
+        self.received = asyncio.Event()
+
+    async def send(self, frame: CoreEventFrame) -> None:
+        self.frames.append(frame)
+        self.received.set()
+
+
+@pytest.fixture
+def short_tmp():
+    """Short temp directory for Unix socket paths (macOS 104-byte limit)."""
+    path = Path(tempfile.mkdtemp(prefix="k-", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def test_filter_rejects_unknown_event_types() -> None:
+    with pytest.raises(ValueError, match="Unknown event types: NotAnEvent"):
+        EventSubscriptionFilter.from_params({"event_types": ["TaskUpdated", "NotAnEvent"]})
+
+
+def test_filter_matches_task_ids_and_event_types() -> None:
+    event_filter = EventSubscriptionFilter.from_params(
+        {"event_types": ["TaskUpdated"], "task_ids": ["t1"]}
+    )
+
+    assert event_filter.accepts_type(TaskUpdated("t1", ["title"], utc_now()))
+    assert not event_filter.accepts_type(TaskUpdated("t2", ["title"], utc_now()))
+    assert not event_filter.accepts_type(TaskDeleted("t1"))
+
+
+async def test_subscription_filters_by_task_project_and_detaches_on_cancel() -> None:
+    bus = InMemoryEventBus()
+    projects = {"mine": "p1", "theirs": "p2"}
+
+    async def resolve_project(task_id: str) -> str | None:
+        return projects.get(task_id)
+
+    subscription = EventSubscription(
+        "sub-1",
+        bus,
+        EventSubscriptionFilter(project_id="p1"),
+        resolve_project=resolve_project,
+    )
+    connection = _RecordingConnection()
+    forward = asyncio.create_task(subscription.forward(cast("ServerConnection", connection)))
+
+    await bus.publish(TaskCreated("theirs", TaskStatus.BACKLOG, "other", utc_now()))
+    await bus.publish(TaskCreated("mine", TaskStatus.BACKLOG, "mine", utc_now()))
+    await asyncio.wait_for(connection.received.wait(), timeout=2)
+
+    forward.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await forward
+    await bus.publish(TaskDeleted("mine"))
+
+    assert [frame.payload["task_id"] for frame in connection.frames] == ["mine"]
+    assert connection.frames[0].event_type == "TaskCreated"
+    assert connection.frames[0].subscription_id == "sub-1"
+    assert bus._handlers == []
+
+
+async def test_subscribe_without_ipc_connection_is_unavailable(tmp_path: Path) -> None:
+    repo, api, ctx = await build_api(tmp_path)
+    ctx.api = api
+    host = CoreHost()
+    host._ctx = cast("AppContext", ctx)
+    host.register_session("viewer-session", "viewer")
+
+    try:
+        response = await host.handle_request(
+            CoreRequest(session_id="viewer-session", capability="events", method="subscribe")
+        )
+    finally:
+        await repo.close()
+
+    assert response.ok and response.result is not None
+    assert response.result["success"] is False
+    assert response.result["code"] == "STREAMING_UNAVAILABLE"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_subscriber_receives_pushed_events_for_watched_task(
+    tmp_path: Path, short_tmp: Path
+) -> None:
+    repo, api, ctx = await build_api(tmp_path)
+    ctx.api = api
+    host = CoreHost()
+    host._ctx = cast("AppContext", ctx)
+    host.register_session("viewer-session", "viewer")
+    watched = await api.create_task("Watched")
+    ignored = await api.create_task("Ignored")
+
+    sock = str(short_tmp / "t.sock")
+    server = IPCServer(
+        handler=host.handle_request,
+        transport=UnixSocketTransport(path=sock),
+        concurrent_dispatch=True,
+    )
+    await server.start()
+    client = IPCClient(
+        CoreEndpoint(transport="socket", address=sock, token=server.token),
+        transport=UnixSocketTransport(path=sock),
+        multiplexed=True,
+    )
+    await client.connect()
+
+    try:
+        stream = await client.subscribe_events(
+            session_id="viewer-session",
+            task_ids=[watched.id],
+            event_types=["TaskUpdated"],
+        )
+        await api.update_task(ignored.id, title="Ignored again")
+        await api.update_task(watched.id, title="Watched again")
+
+        frame = await asyncio.wait_for(anext(stream), timeout=2)
+        assert frame.event_type == "TaskUpdated"
+        assert frame.payload["task_id"] == watched.id
+
+        await stream.close()
+        assert [item async for item in stream] == []
+    finally:
+        await client.close()
+        await server.stop()
+        await repo.close()
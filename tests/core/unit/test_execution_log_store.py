@@ -0,0 +1,253 @@
+"""Tests for segmented, compressed and compacted execution logs and their offset index."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kagan.core.adapters.db.repositories import ExecutionRepository
+from kagan.core.adapters.db.schema import Session, Task, Workspace
+from kagan.core.adapters.execution_logs import (
+    SegmentedLogStore,
+    decode_log_payload,
+    encode_log_payload,
+    is_compressed_log_payload,
+)
+from kagan.core.models.enums import ExecutionRunReason, SessionType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kagan.core.adapters.db.repositories import TaskRepository
+
+
+async def _execution_id(state_manager: TaskRepository) -> str:
+    project_id = state_manager.default_project_id
+    assert project_id is not None
+    task = await state_manager.create(Task(project_id=project_id, title="logs"))
+
+    async def _add(session: AsyncSession) -> str:
+        workspace = Workspace(
+            project_id=project_id, task_id=task.id, branch_name="kagan/logs", path="/tmp/logs"
+        )
+        session.add(workspace)
+        await session.flush()
+        record = Session(workspace_id=workspace.id, session_type=next(iter(SessionType)))
+        session.add(record)
+        await session.flush()
+        return record.id
+
+    session_id = await state_manager.session_factory.write(_add)
+    execution = await ExecutionRepository(state_manager.session_factory).create_execution(
+        session_id=session_id, run_reason=ExecutionRunReason.CODINGAGENT
+    )
+    return execution.id
+
+
+def test_store_rolls_segments_and_reads_spans(tmp_path: Path) -> None:
+    store = SegmentedLogStore(tmp_path, segment_max_bytes=16, fsync="always")
+    spans = [store.append("exec1", f"chunk-{i}".encode()) for i in range(4)]
+
+    assert [span.segment for span in spans] == [0, 0, 1, 1]
+    assert store.read("exec1", spans[1:3]) == [b"chunk-1", b"chunk-2"]
+
+    reopened = SegmentedLogStore(tmp_path, segment_max_bytes=16)
+    span = reopened.append("exec1", b"chunk-4")
+    assert span.segment == 2
+    assert sorted(p.name for p in (tmp_path / "exec1").iterdir()) == [
+        "000000.jsonl",
+        "000001.jsonl",
+        "000002.jsonl",
+    ]
+
+    with pytest.raises(ValueError, match="Invalid execution ID"):
+        store.append("../escape", b"x")
+
+
+async def test_logs_live_on_disk_with_offsets_indexed(
+    state_manager: TaskRepository, tmp_path: Path
+) -> None:
+    execution_id = await _execution_id(state_manager)
+    store = SegmentedLogStore(tmp_path / "logs", segment_max_bytes=64)
+    executions = ExecutionRepository(state_manager.session_factory, log_store=store)
+    lines = [f'{{"n":{i},"text":"{"x" * 20}"}}' for i in range(10)]
+    for line in lines:
+        await executions.append_execution_log(execution_id, line)
+
+    entries = await executions.get_execution_log_entries(execution_id)
+    assert [entry.logs for entry in entries] == lines
+    assert [entry.offset for entry in entries] == [i * len(lines[0]) for i in range(10)]
+    assert len(list((tmp_path / "logs" / execution_id).iterdir())) > 1
+
+    assert state_manager._engine is not None
+    async with state_manager._engine.connect() as conn:
+        inline_rows = await conn.exec_driver_sql("SELECT COUNT(*) FROM execution_process_logs")
+        assert inline_rows.scalar() == 0
+
+    newer = await executions.get_execution_log_entries(execution_id, after_offset=entries[7].offset)
+    assert [entry.logs for entry in newer] == lines[7:]
+    page = await executions.get_execution_log_entries(
+        execution_id, after_offset=entries[2].end_offset, limit=2
+    )
+    assert [entry.logs for entry in page] == lines[3:5]
+
+    tail = await executions.get_execution_log_entries(
+        execution_id, tail_bytes=len(lines[0]) * 2 + 1
+    )
+    assert [entry.logs for entry in tail] == lines[7:]
+
+    combined = await executions.get_execution_logs(execution_id)
+    assert combined is not None
+    assert combined.logs == "\n".join(lines)
+    await executions.close()
+
+
+async def test_inline_history_continues_into_segments(
+    state_manager: TaskRepository, tmp_path: Path
+) -> None:
+    execution_id = await _execution_id(state_manager)
+    inline = ExecutionRepository(state_manager.session_factory)
+    await inline.append_execution_log(execution_id, "old-1")
+    await inline.append_execution_log(execution_id, "old-2")
+
+    segmented = ExecutionRepository(
+        state_manager.session_factory, log_store=SegmentedLogStore(tmp_path)
+    )
+    appended = await segmented.append_execution_log(execution_id, "new-1")
+    assert appended.offset == 10
+
+    entries = await segmented.get_execution_log_entries(execution_id)
+    assert [(entry.logs, entry.offset) for entry in entries] == [
+        ("old-1", 0),
+        ("old-2", 5),
+        ("new-1", 10),
+    ]
+    tail = await segmented.get_execution_log_entries(execution_id, tail_bytes=6)
+    assert [entry.logs for entry in tail] == ["old-2", "new-1"]
+
+
+def test_payload_codec_round_trips_and_skips_small_payloads() -> None:
+    payload = json.dumps({"messages": [{"raw_output": "ok " * 500}]})
+
+    packed = encode_log_payload(payload, min_bytes=1024)
+
+    assert is_compressed_log_payload(packed)
+    assert len(packed) < len(payload) // 4
+    assert decode_log_payload(packed) == payload
+    assert encode_log_payload(packed, min_bytes=1024) is packed
+    assert encode_log_payload('{"small":1}', min_bytes=1024) == '{"small":1}'
+    assert encode_log_payload(payload, min_bytes=0) == payload
+
+
+async def test_large_chunks_are_compressed_on_write_and_read_back(
+    state_manager: TaskRepository, tmp_path: Path
+) -> None:
+    execution_id = await _execution_id(state_manager)
+    executions = ExecutionRepository(
+        state_manager.session_factory,
+        log_store=SegmentedLogStore(tmp_path),
+        compress_min_bytes=256,
+    )
+    big = json.dumps({"raw_input": "x" * 4000})
+    await executions.append_execution_log(execution_id, big)
+    await executions.append_execution_log(execution_id, '{"n":1}')
+
+    on_disk = (tmp_path / execution_id / "000000.jsonl").read_text()
+    assert on_disk.startswith("\x00")
+    assert len(on_disk) < 1000
+    entries = await executions.get_execution_log_entries(execution_id)
+    assert [entry.logs for entry in entries] == [big, '{"n":1}']
+
+
+async def test_compress_inline_logs_rewrites_existing_rows(state_manager: TaskRepository) -> None:
+    execution_id = await _execution_id(state_manager)
+    executions = ExecutionRepository(state_manager.session_factory)
+    big = json.dumps({"raw_output": "y" * 5000})
+    await executions.append_execution_log(execution_id, big)
+    await executions.append_execution_log(execution_id, "tiny")
+    before = await executions.get_execution_log_entries(execution_id)
+
+    assert await executions.compress_inline_logs(min_bytes=1024) == 1
+    assert await executions.compress_inline_logs(min_bytes=1024) == 0
+
+    assert state_manager._engine is not None
+    async with state_manager._engine.connect() as conn:
+        sizes = await conn.exec_driver_sql(
+            "SELECT length(logs), byte_size FROM execution_process_logs ORDER BY byte_size DESC"
+        )
+        (stored, logical), _ = sizes.all()
+    assert stored < 1024 < logical
+    assert await executions.get_execution_log_entries(execution_id) == before
+
+
+def _tool_update(tool_call_id: str, status: str) -> dict[str, str]:
+    return {"type": "tool_call_update", "id": tool_call_id, "status": status}
+
+
+async def test_compaction_merges_chunks_and_drops_superseded_tool_updates(
+    state_manager: TaskRepository, tmp_path: Path
+) -> None:
+    execution_id = await _execution_id(state_manager)
+    executions = ExecutionRepository(
+        state_manager.session_factory,
+        log_store=SegmentedLogStore(tmp_path, segment_max_bytes=80),
+    )
+    batches = [
+        [{"type": "tool_call", "id": "t1", "status": "pending"}],
+        [_tool_update("t1", "in_progress")],
+        [_tool_update("t1", "in_progress"), {"type": "response", "content": "hi"}],
+        [_tool_update("t1", "completed")],
+        [{"type": "response", "content": "done"}],
+    ]
+    for batch in batches:
+        await executions.append_execution_log(execution_id, json.dumps({"messages": batch}))
+    before = await executions.get_execution_log_entries(execution_id)
+
+    compaction = await executions.compact_execution_logs(execution_id)
+
+    assert (compaction.entries_before, compaction.entries_after) == (5, 2)
+    assert compaction.bytes_after < compaction.bytes_before
+    merged, last = await executions.get_execution_log_entries(execution_id)
+    assert json.loads(merged.logs)["messages"] == [
+        batches[0][0],
+        {"type": "response", "content": "hi"},
+        _tool_update("t1", "completed"),
+    ]
+    assert merged.offset == before[0].offset
+    assert (last.logs, last.offset) == (before[-1].logs, before[-1].offset)
+    newer = await executions.get_execution_log_entries(execution_id, after_offset=last.offset)
+    assert [entry.logs for entry in newer] == [last.logs]
+    segments = {path.name for path in (tmp_path / execution_id).iterdir()}
+    assert len(segments) == 2
+
+    again = await executions.compact_execution_logs(execution_id)
+    assert again.entries_after == again.entries_before == 2
+
+
+async def test_compaction_of_inline_rows_keeps_offsets_and_plain_lines(
+    state_manager: TaskRepository,
+) -> None:
+    execution_id = await _execution_id(state_manager)
+    executions = ExecutionRepository(state_manager.session_factory)
+    lines = [
+        json.dumps({"messages": [{"type": "response", "content": "a"}]}),
+        json.dumps({"messages": [{"type": "response", "content": "b"}]}),
+        "not json",
+        json.dumps({"messages": [{"type": "response", "content": "c"}]}),
+        json.dumps({"messages": [{"type": "response", "content": "review"}]}),
+    ]
+    for line in lines:
+        await executions.append_execution_log(execution_id, line)
+    before = await executions.get_execution_log_entries(execution_id)
+
+    compaction = await executions.compact_execution_logs(execution_id)
+
+    assert (compaction.entries_before, compaction.entries_after) == (5, 4)
+    entries = await executions.get_execution_log_entries(execution_id)
+    assert [entry.logs for entry in entries[1:]] == lines[2:]
+    assert [entry.offset for entry in entries] == [before[i].offset for i in (0, 2, 3, 4)]
+    assert [m["content"] for m in json.loads(entries[0].logs)["messages"]] == ["a", "b"]
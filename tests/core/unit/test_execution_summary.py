@@ -0,0 +1,159 @@
+"""Tests for the per-task execution summary maintained by ExecutionRepository."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from kagan.core.adapters.db.repositories import ExecutionRepository, TaskRepository
+from kagan.core.adapters.db.schema import Session, Task, TaskExecutionSummary, Workspace
+from kagan.core.models.enums import ExecutionRunReason, ExecutionStatus, SessionType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _open(db_path: Path) -> tuple[TaskRepository, ExecutionRepository]:
+    repo = TaskRepository(db_path)
+    await repo.initialize()
+    return repo, ExecutionRepository(repo.session_factory)
+
+
+async def _task_session(repo: TaskRepository) -> tuple[str, str]:
+    project_id = await repo.ensure_test_project()
+    task = await repo.create(Task(project_id=project_id, title="runs"))
+
+    async def _add(session: AsyncSession) -> str:
+        workspace = Workspace(
+            project_id=project_id, task_id=task.id, branch_name="kagan/runs", path="/tmp/runs"
+        )
+        session.add(workspace)
+        await session.flush()
+        record = Session(workspace_id=workspace.id, session_type=next(iter(SessionType)))
+        session.add(record)
+        await session.flush()
+        return record.id
+
+    return task.id, await repo.session_factory.write(_add)
+
+
+async def _start(executions: ExecutionRepository, session_id: str) -> str:
+    execution = await executions.create_execution(
+        session_id=session_id, run_reason=ExecutionRunReason.CODINGAGENT
+    )
+    return execution.id
+
+
+async def test_summary_tracks_latest_running_and_count(tmp_path: Path) -> None:
+    repo, executions = await _open(tmp_path / "kagan.db")
+    try:
+        task_id, session_id = await _task_session(repo)
+        first = await _start(executions, session_id)
+        second = await _start(executions, session_id)
+
+        assert await executions.count_executions_for_task(task_id) == 2
+        latest = await executions.get_latest_execution_for_task(task_id)
+        assert latest is not None
+        assert latest.id == second
+        running = await executions.get_latest_running_executions_for_tasks([task_id, "other"])
+        assert running == {task_id: second}
+
+        await executions.update_execution(second, status=ExecutionStatus.COMPLETED)
+        running = await executions.get_latest_running_executions_for_tasks([task_id])
+        assert running == {task_id: first}
+
+        await executions.update_execution(first, status=ExecutionStatus.FAILED)
+        assert await executions.get_latest_running_executions_for_tasks([task_id]) == {}
+    finally:
+        await repo.close()
+
+
+async def test_task_without_executions(tmp_path: Path) -> None:
+    repo, executions = await _open(tmp_path / "kagan.db")
+    try:
+        assert await executions.count_executions_for_task("missing") == 0
+        assert await executions.get_latest_execution_for_task("missing") is None
+    finally:
+        await repo.close()
+
+
+async def test_summary_is_backfilled_for_existing_databases(tmp_path: Path) -> None:
+    db_path = tmp_path / "kagan.db"
+    repo, executions = await _open(db_path)
+    task_id, session_id = await _task_session(repo)
+    await _start(executions, session_id)
+    running = await _start(executions, session_id)
+    assert repo._engine is not None
+    async with repo._engine.begin() as conn:
+        await conn.exec_driver_sql(f"DELETE FROM {TaskExecutionSummary.__tablename__}")
+    await repo.close()
+
+    repo, executions = await _open(db_path)
+    try:
+        assert await executions.count_executions_for_task(task_id) == 2
+        assert await executions.get_latest_running_executions_for_tasks([task_id]) == {
+            task_id: running
+        }
+    finally:
+        await repo.close()
+
+
+async def _summary_task_ids(repo: TaskRepository) -> list[str]:
+    assert repo._engine is not None
+    async with repo._engine.connect() as conn:
+        rows = await conn.exec_driver_sql(
+            f"SELECT task_id FROM {TaskExecutionSummary.__tablename__}"
+        )
+        return [row[0] for row in rows]
+
+
+async def test_task_and_project_deletes_drop_summaries(tmp_path: Path) -> None:
+    from kagan.cli.commands.reset import _delete_project_data
+
+    db_path = tmp_path / "kagan.db"
+    repo, executions = await _open(db_path)
+    task_id, session_id = await _task_session(repo)
+    await _start(executions, session_id)
+    assert await repo.delete(task_id)
+    assert await _summary_task_ids(repo) == []
+
+    project_id = await repo.ensure_test_project()
+    other_id, other_session_id = await _task_session(repo)
+    await _start(executions, other_session_id)
+    assert await _summary_task_ids(repo) == [other_id]
+    await repo.close()
+
+    await _delete_project_data(str(db_path), project_id)
+
+    with sqlite3.connect(db_path) as conn:
+        table = TaskExecutionSummary.__tablename__
+        assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone() == (0,)
+
+
+async def test_stale_summaries_are_repaired_on_open(tmp_path: Path) -> None:
+    db_path = tmp_path / "kagan.db"
+    repo, executions = await _open(db_path)
+    task_id, session_id = await _task_session(repo)
+    first = await _start(executions, session_id)
+    latest = await _start(executions, session_id)
+    assert repo._engine is not None
+    async with repo._engine.begin() as conn:
+        await conn.exec_driver_sql(f"DELETE FROM execution_processes WHERE id = '{latest}'")
+        await conn.exec_driver_sql(
+            f"INSERT INTO {TaskExecutionSummary.__tablename__} "
+            "(task_id, latest_execution_id, execution_count, last_status, updated_at) "
+            f"VALUES ('gone0000', '{first}', 1, 'RUNNING', '2026-01-01 00:00:00')"
+        )
+    await repo.close()
+
+    repo, executions = await _open(db_path)
+    try:
+        assert await _summary_task_ids(repo) == [task_id]
+        assert await executions.count_executions_for_task(task_id) == 1
+        assert await executions.get_latest_running_executions_for_tasks([task_id]) == {
+            task_id: first
+        }
+    finally:
+        await repo.close()
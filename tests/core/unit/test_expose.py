@@ -115,7 +115,7 @@ class TestApiExposeIntegration:
             attr = getattr(KaganAPI, name, None)
             if attr is not None and hasattr(attr, EXPOSE_ATTR):
                 exposed.append(name)
-        assert len(exposed) == 25
+        assert len(exposed) == 29
 
     def test_excluded_methods_are_not_exposed(self) -> None:
         from kagan.core.api import KaganAPI
@@ -8,7 +8,7 @@ import pytest
 from _api_helpers import build_api
 
 from kagan.core.host import CoreHost
-from kagan.core.ipc.contracts import CoreRequest
+from kagan.core.ipc.contracts import MAX_BATCH_ITEMS, CoreBatchItem, CoreRequest
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -94,6 +94,52 @@ class TestApiDispatchIntegration:
         assert response.error.code == "AUTHORIZATION_DENIED"
 
 
+class TestBatchDispatch:
+    """Batch envelopes are authorized and answered per item."""
+
+    async def test_batch_returns_per_item_results_and_denials(self, handle_host: tuple) -> None:
+        host, api = handle_host
+        task = await api.create_task("Batched Task")
+
+        response = await _dispatch(
+            host,
+            CoreRequest.for_batch(
+                [
+                    CoreBatchItem(capability="tasks", method="get", params={"task_id": task.id}),
+                    CoreBatchItem(capability="settings", method="get"),
+                    CoreBatchItem(capability="tasks", method="list"),
+                ],
+                session_id="viewer-session",
+            ),
+        )
+
+        assert response.ok
+        get_resp, settings_resp, list_resp = response.batch_responses()
+        assert get_resp.ok and get_resp.result is not None
+        assert get_resp.result["task"]["id"] == task.id
+        assert get_resp.request_id == f"{response.request_id}.0"
+        assert not settings_resp.ok
+        assert settings_resp.error is not None
+        assert settings_resp.error.code == "AUTHORIZATION_DENIED"
+        assert list_resp.ok
+
+    @pytest.mark.parametrize("size", [0, MAX_BATCH_ITEMS + 1])
+    async def test_batch_size_out_of_bounds_is_rejected(
+        self, handle_host: tuple, size: int
+    ) -> None:
+        host, _api = handle_host
+        items = [CoreBatchItem(capability="tasks", method="list") for _ in range(size)]
+
+        response = await _dispatch(
+            host,
+            CoreRequest.for_batch(items, session_id="maintainer-session"),
+        )
+
+        assert not response.ok
+        assert response.error is not None
+        assert response.error.code == "INVALID_PARAMS"
+
+
 class TestNoApi:
     """Built-in dispatch map requires an API boundary on AppContext."""
 
@@ -4,8 +4,10 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 from kagan.core.instrumentation import (
+    bucket_upper_bound_ms,
     configure,
     increment_counter,
+    record_timing,
     reset,
     snapshot,
     timed_operation,
@@ -56,3 +58,35 @@ def test_instrumentation_tracks_counter_and_timing_when_enabled() -> None:
         assert state["counters"]["core.test.counter"] == 3
         assert state["timings"]["core.test.timer"]["count"] == 1
         assert state["timings"]["core.test.timer"]["total_ms"] >= 0.0
+
+
+def test_timing_percentiles_come_from_fixed_histogram_buckets() -> None:
+    with _preserve_runtime_flags():
+        configure(enabled=True, log_events=False)
+        reset()
+
+        for duration_ms in range(1, 101):
+            record_timing("core.test.latency", float(duration_ms))
+
+        state = snapshot()
+        stats = state["timings"]["core.test.latency"]
+        # Bucket upper bounds overstate a sample by at most 12.5%.
+        assert 50.0 <= stats["p50_ms"] <= 50.0 * 1.125
+        assert 95.0 <= stats["p95_ms"] <= 95.0 * 1.125
+        assert 99.0 <= stats["p99_ms"] <= stats["max_ms"] == 100.0
+        buckets = state["histograms"]["core.test.latency"]
+        assert sum(count for _, count in buckets) == 100
+        assert [bound for bound, _ in buckets] == sorted(bound for bound, _ in buckets)
+
+
+def test_bucket_upper_bounds_cover_recorded_values() -> None:
+    with _preserve_runtime_flags():
+        configure(enabled=True, log_events=False)
+        reset()
+
+        for duration_ms in (0.0005, 0.0042, 1.0, 37.5, 1234.0):
+            reset()
+            record_timing("core.test.single", duration_ms)
+            [(upper_ms, count)] = snapshot()["histograms"]["core.test.single"]
+            assert count == 1
+            assert duration_ms <= upper_ms <= max(duration_ms * 1.125, bucket_upper_bound_ms(0))
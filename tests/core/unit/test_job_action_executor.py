@@ -4,8 +4,9 @@ from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock
 
+from kagan.core.adapters.db.repositories.execution import ExecutionLogCompaction
 from kagan.core.commands.job_action_executor import execute_job_action
-from kagan.core.models.enums import TaskStatus, TaskType
+from kagan.core.models.enums import ExecutionStatus, TaskStatus, TaskType
 
 
 def _ctx(**kwargs: object) -> Any:
@@ -148,6 +149,33 @@ async def test_execute_stop_agent_returns_success_when_running() -> None:
     automation_service.stop_task.assert_awaited_once_with("task-1")
 
 
+async def test_execute_compact_execution_logs_skips_running_execution() -> None:
+    execution = SimpleNamespace(id="exec-1", status=ExecutionStatus.RUNNING)
+    execution_service = SimpleNamespace(
+        get_execution=AsyncMock(return_value=execution),
+        compact_execution_logs=AsyncMock(),
+    )
+    ctx = _ctx(execution_service=execution_service)
+    params = {"task_id": "task-1", "execution_id": "exec-1"}
+
+    result = await execute_job_action(ctx, action="compact_execution_logs", params=params)
+
+    assert result["success"] is False
+    assert result["code"] == "EXECUTION_RUNNING"
+    execution_service.compact_execution_logs.assert_not_awaited()
+
+    execution.status = ExecutionStatus.COMPLETED
+    execution_service.compact_execution_logs.return_value = ExecutionLogCompaction(
+        entries_before=5, entries_after=2, bytes_before=900, bytes_after=400
+    )
+    result = await execute_job_action(ctx, action="compact_execution_logs", params=params)
+
+    assert result["success"] is True
+    assert result["code"] == "COMPACTED"
+    assert (result["bytes_before"], result["bytes_after"]) == (900, 400)
+    execution_service.compact_execution_logs.assert_awaited_once_with("exec-1")
+
+
 async def test_execute_job_action_rejects_unsupported_action() -> None:
     ctx = _ctx(task_service=SimpleNamespace(), automation_service=SimpleNamespace())
 
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
+import sys
+import tempfile
 from datetime import UTC, datetime
+from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
+from _api_helpers import build_api
 
+from kagan.core.adapters.db.repositories import JobRepository
 from kagan.core.api import KaganAPI
+from kagan.core.host import CoreHost
+from kagan.core.ipc.client import IPCClient
+from kagan.core.ipc.discovery import CoreEndpoint
+from kagan.core.ipc.server import IPCServer
+from kagan.core.ipc.transports import UnixSocketTransport
 from kagan.core.request_handlers import (
     handle_job_cancel,
     handle_job_events,
@@ -16,7 +28,10 @@ from kagan.core.request_handlers import (
     handle_job_submit,
     handle_job_wait,
 )
-from kagan.core.services.jobs import JobEvent, JobRecord, JobStatus
+from kagan.core.services.jobs import JobEvent, JobRecord, JobServiceImpl, JobStatus
+
+if TYPE_CHECKING:
+    from kagan.core.bootstrap import AppContext
 
 
 def _api(**services: object) -> KaganAPI:
@@ -163,7 +178,10 @@ async def test_job_events_returns_bounded_page() -> None:
     now = datetime.now(UTC)
 
     class _JobService:
-        async def events(self, job_id: str, *, task_id: str) -> list[JobEvent]:
+        async def events(
+            self, job_id: str, *, task_id: str, after_index: int | None = None
+        ) -> list[JobEvent]:
+            assert after_index is None
             return [
                 JobEvent(
                     job_id=job_id,
@@ -204,3 +222,70 @@ async def test_job_events_returns_bounded_page() -> None:
     assert result["has_more"] is False
     assert result["next_offset"] is None
     assert [event["status"] for event in result["events"]] == ["running", "succeeded"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets unavailable on Windows")
+async def test_job_events_poll_over_ipc_with_cursor(tmp_path: Path) -> None:
+    release = asyncio.Event()
+
+    async def executor(action: str, params: dict[str, object]) -> dict[str, object]:
+        del action, params
+        await release.wait()
+        return {"success": True, "message": "done", "code": "DONE"}
+
+    repo, api, ctx = await build_api(tmp_path)
+    jobs = JobServiceImpl(executor, repository=JobRepository(repo.session_factory))
+    ctx.job_service = jobs
+    ctx.api = api
+    host = CoreHost()
+    host._ctx = cast("AppContext", ctx)
+    host.register_session("job-session", "maintainer")
+    sock_dir = Path(tempfile.mkdtemp(prefix="k-", dir="/tmp"))
+    sock = str(sock_dir / "t.sock")
+    server = IPCServer(handler=host.handle_request, transport=UnixSocketTransport(path=sock))
+    await server.start()
+    client = IPCClient(
+        CoreEndpoint(transport="socket", address=sock, token=server.token),
+        transport=UnixSocketTransport(path=sock),
+    )
+    await client.connect()
+
+    async def poll(after_index: int | None) -> dict[str, Any]:
+        params: dict[str, Any] = {"job_id": job_id, "task_id": "TASK-POLL"}
+        if after_index is not None:
+            params["after_index"] = after_index
+        response = await client.request(
+            session_id="job-session", capability="jobs", method="events", params=params
+        )
+        assert response.ok and response.result is not None
+        return response.result
+
+    try:
+        submitted = await jobs.submit(
+            task_id="TASK-POLL", action="start_agent", params={"task_id": "TASK-POLL"}
+        )
+        job_id = submitted.job_id
+        deadline = asyncio.get_running_loop().time() + 2
+        first = await poll(None)
+        while first["total_events"] < 2:
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.01)
+            first = await poll(None)
+        assert [event["status"] for event in first["events"]] == ["queued", "running"]
+        assert first["next_index"] == 2
+
+        assert (await poll(first["next_index"]))["events"] == []
+
+        release.set()
+        await jobs.wait(job_id, task_id="TASK-POLL", timeout_seconds=2)
+        newer = await poll(first["next_index"])
+        assert newer["after_index"] == 2
+        assert [event["status"] for event in newer["events"]] == ["succeeded"]
+        assert newer["total_events"] == 1
+        assert newer["next_index"] == 3
+    finally:
+        await client.close()
+        await server.stop()
+        await jobs.shutdown()
+        await repo.close()
+        shutil.rmtree(sock_dir, ignore_errors=True)
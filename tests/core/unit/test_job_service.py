@@ -440,3 +440,50 @@ async def test_handle_job_events_paginates_persisted_lifecycle(tmp_path) -> None
     finally:
         await service.shutdown()
         await task_repo.close()
+
+
+@pytest.mark.asyncio()
+async def test_repository_tracks_event_cursor_and_reads_after_index(tmp_path) -> None:
+    task_repo = TaskRepository(tmp_path / "jobs.db")
+    await task_repo.initialize()
+    repository = JobRepository(task_repo.session_factory)
+    now = datetime.now(UTC)
+    try:
+        for job_id in ("job-new", "job-legacy"):
+            await repository.create_job(
+                job_id=job_id,
+                task_id="TASK-CURSOR",
+                action="start_agent",
+                params_json={},
+                created_at=now,
+                queued_message="Job queued",
+                queued_code="JOB_QUEUED",
+            )
+        assert task_repo._engine is not None
+        async with task_repo._engine.begin() as conn:
+            await conn.exec_driver_sql("DELETE FROM job_event_cursors WHERE job_id = 'job-legacy'")
+
+        for job_id in ("job-new", "job-legacy"):
+            await repository.mark_running(job_id, timestamp=now, message="run", code="RUN")
+            await repository.complete_job(
+                job_id,
+                status="succeeded",
+                timestamp=now,
+                message="done",
+                code="DONE",
+                result_json={"ok": True},
+            )
+
+            events = await repository.list_events(job_id)
+            assert [event.event_index for event in events] == [1, 2, 3]
+            assert await repository.count_events(job_id) == 3
+            newer = await repository.list_events(job_id, after_index=1, limit=1)
+            assert [event.status for event in newer] == ["running"]
+
+        async with task_repo._engine.connect() as conn:
+            attempts = await conn.exec_driver_sql(
+                "SELECT status, finished_at IS NOT NULL FROM job_attempts ORDER BY job_id"
+            )
+            assert attempts.all() == [("succeeded", 1), ("succeeded", 1)]
+    finally:
+        await task_repo.close()
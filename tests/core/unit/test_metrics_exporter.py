@@ -0,0 +1,150 @@
+"""Tests for the local OpenMetrics exporter."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kagan.core.host import CoreHost
+from kagan.core.metrics_exporter import (
+    OPENMETRICS_CONTENT_TYPE,
+    GaugeSample,
+    MetricsExporter,
+    render_openmetrics,
+)
+
+_unix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix sockets unavailable on Windows"
+)
+
+
+@pytest.fixture
+def short_tmp():
+    """Short temp directory for Unix socket paths (macOS 104-byte limit)."""
+    path = Path(tempfile.mkdtemp(prefix="k-", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+async def _get(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str) -> bytes:
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+def test_render_openmetrics_emits_gauges_counters_and_histograms() -> None:
+    snapshot: dict[str, Any] = {
+        "counters": {"core.audit.dropped": 3},
+        "timings": {
+            "core.request.tasks.list.duration_ms": {"count": 3, "total_ms": 4.5},
+            "core.db.transaction.duration_ms": {"count": 1, "total_ms": 0.25},
+        },
+        "histograms": {
+            "core.request.tasks.list.duration_ms": [(1.0, 1), (2.25, 2)],
+            "core.db.transaction.duration_ms": [(0.25, 1)],
+        },
+    }
+    gauges = [
+        GaugeSample("core.jobs", 2, labels=(("status", "queued"),), help="Jobs by status"),
+        GaugeSample("core.jobs", 0, labels=(("status", "running"),)),
+    ]
+
+    text = render_openmetrics(snapshot, gauges)
+
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert "# TYPE kagan_core_jobs gauge" in lines
+    assert 'kagan_core_jobs{status="queued"} 2' in lines
+    assert 'kagan_core_jobs{status="running"} 0' in lines
+    assert "# TYPE kagan_core_audit_dropped counter" in lines
+    assert "kagan_core_audit_dropped_total 3" in lines
+    assert "# TYPE kagan_core_request_duration_ms histogram" in lines
+    assert (
+        'kagan_core_request_duration_ms_bucket{capability="tasks",method="list",le="1.0"} 1'
+        in lines
+    )
+    assert (
+        'kagan_core_request_duration_ms_bucket{capability="tasks",method="list",le="2.25"} 3'
+        in lines
+    )
+    assert (
+        'kagan_core_request_duration_ms_bucket{capability="tasks",method="list",le="+Inf"} 3'
+        in lines
+    )
+    assert 'kagan_core_request_duration_ms_sum{capability="tasks",method="list"} 4.5' in lines
+    assert 'kagan_core_db_transaction_duration_ms_bucket{le="0.25"} 1' in lines
+    assert "kagan_core_db_transaction_duration_ms_count 1" in lines
+
+
+@_unix_only
+async def test_socket_exporter_serves_metrics(short_tmp: Path) -> None:
+    socket_path = short_tmp / "metrics.sock"
+    exporter = MetricsExporter(
+        AsyncMock(return_value="# EOF\n"), transport="socket", socket_path=socket_path
+    )
+    await exporter.start()
+    try:
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        response = await _get(*await asyncio.open_unix_connection(str(socket_path)), "/metrics")
+    finally:
+        await exporter.stop()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert f"Content-Type: {OPENMETRICS_CONTENT_TYPE}".encode() in head
+    assert body == b"# EOF\n"
+    assert not socket_path.exists()
+
+
+async def test_http_exporter_binds_loopback_and_rejects_other_paths() -> None:
+    exporter = MetricsExporter(AsyncMock(return_value="# EOF\n"), transport="http")
+    await exporter.start()
+    try:
+        address = exporter.address
+        assert address["address"] == "127.0.0.1"
+        port = cast("int", address["port"])
+        assert port > 0
+        ok = await _get(*await asyncio.open_connection("127.0.0.1", port), "/metrics")
+        missing = await _get(*await asyncio.open_connection("127.0.0.1", port), "/other")
+    finally:
+        await exporter.stop()
+
+    assert ok.startswith(b"HTTP/1.1 200 OK")
+    assert missing.startswith(b"HTTP/1.1 404 Not Found")
+
+
+async def test_host_metrics_include_core_gauges(tmp_path: Path) -> None:
+    db_path = tmp_path / "kagan.db"
+    db_path.write_bytes(b"x" * 1024)
+    host = CoreHost(db_path=db_path)
+    host._ctx = cast(
+        "Any",
+        SimpleNamespace(
+            automation_service=SimpleNamespace(running_tasks={"t1", "t2"}, pending_spawn_count=3),
+            job_service=SimpleNamespace(
+                status_counts=AsyncMock(return_value={"queued": 4, "succeeded": 7})
+            ),
+        ),
+    )
+    host._on_client_connected()
+
+    lines = (await host.collect_metrics()).splitlines()
+
+    assert "kagan_core_clients_connected 1" in lines
+    assert "kagan_core_agents_running 2" in lines
+    assert "kagan_core_automation_pending_spawns 3" in lines
+    assert 'kagan_core_jobs{status="queued"} 4' in lines
+    assert 'kagan_core_jobs{status="running"} 0' in lines
+    assert 'kagan_core_jobs{status="succeeded"} 7' in lines
+    assert "kagan_core_db_size_bytes 1024" in lines
+    assert "kagan_core_events_subscribers 0" in lines
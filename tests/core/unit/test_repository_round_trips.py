@@ -0,0 +1,134 @@
+"""SQL round trips per repository write."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from kagan.core.adapters.db.repositories import ExecutionRepository
+from kagan.core.adapters.db.schema import Session, Task, Workspace
+from kagan.core.adapters.execution_logs import SegmentedLogStore
+from kagan.core.models.enums import ExecutionRunReason, ExecutionStatus, SessionType, TaskStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kagan.core.adapters.db.repositories import TaskRepository
+
+# Transaction control issued by the write executor around every operation.
+_TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
+
+@contextmanager
+def _count_statements(repo: TaskRepository) -> Iterator[list[str]]:
+    assert repo._engine is not None
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement: str, *_args) -> None:
+        if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+            statements.append(statement)
+
+    event.listen(repo._engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(repo._engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def _session_id(repo: TaskRepository, task_id: str) -> str:
+    project_id = repo.default_project_id
+    assert project_id is not None
+
+    async def _add(session: AsyncSession) -> str:
+        workspace = Workspace(
+            project_id=project_id, task_id=task_id, branch_name="kagan/rt", path="/tmp/rt"
+        )
+        session.add(workspace)
+        await session.flush()
+        record = Session(workspace_id=workspace.id, session_type=next(iter(SessionType)))
+        session.add(record)
+        await session.flush()
+        return record.id
+
+    return await repo.session_factory.write(_add)
+
+
+async def test_repository_writes_round_trips(state_manager: TaskRepository, tmp_path: Path) -> None:
+    project_id = state_manager.default_project_id
+    assert project_id is not None
+    counts: dict[str, int] = {}
+
+    with _count_statements(state_manager) as statements:
+        task = await state_manager.create(Task(project_id=project_id, title="rt"))
+    counts["tasks.create"] = len(statements)
+
+    with _count_statements(state_manager) as statements:
+        renamed = await state_manager.update(task.id, title="renamed")
+    counts["tasks.update"] = len(statements)
+    assert renamed is not None
+    assert renamed.title == "renamed"
+
+    with _count_statements(state_manager) as statements:
+        moved = await state_manager.update(task.id, status=TaskStatus.REVIEW)
+    counts["tasks.update(status)"] = len(statements)
+    assert moved is not None
+    assert (moved.status, moved.title) == (TaskStatus.REVIEW, "renamed")
+
+    session_id = await _session_id(state_manager, task.id)
+    executions = ExecutionRepository(
+        state_manager.session_factory, log_store=SegmentedLogStore(tmp_path)
+    )
+    inline = ExecutionRepository(state_manager.session_factory)
+
+    with _count_statements(state_manager) as statements:
+        execution = await executions.create_execution(
+            session_id=session_id, run_reason=ExecutionRunReason.CODINGAGENT
+        )
+    counts["executions.create"] = len(statements)
+
+    with _count_statements(state_manager) as statements:
+        updated = await executions.update_execution(execution.id, metadata={"k": "v"})
+    counts["executions.update"] = len(statements)
+    assert updated is not None
+    assert updated.metadata_ == {"k": "v"}
+
+    with _count_statements(state_manager) as statements:
+        finished = await executions.update_execution(execution.id, status=ExecutionStatus.COMPLETED)
+    counts["executions.update(status)"] = len(statements)
+    assert finished is not None
+    assert (finished.status, finished.metadata_) == (ExecutionStatus.COMPLETED, {"k": "v"})
+
+    other = await inline.create_execution(
+        session_id=session_id, run_reason=ExecutionRunReason.CODINGAGENT
+    )
+    for label, repo, execution_id in (
+        ("executions.append_log", executions, execution.id),
+        ("executions.append_log(inline)", inline, other.id),
+    ):
+        await repo.append_execution_log(execution_id, "first")
+        with _count_statements(state_manager) as statements:
+            entry = await repo.append_execution_log(execution_id, "second")
+        counts[label] = len(statements)
+        assert (entry.offset, entry.byte_size) == (5, 6)
+
+    with _count_statements(state_manager) as statements:
+        turn = await executions.append_agent_turn(execution.id, prompt="hi")
+    counts["executions.append_agent_turn"] = len(statements)
+    assert turn.prompt == "hi"
+
+    assert counts == {
+        "tasks.create": 1,
+        "tasks.update": 1,
+        "tasks.update(status)": 2,
+        "executions.create": 2,
+        "executions.update": 1,
+        "executions.update(status)": 2,
+        "executions.append_log": 1,
+        "executions.append_log(inline)": 1,
+        "executions.append_agent_turn": 1,
+    }
@@ -0,0 +1,57 @@
+"""Tests for append-only scratchpad notes and their on-read assembly."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kagan.core.adapters.db.repositories import ScratchRepository
+from kagan.core.adapters.db.repositories.auxiliary import _SCRATCHPAD_FOLD_ENTRIES
+from kagan.core.limits import SCRATCHPAD_LIMIT
+
+if TYPE_CHECKING:
+    from kagan.core.adapters.db.repositories import TaskRepository
+
+
+async def _entry_count(state_manager: TaskRepository) -> int:
+    assert state_manager._engine is not None
+    async with state_manager._engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT COUNT(*) FROM scratchpad_entries")
+        return result.scalar() or 0
+
+
+async def test_appends_follow_snapshot_and_separator_skips_empty_pad(
+    state_manager: TaskRepository,
+) -> None:
+    scratch = ScratchRepository(state_manager.session_factory)
+
+    await scratch.append_scratchpad("task-1", "first", separator="\n")
+    await scratch.append_scratchpad("task-1", "second", separator="\n")
+    assert await scratch.get_scratchpad("task-1") == "first\nsecond"
+
+    await scratch.update_scratchpad("task-1", "replaced")
+    assert await _entry_count(state_manager) == 0
+    await scratch.append_scratchpad("task-1", " + note")
+    assert await scratch.get_scratchpad("task-1") == "replaced + note"
+    assert await scratch.get_scratchpad("task-1", max_chars=4) == "note"
+    assert await scratch.get_scratchpad("other") == ""
+
+
+async def test_reads_trim_to_limit_and_notes_fold_into_snapshot(
+    state_manager: TaskRepository,
+) -> None:
+    scratch = ScratchRepository(state_manager.session_factory)
+    note = "x" * 999 + "|"
+    await scratch.update_scratchpad("task-1", "old-head")
+
+    for _ in range(_SCRATCHPAD_FOLD_ENTRIES - 1):
+        await scratch.append_scratchpad("task-1", note)
+    assert await _entry_count(state_manager) == _SCRATCHPAD_FOLD_ENTRIES - 1
+    expected = ("old-head" + note * (_SCRATCHPAD_FOLD_ENTRIES - 1))[-SCRATCHPAD_LIMIT:]
+    assert await scratch.get_scratchpad("task-1") == expected
+
+    await scratch.append_scratchpad("task-1", "tail")
+
+    assert await _entry_count(state_manager) == 0
+    folded = await scratch.get_scratchpad("task-1")
+    assert len(folded) == SCRATCHPAD_LIMIT
+    assert folded == (expected + "tail")[-SCRATCHPAD_LIMIT:]
@@ -0,0 +1,242 @@
+"""Behavior tests for chunked streaming responses over IPC."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from _api_helpers import build_api
+
+from kagan.core import api_tasks, request_handlers
+from kagan.core.adapters.db.schema import Session, Workspace
+from kagan.core.host import CoreHost
+from kagan.core.ipc.client import IPCClient
+from kagan.core.ipc.contracts import CoreRequest
+from kagan.core.ipc.discovery import CoreEndpoint
+from kagan.core.ipc.server import IPCServer
+from kagan.core.ipc.transports import UnixSocketTransport
+from kagan.core.models.enums import ExecutionRunReason, SessionType
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kagan.core.api import KaganAPI
+    from kagan.core.bootstrap import AppContext
+
+_unix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix sockets unavailable on Windows"
+)
+
+
+@pytest.fixture
+def short_tmp():
+    """Short temp directory for Unix socket paths (macOS 104-byte limit)."""
+    path = Path(tempfile.mkdtemp(prefix="k-", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+async def _host(tmp_path: Path):
+    repo, api, ctx = await build_api(tmp_path)
+    ctx.api = api
+    host = CoreHost()
+    host._ctx = cast("AppContext", ctx)
+    host.register_session("viewer-session", "viewer")
+    return repo, api, host
+
+
+async def _serve(host: CoreHost, sock: str) -> tuple[IPCServer, IPCClient]:
+    server = IPCServer(
+        handler=host.handle_request,
+        transport=UnixSocketTransport(path=sock),
+        concurrent_dispatch=True,
+    )
+    await server.start()
+    client = IPCClient(
+        CoreEndpoint(transport="socket", address=sock, token=server.token),
+        transport=UnixSocketTransport(path=sock),
+        multiplexed=True,
+    )
+    await client.connect()
+    return server, client
+
+
+async def _execution_with_logs(api: KaganAPI, project_id: str, logs: list[str]) -> str:
+    task = await api.create_task("Logged")
+
+    async def _add(session: AsyncSession) -> str:
+        workspace = Workspace(
+            project_id=project_id, task_id=task.id, branch_name="kagan/logs", path="/tmp/logs"
+        )
+        session.add(workspace)
+        await session.flush()
+        record = Session(workspace_id=workspace.id, session_type=next(iter(SessionType)))
+        session.add(record)
+        await session.flush()
+        return record.id
+
+    executions = api._ctx.execution_service
+    session_id = await executions._session_factory.write(_add)
+    execution = await executions.create_execution(
+        session_id=session_id, run_reason=ExecutionRunReason.CODINGAGENT
+    )
+    for line in logs:
+        await executions.append_execution_log(execution.id, line)
+    return task.id
+
+
+async def test_stream_request_without_ipc_connection_returns_full_result(
+    tmp_path: Path,
+) -> None:
+    repo, api, host = await _host(tmp_path)
+    task = await api.create_task("No runs yet")
+    try:
+        response = await host.handle_request(
+            CoreRequest(
+                session_id="viewer-session",
+                capability="tasks",
+                method="logs",
+                params={"task_id": task.id},
+                stream=True,
+            )
+        )
+    finally:
+        await repo.close()
+
+    assert response.ok and response.result is not None
+    assert response.result == {"task_id": task.id, "logs": [], "count": 0}
+
+
+@_unix_only
+async def test_audit_list_streams_one_chunk_per_event(tmp_path: Path, short_tmp: Path) -> None:
+    repo, _api, host = await _host(tmp_path)
+    server, client = await _serve(host, str(short_tmp / "t.sock"))
+
+    try:
+        for _ in range(3):
+            await client.request(session_id="viewer-session", capability="tasks", method="list")
+        expected = await client.request(
+            session_id="viewer-session", capability="audit", method="list"
+        )
+        assert expected.result is not None
+
+        stream = await client.request_stream(
+            session_id="viewer-session", capability="audit", method="list"
+        )
+        chunks = [chunk async for chunk in stream]
+
+        # Newest first: the earlier audit.list call, then the three tasks.list calls.
+        assert len(chunks) == 4
+        assert chunks[0]["event"]["command_name"] == "list"
+        assert chunks[0]["event"]["capability"] == "audit"
+        assert [chunk["event"] for chunk in chunks[1:]] == expected.result["events"]
+        assert stream.response is not None and stream.response.ok
+        assert stream.response.result == {
+            "success": True,
+            "streamed": True,
+            "chunk_count": len(chunks),
+        }
+    finally:
+        await client.close()
+        await server.stop()
+        await repo.close()
+
+
+@_unix_only
+async def test_task_logs_stream_in_bounded_pieces(
+    tmp_path: Path, short_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(api_tasks, "_LOG_ENTRY_PAGE_SIZE", 2)
+    monkeypatch.setattr(api_tasks, "_LOG_CHUNK_CHARS", 4)
+    repo, api, host = await _host(tmp_path)
+    assert repo.default_project_id is not None
+    lines = ["alpha", "béta", "gamma-delta", "z"]
+    task_id = await _execution_with_logs(api, repo.default_project_id, lines)
+    server, client = await _serve(host, str(short_tmp / "t.sock"))
+
+    try:
+        stream = await client.request_stream(
+            session_id="viewer-session",
+            capability="tasks",
+            method="logs",
+            params={"task_id": task_id},
+        )
+        pieces = [chunk["log"] async for chunk in stream]
+    finally:
+        await client.close()
+        await server.stop()
+        await repo.close()
+
+    assert all(len(piece["content"]) <= 4 and piece["run"] == 1 for piece in pieces)
+    assert "".join(piece["content"] for piece in pieces) == "".join(lines)
+    stream_offsets = [0]
+    for line in lines:
+        stream_offsets.append(stream_offsets[-1] + len(line.encode()))
+    expected_offsets = []
+    for line, offset in zip(lines, stream_offsets, strict=False):
+        for start in range(0, len(line), 4):
+            expected_offsets.append(offset + len(line[:start].encode()))
+    assert [piece["offset"] for piece in pieces] == expected_offsets
+
+
+@_unix_only
+async def test_audit_list_stream_pages_through_events(
+    tmp_path: Path, short_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(request_handlers, "_AUDIT_STREAM_PAGE_SIZE", 2)
+    repo, _api, host = await _host(tmp_path)
+    server, client = await _serve(host, str(short_tmp / "t.sock"))
+
+    try:
+        for _ in range(6):
+            await client.request(session_id="viewer-session", capability="tasks", method="list")
+        expected = await client.request(
+            session_id="viewer-session", capability="audit", method="list", params={"limit": 5}
+        )
+        assert expected.result is not None
+
+        stream = await client.request_stream(
+            session_id="viewer-session", capability="audit", method="list", params={"limit": 5}
+        )
+        chunks = [chunk async for chunk in stream]
+    finally:
+        await client.close()
+        await server.stop()
+        await repo.close()
+
+    # Three pages of at most two: the earlier audit.list call, then four tasks.list calls.
+    assert len(chunks) == 5
+    assert chunks[0]["event"]["capability"] == "audit"
+    assert [chunk["event"] for chunk in chunks[1:]] == expected.result["events"][:4]
+
+
+@_unix_only
+async def test_non_streamable_method_answers_with_a_single_response(
+    tmp_path: Path, short_tmp: Path
+) -> None:
+    repo, api, host = await _host(tmp_path)
+    await api.create_task("Listed")
+    server, client = await _serve(host, str(short_tmp / "t.sock"))
+
+    try:
+        stream = await client.request_stream(
+            session_id="viewer-session", capability="tasks", method="list"
+        )
+        assert [chunk async for chunk in stream] == []
+        assert stream.response is not None and stream.response.result is not None
+        assert stream.response.result["count"] == 1
+    finally:
+        await client.close()
+        await server.stop()
+        await repo.close()
+
+
+async def test_request_stream_requires_multiplexed_client() -> None:
+    client = IPCClient(CoreEndpoint(transport="socket", address="/tmp/unused.sock", token="t"))
+
+    with pytest.raises(RuntimeError, match="multiplexed"):
+        await client.request_stream(session_id="s", capability="tasks", method="logs")
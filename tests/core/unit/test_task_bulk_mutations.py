@@ -0,0 +1,117 @@
+"""Tests for bulk task create/update/move in one transaction."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+from kagan.core.api import KaganAPI
+from kagan.core.events import TaskCreated, TasksChanged, TaskStatusChanged, TaskUpdated
+from kagan.core.models.enums import TaskPriority, TaskStatus
+from kagan.core.request_handlers import (
+    handle_task_create_many,
+    handle_task_move_many,
+    handle_task_update_many,
+)
+
+
+def _api(task_service: object) -> KaganAPI:
+    return KaganAPI(cast("Any", SimpleNamespace(task_service=task_service)))
+
+
+def _record_events(event_bus) -> list[object]:
+    published: list[object] = []
+    event_bus.add_handler(published.append)
+    return published
+
+
+async def test_create_many_links_batch_mentions_and_publishes_once(
+    event_bus, state_manager, task_factory, task_service
+) -> None:
+    existing = await state_manager.create(task_factory(title="Existing"))
+    published = _record_events(event_bus)
+
+    result = await handle_task_create_many(
+        _api(task_service),
+        {
+            "tasks": [
+                {"title": "First", "status": "in_progress", "priority": "high"},
+                {"title": "Second", "description": f"after @{existing.id}"},
+            ]
+        },
+    )
+
+    assert result["success"] is True
+    assert result["count"] == 2
+    first_id, second_id = (item["task_id"] for item in result["tasks"])
+    first = await state_manager.get(first_id)
+    assert first is not None
+    assert (first.status, first.priority) == (TaskStatus.IN_PROGRESS, TaskPriority.HIGH)
+    assert await state_manager.get_task_links(second_id) == [existing.id]
+
+    assert not [e for e in published if isinstance(e, (TaskCreated, TaskStatusChanged))]
+    (event,) = [e for e in published if isinstance(e, TasksChanged)]
+    assert event.task_ids == [first_id, second_id]
+    assert event.status_changes == [(first_id, TaskStatus.BACKLOG, TaskStatus.IN_PROGRESS)]
+
+
+async def test_move_many_commits_once_and_emits_one_event(
+    event_bus, monkeypatch, state_manager, task_factory, task_service
+) -> None:
+    tasks = [await state_manager.create(task_factory(title=f"Card {i}")) for i in range(40)]
+    writes = 0
+    write = state_manager._write
+
+    async def _counting_write(operation):
+        nonlocal writes
+        writes += 1
+        return await write(operation)
+
+    monkeypatch.setattr(state_manager, "_write", _counting_write)
+    published = _record_events(event_bus)
+
+    result = await handle_task_move_many(
+        _api(task_service), {"task_ids": [task.id for task in tasks], "status": "REVIEW"}
+    )
+
+    assert result["code"] == "MOVED"
+    assert result["count"] == 40
+    assert writes == 1
+    assert {task.status for task in await state_manager.get_all()} == {TaskStatus.REVIEW}
+    assert not [e for e in published if isinstance(e, (TaskUpdated, TaskStatusChanged))]
+    (event,) = published
+    assert isinstance(event, TasksChanged)
+    assert len(event.status_changes) == 40
+
+
+async def test_bulk_update_writes_nothing_when_a_task_is_missing(
+    event_bus, state_manager, task_factory, task_service
+) -> None:
+    task = await state_manager.create(task_factory(title="Keep"))
+    other = await state_manager.create(task_factory(title="Other"))
+    published = _record_events(event_bus)
+    api = _api(task_service)
+
+    missing = await handle_task_update_many(
+        api,
+        {"updates": [{"task_id": task.id, "title": "Renamed"}, {"task_id": "nope0000"}]},
+    )
+
+    assert missing["code"] == "TASK_NOT_FOUND"
+    assert missing["task_ids"] == ["nope0000"]
+    unchanged = await state_manager.get(task.id)
+    assert unchanged is not None
+    assert unchanged.title == "Keep"
+    assert published == []
+
+    updated = await handle_task_update_many(
+        api,
+        {"updates": [{"task_id": task.id, "title": "Renamed", "description": f"@{other.id}"}]},
+    )
+
+    assert updated["task_ids"] == [task.id]
+    assert await state_manager.get_task_links(task.id) == [other.id]
+    (event,) = published
+    assert isinstance(event, TasksChanged)
+    assert event.fields_changed == ["description", "title"]
+    assert event.status_changes == []
@@ -0,0 +1,156 @@
+"""Tests for the write-through task cache and batched task lookups."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kagan.core.adapters.db.repositories import TaskRepository
+from kagan.core.adapters.db.schema import Task
+from kagan.core.instrumentation import configure, reset, snapshot
+from kagan.core.models.enums import TaskStatus
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+@pytest.fixture
+async def cached_repo(tmp_path: Path) -> AsyncIterator[TaskRepository]:
+    repo = TaskRepository(tmp_path / "cache.db", task_cache_size=2)
+    await repo.initialize()
+    await repo.ensure_test_project()
+    yield repo
+    await repo.close()
+
+
+def _new_task(repo: TaskRepository, title: str) -> Task:
+    assert repo.default_project_id is not None
+    return Task(project_id=repo.default_project_id, title=title)
+
+
+async def test_writes_keep_cache_current_and_reads_are_batched(
+    cached_repo: TaskRepository,
+) -> None:
+    first, second, third = await cached_repo.create_many(
+        [_new_task(cached_repo, title) for title in ("one", "two", "three")]
+    )
+    assert cached_repo._cache is not None
+    assert len(cached_repo._cache) == 2
+
+    previous = snapshot()
+    try:
+        configure(enabled=True, log_events=False)
+        reset()
+
+        found = await cached_repo.get_many([third.id, first.id, "missing0", third.id])
+        assert list(found) == [third.id, first.id]
+        assert snapshot()["counters"] == {
+            "core.tasks.cache.hits": 1,
+            "core.tasks.cache.misses": 2,
+        }
+
+        await cached_repo.update(first.id, title="renamed")
+        await cached_repo.move_many([third.id], TaskStatus.REVIEW)
+        cached_first = await cached_repo.get(first.id)
+        cached_third = await cached_repo.get(third.id)
+        assert cached_first is not None
+        assert cached_third is not None
+        assert (cached_first.title, cached_third.status) == ("renamed", TaskStatus.REVIEW)
+        assert snapshot()["counters"]["core.tasks.cache.hits"] == 3
+
+        assert await cached_repo.delete(second.id)
+        assert await cached_repo.get(second.id) is None
+    finally:
+        configure(
+            enabled=bool(previous["enabled"]),
+            log_events=bool(previous["log_events"]),
+        )
+        reset()
+
+
+async def test_read_started_before_a_write_does_not_cache_stale_row(
+    cached_repo: TaskRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    task = await cached_repo.create(_new_task(cached_repo, "before"))
+    cache = cached_repo._cache
+    assert cache is not None
+    cache.clear()
+    read_session = cached_repo._get_read_session
+
+    def _session_with_interleaved_write():
+        session = read_session()
+        execute = session.execute
+
+        async def _execute(*args, **kwargs):
+            result = await execute(*args, **kwargs)
+            monkeypatch.setattr(cached_repo, "_get_read_session", read_session)
+            await cached_repo.update(task.id, title="after")
+            return result
+
+        session.execute = _execute  # type: ignore[method-assign]
+        return session
+
+    monkeypatch.setattr(cached_repo, "_get_read_session", _session_with_interleaved_write)
+
+    stale = await cached_repo.get(task.id)
+
+    assert stale is not None
+    assert stale.title == "before"
+    current = await cached_repo.get(task.id)
+    assert current is not None
+    assert current.title == "after"
+
+
+async def test_read_of_pre_commit_snapshot_cannot_overwrite_committed_row(
+    cached_repo: TaskRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    task = await cached_repo.create(_new_task(cached_repo, "before"))
+    cache = cached_repo._cache
+    assert cache is not None
+    cache.clear()
+    read_session = cached_repo._get_read_session
+    write = cached_repo._write
+    read_done = asyncio.Event()
+    write_done = asyncio.Event()
+
+    def _session_held_until_write_returns():
+        session = read_session()
+        execute = session.execute
+
+        async def _execute(*args, **kwargs):
+            result = await execute(*args, **kwargs)
+            read_done.set()
+            await write_done.wait()
+            return result
+
+        session.execute = _execute  # type: ignore[method-assign]
+        return session
+
+    async def _write_with_read_before_commit(operation):
+        async def _operation(session):
+            result = await operation(session)
+            # The cache was discarded but nothing is committed: this read
+            # observes the new version together with the old row.
+            monkeypatch.setattr(cached_repo, "_get_read_session", _session_held_until_write_returns)
+            reads.append(asyncio.create_task(cached_repo.get(task.id)))
+            await read_done.wait()
+            monkeypatch.setattr(cached_repo, "_get_read_session", read_session)
+            return result
+
+        return await write(_operation)
+
+    reads: list[asyncio.Task[Task | None]] = []
+    monkeypatch.setattr(cached_repo, "_write", _write_with_read_before_commit)
+
+    await cached_repo.update(task.id, title="after")
+    write_done.set()
+    stale = await reads[0]
+
+    assert stale is not None
+    assert stale.title == "before"
+    cached = cache.get(task.id)
+    assert cached is not None
+    assert cached.title == "after"
@@ -0,0 +1,192 @@
+"""Tests for keyset-paginated, SQL-filtered task listing."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+from sqlalchemy import event
+
+from kagan.core.adapters.db.task_board import BOARD_ORDER_INDEX
+from kagan.core.api import KaganAPI
+from kagan.core.models.enums import TaskPriority, TaskStatus, TaskType
+from kagan.core.request_handlers import handle_task_list
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kagan.core.adapters.db.repositories import TaskRepository
+    from kagan.core.adapters.db.schema import Task
+    from kagan.core.services.tasks import TaskService
+
+
+async def _seed(state_manager: TaskRepository, task_factory: Callable[..., Task]) -> list[Task]:
+    tasks = []
+    for i, status in enumerate(TaskStatus):
+        for priority in TaskPriority:
+            for task_type in TaskType:
+                tasks.append(
+                    await state_manager.create(
+                        task_factory(
+                            title=f"t{i}-{priority.name}-{task_type.name}",
+                            status=status,
+                            priority=priority,
+                            task_type=task_type,
+                        )
+                    )
+                )
+    return tasks
+
+
+async def test_pages_walk_the_board_in_order_without_gaps(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    await _seed(state_manager, task_factory)
+    expected = [task.id for task in await state_manager.get_all()]
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = await state_manager.list_page(limit=5, cursor=cursor)
+        seen.extend(task.id for task in page)
+        if len(page) < 5:
+            break
+        cursor = state_manager.cursor_for(page[-1])
+
+    assert seen == expected
+    assert len(seen) == 4 * 3 * 2
+    statuses = [task.status for task in await state_manager.get_all()]
+    assert statuses == sorted(statuses, key=list(TaskStatus).index)
+
+
+async def test_filters_are_applied_in_sql(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    tasks = await _seed(state_manager, task_factory)
+    excluded = next(
+        t for t in tasks if t.status is TaskStatus.REVIEW and t.task_type is TaskType.AUTO
+    )
+
+    page = await state_manager.list_page(
+        status=TaskStatus.REVIEW, task_type=TaskType.AUTO, exclude_ids=[excluded.id]
+    )
+
+    assert len(page) == 2
+    assert all(t.status is TaskStatus.REVIEW and t.task_type is TaskType.AUTO for t in page)
+    assert excluded.id not in {t.id for t in page}
+    assert [t.priority for t in page] == [TaskPriority.HIGH, TaskPriority.MEDIUM]
+
+
+async def test_each_listing_is_one_query_and_ties_page_by_id(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    for i in range(5):
+        task = task_factory(title=f"tie-{i}")
+        task.created_at = created_at
+        await state_manager.create(task)
+    engine = state_manager._reader_engine or state_manager._engine
+    assert engine is not None
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement: str, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        everything = await state_manager.get_all()
+        first = await state_manager.list_page(limit=2)
+        rest = await state_manager.list_page(limit=10, cursor=state_manager.cursor_for(first[-1]))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert [t.id for t in first + rest] == [t.id for t in everything]
+    assert [t.id for t in everything] == sorted(t.id for t in everything)
+    assert len(statements) == 3
+
+
+@pytest.mark.parametrize("status", [None, TaskStatus.REVIEW])
+async def test_board_page_walks_the_rank_index_without_sorting(
+    state_manager: TaskRepository,
+    task_factory: Callable[..., Task],
+    status: TaskStatus | None,
+) -> None:
+    tasks = await _seed(state_manager, task_factory)
+    project_id = state_manager.default_project_id
+    engine = state_manager._reader_engine or state_manager._engine
+    assert engine is not None
+    captured: list[tuple[str, Any]] = []
+
+    def _record(_conn, _cursor, statement: str, parameters: Any, *_args) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        await state_manager.list_page(
+            project_id=project_id,
+            status=status,
+            limit=5,
+            cursor=state_manager.cursor_for(
+                next(t for t in tasks if status is None or t.status is status)
+            ),
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    [(statement, parameters)] = captured
+    async with engine.connect() as conn:
+        plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = " | ".join(row[-1] for row in plan)
+    assert BOARD_ORDER_INDEX in details
+    assert "TEMP B-TREE" not in details
+
+
+async def test_status_page_with_cursor_from_another_status(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    tasks = await _seed(state_manager, task_factory)
+    backlog = next(t for t in tasks if t.status is TaskStatus.BACKLOG)
+    done = next(t for t in tasks if t.status is TaskStatus.DONE)
+
+    after_earlier = await state_manager.list_page(
+        status=TaskStatus.REVIEW, cursor=state_manager.cursor_for(backlog)
+    )
+    after_later = await state_manager.list_page(
+        status=TaskStatus.REVIEW, cursor=state_manager.cursor_for(done)
+    )
+
+    assert after_earlier == await state_manager.get_by_status(TaskStatus.REVIEW)
+    assert len(after_earlier) == 6
+    assert after_later == []
+
+
+async def test_handler_returns_next_cursor_until_last_page(
+    state_manager: TaskRepository,
+    task_factory: Callable[..., Task],
+    task_service: TaskService,
+) -> None:
+    await _seed(state_manager, task_factory)
+    api = KaganAPI(cast("Any", SimpleNamespace(task_service=task_service)))
+
+    first = await handle_task_list(api, {"filter": "in_progress", "limit": 4})
+    second = await handle_task_list(
+        api, {"filter": "in_progress", "limit": 4, "cursor": first["next_cursor"]}
+    )
+
+    assert first["count"] == 4
+    assert first["next_cursor"] is not None
+    assert second["count"] == 2
+    assert second["next_cursor"] is None
+    ids = [t["id"] for t in first["tasks"] + second["tasks"]]
+    assert len(set(ids)) == 6
+
+    unpaged = await handle_task_list(api, {"task_type": "auto"})
+    assert unpaged["count"] == 12
+    assert unpaged["next_cursor"] is None
+
+
+async def test_invalid_cursor_is_rejected(state_manager: TaskRepository) -> None:
+    with pytest.raises(ValueError, match="Invalid task cursor"):
+        await state_manager.list_page(limit=5, cursor="not-a-cursor")
@@ -0,0 +1,133 @@
+"""Tests for board revisions and incremental task sync."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from kagan.core.adapters.db.schema import Project
+from kagan.core.api import KaganAPI
+from kagan.core.models.enums import TaskStatus
+from kagan.core.request_handlers import handle_task_changed_since
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from kagan.core.adapters.db.repositories import TaskRepository
+    from kagan.core.adapters.db.schema import Task
+    from kagan.core.services.tasks import TaskService
+
+
+async def test_changed_since_returns_only_changes_and_tombstones(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    project_id = state_manager.default_project_id
+    assert project_id is not None
+    kept = await state_manager.create(task_factory(title="kept"))
+    edited = await state_manager.create(task_factory(title="edited"))
+    doomed = await state_manager.create(task_factory(title="doomed"))
+    baseline = await state_manager.get_board_revision(project_id)
+    assert baseline == 3
+
+    await state_manager.update(edited.id, status=TaskStatus.IN_PROGRESS)
+    await state_manager.delete(doomed.id)
+    changes = await state_manager.changed_since(project_id, baseline)
+
+    assert changes.revision == baseline + 2
+    assert changes.full is False
+    assert [t.id for t in changes.tasks] == [edited.id]
+    assert changes.tasks[0].status is TaskStatus.IN_PROGRESS
+    assert changes.deleted_ids == [doomed.id]
+    assert kept.id not in {t.id for t in changes.tasks}
+
+    unchanged = await state_manager.changed_since(project_id, changes.revision)
+    assert (unchanged.tasks, unchanged.deleted_ids) == ([], [])
+
+
+async def test_unusable_revision_returns_full_board(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    project_id = state_manager.default_project_id
+    assert project_id is not None
+    await state_manager.create(task_factory(title="a"))
+    await state_manager.create(task_factory(title="b"))
+
+    for revision in (0, 99):
+        changes = await state_manager.changed_since(project_id, revision)
+        assert changes.full is True
+        assert len(changes.tasks) == 2
+
+
+async def test_revisions_are_per_project_and_track_moves(
+    state_manager: TaskRepository, task_factory: Callable[..., Task]
+) -> None:
+    home = state_manager.default_project_id
+    assert home is not None
+
+    async def _add_project(session: AsyncSession) -> str:
+        project = Project(name="Other", description="")
+        session.add(project)
+        await session.flush()
+        return project.id
+
+    other = await state_manager.session_factory.write(_add_project)
+    task = await state_manager.create(task_factory(title="mover"))
+    other_before = await state_manager.get_board_revision(other)
+    home_before = await state_manager.get_board_revision(home)
+
+    await state_manager.update(task.id, project_id=other)
+
+    home_changes = await state_manager.changed_since(home, home_before)
+    other_changes = await state_manager.changed_since(other, other_before)
+    assert home_changes.deleted_ids == [task.id]
+    assert [t.id for t in other_changes.tasks] == [task.id]
+
+
+async def test_existing_tasks_are_backfilled_at_revision_one(tmp_path: Path) -> None:
+    from kagan.core.adapters.db.repositories import TaskRepository
+    from kagan.core.adapters.db.schema import Task
+
+    db_path = tmp_path / "kagan.db"
+    repo = TaskRepository(db_path)
+    await repo.initialize()
+    project_id = await repo.ensure_test_project()
+    task = await repo.create(Task(project_id=project_id, title="legacy"))
+    assert repo._engine is not None
+    async with repo._engine.begin() as conn:
+        for statement in ("DELETE FROM task_changes", "DELETE FROM board_revisions"):
+            await conn.exec_driver_sql(statement)
+    await repo.close()
+
+    reopened = TaskRepository(db_path)
+    await reopened.initialize()
+    try:
+        assert await reopened.get_board_revision(project_id) == 1
+        changes = await reopened.changed_since(project_id, 0)
+        assert [t.id for t in changes.tasks] == [task.id]
+    finally:
+        await reopened.close()
+
+
+async def test_handler_serializes_changes(
+    state_manager: TaskRepository,
+    task_factory: Callable[..., Task],
+    task_service: TaskService,
+) -> None:
+    project_id = state_manager.default_project_id
+    task = await state_manager.create(task_factory(title="new"))
+    api = KaganAPI(cast("Any", SimpleNamespace(task_service=task_service)))
+
+    result = await handle_task_changed_since(api, {"project_id": project_id})
+
+    assert result["revision"] == 1
+    assert result["full"] is True
+    assert [t["id"] for t in result["tasks"]] == [task.id]
+    assert result["deleted_task_ids"] == []
+
+    with pytest.raises(ValueError, match="Invalid revision"):
+        await handle_task_changed_since(api, {"project_id": project_id, "revision": -1})
@@ -0,0 +1,109 @@
+"""Tests for the FTS5-backed task search index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kagan.core.adapters.db.repositories import ScratchRepository, TaskRepository
+from kagan.core.adapters.db.schema import Task
+from kagan.core.adapters.db.task_search import build_match_query, drop_task_search_index
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+@pytest.fixture
+async def task_repo(tmp_path: Path) -> AsyncIterator[TaskRepository]:
+    repo = TaskRepository(tmp_path / "kagan.db")
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+async def _create(repo: TaskRepository, title: str, **fields: object) -> Task:
+    project_id = repo.default_project_id or await repo.ensure_test_project()
+    return await repo.create(Task(project_id=project_id, title=title, **fields))
+
+
+async def test_search_ranks_title_matches_first_and_matches_prefixes(
+    task_repo: TaskRepository,
+) -> None:
+    in_description = await _create(task_repo, "Write docs", description="explain the login flow")
+    in_title = await _create(task_repo, "Fix login redirect")
+    await _create(task_repo, "Unrelated")
+
+    hits = await task_repo.search_hits("logi")
+
+    assert [hit.task.id for hit in hits] == [in_title.id, in_description.id]
+    assert hits[0].snippet == "Fix **login** redirect"
+
+
+async def test_search_requires_every_term_and_honours_limit(task_repo: TaskRepository) -> None:
+    for i in range(5):
+        await _create(task_repo, f"Parser bug {i}", description="tokenizer crash")
+    await _create(task_repo, "Parser cleanup")
+
+    assert len(await task_repo.search("parser crash")) == 5
+    assert len(await task_repo.search("parser", limit=2)) == 2
+
+
+async def test_index_follows_updates_deletes_and_criteria(task_repo: TaskRepository) -> None:
+    task = await _create(task_repo, "Old title", acceptance_criteria=["users can authenticate"])
+
+    assert [t.id for t in await task_repo.search("authenticate")] == [task.id]
+
+    await task_repo.update(task.id, title="Shiny new title")
+    assert await task_repo.search("old") == []
+    assert [t.id for t in await task_repo.search("shiny")] == [task.id]
+
+    await task_repo.delete(task.id)
+    assert await task_repo.search("shiny") == []
+
+
+async def test_index_covers_scratchpad(task_repo: TaskRepository) -> None:
+    task = await _create(task_repo, "Investigate")
+    scratch = ScratchRepository(task_repo.session_factory)
+
+    await scratch.update_scratchpad(task.id, "suspect the websocket heartbeat")
+    assert [t.id for t in await task_repo.search("heartbeat")] == [task.id]
+
+    await scratch.append_scratchpad(task.id, " and the reconnect backoff")
+    assert [t.id for t in await task_repo.search("backoff heartbeat")] == [task.id]
+
+    await scratch.delete_scratchpad(task.id)
+    assert await task_repo.search("heartbeat") == []
+    assert await task_repo.search("backoff") == []
+
+
+async def test_search_by_exact_id_and_operator_characters(task_repo: TaskRepository) -> None:
+    task = await _create(task_repo, "Anything")
+
+    assert [t.id for t in await task_repo.search(task.id)] == [task.id]
+    assert await task_repo.search('"') == []
+    assert await task_repo.search("NEAR(title:") == []
+
+
+async def test_missing_index_is_rebuilt_on_startup(tmp_path: Path) -> None:
+    db_path = tmp_path / "kagan.db"
+    repo = TaskRepository(db_path)
+    await repo.initialize()
+    task = await _create(repo, "Backfilled task")
+    assert repo._engine is not None
+    async with repo._engine.begin() as conn:
+        await conn.run_sync(drop_task_search_index)
+    await repo.close()
+
+    reopened = TaskRepository(db_path)
+    await reopened.initialize()
+    try:
+        assert [t.id for t in await reopened.search("backfill")] == [task.id]
+    finally:
+        await reopened.close()
+
+
+def test_build_match_query_quotes_terms_as_prefixes() -> None:
+    assert build_match_query('fix "login" OR col:x') == '"fix"* "login"* "OR"* "col"* "x"*'
+    assert build_match_query("  -- ") is None
@@ -0,0 +1,64 @@
+"""Workspace provisioning and release against a split-profile database."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+from kagan.core.adapters.db.repositories import RepoRepository
+from kagan.core.adapters.db.schema import Task
+from kagan.core.bootstrap import InMemoryEventBus
+from kagan.core.models.enums import WorkspaceStatus
+from kagan.core.services.projects import ProjectServiceImpl
+from kagan.core.services.tasks import TaskServiceImpl
+from kagan.core.services.workspaces import WorkspaceServiceImpl
+
+if TYPE_CHECKING:
+    from kagan.core.adapters.db.repositories import TaskRepository
+
+
+async def test_release_writes_while_worktrees_are_removed(
+    state_manager: TaskRepository, tmp_path: Path
+) -> None:
+    project_id = state_manager.default_project_id
+    assert project_id is not None
+    session_factory = state_manager.session_factory
+    events = InMemoryEventBus()
+    repos = RepoRepository(session_factory)
+    projects = ProjectServiceImpl(session_factory, events, repos)
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    await projects.add_repo_to_project(project_id, repo_path, is_primary=True)
+    task = await state_manager.create(Task(project_id=project_id, title="Release me"))
+
+    written: list[str] = []
+
+    async def _delete_worktree(path: str) -> None:
+        # Writes from elsewhere must not wait on a session held by release().
+        updated = await asyncio.wait_for(
+            state_manager.update(task.id, title="Written during cleanup"), timeout=2
+        )
+        assert updated is not None
+        written.append(path)
+
+    async def _create_worktree(*, worktree_path: str, **_: object) -> None:
+        Path(worktree_path).mkdir()
+
+    git = MagicMock()
+    git.create_worktree = AsyncMock(side_effect=_create_worktree)
+    git.delete_worktree = AsyncMock(side_effect=_delete_worktree)
+    service = WorkspaceServiceImpl(
+        session_factory, git, TaskServiceImpl(state_manager, events), projects
+    )
+
+    workspace_id = await service.provision_for_project(task.id, project_id)
+    await service.release(workspace_id)
+
+    assert len(written) == 1
+    workspace = await service.get_workspace(workspace_id)
+    assert workspace is not None
+    assert workspace.status == WorkspaceStatus.ARCHIVED
+    updated = await state_manager.get(task.id)
+    assert updated is not None and updated.title == "Written during cleanup"
@@ -0,0 +1,113 @@
+"""Tests for the group-committing repository write executor."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from kagan.core.adapters.db.repositories import (
+    AuditRepository,
+    ScratchRepository,
+    TaskRepository,
+)
+from kagan.core.adapters.db.schema import AuditEvent, Task
+from kagan.core.adapters.db.write_executor import WriteExecutor
+from kagan.core.instrumentation import configure, reset, snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+async def task_repo(tmp_path: Path) -> AsyncIterator[TaskRepository]:
+    repo = TaskRepository(tmp_path / "kagan.db")
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+@pytest.fixture
+def instrumentation() -> Iterator[None]:
+    previous = snapshot()
+    configure(enabled=True, log_events=False)
+    reset()
+    yield
+    configure(enabled=bool(previous["enabled"]), log_events=bool(previous["log_events"]))
+    reset()
+
+
+@pytest.mark.usefixtures("instrumentation")
+async def test_concurrent_writes_from_several_repositories_share_commits(
+    task_repo: TaskRepository,
+) -> None:
+    project_id = await task_repo.ensure_test_project()
+    scratch = ScratchRepository(task_repo.session_factory)
+    audit = AuditRepository(task_repo.session_factory)
+    reset()
+
+    await asyncio.gather(
+        *(task_repo.create(Task(project_id=project_id, title=f"t{i}")) for i in range(4)),
+        *(scratch.update_scratchpad(f"task-{i}", f"note {i}") for i in range(4)),
+        audit.record_many([AuditEvent(capability="tasks", command_name="create")]),
+    )
+
+    counters = snapshot()["counters"]
+    assert counters["core.db.write_batch.operations"] == 9
+    assert counters["core.db.write_batch.batches"] < 9
+    assert len(await task_repo.get_all()) == 4
+    assert await scratch.get_scratchpad("task-3") == "note 3"
+    assert await audit.count_events() == 1
+
+
+async def test_failing_operation_rolls_back_only_itself(task_repo: TaskRepository) -> None:
+    scratch = ScratchRepository(task_repo.session_factory)
+
+    async def _write_then_fail(session: AsyncSession) -> None:
+        session.add(AuditEvent(capability="tasks", command_name="doomed"))
+        await session.flush()
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        scratch.update_scratchpad("before", "kept"),
+        task_repo.session_factory.write(_write_then_fail),
+        scratch.update_scratchpad("after", "kept"),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert results[2] is None
+    assert await scratch.get_scratchpad("before") == "kept"
+    assert await scratch.get_scratchpad("after") == "kept"
+    assert await AuditRepository(task_repo.session_factory).count_events() == 0
+
+
+async def test_unstarted_executor_commits_each_write(task_repo: TaskRepository) -> None:
+    await task_repo.session_factory.writer.stop()
+
+    project_id = await task_repo.ensure_test_project()
+    created = await task_repo.create(Task(project_id=project_id, title="direct"))
+
+    assert (await task_repo.get(created.id)) is not None
+
+
+async def test_stop_commits_queued_writes(task_repo: TaskRepository) -> None:
+    scratch = ScratchRepository(task_repo.session_factory)
+
+    pending = asyncio.ensure_future(scratch.update_scratchpad("queued", "saved"))
+    await asyncio.sleep(0)
+    await task_repo.session_factory.writer.stop()
+
+    await pending
+    assert await scratch.get_scratchpad("queued") == "saved"
+
+
+def test_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_batch"):
+        WriteExecutor(async_sessionmaker(), max_batch=0)
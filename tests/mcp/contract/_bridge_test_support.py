@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock
 
 from kagan.core.ipc.contracts import CoreErrorDetail, CoreResponse
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from kagan.core.ipc.contracts import CoreBatchItem
+
 SESSION = "test-session-1"
 
 
@@ -19,3 +25,35 @@ def make_client(response_data: dict | None = None, ok: bool = True) -> AsyncMock
     )
     client.request = AsyncMock(return_value=resp)
     return client
+
+
+def route_batches(
+    client: AsyncMock, handler: Callable[..., Awaitable[CoreResponse]]
+) -> list[list[tuple[str, str]]]:
+    """Answer ``client.request_batch`` items with *handler*; return the batches sent."""
+    batches: list[list[tuple[str, str]]] = []
+
+    async def request_batch(
+        items: list[CoreBatchItem],
+        *,
+        session_id: str,
+        session_profile: str | None = None,
+        session_origin: str | None = None,
+    ) -> list[CoreResponse]:
+        batches.append([(item.capability, item.method) for item in items])
+        responses: list[Any] = []
+        for item in items:
+            responses.append(
+                await handler(
+                    session_id=session_id,
+                    session_profile=session_profile,
+                    session_origin=session_origin,
+                    capability=item.capability,
+                    method=item.method,
+                    params=item.params,
+                )
+            )
+        return responses
+
+    client.request_batch = request_batch
+    return batches
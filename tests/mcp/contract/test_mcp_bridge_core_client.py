@@ -5,7 +5,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock
 
 import pytest
-from tests.mcp.contract._bridge_test_support import SESSION, make_client
+from tests.mcp.contract._bridge_test_support import SESSION, make_client, route_batches
 
 from kagan.core.ipc.contracts import CoreErrorDetail, CoreResponse
 from kagan.mcp.tools import CoreClientBridge, MCPBridgeError
@@ -165,7 +165,7 @@ async def test_get_task_includes_runtime_metadata() -> None:
 
 @pytest.mark.asyncio
 async def test_get_task_with_scratchpad() -> None:
-    """get_task with include_scratchpad should make two requests."""
+    """get_task with include_scratchpad should send both queries in one batch."""
     client = AsyncMock()
     calls: list[tuple[str, str, dict[str, object] | None]] = []
 
@@ -204,7 +204,7 @@ async def test_get_task_with_scratchpad() -> None:
             )
         return CoreResponse(request_id="r0", ok=True, result={})
 
-    client.request = mock_request
+    batches = route_batches(client, mock_request)
     bridge = CoreClientBridge(client, SESSION)
     result = await bridge.get_task("T1", include_scratchpad=True)
 
@@ -214,6 +214,8 @@ async def test_get_task_with_scratchpad() -> None:
         ("tasks", "get", {"task_id": "T1"}),
         ("tasks", "scratchpad", {"task_id": "T1"}),
     ]
+    assert len(batches) == 1
+    client.request.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -267,7 +269,7 @@ async def test_get_task_with_logs_uses_tasks_logs() -> None:
             )
         return CoreResponse(request_id="rx", ok=True, result={})
 
-    client.request = mock_request
+    batches = route_batches(client, mock_request)
     bridge = CoreClientBridge(client, SESSION)
     result = await bridge.get_task("T1", include_logs=True)
 
@@ -280,6 +282,7 @@ async def test_get_task_with_logs_uses_tasks_logs() -> None:
         }
     ]
     assert calls == [("tasks", "get"), ("tasks", "logs")]
+    assert batches == [calls]
 
 
 @pytest.mark.asyncio
@@ -324,7 +327,7 @@ async def test_get_task_with_logs_fallback_when_query_unavailable() -> None:
             )
         return CoreResponse(request_id="rx", ok=True, result={})
 
-    client.request = mock_request
+    batches = route_batches(client, mock_request)
     bridge = CoreClientBridge(client, SESSION)
     result = await bridge.get_task("T1", include_logs=True)
 
@@ -332,6 +335,7 @@ async def test_get_task_with_logs_fallback_when_query_unavailable() -> None:
     assert result["status"] == "backlog"
     assert result["logs"] == []
     assert calls == [("tasks", "get"), ("tasks", "logs")]
+    assert batches == [calls]
 
 
 @pytest.mark.asyncio
@@ -390,7 +394,7 @@ async def test_get_task_summary_mode_truncates_large_fields() -> None:
             )
         return CoreResponse(request_id="rx", ok=True, result={})
 
-    client.request = mock_request
+    batches = route_batches(client, mock_request)
     bridge = CoreClientBridge(client, SESSION)
     result = await bridge.get_task(
         "T1",
@@ -399,6 +403,8 @@ async def test_get_task_summary_mode_truncates_large_fields() -> None:
         mode="summary",
     )
 
+    assert batches == [[("tasks", "get"), ("tasks", "scratchpad"), ("tasks", "logs")]]
+
     assert "[truncated " in result["scratchpad"]
     assert len(result["logs"]) == 3
     assert [entry["run"] for entry in result["logs"]] == [3, 4, 5]
@@ -92,6 +92,12 @@ async def test_request_review_preserves_recovery_fields() -> None:
             "events",
             {"job_id": "J1", "task_id": "T1", "limit": 25, "offset": 10},
         ),
+        (
+            "list_job_events",
+            {"job_id": "J1", "task_id": "T1", "after_index": 3},
+            "events",
+            {"job_id": "J1", "task_id": "T1", "limit": 50, "offset": 0, "after_index": 3},
+        ),
         (
             "cancel_job",
             {"job_id": "J1", "task_id": "T1"},
@@ -403,3 +409,24 @@ async def test_auth_failed_normalizes_to_stale_token_code_when_recovery_fails()
 
     assert exc_info.value.code == "AUTH_STALE_TOKEN"
     assert "stale" in exc_info.value.message.lower()
+
+
+@pytest.mark.asyncio
+async def test_batched_get_task_normalizes_stale_token_when_recovery_fails() -> None:
+    stale_client = AsyncMock()
+    stale_client.connect = AsyncMock()
+    stale_client.close = AsyncMock()
+    stale_client.is_connected = True
+    stale_client.request_batch = AsyncMock(
+        side_effect=ValueError("Batch request rejected [AUTH_FAILED]: Invalid token")
+    )
+
+    with patch("kagan.core.ipc.discovery.discover_core_endpoint", return_value=None):
+        bridge = CoreClientBridge(stale_client, SESSION)
+        with pytest.raises(MCPBridgeError) as exc_info:
+            await bridge.get_task("T1", include_scratchpad=True)
+
+    assert exc_info.value.code == "AUTH_STALE_TOKEN"
+    assert (exc_info.value.capability, exc_info.value.method) == ("core", "batch")
+    stale_client.request_batch.assert_awaited_once()
+    stale_client.request.assert_not_awaited()
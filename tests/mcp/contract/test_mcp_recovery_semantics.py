@@ -426,11 +426,13 @@ async def test_jobs_events_maps_canonical_payload_and_pagination(monkeypatch) ->
             task_id: str,
             limit: int = 50,
             offset: int = 0,
+            after_index: int | None = None,
         ) -> dict[str, object]:
             assert job_id == "J2"
             assert task_id == "T2"
             assert limit == 1
             assert offset == 1
+            assert after_index == 4
             return {
                 "success": True,
                 "job_id": job_id,
@@ -451,18 +453,21 @@ async def test_jobs_events_maps_canonical_payload_and_pagination(monkeypatch) ->
                 "limit": limit,
                 "has_more": True,
                 "next_offset": 2,
+                "after_index": after_index,
+                "next_index": 6,
             }
 
     monkeypatch.setattr("kagan.mcp.server._require_bridge", lambda _ctx: _BridgeStub())
     mcp = _create_mcp_server(readonly=False)
     tool = _tool(mcp, "jobs_events")
 
-    result = await tool.fn(job_id="J2", task_id="T2", limit=1, offset=1, ctx=None)
+    result = await tool.fn(job_id="J2", task_id="T2", limit=1, offset=1, after_index=4, ctx=None)
 
     assert result.success is True
     r = result
     assert (r.total_events, r.returned_events, r.offset, r.limit) == (3, 1, 1, 1)
     assert (r.has_more, r.next_offset) == (True, 2)
+    assert (r.after_index, r.next_index) == (4, 6)
     event = result.events[0]
     expected = ("J2", "T2", "queued", "2026-02-10T10:00:00Z", "JOB_QUEUED")
     assert (event.job_id, event.task_id, event.status, event.timestamp, event.code) == expected
@@ -653,7 +658,10 @@ async def test_internal_diagnostics_tool_returns_instrumentation_snapshot(monkey
                 "enabled": True,
                 "log_events": False,
                 "counters": {"core.process.exec.calls": 4},
-                "timings": {"core.process.exec.duration_ms": {"count": 4, "avg_ms": 5.2}},
+                "timings": {
+                    "core.process.exec.duration_ms": {"count": 4, "avg_ms": 5.2, "p99_ms": 9.0}
+                },
+                "histograms": {"core.process.exec.duration_ms": [[4.5, 3], [9.0, 1]]},
             }
 
     monkeypatch.setattr("kagan.mcp.server._require_bridge", lambda _ctx: _BridgeStub())
@@ -673,3 +681,5 @@ async def test_internal_diagnostics_tool_returns_instrumentation_snapshot(monkey
     assert result.log_events is False
     assert result.counters["core.process.exec.calls"] == 4
     assert result.timings["core.process.exec.duration_ms"]["count"] == 4
+    assert result.timings["core.process.exec.duration_ms"]["p99_ms"] == 9.0
+    assert result.histograms["core.process.exec.duration_ms"] == [(4.5, 3), (9.0, 1)]
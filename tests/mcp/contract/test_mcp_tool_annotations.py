@@ -25,6 +25,7 @@ def full_mcp():
 _ANNOTATION_MATRIX: dict[str, tuple[bool, bool, bool]] = {
     "get_task": (True, False, True),
     "tasks_list": (True, False, True),
+    "tasks_changed_since": (True, False, True),
     "sessions_exists": (True, False, True),
     "projects_list": (True, False, True),
     "repos_list": (True, False, True),
@@ -37,6 +38,9 @@ _ANNOTATION_MATRIX: dict[str, tuple[bool, bool, bool]] = {
     "tasks_create": (False, False, False),
     "tasks_update": (False, False, False),
     "tasks_move": (False, False, False),
+    "tasks_create_many": (False, False, False),
+    "tasks_update_many": (False, False, False),
+    "tasks_move_many": (False, False, False),
     "jobs_submit": (False, False, False),
     "jobs_get": (True, False, True),
     "jobs_wait": (True, False, True),
@@ -60,6 +64,7 @@ _READONLY_TOOLS = {
     "propose_plan",
     "get_task",
     "tasks_list",
+    "tasks_changed_since",
     "projects_list",
     "repos_list",
     "audit_tail",
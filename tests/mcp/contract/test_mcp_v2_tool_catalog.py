@@ -14,6 +14,7 @@ READONLY_TOOLS = {
     "propose_plan",
     "get_task",
     "tasks_list",
+    "tasks_changed_since",
     "projects_list",
     "repos_list",
     "audit_tail",
@@ -27,6 +28,7 @@ FULL_TOOLS = {
     "request_review",
     # v2 read-only
     "tasks_list",
+    "tasks_changed_since",
     "projects_list",
     "repos_list",
     "audit_tail",
@@ -39,6 +41,9 @@ FULL_TOOLS = {
     "tasks_create",
     "tasks_update",
     "tasks_move",
+    "tasks_create_many",
+    "tasks_update_many",
+    "tasks_move_many",
     "jobs_submit",
     "jobs_cancel",
     "sessions_create",
@@ -188,12 +188,12 @@ class TestAutoCommitOnMerge:
 
         mock_session = MagicMock()
         mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.commit = AsyncMock()
-        mock_session.add = MagicMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=False)
 
-        merge_svc._session_factory = MagicMock(return_value=mock_session)
+        merge_svc._session_factory = MagicMock(
+            read=MagicMock(return_value=mock_session), write=AsyncMock()
+        )
 
         # Mock push (no remote in test repo) and PR creation
         git_adapter.push = AsyncMock()
@@ -203,8 +203,9 @@ class TestAutoCommitOnMerge:
 
         # Worktree was auto-committed (no longer dirty)
         assert not await git_adapter.has_uncommitted_changes(str(worktree))
-        # Merge succeeded
+        # Merge succeeded and was recorded
         assert result.success
+        merge_svc._session_factory.write.assert_awaited_once()
 
 
 class TestAutoCommitOnRebase:
@@ -414,7 +414,7 @@ async def test_enter_auto_in_progress_backfill_with_empty_payload_shows_fallback
                 metadata={},
             )
 
-        async def _get_execution_log_entries(_execution_id: str) -> list[Any]:
+        async def _get_execution_log_entries(_execution_id: str, **_kwargs: Any) -> list[Any]:
             return [make_execution_log_entry('{"messages":[]}')]
 
         async def _get_execution(_execution_id: str) -> Any:
@@ -652,7 +652,7 @@ async def test_enter_auto_in_progress_recovers_stale_running_execution_without_l
                 )
             return None
 
-        async def _get_execution_log_entries(_execution_id: str) -> list[Any]:
+        async def _get_execution_log_entries(_execution_id: str, **_kwargs: Any) -> list[Any]:
             return []
 
         async def _update_execution(execution_id: str, **_kwargs) -> Any:
@@ -749,7 +749,7 @@ async def test_enter_auto_backlog_backfills_history_when_live_agent_unavailable(
         monkeypatch.setattr(automation, "get_running_agent", lambda _task_id: None)
         monkeypatch.setattr(automation, "wait_for_running_agent", _wait_for_running_agent)
 
-        async def _get_execution_log_entries(_execution_id: str) -> list[Any]:
+        async def _get_execution_log_entries(_execution_id: str, **_kwargs: Any) -> list[Any]:
             return [
                 make_execution_log_entry(
                     '{"messages":[{"type":"response","content":"history backfill line"}]}'